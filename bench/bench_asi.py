@@ -0,0 +1,29 @@
+"""Parsing speed of code with and without semicolons.
+
+Semicolon-free code relies on automatic semicolon insertion
+at the end of almost every statement.
+
+    $ python bench/bench_asi.py [size in bytes]
+"""
+from __future__ import print_function
+
+import sys
+
+from slimit.parser import Parser
+
+from bench_lexer import best_of
+from corpus import NO_SEMI_SNIPPET, SNIPPET, make_bundle
+
+
+def main(size=200000):
+    parser = Parser()
+    for name, snippet in [('semicolons', SNIPPET),
+                          ('no semicolons', NO_SEMI_SNIPPET)]:
+        text = make_bundle(size, snippet)
+        elapsed, _ = best_of(lambda: parser.parse(text))
+        print('%-14s %8d bytes %8.3f s %8.2f MB/s' % (
+            name, len(text), elapsed, len(text) / elapsed / 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
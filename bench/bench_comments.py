@@ -0,0 +1,32 @@
+"""Lexer speed on comment-heavy sources (license headers, JSDoc).
+
+    $ python bench/bench_comments.py [size in bytes]
+"""
+from __future__ import print_function
+
+import sys
+
+from slimit.lexer import Lexer
+
+from bench_lexer import best_of, tokenize
+from corpus import COMMENTED_SNIPPET, SNIPPET, make_bundle
+
+
+def main(size=1000000):
+    for name, snippet in [('code', SNIPPET), ('comments', COMMENTED_SNIPPET)]:
+        text = make_bundle(size, snippet)
+        print('%s: %d bytes' % (name, len(text)))
+        for backend in Lexer.backends:
+            lexer = Lexer(backend=backend)
+            elapsed, count = best_of(lambda: tokenize(lexer, text))
+            print('  %-10s %8d tokens %8.3f s %8.2f MB/s' % (
+                backend, count, elapsed, len(text) / elapsed / 1e6))
+            lexer = Lexer(backend=backend)
+            elapsed, buffer = best_of(lambda: lexer.tokenize(text))
+            print('  %-10s %8d tokens %8.3f s %8.2f MB/s' % (
+                backend + '/buf', len(buffer), elapsed,
+                len(text) / elapsed / 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,45 @@
+"""Eager and lazy parsing of function bodies with the 'rd' backend.
+
+'lazy' only parses the top level of the bundle, 'lazy+access'
+parses every function body afterwards as well.
+
+    $ python bench/bench_lazy.py [size in bytes]
+"""
+from __future__ import print_function
+
+import sys
+
+from slimit.parser import Parser
+
+from bench_lexer import best_of
+from corpus import make_bundle
+
+
+def force(node):
+    """Parse all function bodies under the node."""
+    for child in node.children():
+        if child is not None:
+            force(child)
+
+
+def main(size=200000):
+    text = make_bundle(size)
+    print('input: %d bytes' % len(text))
+    for name, lazy, access in [
+        ('eager', False, False),
+        ('lazy', True, False),
+        ('lazy+access', True, True),
+        ]:
+        parser = Parser(backend='rd', lazy_functions=lazy)
+        buffer = parser.lexer.tokenize(text)
+        if access:
+            run = lambda: force(parser.parse(buffer))
+        else:
+            run = lambda: parser.parse(buffer)
+        elapsed, _ = best_of(run)
+        print('%-12s %8.3f s %8.2f MB/s' % (
+            name, elapsed, len(text) / elapsed / 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
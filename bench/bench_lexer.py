@@ -0,0 +1,43 @@
+"""Tokenizing speed of the lexer backends on large bundles.
+
+    $ python bench/bench_lexer.py [size in bytes]
+"""
+from __future__ import print_function
+
+import sys
+import time
+
+from slimit.lexer import Lexer
+
+from corpus import make_bundle
+
+
+def tokenize(lexer, text):
+    lexer.input(text)
+    count = 0
+    for _ in lexer:
+        count += 1
+    return count
+
+
+def best_of(func, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.time()
+        result = func()
+        timings.append(time.time() - start)
+    return min(timings), result
+
+
+def main(size=1000000):
+    text = make_bundle(size)
+    print('input: %d bytes' % len(text))
+    for backend in Lexer.backends:
+        lexer = Lexer(backend=backend)
+        elapsed, count = best_of(lambda: tokenize(lexer, text))
+        print('%-10s %8d tokens %8.3f s %10.0f tokens/s' % (
+            backend, count, elapsed, count / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
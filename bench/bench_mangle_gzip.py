@@ -0,0 +1,53 @@
+"""Size of the minified and mangled output compressed with zlib, with
+mangled names made of the default alphabet and with
+mangle(tree, for_gzip=True).
+
+Generated bundles are used unless JavaScript files are given.
+
+    $ python bench/bench_mangle_gzip.py [file ...]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import zlib
+
+from slimit import mangler
+from slimit.parser import Parser
+from slimit.visitors.minvisitor import ECMAMinifier
+
+from corpus import COMMENTED_SNIPPET, NO_SEMI_SNIPPET, make_bundle
+
+
+def sizes(parser, text, **options):
+    tree = parser.parse(text)
+    mangler.mangle(tree, toplevel=True, **options)
+    minified = ECMAMinifier().visit(tree).encode('utf-8')
+    return len(minified), len(zlib.compress(minified, 9))
+
+
+def main(paths):
+    if paths:
+        corpora = []
+        for path in paths:
+            with open(path) as fin:
+                corpora.append((os.path.basename(path), fin.read()))
+    else:
+        corpora = [
+            ('bundle', make_bundle(200000)),
+            ('commented', make_bundle(200000, COMMENTED_SNIPPET)),
+            ('no-semi', make_bundle(200000, NO_SEMI_SNIPPET)),
+            ]
+    parser = Parser(backend='rd')
+    print('%-12s %10s %10s %10s %8s' % (
+        '', 'minified', 'zlib', 'for_gzip', 'saved'))
+    for name, text in corpora:
+        size, compressed = sizes(parser, text)
+        compressed_for_gzip = sizes(parser, text, for_gzip=True)[1]
+        print('%-12s %10d %10d %10d %7.2f%%' % (
+            name[:12], size, compressed, compressed_for_gzip,
+            100.0 * (compressed - compressed_for_gzip) / compressed))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
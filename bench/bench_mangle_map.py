@@ -0,0 +1,62 @@
+"""How much of the minified output changes after a small edit of the
+source, with names mangled from scratch and with the name map of the
+previous build (mangle(tree, name_map=...)).
+
+The output is split into statements and the changed ones are counted
+with difflib.
+
+    $ python bench/bench_mangle_map.py [size in bytes]
+"""
+from __future__ import print_function
+
+import difflib
+import re
+import sys
+
+from slimit import mangler
+from slimit.parser import Parser
+from slimit.visitors.minvisitor import ECMAMinifier
+
+from corpus import make_bundle
+
+
+EDITS = [
+    # a new local variable in a library function
+    ('new local', lambda text: text.replace(
+        'var result = {}, i,', 'var added = 1, result = {}, i,', 1)),
+    # a new function at the top of the bundle
+    ('new function', lambda text:
+     'function added(a, b) { return a + b; }\n' + text),
+    ]
+
+
+def minify(parser, text, name_map):
+    tree = parser.parse(text)
+    mangler.mangle(tree, toplevel=True, name_map=name_map)
+    return ECMAMinifier().visit(tree)
+
+
+def changed(old, new):
+    old = re.split('(?<=[;{}])', old)
+    new = re.split('(?<=[;{}])', new)
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    same = sum(block.size for block in matcher.get_matching_blocks())
+    return len(new) - same, len(new)
+
+
+def main(size=100000):
+    text = make_bundle(size)
+    parser = Parser(backend='rd')
+    print('%-14s %12s %12s' % ('', 'scratch', 'name map'))
+    for name, edit in EDITS:
+        edited = edit(text)
+        scratch = changed(minify(parser, text, None),
+                          minify(parser, edited, None))
+        name_map = {}
+        before = minify(parser, text, name_map)
+        with_map = changed(before, minify(parser, edited, name_map))
+        print('%-14s %5d/%-6d %5d/%-6d' % ((name,) + scratch + with_map))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
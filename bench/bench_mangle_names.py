@@ -0,0 +1,52 @@
+"""Size of the minified output with names given in definition order
+and with the shortest names given to the most used symbols
+(mangle(tree, by_frequency=True)).
+
+    $ python bench/bench_mangle_names.py [size in bytes]
+"""
+from __future__ import print_function
+
+import sys
+
+from slimit import mangler
+from slimit.parser import Parser
+from slimit.visitors.minvisitor import ECMAMinifier
+
+from corpus import COMMENTED_SNIPPET, make_bundle
+
+
+def make_locals(count):
+    """Return a function with 'count' locals, the ones defined last
+    are used the most like loop counters and temporaries often are.
+    """
+    names = ['v%d' % index for index in range(count)]
+    lines = ['function f() {', 'var %s;' % ', '.join(names)]
+    for index, name in enumerate(names):
+        lines.append('%s = [%s];' % (name, ', '.join([name] * index)))
+    lines.append('}')
+    return '\n'.join(lines)
+
+
+def minified_size(parser, text, **options):
+    tree = parser.parse(text)
+    mangler.mangle(tree, toplevel=True, **options)
+    return len(ECMAMinifier().visit(tree))
+
+
+def main(size=200000):
+    parser = Parser(backend='rd')
+    corpora = [
+        ('bundle', make_bundle(size)),
+        ('commented', make_bundle(size, COMMENTED_SNIPPET)),
+        ('locals', make_locals(200)),
+        ]
+    print('%-10s %10s %10s %10s' % ('', 'order', 'frequency', 'saved'))
+    for name, text in corpora:
+        ordered = minified_size(parser, text)
+        ranked = minified_size(parser, text, by_frequency=True)
+        print('%-10s %10d %10d %9.1f%%' % (
+            name, ordered, ranked, 100.0 * (ordered - ranked) / ordered))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
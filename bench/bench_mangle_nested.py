@@ -0,0 +1,65 @@
+"""Name mangling of deeply nested closures with many locals that use
+the variables of all enclosing functions, phase by phase: scope
+analysis, assignment of the mangled names and renaming.
+
+    $ python bench/bench_mangle_nested.py [depth] [locals per function]
+"""
+from __future__ import print_function
+
+import sys
+import time
+
+from slimit.parser import Parser
+from slimit.scope import SymbolTable
+from slimit.visitors.scopevisitor import (
+    ScopeAnalysisVisitor,
+    mangle_scope_tree,
+    rename_symbols,
+    )
+
+
+def make_closures(depth, count):
+    lines = []
+    for level in range(depth):
+        names = ['v%d_%d' % (level, index) for index in range(count)]
+        lines.append('function f%d(p%d) {' % (level, level))
+        lines.append('var %s;' % ', '.join(
+            '%s = p%d' % (name, level) for name in names))
+        for outer in range(level):
+            # reference the variables of all enclosing functions
+            lines.append('x%d = %s;' % (level, ' + '.join(
+                'v%d_%d' % (outer, index) for index in range(count))))
+    lines.append('}' * depth)
+    return '\n'.join(lines)
+
+
+def mangle(tree):
+    timings = []
+    start = time.time()
+    sym_table = SymbolTable()
+    visitor = ScopeAnalysisVisitor(sym_table)
+    visitor.visit(tree)
+    visitor.fill_references()
+    timings.append(time.time() - start)
+    start = time.time()
+    mangle_scope_tree(sym_table.globals, True)
+    timings.append(time.time() - start)
+    start = time.time()
+    rename_symbols(sym_table.globals)
+    timings.append(time.time() - start)
+    return timings
+
+
+def main(depth=40, count=40):
+    text = make_closures(depth, count)
+    print('input: %d bytes, depth %d, %d locals per function' % (
+        len(text), depth, count))
+    parser = Parser(backend='rd')
+    best = min((mangle(parser.parse(text)) for _ in range(3)), key=sum)
+    for name, elapsed in zip(['analyse', 'assign', 'rename'], best):
+        print('%-8s %8.3f s' % (name, elapsed))
+    print('%-8s %8.3f s' % ('total', sum(best)))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,52 @@
+"""Size of the minified output with mangled names and with the
+property names that start with '_' mangled as well
+(mangle(tree, properties='^_')), raw and compressed with zlib.
+
+Generated bundles are used unless JavaScript files are given.
+
+    $ python bench/bench_mangle_props.py [file ...]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import time
+import zlib
+
+from slimit import mangler
+from slimit.parser import Parser
+from slimit.visitors.minvisitor import ECMAMinifier
+
+from corpus import CLASS_SNIPPET, make_bundle
+
+
+def sizes(parser, text, **options):
+    tree = parser.parse(text)
+    start = time.time()
+    mangler.mangle(tree, toplevel=True, **options)
+    elapsed = time.time() - start
+    minified = ECMAMinifier().visit(tree).encode('utf-8')
+    return len(minified), len(zlib.compress(minified, 9)), elapsed
+
+
+def main(paths):
+    if paths:
+        corpora = []
+        for path in paths:
+            with open(path) as fin:
+                corpora.append((os.path.basename(path), fin.read()))
+    else:
+        corpora = [('classes', make_bundle(200000, CLASS_SNIPPET))]
+    parser = Parser(backend='rd')
+    print('%-12s %10s %10s %10s %10s %8s %8s' % (
+        '', 'minified', 'zlib', 'props', 'zlib', 'mangle', 'props'))
+    for name, text in corpora:
+        size, compressed, elapsed = sizes(parser, text)
+        props = sizes(parser, text, properties='^_')
+        print('%-12s %10d %10d %10d %10d %7.3fs %7.3fs' % (
+            (name[:12], size, compressed) + props[:2] +
+            (elapsed, props[2])))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,67 @@
+"""Memory taken by the AST of a large bundle.
+
+Reports the bytes allocated per node after parsing and after the
+mangler has attached its scope attributes, and the same for a
+slimit.flatast.FlatTree of the bundle. 'peak' is the most memory
+allocated during the parse.
+
+    $ python bench/bench_memory.py [size in bytes]
+"""
+from __future__ import print_function
+
+import gc
+import sys
+import tracemalloc
+
+from slimit import flatast, mangler
+from slimit.parser import Parser
+
+from corpus import make_bundle
+
+
+def walk(node):
+    yield node
+    for child in node:
+        for descendant in walk(child):
+            yield descendant
+
+
+def main(size=1000000):
+    text = make_bundle(size)
+    print('input: %d bytes' % len(text))
+    parser = Parser(backend='rd')
+    buffer = parser.lexer.tokenize(text)
+    gc.collect()
+    tracemalloc.start()
+    tree = parser.parse(buffer)
+    gc.collect()
+    parsed, parsed_peak = tracemalloc.get_traced_memory()
+    mangler.mangle(tree, toplevel=True)
+    gc.collect()
+    mangled = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    nodes = sum(1 for node in walk(tree))
+    del tree
+
+    gc.collect()
+    tracemalloc.start()
+    flat = flatast.parse(buffer, parser)
+    gc.collect()
+    flat_parsed, flat_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(flat) == nodes
+
+    print('nodes: %d' % nodes)
+    for name, allocated in [
+        ('parsed', parsed),
+        ('peak', parsed_peak),
+        ('mangled', mangled),
+        ('flat', flat_parsed),
+        ('flat peak', flat_peak),
+        ]:
+        print('%-10s %10.1f MB %8.1f bytes/node' % (
+            name, allocated / 1e6, allocated / float(nodes)))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
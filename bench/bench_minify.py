@@ -0,0 +1,36 @@
+"""Per-call latency of slimit.minify() on small inputs.
+
+Compares building a new Parser for every call (the old behaviour)
+with the per-thread parser cached by slimit.minifier.
+
+    $ python bench/bench_minify.py
+"""
+from __future__ import print_function
+
+import timeit
+
+from slimit.minifier import minify
+from slimit.parser import Parser
+from slimit.visitors.minvisitor import ECMAMinifier
+
+from corpus import SMALL_INPUTS
+
+
+def minify_fresh_parser(text):
+    tree = Parser().parse(text)
+    return ECMAMinifier().visit(tree)
+
+
+def main(number=200):
+    print('%-70s %12s %12s' % ('input', 'fresh (us)', 'cached (us)'))
+    for text in SMALL_INPUTS:
+        fresh = min(timeit.repeat(
+            lambda: minify_fresh_parser(text), number=number, repeat=3))
+        cached = min(timeit.repeat(
+            lambda: minify(text), number=number, repeat=3))
+        print('%-70s %12.1f %12.1f' % (
+            text[:70], fresh / number * 1e6, cached / number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
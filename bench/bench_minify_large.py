@@ -0,0 +1,42 @@
+"""Time of a full minify of a large bundle, phase by phase.
+
+    $ python bench/bench_minify_large.py [size in bytes]
+"""
+from __future__ import print_function
+
+import sys
+import time
+
+from slimit import mangler
+from slimit.parser import Parser
+from slimit.visitors.minvisitor import ECMAMinifier
+
+from corpus import make_bundle
+
+
+def minify(parser, text):
+    timings = []
+    start = time.time()
+    tree = parser.parse(text)
+    timings.append(time.time() - start)
+    start = time.time()
+    mangler.mangle(tree, toplevel=True)
+    timings.append(time.time() - start)
+    start = time.time()
+    ECMAMinifier().visit(tree)
+    timings.append(time.time() - start)
+    return timings
+
+
+def main(size=1000000):
+    text = make_bundle(size)
+    print('input: %d bytes' % len(text))
+    parser = Parser(backend='rd')
+    best = min((minify(parser, text) for _ in range(3)), key=sum)
+    for name, elapsed in zip(['parse', 'mangle', 'minify'], best):
+        print('%-8s %8.3f s' % (name, elapsed))
+    print('%-8s %8.3f s' % ('total', sum(best)))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
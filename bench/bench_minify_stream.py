@@ -0,0 +1,59 @@
+"""Code generation of ECMAMinifier for a bundle wrapped in nested
+function expressions, as module bundlers emit it.
+
+Reports the time and the peak of allocated memory for generating the
+code as a string and for writing it to a file.
+
+    $ python bench/bench_minify_stream.py [size in bytes] [depth]
+"""
+from __future__ import print_function
+
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from slimit.parser import Parser
+from slimit.visitors.minvisitor import ECMAMinifier
+
+from corpus import make_bundle
+
+
+def measure(func):
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    func()
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(size=1000000, depth=4):
+    text = make_bundle(size)
+    for _ in range(depth):
+        text = '(function () {\n%s\n})();\n' % text
+    print('input: %d bytes, depth %d' % (len(text), depth))
+    tree = Parser(backend='rd').parse(text)
+    fd, path = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        def to_file():
+            with open(path, 'w') as fout:
+                ECMAMinifier().visit(tree, fout)
+
+        for name, func in [
+            ('string', lambda: ECMAMinifier().visit(tree)),
+            ('file', to_file),
+            ]:
+            elapsed, peak = measure(func)
+            print('%-8s %8.3f s %8.1f MB peak' % (name, elapsed, peak / 1e6))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
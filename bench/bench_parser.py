@@ -0,0 +1,27 @@
+"""Parsing speed of the parser backends on large bundles.
+
+    $ python bench/bench_parser.py [size in bytes]
+"""
+from __future__ import print_function
+
+import sys
+
+from slimit.parser import Parser
+
+from bench_lexer import best_of
+from corpus import make_bundle
+
+
+def main(size=200000):
+    text = make_bundle(size)
+    print('input: %d bytes' % len(text))
+    for backend in Parser.backends:
+        parser = Parser(backend=backend)
+        buffer = parser.lexer.tokenize(text)
+        elapsed, _ = best_of(lambda: parser.parse(buffer))
+        print('%-10s %8.3f s %8.2f MB/s' % (
+            backend, elapsed, len(text) / elapsed / 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
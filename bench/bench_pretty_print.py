@@ -0,0 +1,46 @@
+"""Pretty printing of a bundle wrapped in nested function expressions
+with ECMAVisitor, as Node.to_ecma does it.
+
+Reports the time and the peak of allocated memory for printing the
+code as a string and for writing it to a file.
+
+    $ python bench/bench_pretty_print.py [size in bytes] [depth]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import tempfile
+
+from slimit.parser import Parser
+from slimit.visitors.ecmavisitor import ECMAVisitor
+
+from bench_minify_stream import measure
+from corpus import make_bundle
+
+
+def main(size=1000000, depth=8):
+    text = make_bundle(size)
+    for _ in range(depth):
+        text = '(function () {\n%s\n})();\n' % text
+    print('input: %d bytes, depth %d' % (len(text), depth))
+    tree = Parser(backend='rd').parse(text)
+    fd, path = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        def to_file():
+            with open(path, 'w') as fout:
+                ECMAVisitor().visit(tree, fout)
+
+        for name, func in [
+            ('string', lambda: ECMAVisitor().visit(tree)),
+            ('file', to_file),
+            ]:
+            elapsed, peak = measure(func)
+            print('%-8s %8.3f s %8.1f MB peak' % (name, elapsed, peak / 1e6))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
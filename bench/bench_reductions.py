@@ -0,0 +1,77 @@
+"""Reductions and grammar rule calls per token.
+
+The 'ply' backend calls a grammar rule for every reduction, the 'lr'
+backend skips the rules of pass-through productions like 'expr :
+assignment_expr'.
+
+    $ python bench/bench_reductions.py [size in bytes]
+"""
+from __future__ import print_function
+
+import sys
+
+from slimit.parser import Parser
+
+from bench_lexer import best_of
+from corpus import make_bundle
+
+
+class Counter(object):
+
+    def __init__(self):
+        self.count = 0
+
+    def wrap(self, func):
+        def wrapper(p):
+            self.count += 1
+            func(p)
+        return wrapper
+
+
+def count_ply(parser, buffer):
+    # every reduction calls a grammar rule
+    counter = Counter()
+    productions = parser.parser.productions
+    saved = [prod.callable for prod in productions]
+    for prod in productions:
+        if prod.callable is not None:
+            prod.callable = counter.wrap(prod.callable)
+    try:
+        parser.parse(buffer)
+    finally:
+        for prod, func in zip(productions, saved):
+            prod.callable = func
+    return counter.count
+
+
+def count_lr(parser, buffer):
+    counter = Counter()
+    saved = parser.reductions
+    parser.reductions = [
+        (nonterminal, length, func and counter.wrap(func))
+        for nonterminal, length, func in saved]
+    try:
+        parser.parse(buffer)
+    finally:
+        parser.reductions = saved
+    return counter.count
+
+
+def main(size=200000):
+    text = make_bundle(size)
+    parsers = {'ply': Parser(), 'lr': Parser(backend='lr')}
+    buffer = parsers['ply'].lexer.tokenize(text)
+    tokens = len(buffer)
+    reductions = count_ply(parsers['ply'], buffer)
+    print('input: %d bytes, %d tokens, %.1f reductions/token' % (
+        len(text), tokens, reductions / float(tokens)))
+    for backend, count in [('ply', count_ply), ('lr', count_lr)]:
+        parser = parsers[backend]
+        calls = count(parser, buffer)
+        elapsed, _ = best_of(lambda: parser.parse(buffer))
+        print('%-10s %6.1f rule calls/token %8.3f s' % (
+            backend, calls / float(tokens), elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,49 @@
+"""Memory and time of a token list versus a compact TokenBuffer.
+
+    $ python bench/bench_tokens.py [size in bytes]
+"""
+from __future__ import print_function
+
+import sys
+import time
+import tracemalloc
+
+from slimit.lexer import Lexer
+
+from corpus import make_bundle
+
+
+def token_list(lexer, text):
+    lexer.input(text)
+    return list(lexer)
+
+
+def measure(func):
+    start = time.time()
+    func()
+    elapsed = time.time() - start
+    # tracing slows allocations down, so memory is measured separately
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed, size, result
+
+
+def main(size=1000000):
+    text = make_bundle(size)
+    print('input: %d bytes' % len(text))
+    for backend in Lexer.backends:
+        lexer = Lexer(backend=backend)
+        for name, func in [
+            ('list', lambda: token_list(lexer, text)),
+            ('buffer', lambda: lexer.tokenize(text)),
+            ]:
+            elapsed, size, result = measure(func)
+            print('%-8s %-7s %8d tokens %8.3f s %10.1f KiB %6.1f bytes/token'
+                  % (backend, name, len(result), elapsed, size / 1024.0,
+                     float(size) / len(result)))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
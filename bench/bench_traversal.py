@@ -0,0 +1,51 @@
+"""Speed of walking the AST of a large bundle and of a long string
+concatenation, a left-deep chain of BinOp nodes.
+
+    $ python bench/bench_traversal.py [size in bytes]
+"""
+from __future__ import print_function
+
+import sys
+
+from slimit import ast
+from slimit.parser import Parser
+from slimit.visitors.nodevisitor import ASTVisitor, NodeVisitor
+from slimit.visitors.scopevisitor import Visitor
+
+from bench_lexer import best_of
+from corpus import make_bundle
+
+
+def node_visitor(tree):
+    count = 0
+    for _ in NodeVisitor().visit(tree):
+        count += 1
+    return count
+
+
+def concatenation(length):
+    node = ast.String('"a"')
+    for _ in range(length):
+        node = ast.BinOp('+', node, ast.String('"b"'))
+    return node
+
+
+def main(size=1000000):
+    text = make_bundle(size)
+    print('input: %d bytes' % len(text))
+    tree = Parser(backend='rd').parse(text)
+    for name, walk in [
+        ('ASTVisitor', ASTVisitor().visit),
+        ('scope Visitor', Visitor().visit),
+        ('NodeVisitor', node_visitor),
+        ]:
+        elapsed, _ = best_of(lambda: walk(tree))
+        print('%-14s %8.3f s' % (name, elapsed))
+    # the recursive visitors can't go that deep
+    chain = concatenation(100000)
+    elapsed, _ = best_of(lambda: node_visitor(chain))
+    print('%-14s %8.3f s' % ('NodeVisitor, concatenation of 100000', elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,186 @@
+"""Synthetic JavaScript inputs shared by the benchmark scripts."""
+
+import re
+
+SNIPPET = r"""
+/*
+ * Helper functions used for managing events.
+ * Many of the ideas behind this code originated from
+ * Dean Edwards' addEvent library.
+ */
+var module%(n)d = (function (window, undefined) {
+    var rquickExpr = /^(?:[^#<]*(<[\w\W]+>)[^>]*$|#([\w\-]*)$)/,
+        rtrim = /^\s+|\s+$/g,
+        toString = Object.prototype.toString;
+
+    // Build a map of handlers keyed by their type
+    function buildMap(elems, name, data) {
+        var result = {}, i, elem, length = elems.length;
+        for (i = 0; i < length; i++) {
+            elem = elems[i];
+            if (elem && elem.nodeType === 1 && elem[name] !== undefined) {
+                result[elem.id || "elem" + i] = {
+                    "name": name,
+                    data: data,
+                    index: i * 2 + 1
+                };
+            } else if (typeof elem === "string") {
+                result[elem] = elem.replace(rtrim, "").split(" ");
+            }
+        }
+        return result;
+    }
+
+    /**
+     * Find elements matching the selector.
+     *
+     * @param {String} selector
+     * @param {Object} context
+     */
+    function find(selector, context) {
+        var match = rquickExpr.exec(selector), ret = [];
+        if (!match) {
+            return context.querySelectorAll(selector);
+        }
+        while (context) {
+            if (context.id === match[2]) {
+                ret.push(context);
+            }
+            context = context.nextSibling;
+        }
+        switch (ret.length) {
+        case 0:
+            return null;
+        case 1:
+            return ret[0];
+        default:
+            return ret;
+        }
+    }
+
+    try {
+        window.addEventListener("load", function (event) {
+            buildMap(find("#main", document), "data-%(n)d", event);
+        }, false);
+    } catch (e) {
+        toString.call(e) === "[object Error]" ? window.console.log(e) : 0;
+    }
+
+    return {
+        find: find,
+        buildMap: buildMap,
+        version: "%(n)d.0"
+    };
+})(this);
+"""
+
+# license header and JSDoc annotated code, most of the text is comments
+COMMENTED_SNIPPET = r"""
+/*!
+ * Widget library v%(n)d.0
+ *
+ * Copyright (c) 2013 The Widget Authors
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to
+ * deal in the Software without restriction, including without limitation the
+ * rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+ * sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ */
+
+/**
+ * Create a new widget.
+ *
+ * @constructor
+ * @param {Element} element The element the widget is attached to.
+ * @param {Object=} options Optional settings.
+ * @param {number=} options.delay Delay in milliseconds, defaults to 100.
+ * @param {string=} options.name Name used for events.
+ */
+function Widget%(n)d(element, options) {
+    // element the widget is attached to
+    this.element = element;
+    // merged settings
+    this.options = options || {};
+    // timers started by the widget
+    this.timers = [];
+}
+
+/**
+ * Schedule a callback.
+ *
+ * @param {function()} callback The function to call.
+ * @return {number} The timer id.
+ */
+Widget%(n)d.prototype.schedule = function (callback) {
+    // the delay can be overriden with options.delay
+    var id = setTimeout(callback, this.options.delay || 100);
+    this.timers.push(id); // remember to cancel it later
+    return id;
+};
+"""
+
+# same code written without semicolons at the end of lines
+NO_SEMI_SNIPPET = re.sub(r';(?=\n)', '', SNIPPET)
+
+# constructor and prototype methods with '_' prefixed private members
+CLASS_SNIPPET = r"""
+function Widget%(n)d(element, options) {
+    this._element = element;
+    this._options = options || {};
+    this._handlers = [];
+    this._visible = false;
+}
+
+Widget%(n)d.prototype = {
+    _defaults: {"_duration": 200, _easing: "swing"},
+
+    show: function () {
+        if (!this._visible) {
+            this._visible = true;
+            this._element.style.display = "block";
+            this._trigger("show", this._options["_duration"]);
+        }
+        return this;
+    },
+
+    on: function (type, handler) {
+        this._handlers.push({_type: type, _handler: handler});
+        return this;
+    },
+
+    _trigger: function (type, data) {
+        var handlers = this._handlers, i;
+        for (i = 0; i < handlers.length; i++) {
+            if (handlers[i]._type === type) {
+                handlers[i]._handler.call(this._element, data);
+            }
+        }
+    }
+};
+"""
+
+
+def make_bundle(size, snippet=SNIPPET):
+    """Return JavaScript source of roughly 'size' characters."""
+    chunks = []
+    total = 0
+    n = 0
+    while total < size:
+        chunk = snippet % {'n': n}
+        chunks.append(chunk)
+        total += len(chunk)
+        n += 1
+    return ''.join(chunks)
+
+
+SMALL_INPUTS = [
+    'var a = 1;',
+    'function add(x, y) { return x + y; }',
+    'if (window.jQuery) { jQuery(document).ready(init); }',
+    'var o = {a: 1, "b": [1, 2, 3], c: function () { return this.a; }};',
+]
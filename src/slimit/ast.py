@@ -25,340 +25,439 @@
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
 
-class Node(object):
+def _iter_children(node):
+    for child in node.children():
+        if child is not None:
+            yield child
+
+
+def _each_child_of_children(node, func):
+    for child in node.children():
+        if child is not None:
+            func(child)
+
+
+class _NodeType(type):
+    """Metaclass of the nodes.
+
+    Iteration and 'each_child' read the 'child_fields' of a node.
+    Classes defined outside of this module that override 'children'
+    instead get versions of them that walk what 'children' returns,
+    as all nodes did before 'child_fields' existed.
+    """
+
+    def __init__(cls, name, bases, namespace):
+        super(_NodeType, cls).__init__(name, bases, namespace)
+        if 'children' in namespace and cls.__module__ != __name__:
+            if '__iter__' not in namespace:
+                cls.__iter__ = _iter_children
+            if 'each_child' not in namespace:
+                cls.each_child = _each_child_of_children
+
+
+# the base class is made by calling the metaclass, the syntax to
+# give a class a metaclass differs between Python 2 and 3
+_NodeBase = _NodeType('_NodeBase', (object,), {'__slots__': ()})
+
+
+class Node(_NodeBase):
+    # nodes have no instance dictionary, attributes set on them
+    # after parsing must be declared: '_parens' is set by the parser
+    # on expressions in parentheses, '_children_list' holds the
+    # children of nodes that keep the default 'child_fields'
+    __slots__ = ('_parens', '_children_list')
+
+    # names of the attributes holding the children in source order,
+    # an attribute holds a node, None or a list of nodes
+    child_fields = ('_children_list',)
+
     def __init__(self, children=None):
         self._children_list = [] if children is None else children
 
     def __iter__(self):
-        for child in self.children():
-            if child is not None:
+        for name in self.child_fields:
+            child = getattr(self, name)
+            if child.__class__ is list:
+                for item in child:
+                    if item is not None:
+                        yield item
+            elif child is not None:
                 yield child
 
-    def children(self):
-        return self._children_list
-
-    def to_ecma(self):
+    def each_child(self, func):
+        """Call func with every child that is not None.
+
+        Walks the same children as iterating over the node does but
+        doesn't build a list or a generator, visitors use it in
+        'generic_visit'.
+        """
+        for name in self.child_fields:
+            child = getattr(self, name)
+            if child.__class__ is list:
+                for item in child:
+                    if item is not None:
+                        func(item)
+            elif child is not None:
+                func(child)
+
+    def children(self):
+        children = []
+        for name in self.child_fields:
+            child = getattr(self, name)
+            if child.__class__ is list:
+                children.extend(child)
+            else:
+                children.append(child)
+        return children
+
+    def to_ecma(self, out=None):
+        """Return the pretty printed code of the node.
+
+        If 'out' is given the code is written to that file-like object
+        instead.
+        """
         # Can't import at module level as ecmavisitor depends
         # on ast module...
         from slimit.visitors.ecmavisitor import ECMAVisitor
         visitor = ECMAVisitor()
-        return visitor.visit(self)
+        return visitor.visit(self, out)
 
 class Program(Node):
-    pass
+    __slots__ = ()
 
 class Block(Node):
-    pass
+    __slots__ = ()
 
 class Boolean(Node):
+    __slots__ = ('value',)
+    child_fields = ()
+
     def __init__(self, value):
         self.value = value
 
-    def children(self):
-        return []
-
 class Null(Node):
+    __slots__ = ('value',)
+    child_fields = ()
+
     def __init__(self, value):
         self.value = value
 
-    def children(self):
-        return []
-
 class Number(Node):
+    __slots__ = ('value',)
+    child_fields = ()
+
     def __init__(self, value):
         self.value = value
 
-    def children(self):
-        return []
-
 class Identifier(Node):
+    # '_mangle_candidate' and '_in_expression' are set by the parser,
+    # 'scope' by slimit.visitors.scopevisitor.ScopeTreeVisitor
+    __slots__ = ('value', '_mangle_candidate', '_in_expression', 'scope')
+    child_fields = ()
+
     def __init__(self, value):
         self.value = value
 
-    def children(self):
-        return []
-
 class String(Node):
+    __slots__ = ('value',)
+    child_fields = ()
+
     def __init__(self, value):
         self.value = value
 
-    def children(self):
-        return []
-
 class Regex(Node):
+    __slots__ = ('value',)
+    child_fields = ()
+
     def __init__(self, value):
         self.value = value
 
-    def children(self):
-        return []
-
 class Array(Node):
+    __slots__ = ('items',)
+    child_fields = ('items',)
+
     def __init__(self, items):
         self.items = items
 
-    def children(self):
-        return self.items
-
 class Object(Node):
+    __slots__ = ('properties',)
+    child_fields = ('properties',)
+
     def __init__(self, properties=None):
         self.properties = [] if properties is None else properties
 
-    def children(self):
-        return self.properties
-
 class NewExpr(Node):
+    __slots__ = ('identifier', 'args')
+    child_fields = ('identifier', 'args')
+
     def __init__(self, identifier, args=None):
         self.identifier = identifier
         self.args = [] if args is None else args
 
-    def children(self):
-        return [self.identifier, self.args]
-
 class FunctionCall(Node):
+    __slots__ = ('identifier', 'args')
+    child_fields = ('identifier', 'args')
+
     def __init__(self, identifier, args=None):
         self.identifier = identifier
         self.args = [] if args is None else args
 
-    def children(self):
-        return [self.identifier] + self.args
-
 class BracketAccessor(Node):
+    __slots__ = ('node', 'expr')
+    child_fields = ('node', 'expr')
+
     def __init__(self, node, expr):
         self.node = node
         self.expr = expr
 
-    def children(self):
-        return [self.node, self.expr]
-
 class DotAccessor(Node):
+    __slots__ = ('node', 'identifier')
+    child_fields = ('node', 'identifier')
+
     def __init__(self, node, identifier):
         self.node = node
         self.identifier = identifier
 
-    def children(self):
-        return [self.node, self.identifier]
-
 class Assign(Node):
+    __slots__ = ('op', 'left', 'right')
+    child_fields = ('left', 'right')
+
     def __init__(self, op, left, right):
         self.op = op
         self.left = left
         self.right = right
 
-    def children(self):
-        return [self.left, self.right]
-
 class GetPropAssign(Node):
+    __slots__ = ('prop_name', 'elements')
+    child_fields = ('prop_name', 'elements')
+
     def __init__(self, prop_name, elements):
         """elements - function body"""
         self.prop_name = prop_name
         self.elements = elements
 
-    def children(self):
-        return [self.prop_name] + self.elements
-
 class SetPropAssign(Node):
+    __slots__ = ('prop_name', 'parameters', 'elements')
+    child_fields = ('prop_name', 'parameters', 'elements')
+
     def __init__(self, prop_name, parameters, elements):
         """elements - function body"""
         self.prop_name = prop_name
         self.parameters = parameters
         self.elements = elements
 
-    def children(self):
-        return [self.prop_name] + self.parameters + self.elements
-
 class VarStatement(Node):
-    pass
+    __slots__ = ()
 
 class VarDecl(Node):
+    __slots__ = ('identifier', 'initializer')
+    child_fields = ('identifier', 'initializer')
+
     def __init__(self, identifier, initializer=None):
         self.identifier = identifier
         self.identifier._mangle_candidate = True
         self.initializer = initializer
 
-    def children(self):
-        return [self.identifier, self.initializer]
-
 class UnaryOp(Node):
+    __slots__ = ('op', 'value', 'postfix')
+    child_fields = ('value',)
+
     def __init__(self, op, value, postfix=False):
         self.op = op
         self.value = value
         self.postfix = postfix
 
-    def children(self):
-        return [self.value]
-
 class BinOp(Node):
+    __slots__ = ('op', 'left', 'right')
+    child_fields = ('left', 'right')
+
     def __init__(self, op, left, right):
         self.op = op
         self.left = left
         self.right = right
 
-    def children(self):
-        return [self.left, self.right]
-
 class Conditional(Node):
     """Conditional Operator ( ? : )"""
+    __slots__ = ('predicate', 'consequent', 'alternative')
+    child_fields = ('predicate', 'consequent', 'alternative')
+
     def __init__(self, predicate, consequent, alternative):
         self.predicate = predicate
         self.consequent = consequent
         self.alternative = alternative
 
-    def children(self):
-        return [self.predicate, self.consequent, self.alternative]
-
 class If(Node):
+    __slots__ = ('predicate', 'consequent', 'alternative')
+    child_fields = ('predicate', 'consequent', 'alternative')
+
     def __init__(self, predicate, consequent, alternative=None):
         self.predicate = predicate
         self.consequent = consequent
         self.alternative = alternative
 
-    def children(self):
-        return [self.predicate, self.consequent, self.alternative]
-
 class DoWhile(Node):
+    __slots__ = ('predicate', 'statement')
+    child_fields = ('predicate', 'statement')
+
     def __init__(self, predicate, statement):
         self.predicate = predicate
         self.statement = statement
 
-    def children(self):
-        return [self.predicate, self.statement]
-
 class While(Node):
+    __slots__ = ('predicate', 'statement')
+    child_fields = ('predicate', 'statement')
+
     def __init__(self, predicate, statement):
         self.predicate = predicate
         self.statement = statement
 
-    def children(self):
-        return [self.predicate, self.statement]
-
 class For(Node):
+    __slots__ = ('init', 'cond', 'count', 'statement')
+    child_fields = ('init', 'cond', 'count', 'statement')
+
     def __init__(self, init, cond, count, statement):
         self.init = init
         self.cond = cond
         self.count = count
         self.statement = statement
 
-    def children(self):
-        return [self.init, self.cond, self.count, self.statement]
-
 class ForIn(Node):
+    __slots__ = ('item', 'iterable', 'statement')
+    child_fields = ('item', 'iterable', 'statement')
+
     def __init__(self, item, iterable, statement):
         self.item = item
         self.iterable = iterable
         self.statement = statement
 
-    def children(self):
-        return [self.item, self.iterable, self.statement]
-
 class Continue(Node):
+    __slots__ = ('identifier',)
+    child_fields = ('identifier',)
+
     def __init__(self, identifier=None):
         self.identifier = identifier
 
-    def children(self):
-        return [self.identifier]
-
 class Break(Node):
+    __slots__ = ('identifier',)
+    child_fields = ('identifier',)
+
     def __init__(self, identifier=None):
         self.identifier = identifier
 
-    def children(self):
-        return [self.identifier]
-
 class Return(Node):
+    __slots__ = ('expr',)
+    child_fields = ('expr',)
+
     def __init__(self, expr=None):
         self.expr = expr
 
-    def children(self):
-        return [self.expr]
-
 class With(Node):
+    __slots__ = ('expr', 'statement')
+    child_fields = ('expr', 'statement')
+
     def __init__(self, expr, statement):
         self.expr = expr
         self.statement = statement
 
-    def children(self):
-        return [self.expr, self.statement]
-
 class Switch(Node):
+    __slots__ = ('expr', 'cases', 'default')
+    child_fields = ('expr', 'cases', 'default')
+
     def __init__(self, expr, cases, default=None):
         self.expr = expr
         self.cases = cases
         self.default = default
 
-    def children(self):
-        return [self.expr] + self.cases + [self.default]
-
 class Case(Node):
+    __slots__ = ('expr', 'elements')
+    child_fields = ('expr', 'elements')
+
     def __init__(self, expr, elements):
         self.expr = expr
         self.elements = elements if elements is not None else []
 
-    def children(self):
-        return [self.expr] + self.elements
-
 class Default(Node):
+    __slots__ = ('elements',)
+    child_fields = ('elements',)
+
     def __init__(self, elements):
         self.elements = elements if elements is not None else []
 
-    def children(self):
-        return self.elements
-
 class Label(Node):
+    __slots__ = ('identifier', 'statement')
+    child_fields = ('identifier', 'statement')
+
     def __init__(self, identifier, statement):
         self.identifier = identifier
         self.statement = statement
 
-    def children(self):
-        return [self.identifier, self.statement]
-
 class Throw(Node):
+    __slots__ = ('expr',)
+    child_fields = ('expr',)
+
     def __init__(self, expr):
         self.expr = expr
 
-    def children(self):
-        return [self.expr]
-
 class Try(Node):
+    __slots__ = ('statements', 'catch', 'fin')
+    child_fields = ('statements', 'catch', 'fin')
+
     def __init__(self, statements, catch=None, fin=None):
         self.statements = statements
         self.catch = catch
         self.fin = fin
 
-    def children(self):
-        return [self.statements] + [self.catch, self.fin]
-
 class Catch(Node):
+    __slots__ = ('identifier', 'elements')
+    child_fields = ('identifier', 'elements')
+
     def __init__(self, identifier, elements):
         self.identifier = identifier
         # CATCH identifiers are subject to name mangling. we need to mark them.
         self.identifier._mangle_candidate = True
         self.elements = elements
 
-    def children(self):
-        return [self.identifier, self.elements]
-
 class Finally(Node):
+    __slots__ = ('elements',)
+    child_fields = ('elements',)
+
     def __init__(self, elements):
         self.elements = elements
 
-    def children(self):
-        return self.elements
-
 class Debugger(Node):
+    __slots__ = ('value',)
+    child_fields = ()
+
     def __init__(self, value):
         self.value = value
 
-    def children(self):
-        return []
 
 
 class FuncBase(Node):
-    def __init__(self, identifier, parameters, elements):
+    __slots__ = (
+        'identifier', 'parameters', '_elements', '_lazy_elements', 'scope')
+    child_fields = ('identifier', 'parameters', 'elements')
+
+    def __init__(self, identifier, parameters, elements, lazy_elements=None):
+        """lazy_elements - callable returning the function body,
+        called on the first access to 'elements'"""
         self.identifier = identifier
         self.parameters = parameters if parameters is not None else []
-        self.elements = elements if elements is not None else []
+        self.elements = elements
+        self._lazy_elements = lazy_elements
         self._init_ids()
 
+    @property
+    def elements(self):
+        if self._lazy_elements is not None:
+            self.elements = self._lazy_elements()
+        return self._elements
+
+    @elements.setter
+    def elements(self, elements):
+        self._lazy_elements = None
+        self._elements = elements if elements is not None else []
+
     def _init_ids(self):
         # function declaration/expression name and parameters are identifiers
         # and therefore are subject to name mangling. we need to mark them.
@@ -367,49 +466,48 @@ class FuncBase(Node):
         for param in self.parameters:
             param._mangle_candidate = True
 
-    def children(self):
-        return [self.identifier] + self.parameters + self.elements
 
 class FuncDecl(FuncBase):
-    pass
+    __slots__ = ()
 
 # The only difference is that function expression might not have an identifier
 class FuncExpr(FuncBase):
-    pass
+    __slots__ = ()
 
 
 class Comma(Node):
+    __slots__ = ('left', 'right')
+    child_fields = ('left', 'right')
+
     def __init__(self, left, right):
         self.left = left
         self.right = right
 
-    def children(self):
-        return [self.left, self.right]
-
 class EmptyStatement(Node):
+    __slots__ = ('value',)
+    child_fields = ()
+
     def __init__(self, value):
         self.value = value
 
-    def children(self):
-        return []
-
 class ExprStatement(Node):
+    __slots__ = ('expr',)
+    child_fields = ('expr',)
+
     def __init__(self, expr):
         self.expr = expr
 
-    def children(self):
-        return [self.expr]
-
 class Elision(Node):
+    __slots__ = ('value',)
+    child_fields = ()
+
     def __init__(self, value):
         self.value = value
 
-    def children(self):
-        return []
-
 class This(Node):
+    __slots__ = ()
+    child_fields = ()
+
     def __init__(self):
         pass
 
-    def children(self):
-        return []
@@ -0,0 +1,336 @@
+###############################################################################
+#
+# Copyright (c) 2011 Ruslan Spivak
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+###############################################################################
+"""Flat AST stored in parallel arrays.
+
+Nodes of a FlatTree are numbered in pre-order, the root is 0, and
+live in arrays indexed by the node number instead of being objects:
+
+    kinds        - code of the node class, an index into KINDS
+    flags        - the '_parens', '_mangle_candidate' and
+                   '_in_expression' markers and 'postfix' of UnaryOp
+    values       - index of the 'value' or 'op' string of the node in
+                   the 'strings' table, -1 if it has neither
+    child_start  - start and length of the slice of 'children'
+    child_count    holding the node's 'child_fields'
+
+Every child field is encoded in 'children' as a node number, NO_CHILD
+for None or 'LIST_BASE - n' followed by the n items of a list.
+
+FlatNode proxies read a node on access and look like the slimit.ast
+node they stand for, the visitors that only read the tree work on
+them. Code that modifies the tree, like the mangler, needs the object
+tree built by FlatTree.node.
+
+slimit nodes don't record source positions, so there are no spans
+to store.
+"""
+
+__author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
+
+from array import array
+
+from slimit import ast
+
+NO_CHILD = -1
+LIST_BASE = -2
+
+# node classes in the order they are defined in slimit.ast
+KINDS = tuple(
+    cls for cls in vars(ast).values()
+    if isinstance(cls, type) and issubclass(cls, ast.Node)
+    and cls.__module__ == ast.__name__)
+
+KIND_CODES = dict((cls, code) for code, cls in enumerate(KINDS))
+
+MARKERS = (('_parens', 1), ('_mangle_candidate', 2), ('_in_expression', 4))
+POSTFIX = 8
+
+
+def _scalar_field(cls):
+    slots = set()
+    for klass in cls.__mro__:
+        slots.update(getattr(klass, '__slots__', ()))
+    for name in ('op', 'value'):
+        if name in slots and name not in cls.child_fields:
+            return name
+    return None
+
+# name of the string attribute per kind
+SCALAR_FIELDS = tuple(_scalar_field(cls) for cls in KINDS)
+
+
+class FlatTree(object):
+    """AST stored in parallel arrays, see the module docstring."""
+
+    def __init__(self):
+        self.kinds = array('B')
+        self.flags = array('B')
+        self.values = array('i')
+        self.child_start = array('i')
+        self.child_count = array('i')
+        self.children = array('i')
+        self.strings = []
+        self._string_index = {}
+
+    def __len__(self):
+        return len(self.kinds)
+
+    @classmethod
+    def from_node(cls, node):
+        """Make the tree from a slimit.ast node and its descendants."""
+        tree = cls()
+        tree.add(node)
+        return tree
+
+    @classmethod
+    def from_elements(cls, elements):
+        """Make the tree of a Program from its source elements.
+
+        'elements' can be an iterator, only one element at a time
+        needs to exist as objects.
+        """
+        tree = cls()
+        root = tree._new_node(ast.Program, 0, None)
+        numbers = [tree.add(element) for element in elements]
+        tree._set_children(root, [LIST_BASE - len(numbers)] + numbers)
+        return tree
+
+    @property
+    def root(self):
+        return FlatNode(self, 0)
+
+    def add(self, node):
+        """Append the node and its descendants, return the node number."""
+        cls = node.__class__
+        flags = 0
+        for name, flag in MARKERS:
+            if getattr(node, name, False):
+                flags |= flag
+        if cls is ast.UnaryOp and node.postfix:
+            flags |= POSTFIX
+        index = self._new_node(cls, flags, node)
+
+        encoded = []
+        add = self.add
+        for name in cls.child_fields:
+            child = getattr(node, name)
+            if child is None:
+                encoded.append(NO_CHILD)
+            elif child.__class__ is list:
+                encoded.append(LIST_BASE - len(child))
+                encoded.extend([NO_CHILD if item is None else add(item)
+                                for item in child])
+            else:
+                encoded.append(add(child))
+        self._set_children(index, encoded)
+        return index
+
+    def _new_node(self, cls, flags, node):
+        try:
+            kind = KIND_CODES[cls]
+        except KeyError:
+            raise TypeError('Not a slimit.ast node class: %r' % cls)
+        scalar = SCALAR_FIELDS[kind]
+        value = None if scalar is None else getattr(node, scalar)
+        if value is None:
+            value_index = -1
+        else:
+            value_index = self._string_index.get(value)
+            if value_index is None:
+                value_index = len(self.strings)
+                self._string_index[value] = value_index
+                self.strings.append(value)
+        self.kinds.append(kind)
+        self.flags.append(flags)
+        self.values.append(value_index)
+        self.child_start.append(0)
+        self.child_count.append(0)
+        return len(self.kinds) - 1
+
+    def _set_children(self, index, encoded):
+        self.child_start[index] = len(self.children)
+        self.child_count[index] = len(encoded)
+        self.children.extend(encoded)
+
+    def kind(self, index):
+        """Return the slimit.ast class of the node."""
+        return KINDS[self.kinds[index]]
+
+    def value(self, index):
+        """Return the 'value' or 'op' string of the node or None."""
+        value_index = self.values[index]
+        return None if value_index == -1 else self.strings[value_index]
+
+    def fields(self, index):
+        """Return (name, value) pairs of the child fields of the node.
+
+        Children are node numbers, a list field is a list of them.
+        """
+        children = self.children
+        position = self.child_start[index]
+        fields = []
+        for name in self.kind(index).child_fields:
+            code = children[position]
+            position += 1
+            if code == NO_CHILD:
+                value = None
+            elif code <= LIST_BASE:
+                end = position + LIST_BASE - code
+                value = [None if item == NO_CHILD else item
+                         for item in children[position:end]]
+                position = end
+            else:
+                value = code
+            fields.append((name, value))
+        return fields
+
+    def node(self, index=0):
+        """Build the slimit.ast sub-tree of the node."""
+        cls = self.kind(index)
+        node = cls.__new__(cls)
+        flags = self.flags[index]
+        for name, flag in MARKERS:
+            if flags & flag:
+                setattr(node, name, True)
+        if cls is ast.UnaryOp:
+            node.postfix = bool(flags & POSTFIX)
+        scalar = SCALAR_FIELDS[self.kinds[index]]
+        if scalar is not None:
+            setattr(node, scalar, self.value(index))
+        for name, value in self.fields(index):
+            if value.__class__ is list:
+                value = [None if item is None else self.node(item)
+                         for item in value]
+            elif value is not None:
+                value = self.node(value)
+            setattr(node, name, value)
+        return node
+
+
+class FlatNode(object):
+    """Read-only proxy of a FlatTree node.
+
+    '__class__' is the slimit.ast class of the node, so isinstance
+    checks and the dispatch of the visitors work on proxies.
+    Attributes are read from the tree on access, child nodes are
+    returned as new proxies.
+    """
+    __slots__ = ('tree', 'index')
+
+    def __init__(self, tree, index):
+        object.__setattr__(self, 'tree', tree)
+        object.__setattr__(self, 'index', index)
+
+    @property
+    def __class__(self):
+        return self.tree.kind(self.index)
+
+    def __getattr__(self, name):
+        tree = self.tree
+        index = self.index
+        kind = tree.kinds[index]
+        if name == SCALAR_FIELDS[kind]:
+            return tree.value(index)
+        for field, value in tree.fields(index):
+            if field == name:
+                return self._proxy(value)
+        flags = tree.flags[index]
+        if name == 'postfix' and KINDS[kind] is ast.UnaryOp:
+            return bool(flags & POSTFIX)
+        for marker, flag in MARKERS:
+            # markers that weren't set don't exist, like unset slots
+            if marker == name and flags & flag:
+                return True
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('FlatNode is read-only')
+
+    def __eq__(self, other):
+        return (isinstance(other, FlatNode) and
+                self.tree is other.tree and self.index == other.index)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((id(self.tree), self.index))
+
+    def __repr__(self):
+        return '<FlatNode %s %d>' % (self.__class__.__name__, self.index)
+
+    def _proxy(self, value):
+        if value is None:
+            return None
+        if value.__class__ is list:
+            return [None if item is None else FlatNode(self.tree, item)
+                    for item in value]
+        return FlatNode(self.tree, value)
+
+    def __iter__(self):
+        for _, value in self.tree.fields(self.index):
+            if value.__class__ is list:
+                for item in value:
+                    if item is not None:
+                        yield FlatNode(self.tree, item)
+            elif value is not None:
+                yield FlatNode(self.tree, value)
+
+    def each_child(self, func):
+        for child in self:
+            func(child)
+
+    def children(self):
+        children = []
+        for _, value in self.tree.fields(self.index):
+            value = self._proxy(value)
+            if value.__class__ is list:
+                children.extend(value)
+            else:
+                children.append(value)
+        return children
+
+    def to_ecma(self, out=None):
+        from slimit.visitors.ecmavisitor import ECMAVisitor
+        return ECMAVisitor().visit(self, out)
+
+    def to_node(self):
+        """Build the slimit.ast sub-tree of the node."""
+        return self.tree.node(self.index)
+
+
+def parse(text, parser=None):
+    """Parse the text or TokenBuffer into a FlatTree.
+
+    'parser' is a slimit.parser.Parser with the 'rd' backend. Top
+    level source elements are added to the tree one by one as the
+    parser returns them, the object tree of the whole program is
+    never built.
+    """
+    if parser is None:
+        from slimit.parser import Parser
+        parser = Parser(backend='rd')
+    elif parser.backend != 'rd':
+        raise ValueError('FlatTree parsing needs the rd parser backend')
+    return FlatTree.from_elements(parser.rd_parser.iter_elements(text))
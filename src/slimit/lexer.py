@@ -25,6 +25,10 @@ from  __future__ import print_function
 
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+
 import ply.lex
 
 from slimit.unicode_chars import (
@@ -52,6 +56,145 @@ TOKENS_THAT_IMPLY_DIVISON = frozenset([
     'RBRACKET',
     ])
 
+# insert semicolon before restricted tokens
+# See section 7.9.1 ECMA262
+TOKENS_THAT_PRECEDE_SEMI = frozenset([
+    'BREAK',
+    'CONTINUE',
+    'RETURN',
+    'THROW',
+    ])
+
+# whitespace, line terminators and comments in between tokens
+_skip_match = re.compile(r"""
+(?:
+    [ \t\n\r]+
+  | //[^\r\n]*                        # line comment
+  | /\*[^*]*\*+(?:[^/*][^*]*\*+)*/     # block comment
+)*
+""", re.VERBOSE).match
+_line_terminator_finditer = re.compile(r'\r\n|[\n\r]').finditer
+
+
+def _has_line_terminator(text, start, end):
+    return (text.find('\n', start, end) != -1 or
+            text.find('\r', start, end) != -1)
+
+
+class Token(object):
+    """Lightweight token materialized from a TokenBuffer.
+
+    Has the same attributes and representation as 'ply.lex.LexToken'.
+    """
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer',
+                 'newline_before')
+
+    def __init__(self, type, value, lineno, lexpos, newline_before=False):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+        self.newline_before = newline_before
+
+    def __str__(self):
+        return 'LexToken(%s,%r,%d,%d)' % (
+            self.type, self.value, self.lineno, self.lexpos)
+
+    __repr__ = __str__
+
+
+class TokenBuffer(object):
+    """Compact representation of a token stream.
+
+    Instead of a token object per token the buffer keeps parallel
+    arrays: an integer type code (index into 'types'), start/end
+    offsets into the source text and a flag telling whether a line
+    terminator precedes the token. Token values are sliced from the
+    text on demand.
+
+    >>> from slimit.lexer import Lexer
+    >>> tokens = Lexer().tokenize('a = 1;')
+    >>> len(tokens)
+    4
+    >>> tokens.type(2), tokens.value(2)
+    ('NUMBER', '1')
+    >>> for token in tokens:
+    ...     print(token)
+    ...
+    LexToken(ID,'a',1,0)
+    LexToken(EQ,'=',1,2)
+    LexToken(NUMBER,'1',1,4)
+    LexToken(SEMI,';',1,5)
+
+    A buffer can be passed to 'Parser.parse' instead of a text.
+    """
+    # populated below, after the Lexer class is defined
+    types = ()
+    type_codes = {}
+
+    def __init__(self, text):
+        self.text = text
+        self.codes = array('B')
+        self.starts = array('I')
+        self.ends = array('I')
+        self.newlines = array('B')
+
+    def __len__(self):
+        return len(self.codes)
+
+    def append(self, type_, start, end, newline_before):
+        self.codes.append(self.type_codes[type_])
+        self.starts.append(start)
+        self.ends.append(end)
+        self.newlines.append(newline_before)
+
+    def type(self, index):
+        return self.types[self.codes[index]]
+
+    def value(self, index):
+        value = self.text[self.starts[index]:self.ends[index]]
+        if self.codes[index] == self.type_codes['STRING']:
+            # remove escape + new line sequence used for strings
+            # written across multiple lines of code
+            value = value.replace('\\\n', '')
+        return value
+
+    def token(self, index):
+        return Token(self.type(index), self.value(index), 1,
+                     self.starts[index], bool(self.newlines[index]))
+
+    def __iter__(self):
+        for index in range(len(self.codes)):
+            yield self.token(index)
+
+
+class LineIndex(object):
+    """Map offsets in a text to line and column numbers.
+
+    Offsets of line starts are collected with a single pass over the
+    text the first time a position is requested.
+
+    >>> from slimit.lexer import LineIndex
+    >>> index = LineIndex('a\nbc\r\nd')
+    >>> index.position(0), index.position(3), index.position(6)
+    ((1, 1), (2, 2), (3, 1))
+
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.line_starts = None
+
+    def position(self, offset):
+        """Return (line, column) of the offset, both are 1-based."""
+        if self.line_starts is None:
+            self.line_starts = [0] + [
+                match.end() for match in _line_terminator_finditer(self.text)]
+        lineno = bisect_right(self.line_starts, offset)
+        return lineno, offset - self.line_starts[lineno - 1] + 1
+
+
+
 
 class Lexer(object):
     """A JavaScript lexer.
@@ -89,98 +232,235 @@ class Lexer(object):
     >>> token.type, token.value, token.lineno, token.lexpos
     ('ID', 'a', 1, 0)
 
+    Line terminators are not returned as tokens, instead every token
+    tells whether a line terminator precedes it. Line and column
+    numbers are computed on demand with 'position':
+
+    >>> lexer.input('a\n  b')
+    >>> [(token.value, token.newline_before) for token in lexer]
+    [('a', False), ('b', True)]
+    >>> lexer.position(4)
+    (2, 3)
+
+    The 'backend' argument selects what splits the text into tokens:
+    'ply' (the default) uses the PLY master regular expression and
+    'scanner' uses the hand-written slimit.scanner.Scanner, which is
+    faster and produces the same tokens.
+
     For more information see:
     http://www.ecma-international.org/publications/files/ECMA-ST/ECMA-262.pdf
     """
-    def __init__(self):
+    backends = ('ply', 'scanner')
+
+    def __init__(self, backend='ply'):
+        if backend not in self.backends:
+            raise ValueError('Unknown lexer backend: %r' % backend)
+        self.backend = backend
         self.prev_token = None
         self.cur_token = None
         self.next_tokens = []
+        # set when the input is a TokenBuffer
+        self.buffer = None
+        self.buffer_index = 0
+        # a line terminator has been skipped since the last token
+        self.newline = False
+        self.line_index = LineIndex('')
         self.build()
 
     def build(self, **kwargs):
         """Build the lexer."""
-        self.lexer = ply.lex.lex(object=self, **kwargs)
+        if self.backend == 'scanner':
+            # the scanner module depends on this one
+            from slimit.scanner import Scanner
+            self.lexer = Scanner(self)
+        else:
+            self.lexer = ply.lex.lex(object=self, **kwargs)
+
+    def input(self, text, start=0):
+        """Set the input: either a text or a TokenBuffer.
+
+        Tokens are read from the offset 'start' of the text.
+        """
+        # reset the state left over from a previous input so that
+        # the same lexer instance can be reused for many texts
+        self.prev_token = None
+        self.cur_token = None
+        self.next_tokens = []
+        self.newline = False
+        self.lexer.begin('INITIAL')
+        if isinstance(text, TokenBuffer):
+            self.buffer = text
+            self.buffer_index = bisect_left(text.starts, start)
+            self.line_index = LineIndex(text.text)
+        else:
+            self.buffer = None
+            self.lexer.input(text)
+            self.lexer.lexpos = start
+            self.line_index = LineIndex(text)
+
+    def position(self, lexpos):
+        """Return (line, column) of the offset in the current input."""
+        return self.line_index.position(lexpos)
 
-    def input(self, text):
-        self.lexer.input(text)
+    def tokenize(self, text):
+        """Split the whole text into tokens and return a TokenBuffer.
+
+        Tokens are classified exactly as 'token' would do it, but no
+        token objects are created.
+        """
+        buffer = TokenBuffer(text)
+        append = buffer.append
+        lexer = self.lexer
+        lexer.begin('INITIAL')
+        lexer.input(text)
+        self.line_index = LineIndex(text)
+        if self.backend == 'scanner':
+            scan = lexer.scan
+        else:
+            scan = self._scan_ply_token
+        length = len(text)
+        # type of the last token stored in the buffer
+        prev_type = None
+        while True:
+            start = lexer.lexpos
+            pos = lexer.lexpos = _skip_match(text, start).end()
+            newline = pos != start and _has_line_terminator(text, start, pos)
+            if (pos + 1 < length and text[pos] == '/'
+                and text[pos + 1] not in '/*'
+                and prev_type not in TOKENS_THAT_IMPLY_DIVISON
+                ):
+                lexer.begin('regex')
+                type_ = scan()
+                lexer.begin('INITIAL')
+            else:
+                type_ = scan()
+            if type_ is None:
+                return buffer
+            append(type_, lexer.tokpos, lexer.lexpos, newline)
+            prev_type = type_
+
+    def _scan_ply_token(self):
+        # same as Scanner.scan for the PLY lexer
+        token = self.lexer.token()
+        if token is None:
+            return None
+        self.lexer.tokpos = token.lexpos
+        return token.type
 
     def token(self):
         if self.next_tokens:
             return self.next_tokens.pop()
 
+        if self.buffer is not None:
+            return self._get_buffered_token()
+
         lexer = self.lexer
-        while True:
-            pos = lexer.lexpos
-            try:
-                char = lexer.lexdata[pos]
-                while char in ' \t':
-                    pos += 1
-                    char = lexer.lexdata[pos]
-                next_char = lexer.lexdata[pos + 1]
-            except IndexError:
-                tok = self._get_update_token()
-                if tok is not None and tok.type == 'LINE_TERMINATOR':
-                    continue
-                else:
-                    return tok
-
-            if char != '/' or (char == '/' and next_char in ('/', '*')):
-                tok = self._get_update_token()
-                if tok.type in ('LINE_TERMINATOR',
-                                'LINE_COMMENT', 'BLOCK_COMMENT'):
-                    continue
-                else:
-                    return tok
-
-            # current character is '/' which is either division or regex
-            cur_token = self.cur_token
-            is_division_allowed = (
-                cur_token is not None and
-                cur_token.type in TOKENS_THAT_IMPLY_DIVISON
-                )
-            if is_division_allowed:
-                return self._get_update_token()
-            else:
-                self.prev_token = self.cur_token
-                self.cur_token = self._read_regex()
-                return self.cur_token
+        data = lexer.lexdata
+        # jump over whitespace and comments, a multi-line comment
+        # with a line terminator counts as a line terminator
+        start = lexer.lexpos
+        pos = lexer.lexpos = _skip_match(data, start).end()
+        if pos != start and _has_line_terminator(data, start, pos):
+            self.newline = True
+
+        # an unterminated block comment is left to the lexer
+        if data[pos:pos + 1] != '/' or data[pos + 1:pos + 2] in ('', '*'):
+            return self._get_update_token()
+
+        # current character is '/' which is either division or regex
+        cur_token = self.cur_token
+        is_division_allowed = (
+            cur_token is not None and
+            cur_token.type in TOKENS_THAT_IMPLY_DIVISON
+            )
+        if is_division_allowed:
+            return self._get_update_token()
+        else:
+            return self._update_token(
+                self._mark_newline(self._read_regex()))
+
+    def skip_block(self):
+        """Skip the tokens up to the '}' closing the current block.
+
+        Returns the closing token or None at the end of input.
+        """
+        depth = 1
+        buffer = self.buffer
+        if buffer is not None and not self.next_tokens:
+            # count braces in the buffer without creating tokens
+            lbrace = TokenBuffer.type_codes['LBRACE']
+            rbrace = TokenBuffer.type_codes['RBRACE']
+            codes = buffer.codes
+            for index in range(self.buffer_index, len(codes)):
+                code = codes[index]
+                if code == lbrace:
+                    depth += 1
+                elif code == rbrace:
+                    depth -= 1
+                    if not depth:
+                        self.buffer_index = index + 1
+                        return self._update_token(buffer.token(index))
+            self.buffer_index = len(codes)
+            return self._update_token(None)
+
+        token = self.token()
+        while token is not None:
+            if token.type == 'LBRACE':
+                depth += 1
+            elif token.type == 'RBRACE':
+                depth -= 1
+                if not depth:
+                    return token
+            token = self.token()
+        return None
 
     def auto_semi(self, token):
         if (token is None or token.type == 'RBRACE'
-            or self._is_prev_token_lt()
+            or token.newline_before
             ):
             if token:
                 self.next_tokens.append(token)
             return self._create_semi_token(token)
 
-    def _is_prev_token_lt(self):
-        return self.prev_token and self.prev_token.type == 'LINE_TERMINATOR'
-
     def _read_regex(self):
         self.lexer.begin('regex')
         token = self.lexer.token()
         self.lexer.begin('INITIAL')
         return token
 
+    def _get_buffered_token(self):
+        index = self.buffer_index
+        if index < len(self.buffer):
+            self.buffer_index = index + 1
+            return self._update_token(self.buffer.token(index))
+        return self._update_token(None)
+
     def _get_update_token(self):
+        return self._update_token(self._mark_newline(self.lexer.token()))
+
+    def _mark_newline(self, token):
+        if token is not None:
+            token.newline_before = self.newline
+            self.newline = False
+        return token
+
+    def _update_token(self, token):
         self.prev_token = self.cur_token
-        self.cur_token = self.lexer.token()
-        # insert semicolon before restricted tokens
-        # See section 7.9.1 ECMA262
-        if (self.cur_token is not None
-            and self.cur_token.type == 'LINE_TERMINATOR'
+        self.cur_token = token
+        if (token is not None
+            and token.newline_before
             and self.prev_token is not None
-            and self.prev_token.type in ['BREAK', 'CONTINUE',
-                                         'RETURN', 'THROW']
+            and self.prev_token.type in TOKENS_THAT_PRECEDE_SEMI
             ):
-            return self._create_semi_token(self.cur_token)
-        return self.cur_token
+            self.next_tokens.append(token)
+            return self._create_semi_token(token)
+        return token
 
     def _create_semi_token(self, orig_token):
         token = ply.lex.LexToken()
         token.type = 'SEMI'
         token.value = ';'
+        token.newline_before = False
         if orig_token is not None:
             token.lineno = orig_token.lineno
             token.lexpos = orig_token.lexpos
@@ -286,8 +566,8 @@ class Lexer(object):
 
     def t_regex_error(self, token):
         raise TypeError(
-            "Error parsing regular expression '%s' at %s" % (
-                token.value, token.lineno)
+            "Error parsing regular expression '%s' at %s:%s" % (
+                (token.value,) + self.position(token.lexpos))
             )
 
     # Punctuators
@@ -438,10 +718,13 @@ class Lexer(object):
     def t_error(self, token):
         print(
             'Illegal character %r at %s:%s after %s' % (
-                token.value[0],
-                token.lineno,
-                token.lexpos,
-                self.prev_token
+                (token.value[0],) + self.position(token.lexpos) +
+                (self.prev_token,)
             )
         )
         token.lexer.skip(1)
+
+
+TokenBuffer.types = Lexer.tokens
+TokenBuffer.type_codes = dict(
+    (type_, code) for code, type_ in enumerate(Lexer.tokens))
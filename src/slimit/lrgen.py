@@ -0,0 +1,185 @@
+###############################################################################
+#
+# Copyright (c) 2011 Ruslan Spivak
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+###############################################################################
+"""Integer indexed LR tables for the 'lr' parser backend.
+
+The tables are generated from the PLY tables (yacctab.py) into
+lrtab.py, regenerate it after changing the grammar:
+
+    $ python -c 'from slimit import lrgen; lrgen.main()'
+"""
+
+__author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
+
+import hashlib
+import os
+import pprint
+
+
+def signature_digest(signature):
+    """Return a short digest of a PLY grammar signature."""
+    return hashlib.md5(signature.encode('utf-8')).hexdigest()
+
+
+def is_pass_through(rule):
+    """Return True if the grammar rule only does 'p[0] = p[1]'.
+
+    The rule is called with a marker object as the only value.
+    """
+    marker = object()
+    p = [None, marker]
+    try:
+        rule(p)
+    except Exception:
+        return False
+    return p[0] is marker
+
+
+class LRTables(object):
+    """Action and goto tables indexed by integers.
+
+    Terminals and nonterminals are numbered, 'action[state][terminal]'
+    and 'goto[state][nonterminal]' are plain lists. An action is
+    encoded the same way as in PLY: a positive number is a shift to
+    that state, a negative one is a reduction by that production,
+    0 means accept and None is a syntax error.
+
+    'productions' holds a (nonterminal, length, function name) tuple
+    per production. The function name is None for pass-through
+    productions 'a : b' whose value is the value of 'b', the driver
+    doesn't call their rules. 'signature' is the digest of the PLY signature
+    of the grammar the tables were made from.
+    """
+
+    def __init__(self, signature, terminals, nonterminals, productions,
+                 actions, gotos, defaulted_states):
+        self.signature = signature
+        self.terminals = terminals
+        self.nonterminals = nonterminals
+        self.productions = productions
+        self.terminal_index = dict(
+            (name, index) for index, name in enumerate(terminals))
+        self.end = self.terminal_index['$end']
+        self.semi = self.terminal_index['SEMI']
+
+        # expand the sparse rows into lists
+        self.action = []
+        for row in actions:
+            dense = [None] * len(terminals)
+            for terminal, action in row.items():
+                dense[terminal] = action
+            self.action.append(dense)
+        self.goto = []
+        for row in gotos:
+            dense = [None] * len(nonterminals)
+            for nonterminal, state in row.items():
+                dense[nonterminal] = state
+            self.goto.append(dense)
+        self.defaulted_states = [
+            defaulted_states.get(state) for state in range(len(actions))]
+
+    @classmethod
+    def from_module(cls, module):
+        """Load the tables written by 'write_tables'."""
+        return cls(module.signature, module.terminals, module.nonterminals,
+                   module.productions, module.actions, module.gotos,
+                   module.defaulted_states)
+
+    @classmethod
+    def from_parser(cls, lrparser, tokens, signature=None):
+        """Make the tables from a ply.yacc.LRParser.
+
+        'tokens' are all token types the lexer can return.
+        """
+        terminals = ('$end',) + tuple(sorted(tokens))
+        terminal_index = dict(
+            (name, index) for index, name in enumerate(terminals))
+        nonterminals = tuple(sorted(
+            set(prod.name for prod in lrparser.productions)))
+        nonterminal_index = dict(
+            (name, index) for index, name in enumerate(nonterminals))
+        productions = tuple(
+            (nonterminal_index[prod.name], prod.len,
+             None if prod.len == 1 and is_pass_through(prod.callable)
+             else prod.func)
+            for prod in lrparser.productions)
+        states = range(len(lrparser.action))
+        actions = tuple(
+            dict((terminal_index[name], action)
+                 for name, action in lrparser.action[state].items())
+            for state in states)
+        gotos = tuple(
+            dict((nonterminal_index[name], target)
+                 for name, target in lrparser.goto.get(state, {}).items())
+            for state in states)
+        return cls(signature, terminals, nonterminals, productions,
+                   actions, gotos, dict(lrparser.defaulted_states))
+
+    def write_tables(self, filename):
+        """Write the tables as a Python module."""
+        def sparse(rows):
+            return tuple(
+                dict((index, value) for index, value in enumerate(row)
+                     if value is not None)
+                for row in rows)
+
+        defaulted_states = dict(
+            (state, action)
+            for state, action in enumerate(self.defaulted_states)
+            if action is not None)
+        with open(filename, 'w') as fout:
+            fout.write('# lrtab.py\n'
+                       '# This file is automatically generated by '
+                       'slimit.lrgen. Do not edit.\n')
+            for name, value in [
+                ('signature', self.signature),
+                ('terminals', self.terminals),
+                ('nonterminals', self.nonterminals),
+                ('defaulted_states', defaulted_states),
+                ]:
+                fout.write('\n%s = %s\n' % (name, pprint.pformat(value)))
+            # one row per line
+            for name, rows in [
+                ('productions', self.productions),
+                ('actions', sparse(self.action)),
+                ('gotos', sparse(self.goto)),
+                ]:
+                fout.write('\n%s = (\n' % name)
+                for row in rows:
+                    fout.write('    %r,\n' % (row,))
+                fout.write(')\n')
+
+def main():
+    from slimit import yacctab
+    from slimit.parser import Parser
+
+    parser = Parser()
+    tables = LRTables.from_parser(
+        parser.parser, parser.tokens,
+        signature_digest(yacctab._lr_signature))
+    tables.write_tables(
+        os.path.join(os.path.dirname(__file__), 'lrtab.py'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,1583 @@
+# lrtab.py
+# This file is automatically generated by slimit.lrgen. Do not edit.
+
+signature = 'eb4ca5ee075534b54aaf800e0a726294'
+
+terminals = ('$end',
+ 'AND',
+ 'ANDEQUAL',
+ 'BAND',
+ 'BLOCK_COMMENT',
+ 'BNOT',
+ 'BOR',
+ 'BREAK',
+ 'BXOR',
+ 'CASE',
+ 'CATCH',
+ 'CLASS',
+ 'COLON',
+ 'COMMA',
+ 'CONDOP',
+ 'CONST',
+ 'CONTINUE',
+ 'DEBUGGER',
+ 'DEFAULT',
+ 'DELETE',
+ 'DIV',
+ 'DIVEQUAL',
+ 'DO',
+ 'ELSE',
+ 'ENUM',
+ 'EQ',
+ 'EQEQ',
+ 'EXPORT',
+ 'EXTENDS',
+ 'FALSE',
+ 'FINALLY',
+ 'FOR',
+ 'FUNCTION',
+ 'GE',
+ 'GETPROP',
+ 'GT',
+ 'ID',
+ 'IF',
+ 'IMPORT',
+ 'IN',
+ 'INSTANCEOF',
+ 'LBRACE',
+ 'LBRACKET',
+ 'LE',
+ 'LINE_COMMENT',
+ 'LINE_TERMINATOR',
+ 'LPAREN',
+ 'LSHIFT',
+ 'LSHIFTEQUAL',
+ 'LT',
+ 'MINUS',
+ 'MINUSEQUAL',
+ 'MINUSMINUS',
+ 'MOD',
+ 'MODEQUAL',
+ 'MULT',
+ 'MULTEQUAL',
+ 'NE',
+ 'NEW',
+ 'NOT',
+ 'NULL',
+ 'NUMBER',
+ 'OR',
+ 'OREQUAL',
+ 'PERIOD',
+ 'PLUS',
+ 'PLUSEQUAL',
+ 'PLUSPLUS',
+ 'RBRACE',
+ 'RBRACKET',
+ 'REGEX',
+ 'RETURN',
+ 'RPAREN',
+ 'RSHIFT',
+ 'RSHIFTEQUAL',
+ 'SEMI',
+ 'SETPROP',
+ 'STREQ',
+ 'STRING',
+ 'STRNEQ',
+ 'SUPER',
+ 'SWITCH',
+ 'THIS',
+ 'THROW',
+ 'TRUE',
+ 'TRY',
+ 'TYPEOF',
+ 'URSHIFT',
+ 'URSHIFTEQUAL',
+ 'VAR',
+ 'VOID',
+ 'WHILE',
+ 'WITH',
+ 'XOREQUAL')
+
+nonterminals = ("S'",
+ 'additive_expr',
+ 'additive_expr_nobf',
+ 'argument_list',
+ 'arguments',
+ 'array_literal',
+ 'assignment_expr',
+ 'assignment_expr_nobf',
+ 'assignment_expr_noin',
+ 'assignment_operator',
+ 'bitwise_and_expr',
+ 'bitwise_and_expr_nobf',
+ 'bitwise_and_expr_noin',
+ 'bitwise_or_expr',
+ 'bitwise_or_expr_nobf',
+ 'bitwise_or_expr_noin',
+ 'bitwise_xor_expr',
+ 'bitwise_xor_expr_nobf',
+ 'bitwise_xor_expr_noin',
+ 'block',
+ 'boolean_literal',
+ 'break_statement',
+ 'call_expr',
+ 'call_expr_nobf',
+ 'case_block',
+ 'case_clause',
+ 'case_clauses',
+ 'case_clauses_opt',
+ 'catch',
+ 'conditional_expr',
+ 'conditional_expr_nobf',
+ 'conditional_expr_noin',
+ 'continue_statement',
+ 'debugger_statement',
+ 'default_clause',
+ 'element_list',
+ 'elision',
+ 'elision_opt',
+ 'empty',
+ 'empty_statement',
+ 'equality_expr',
+ 'equality_expr_nobf',
+ 'equality_expr_noin',
+ 'expr',
+ 'expr_nobf',
+ 'expr_noin',
+ 'expr_noin_opt',
+ 'expr_opt',
+ 'expr_statement',
+ 'finally',
+ 'formal_parameter_list',
+ 'function_body',
+ 'function_declaration',
+ 'function_expr',
+ 'identifier',
+ 'if_statement',
+ 'initializer',
+ 'initializer_noin',
+ 'iteration_statement',
+ 'labelled_statement',
+ 'left_hand_side_expr',
+ 'left_hand_side_expr_nobf',
+ 'literal',
+ 'logical_and_expr',
+ 'logical_and_expr_nobf',
+ 'logical_and_expr_noin',
+ 'logical_or_expr',
+ 'logical_or_expr_nobf',
+ 'logical_or_expr_noin',
+ 'member_expr',
+ 'member_expr_nobf',
+ 'multiplicative_expr',
+ 'multiplicative_expr_nobf',
+ 'new_expr',
+ 'new_expr_nobf',
+ 'null_literal',
+ 'numeric_literal',
+ 'object_literal',
+ 'postfix_expr',
+ 'postfix_expr_nobf',
+ 'primary_expr',
+ 'primary_expr_no_brace',
+ 'program',
+ 'property_assignment',
+ 'property_list',
+ 'property_name',
+ 'regex_literal',
+ 'relational_expr',
+ 'relational_expr_nobf',
+ 'relational_expr_noin',
+ 'return_statement',
+ 'shift_expr',
+ 'shift_expr_nobf',
+ 'source_element',
+ 'source_element_list',
+ 'source_elements',
+ 'statement',
+ 'string_literal',
+ 'switch_statement',
+ 'throw_statement',
+ 'try_statement',
+ 'unary_expr',
+ 'unary_expr_common',
+ 'unary_expr_nobf',
+ 'variable_declaration',
+ 'variable_declaration_list',
+ 'variable_declaration_list_noin',
+ 'variable_declaration_noin',
+ 'variable_statement',
+ 'with_statement')
+
+defaulted_states = {2: -2, 270: -255, 414: -289}
+
+productions = (
+    (0, 1, None),
+    (38, 0, 'p_empty'),
+    (82, 1, 'p_program'),
+    (95, 1, None),
+    (95, 1, None),
+    (94, 1, 'p_source_element_list'),
+    (94, 2, 'p_source_element_list'),
+    (93, 1, None),
+    (93, 1, None),
+    (96, 1, None),
+    (96, 1, None),
+    (96, 1, None),
+    (96, 1, None),
+    (96, 1, None),
+    (96, 1, None),
+    (96, 1, None),
+    (96, 1, None),
+    (96, 1, None),
+    (96, 1, None),
+    (96, 1, None),
+    (96, 1, None),
+    (96, 1, None),
+    (96, 1, None),
+    (96, 1, None),
+    (96, 1, None),
+    (19, 3, 'p_block'),
+    (62, 1, None),
+    (62, 1, None),
+    (62, 1, None),
+    (62, 1, None),
+    (62, 1, None),
+    (20, 1, 'p_boolean_literal'),
+    (20, 1, 'p_boolean_literal'),
+    (75, 1, 'p_null_literal'),
+    (76, 1, 'p_numeric_literal'),
+    (97, 1, 'p_string_literal'),
+    (86, 1, 'p_regex_literal'),
+    (54, 1, 'p_identifier'),
+    (80, 1, None),
+    (80, 1, None),
+    (81, 1, 'p_primary_expr_no_brace_1'),
+    (81, 1, 'p_primary_expr_no_brace_2'),
+    (81, 1, None),
+    (81, 1, None),
+    (81, 3, 'p_primary_expr_no_brace_4'),
+    (5, 3, 'p_array_literal_1'),
+    (5, 3, 'p_array_literal_2'),
+    (5, 5, 'p_array_literal_2'),
+    (35, 2, 'p_element_list'),
+    (35, 4, 'p_element_list'),
+    (37, 1, 'p_elision_opt_1'),
+    (37, 1, None),
+    (36, 1, 'p_elision'),
+    (36, 2, 'p_elision'),
+    (77, 2, 'p_object_literal'),
+    (77, 3, 'p_object_literal'),
+    (77, 4, 'p_object_literal'),
+    (84, 1, 'p_property_list'),
+    (84, 3, 'p_property_list'),
+    (83, 3, 'p_property_assignment'),
+    (83, 7, 'p_property_assignment'),
+    (83, 8, 'p_property_assignment'),
+    (85, 1, None),
+    (85, 1, None),
+    (85, 1, None),
+    (69, 1, None),
+    (69, 1, None),
+    (69, 4, 'p_member_expr'),
+    (69, 3, 'p_member_expr'),
+    (69, 3, 'p_member_expr'),
+    (70, 1, None),
+    (70, 1, None),
+    (70, 4, 'p_member_expr_nobf'),
+    (70, 3, 'p_member_expr_nobf'),
+    (70, 3, 'p_member_expr_nobf'),
+    (73, 1, None),
+    (73, 2, 'p_new_expr'),
+    (74, 1, None),
+    (74, 2, 'p_new_expr_nobf'),
+    (22, 2, 'p_call_expr'),
+    (22, 2, 'p_call_expr'),
+    (22, 4, 'p_call_expr'),
+    (22, 3, 'p_call_expr'),
+    (23, 2, 'p_call_expr_nobf'),
+    (23, 2, 'p_call_expr_nobf'),
+    (23, 4, 'p_call_expr_nobf'),
+    (23, 3, 'p_call_expr_nobf'),
+    (4, 2, 'p_arguments'),
+    (4, 3, 'p_arguments'),
+    (3, 1, 'p_argument_list'),
+    (3, 3, 'p_argument_list'),
+    (60, 1, None),
+    (60, 1, None),
+    (61, 1, None),
+    (61, 1, None),
+    (78, 1, None),
+    (78, 2, 'p_postfix_expr'),
+    (78, 2, 'p_postfix_expr'),
+    (79, 1, None),
+    (79, 2, 'p_postfix_expr_nobf'),
+    (79, 2, 'p_postfix_expr_nobf'),
+    (101, 1, None),
+    (101, 1, None),
+    (103, 1, None),
+    (103, 1, None),
+    (102, 2, 'p_unary_expr_common'),
+    (102, 2, 'p_unary_expr_common'),
+    (102, 2, 'p_unary_expr_common'),
+    (102, 2, 'p_unary_expr_common'),
+    (102, 2, 'p_unary_expr_common'),
+    (102, 2, 'p_unary_expr_common'),
+    (102, 2, 'p_unary_expr_common'),
+    (102, 2, 'p_unary_expr_common'),
+    (102, 2, 'p_unary_expr_common'),
+    (71, 1, None),
+    (71, 3, 'p_multiplicative_expr'),
+    (71, 3, 'p_multiplicative_expr'),
+    (71, 3, 'p_multiplicative_expr'),
+    (72, 1, None),
+    (72, 3, 'p_multiplicative_expr_nobf'),
+    (72, 3, 'p_multiplicative_expr_nobf'),
+    (72, 3, 'p_multiplicative_expr_nobf'),
+    (1, 1, None),
+    (1, 3, 'p_additive_expr'),
+    (1, 3, 'p_additive_expr'),
+    (2, 1, None),
+    (2, 3, 'p_additive_expr_nobf'),
+    (2, 3, 'p_additive_expr_nobf'),
+    (91, 1, None),
+    (91, 3, 'p_shift_expr'),
+    (91, 3, 'p_shift_expr'),
+    (91, 3, 'p_shift_expr'),
+    (92, 1, None),
+    (92, 3, 'p_shift_expr_nobf'),
+    (92, 3, 'p_shift_expr_nobf'),
+    (92, 3, 'p_shift_expr_nobf'),
+    (87, 1, None),
+    (87, 3, 'p_relational_expr'),
+    (87, 3, 'p_relational_expr'),
+    (87, 3, 'p_relational_expr'),
+    (87, 3, 'p_relational_expr'),
+    (87, 3, 'p_relational_expr'),
+    (87, 3, 'p_relational_expr'),
+    (89, 1, None),
+    (89, 3, 'p_relational_expr_noin'),
+    (89, 3, 'p_relational_expr_noin'),
+    (89, 3, 'p_relational_expr_noin'),
+    (89, 3, 'p_relational_expr_noin'),
+    (89, 3, 'p_relational_expr_noin'),
+    (88, 1, None),
+    (88, 3, 'p_relational_expr_nobf'),
+    (88, 3, 'p_relational_expr_nobf'),
+    (88, 3, 'p_relational_expr_nobf'),
+    (88, 3, 'p_relational_expr_nobf'),
+    (88, 3, 'p_relational_expr_nobf'),
+    (88, 3, 'p_relational_expr_nobf'),
+    (40, 1, None),
+    (40, 3, 'p_equality_expr'),
+    (40, 3, 'p_equality_expr'),
+    (40, 3, 'p_equality_expr'),
+    (40, 3, 'p_equality_expr'),
+    (42, 1, None),
+    (42, 3, 'p_equality_expr_noin'),
+    (42, 3, 'p_equality_expr_noin'),
+    (42, 3, 'p_equality_expr_noin'),
+    (42, 3, 'p_equality_expr_noin'),
+    (41, 1, None),
+    (41, 3, 'p_equality_expr_nobf'),
+    (41, 3, 'p_equality_expr_nobf'),
+    (41, 3, 'p_equality_expr_nobf'),
+    (41, 3, 'p_equality_expr_nobf'),
+    (10, 1, None),
+    (10, 3, 'p_bitwise_and_expr'),
+    (12, 1, None),
+    (12, 3, 'p_bitwise_and_expr_noin'),
+    (11, 1, None),
+    (11, 3, 'p_bitwise_and_expr_nobf'),
+    (16, 1, None),
+    (16, 3, 'p_bitwise_xor_expr'),
+    (18, 1, None),
+    (18, 3, 'p_bitwise_xor_expr_noin'),
+    (17, 1, None),
+    (17, 3, 'p_bitwise_xor_expr_nobf'),
+    (13, 1, None),
+    (13, 3, 'p_bitwise_or_expr'),
+    (15, 1, None),
+    (15, 3, 'p_bitwise_or_expr_noin'),
+    (14, 1, None),
+    (14, 3, 'p_bitwise_or_expr_nobf'),
+    (63, 1, None),
+    (63, 3, 'p_logical_and_expr'),
+    (65, 1, None),
+    (65, 3, 'p_logical_and_expr_noin'),
+    (64, 1, None),
+    (64, 3, 'p_logical_and_expr_nobf'),
+    (66, 1, None),
+    (66, 3, 'p_logical_or_expr'),
+    (68, 1, None),
+    (68, 3, 'p_logical_or_expr_noin'),
+    (67, 1, None),
+    (67, 3, 'p_logical_or_expr_nobf'),
+    (29, 1, None),
+    (29, 5, 'p_conditional_expr'),
+    (31, 1, None),
+    (31, 5, 'p_conditional_expr_noin'),
+    (30, 1, None),
+    (30, 5, 'p_conditional_expr_nobf'),
+    (6, 1, None),
+    (6, 3, 'p_assignment_expr'),
+    (8, 1, None),
+    (8, 3, 'p_assignment_expr_noin'),
+    (7, 1, None),
+    (7, 3, 'p_assignment_expr_nobf'),
+    (9, 1, None),
+    (9, 1, None),
+    (9, 1, None),
+    (9, 1, None),
+    (9, 1, None),
+    (9, 1, None),
+    (9, 1, None),
+    (9, 1, None),
+    (9, 1, None),
+    (9, 1, None),
+    (9, 1, None),
+    (9, 1, None),
+    (43, 1, None),
+    (43, 3, 'p_expr'),
+    (45, 1, None),
+    (45, 3, 'p_expr_noin'),
+    (44, 1, None),
+    (44, 3, 'p_expr_nobf'),
+    (108, 3, 'p_variable_statement'),
+    (105, 1, 'p_variable_declaration_list'),
+    (105, 3, 'p_variable_declaration_list'),
+    (106, 1, 'p_variable_declaration_list_noin'),
+    (106, 3, 'p_variable_declaration_list_noin'),
+    (104, 1, 'p_variable_declaration'),
+    (104, 2, 'p_variable_declaration'),
+    (107, 1, 'p_variable_declaration_noin'),
+    (107, 2, 'p_variable_declaration_noin'),
+    (56, 2, 'p_initializer'),
+    (57, 2, 'p_initializer_noin'),
+    (39, 1, 'p_empty_statement'),
+    (48, 2, 'p_expr_statement'),
+    (55, 5, 'p_if_statement_1'),
+    (55, 7, 'p_if_statement_2'),
+    (58, 7, 'p_iteration_statement_1'),
+    (58, 5, 'p_iteration_statement_2'),
+    (58, 9, 'p_iteration_statement_3'),
+    (58, 10, 'p_iteration_statement_3'),
+    (58, 7, 'p_iteration_statement_4'),
+    (58, 8, 'p_iteration_statement_5'),
+    (58, 9, 'p_iteration_statement_6'),
+    (47, 1, None),
+    (47, 1, None),
+    (46, 1, None),
+    (46, 1, None),
+    (32, 2, 'p_continue_statement_1'),
+    (32, 3, 'p_continue_statement_2'),
+    (21, 2, 'p_break_statement_1'),
+    (21, 3, 'p_break_statement_2'),
+    (90, 2, 'p_return_statement_1'),
+    (90, 3, 'p_return_statement_2'),
+    (109, 5, 'p_with_statement'),
+    (98, 5, 'p_switch_statement'),
+    (24, 3, 'p_case_block'),
+    (24, 5, 'p_case_block'),
+    (27, 1, None),
+    (27, 1, None),
+    (26, 1, 'p_case_clauses'),
+    (26, 2, 'p_case_clauses'),
+    (25, 4, 'p_case_clause'),
+    (34, 3, 'p_default_clause'),
+    (59, 3, 'p_labelled_statement'),
+    (99, 3, 'p_throw_statement'),
+    (100, 3, 'p_try_statement_1'),
+    (100, 3, 'p_try_statement_2'),
+    (100, 4, 'p_try_statement_3'),
+    (28, 5, 'p_catch'),
+    (49, 2, 'p_finally'),
+    (33, 2, 'p_debugger_statement'),
+    (52, 7, 'p_function_declaration'),
+    (52, 8, 'p_function_declaration'),
+    (53, 6, 'p_function_expr_1'),
+    (53, 7, 'p_function_expr_1'),
+    (53, 7, 'p_function_expr_2'),
+    (53, 8, 'p_function_expr_2'),
+    (50, 1, 'p_formal_parameter_list'),
+    (50, 3, 'p_formal_parameter_list'),
+    (51, 1, None),
+)
+
+actions = (
+    {0: -1, 5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {0: 0},
+    {0: -2},
+    {0: -3, 9: -3, 18: -3, 68: -3},
+    {0: -4, 5: 87, 7: 35, 9: -4, 16: 34, 17: 41, 18: -4, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 68: -4, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {0: -5, 5: -5, 7: -5, 9: -5, 16: -5, 17: -5, 18: -5, 19: -5, 22: -5, 29: -5, 31: -5, 32: -5, 36: -5, 37: -5, 41: -5, 42: -5, 46: -5, 50: -5, 52: -5, 58: -5, 59: -5, 60: -5, 61: -5, 65: -5, 67: -5, 68: -5, 70: -5, 71: -5, 75: -5, 78: -5, 81: -5, 82: -5, 83: -5, 84: -5, 85: -5, 86: -5, 89: -5, 90: -5, 91: -5, 92: -5},
+    {0: -7, 5: -7, 7: -7, 9: -7, 16: -7, 17: -7, 18: -7, 19: -7, 22: -7, 29: -7, 31: -7, 32: -7, 36: -7, 37: -7, 41: -7, 42: -7, 46: -7, 50: -7, 52: -7, 58: -7, 59: -7, 60: -7, 61: -7, 65: -7, 67: -7, 68: -7, 70: -7, 71: -7, 75: -7, 78: -7, 81: -7, 82: -7, 83: -7, 84: -7, 85: -7, 86: -7, 89: -7, 90: -7, 91: -7, 92: -7},
+    {0: -8, 5: -8, 7: -8, 9: -8, 16: -8, 17: -8, 18: -8, 19: -8, 22: -8, 29: -8, 31: -8, 32: -8, 36: -8, 37: -8, 41: -8, 42: -8, 46: -8, 50: -8, 52: -8, 58: -8, 59: -8, 60: -8, 61: -8, 65: -8, 67: -8, 68: -8, 70: -8, 71: -8, 75: -8, 78: -8, 81: -8, 82: -8, 83: -8, 84: -8, 85: -8, 86: -8, 89: -8, 90: -8, 91: -8, 92: -8},
+    {0: -9, 5: -9, 7: -9, 9: -9, 16: -9, 17: -9, 18: -9, 19: -9, 22: -9, 23: -9, 29: -9, 31: -9, 32: -9, 36: -9, 37: -9, 41: -9, 42: -9, 46: -9, 50: -9, 52: -9, 58: -9, 59: -9, 60: -9, 61: -9, 65: -9, 67: -9, 68: -9, 70: -9, 71: -9, 75: -9, 78: -9, 81: -9, 82: -9, 83: -9, 84: -9, 85: -9, 86: -9, 89: -9, 90: -9, 91: -9, 92: -9},
+    {0: -10, 5: -10, 7: -10, 9: -10, 16: -10, 17: -10, 18: -10, 19: -10, 22: -10, 23: -10, 29: -10, 31: -10, 32: -10, 36: -10, 37: -10, 41: -10, 42: -10, 46: -10, 50: -10, 52: -10, 58: -10, 59: -10, 60: -10, 61: -10, 65: -10, 67: -10, 68: -10, 70: -10, 71: -10, 75: -10, 78: -10, 81: -10, 82: -10, 83: -10, 84: -10, 85: -10, 86: -10, 89: -10, 90: -10, 91: -10, 92: -10},
+    {0: -11, 5: -11, 7: -11, 9: -11, 16: -11, 17: -11, 18: -11, 19: -11, 22: -11, 23: -11, 29: -11, 31: -11, 32: -11, 36: -11, 37: -11, 41: -11, 42: -11, 46: -11, 50: -11, 52: -11, 58: -11, 59: -11, 60: -11, 61: -11, 65: -11, 67: -11, 68: -11, 70: -11, 71: -11, 75: -11, 78: -11, 81: -11, 82: -11, 83: -11, 84: -11, 85: -11, 86: -11, 89: -11, 90: -11, 91: -11, 92: -11},
+    {0: -12, 5: -12, 7: -12, 9: -12, 16: -12, 17: -12, 18: -12, 19: -12, 22: -12, 23: -12, 29: -12, 31: -12, 32: -12, 36: -12, 37: -12, 41: -12, 42: -12, 46: -12, 50: -12, 52: -12, 58: -12, 59: -12, 60: -12, 61: -12, 65: -12, 67: -12, 68: -12, 70: -12, 71: -12, 75: -12, 78: -12, 81: -12, 82: -12, 83: -12, 84: -12, 85: -12, 86: -12, 89: -12, 90: -12, 91: -12, 92: -12},
+    {0: -13, 5: -13, 7: -13, 9: -13, 16: -13, 17: -13, 18: -13, 19: -13, 22: -13, 23: -13, 29: -13, 31: -13, 32: -13, 36: -13, 37: -13, 41: -13, 42: -13, 46: -13, 50: -13, 52: -13, 58: -13, 59: -13, 60: -13, 61: -13, 65: -13, 67: -13, 68: -13, 70: -13, 71: -13, 75: -13, 78: -13, 81: -13, 82: -13, 83: -13, 84: -13, 85: -13, 86: -13, 89: -13, 90: -13, 91: -13, 92: -13},
+    {0: -14, 5: -14, 7: -14, 9: -14, 16: -14, 17: -14, 18: -14, 19: -14, 22: -14, 23: -14, 29: -14, 31: -14, 32: -14, 36: -14, 37: -14, 41: -14, 42: -14, 46: -14, 50: -14, 52: -14, 58: -14, 59: -14, 60: -14, 61: -14, 65: -14, 67: -14, 68: -14, 70: -14, 71: -14, 75: -14, 78: -14, 81: -14, 82: -14, 83: -14, 84: -14, 85: -14, 86: -14, 89: -14, 90: -14, 91: -14, 92: -14},
+    {0: -15, 5: -15, 7: -15, 9: -15, 16: -15, 17: -15, 18: -15, 19: -15, 22: -15, 23: -15, 29: -15, 31: -15, 32: -15, 36: -15, 37: -15, 41: -15, 42: -15, 46: -15, 50: -15, 52: -15, 58: -15, 59: -15, 60: -15, 61: -15, 65: -15, 67: -15, 68: -15, 70: -15, 71: -15, 75: -15, 78: -15, 81: -15, 82: -15, 83: -15, 84: -15, 85: -15, 86: -15, 89: -15, 90: -15, 91: -15, 92: -15},
+    {0: -16, 5: -16, 7: -16, 9: -16, 16: -16, 17: -16, 18: -16, 19: -16, 22: -16, 23: -16, 29: -16, 31: -16, 32: -16, 36: -16, 37: -16, 41: -16, 42: -16, 46: -16, 50: -16, 52: -16, 58: -16, 59: -16, 60: -16, 61: -16, 65: -16, 67: -16, 68: -16, 70: -16, 71: -16, 75: -16, 78: -16, 81: -16, 82: -16, 83: -16, 84: -16, 85: -16, 86: -16, 89: -16, 90: -16, 91: -16, 92: -16},
+    {0: -17, 5: -17, 7: -17, 9: -17, 16: -17, 17: -17, 18: -17, 19: -17, 22: -17, 23: -17, 29: -17, 31: -17, 32: -17, 36: -17, 37: -17, 41: -17, 42: -17, 46: -17, 50: -17, 52: -17, 58: -17, 59: -17, 60: -17, 61: -17, 65: -17, 67: -17, 68: -17, 70: -17, 71: -17, 75: -17, 78: -17, 81: -17, 82: -17, 83: -17, 84: -17, 85: -17, 86: -17, 89: -17, 90: -17, 91: -17, 92: -17},
+    {0: -18, 5: -18, 7: -18, 9: -18, 16: -18, 17: -18, 18: -18, 19: -18, 22: -18, 23: -18, 29: -18, 31: -18, 32: -18, 36: -18, 37: -18, 41: -18, 42: -18, 46: -18, 50: -18, 52: -18, 58: -18, 59: -18, 60: -18, 61: -18, 65: -18, 67: -18, 68: -18, 70: -18, 71: -18, 75: -18, 78: -18, 81: -18, 82: -18, 83: -18, 84: -18, 85: -18, 86: -18, 89: -18, 90: -18, 91: -18, 92: -18},
+    {0: -19, 5: -19, 7: -19, 9: -19, 16: -19, 17: -19, 18: -19, 19: -19, 22: -19, 23: -19, 29: -19, 31: -19, 32: -19, 36: -19, 37: -19, 41: -19, 42: -19, 46: -19, 50: -19, 52: -19, 58: -19, 59: -19, 60: -19, 61: -19, 65: -19, 67: -19, 68: -19, 70: -19, 71: -19, 75: -19, 78: -19, 81: -19, 82: -19, 83: -19, 84: -19, 85: -19, 86: -19, 89: -19, 90: -19, 91: -19, 92: -19},
+    {0: -20, 5: -20, 7: -20, 9: -20, 16: -20, 17: -20, 18: -20, 19: -20, 22: -20, 23: -20, 29: -20, 31: -20, 32: -20, 36: -20, 37: -20, 41: -20, 42: -20, 46: -20, 50: -20, 52: -20, 58: -20, 59: -20, 60: -20, 61: -20, 65: -20, 67: -20, 68: -20, 70: -20, 71: -20, 75: -20, 78: -20, 81: -20, 82: -20, 83: -20, 84: -20, 85: -20, 86: -20, 89: -20, 90: -20, 91: -20, 92: -20},
+    {0: -21, 5: -21, 7: -21, 9: -21, 16: -21, 17: -21, 18: -21, 19: -21, 22: -21, 23: -21, 29: -21, 31: -21, 32: -21, 36: -21, 37: -21, 41: -21, 42: -21, 46: -21, 50: -21, 52: -21, 58: -21, 59: -21, 60: -21, 61: -21, 65: -21, 67: -21, 68: -21, 70: -21, 71: -21, 75: -21, 78: -21, 81: -21, 82: -21, 83: -21, 84: -21, 85: -21, 86: -21, 89: -21, 90: -21, 91: -21, 92: -21},
+    {0: -22, 5: -22, 7: -22, 9: -22, 16: -22, 17: -22, 18: -22, 19: -22, 22: -22, 23: -22, 29: -22, 31: -22, 32: -22, 36: -22, 37: -22, 41: -22, 42: -22, 46: -22, 50: -22, 52: -22, 58: -22, 59: -22, 60: -22, 61: -22, 65: -22, 67: -22, 68: -22, 70: -22, 71: -22, 75: -22, 78: -22, 81: -22, 82: -22, 83: -22, 84: -22, 85: -22, 86: -22, 89: -22, 90: -22, 91: -22, 92: -22},
+    {0: -23, 5: -23, 7: -23, 9: -23, 16: -23, 17: -23, 18: -23, 19: -23, 22: -23, 23: -23, 29: -23, 31: -23, 32: -23, 36: -23, 37: -23, 41: -23, 42: -23, 46: -23, 50: -23, 52: -23, 58: -23, 59: -23, 60: -23, 61: -23, 65: -23, 67: -23, 68: -23, 70: -23, 71: -23, 75: -23, 78: -23, 81: -23, 82: -23, 83: -23, 84: -23, 85: -23, 86: -23, 89: -23, 90: -23, 91: -23, 92: -23},
+    {36: 43, 46: 91},
+    {1: -40, 2: -40, 3: -40, 6: -40, 8: -40, 12: 92, 13: -40, 14: -40, 20: -40, 21: -40, 25: -40, 26: -40, 33: -40, 35: -40, 39: -40, 40: -40, 42: -40, 43: -40, 46: -40, 47: -40, 48: -40, 49: -40, 50: -40, 51: -40, 52: -40, 53: -40, 54: -40, 55: -40, 56: -40, 57: -40, 62: -40, 63: -40, 64: -40, 65: -40, 66: -40, 67: -40, 73: -40, 74: -40, 75: -40, 77: -40, 79: -40, 87: -40, 88: -40, 93: -40},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 68: -1, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {36: 43},
+    {0: -242, 5: -242, 7: -242, 9: -242, 16: -242, 17: -242, 18: -242, 19: -242, 22: -242, 23: -242, 29: -242, 31: -242, 32: -242, 36: -242, 37: -242, 41: -242, 42: -242, 46: -242, 50: -242, 52: -242, 58: -242, 59: -242, 60: -242, 61: -242, 65: -242, 67: -242, 68: -242, 70: -242, 71: -242, 75: -242, 78: -242, 81: -242, 82: -242, 83: -242, 84: -242, 85: -242, 86: -242, 89: -242, 90: -242, 91: -242, 92: -242},
+    {13: 126, 75: 125},
+    {46: 127},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {46: 130},
+    {46: 131},
+    {36: 43, 75: 132},
+    {36: 43, 75: 134},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 75: 136, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {46: 138},
+    {46: 139},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {41: 26},
+    {75: 142},
+    {13: -229, 75: -229},
+    {1: -37, 2: -37, 3: -37, 6: -37, 8: -37, 12: -37, 13: -37, 14: -37, 20: -37, 21: -37, 25: -37, 26: -37, 33: -37, 35: -37, 39: -37, 40: -37, 42: -37, 43: -37, 46: -37, 47: -37, 48: -37, 49: -37, 50: -37, 51: -37, 52: -37, 53: -37, 54: -37, 55: -37, 56: -37, 57: -37, 62: -37, 63: -37, 64: -37, 65: -37, 66: -37, 67: -37, 68: -37, 69: -37, 72: -37, 73: -37, 74: -37, 75: -37, 77: -37, 79: -37, 87: -37, 88: -37, 93: -37},
+    {13: -211, 75: -211},
+    {1: -98, 2: 155, 3: -98, 6: -98, 8: -98, 13: -98, 14: -98, 20: -98, 21: 148, 25: 146, 26: -98, 33: -98, 35: -98, 39: -98, 40: -98, 43: -98, 47: -98, 48: 152, 49: -98, 50: -98, 51: 151, 52: 145, 53: -98, 54: 149, 55: -98, 56: 147, 57: -98, 62: -98, 63: 157, 65: -98, 66: 150, 67: 144, 73: -98, 74: 153, 75: -98, 77: -98, 79: -98, 87: -98, 88: 154, 93: 156},
+    {13: -205, 14: 158, 62: 159, 75: -205},
+    {1: -93, 2: -93, 3: -93, 6: -93, 8: -93, 13: -93, 14: -93, 20: -93, 21: -93, 25: -93, 26: -93, 33: -93, 35: -93, 39: -93, 40: -93, 43: -93, 47: -93, 48: -93, 49: -93, 50: -93, 51: -93, 52: -93, 53: -93, 54: -93, 55: -93, 56: -93, 57: -93, 62: -93, 63: -93, 65: -93, 66: -93, 67: -93, 73: -93, 74: -93, 75: -93, 77: -93, 79: -93, 87: -93, 88: -93, 93: -93},
+    {1: -94, 2: -94, 3: -94, 6: -94, 8: -94, 13: -94, 14: -94, 20: -94, 21: -94, 25: -94, 26: -94, 33: -94, 35: -94, 39: -94, 40: -94, 42: 161, 43: -94, 46: 163, 47: -94, 48: -94, 49: -94, 50: -94, 51: -94, 52: -94, 53: -94, 54: -94, 55: -94, 56: -94, 57: -94, 62: -94, 63: -94, 64: 162, 65: -94, 66: -94, 67: -94, 73: -94, 74: -94, 75: -94, 77: -94, 79: -94, 87: -94, 88: -94, 93: -94},
+    {1: 164, 13: -199, 14: -199, 62: -199, 75: -199},
+    {1: -77, 2: -77, 3: -77, 6: -77, 8: -77, 13: -77, 14: -77, 20: -77, 21: -77, 25: -77, 26: -77, 33: -77, 35: -77, 39: -77, 40: -77, 42: 166, 43: -77, 46: 163, 47: -77, 48: -77, 49: -77, 50: -77, 51: -77, 52: -77, 53: -77, 54: -77, 55: -77, 56: -77, 57: -77, 62: -77, 63: -77, 64: 167, 65: -77, 66: -77, 67: -77, 73: -77, 74: -77, 75: -77, 77: -77, 79: -77, 87: -77, 88: -77, 93: -77},
+    {29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 58: 102, 60: 67, 61: 70, 70: 72, 78: 71, 82: 57, 84: 68},
+    {5: -1, 13: 172, 19: -1, 29: -1, 32: -1, 36: -1, 41: -1, 42: -1, 46: -1, 50: -1, 52: -1, 58: -1, 59: -1, 60: -1, 61: -1, 65: -1, 67: -1, 69: -1, 70: -1, 78: -1, 82: -1, 84: -1, 86: -1, 90: -1},
+    {1: -193, 6: 175, 13: -193, 14: -193, 62: -193, 75: -193},
+    {1: -70, 2: -70, 3: -70, 6: -70, 8: -70, 13: -70, 14: -70, 20: -70, 21: -70, 25: -70, 26: -70, 33: -70, 35: -70, 39: -70, 40: -70, 42: -70, 43: -70, 46: -70, 47: -70, 48: -70, 49: -70, 50: -70, 51: -70, 52: -70, 53: -70, 54: -70, 55: -70, 56: -70, 57: -70, 62: -70, 63: -70, 64: -70, 65: -70, 66: -70, 67: -70, 73: -70, 74: -70, 75: -70, 77: -70, 79: -70, 87: -70, 88: -70, 93: -70},
+    {1: -71, 2: -71, 3: -71, 6: -71, 8: -71, 13: -71, 14: -71, 20: -71, 21: -71, 25: -71, 26: -71, 33: -71, 35: -71, 39: -71, 40: -71, 42: -71, 43: -71, 46: -71, 47: -71, 48: -71, 49: -71, 50: -71, 51: -71, 52: -71, 53: -71, 54: -71, 55: -71, 56: -71, 57: -71, 62: -71, 63: -71, 64: -71, 65: -71, 66: -71, 67: -71, 73: -71, 74: -71, 75: -71, 77: -71, 79: -71, 87: -71, 88: -71, 93: -71},
+    {1: -187, 6: -187, 8: 176, 13: -187, 14: -187, 62: -187, 75: -187},
+    {1: -41, 2: -41, 3: -41, 6: -41, 8: -41, 12: -41, 13: -41, 14: -41, 20: -41, 21: -41, 25: -41, 26: -41, 33: -41, 35: -41, 39: -41, 40: -41, 42: -41, 43: -41, 46: -41, 47: -41, 48: -41, 49: -41, 50: -41, 51: -41, 52: -41, 53: -41, 54: -41, 55: -41, 56: -41, 57: -41, 62: -41, 63: -41, 64: -41, 65: -41, 66: -41, 67: -41, 68: -41, 69: -41, 72: -41, 73: -41, 74: -41, 75: -41, 77: -41, 79: -41, 87: -41, 88: -41, 93: -41},
+    {1: -42, 2: -42, 3: -42, 6: -42, 8: -42, 12: -42, 13: -42, 14: -42, 20: -42, 21: -42, 25: -42, 26: -42, 33: -42, 35: -42, 39: -42, 40: -42, 42: -42, 43: -42, 46: -42, 47: -42, 48: -42, 49: -42, 50: -42, 51: -42, 52: -42, 53: -42, 54: -42, 55: -42, 56: -42, 57: -42, 62: -42, 63: -42, 64: -42, 65: -42, 66: -42, 67: -42, 68: -42, 69: -42, 72: -42, 73: -42, 74: -42, 75: -42, 77: -42, 79: -42, 87: -42, 88: -42, 93: -42},
+    {1: -43, 2: -43, 3: -43, 6: -43, 8: -43, 12: -43, 13: -43, 14: -43, 20: -43, 21: -43, 25: -43, 26: -43, 33: -43, 35: -43, 39: -43, 40: -43, 42: -43, 43: -43, 46: -43, 47: -43, 48: -43, 49: -43, 50: -43, 51: -43, 52: -43, 53: -43, 54: -43, 55: -43, 56: -43, 57: -43, 62: -43, 63: -43, 64: -43, 65: -43, 66: -43, 67: -43, 68: -43, 69: -43, 72: -43, 73: -43, 74: -43, 75: -43, 77: -43, 79: -43, 87: -43, 88: -43, 93: -43},
+    {1: -181, 3: 177, 6: -181, 8: -181, 13: -181, 14: -181, 62: -181, 75: -181},
+    {1: -26, 2: -26, 3: -26, 6: -26, 8: -26, 12: -26, 13: -26, 14: -26, 20: -26, 21: -26, 25: -26, 26: -26, 33: -26, 35: -26, 39: -26, 40: -26, 42: -26, 43: -26, 46: -26, 47: -26, 48: -26, 49: -26, 50: -26, 51: -26, 52: -26, 53: -26, 54: -26, 55: -26, 56: -26, 57: -26, 62: -26, 63: -26, 64: -26, 65: -26, 66: -26, 67: -26, 68: -26, 69: -26, 72: -26, 73: -26, 74: -26, 75: -26, 77: -26, 79: -26, 87: -26, 88: -26, 93: -26},
+    {1: -27, 2: -27, 3: -27, 6: -27, 8: -27, 12: -27, 13: -27, 14: -27, 20: -27, 21: -27, 25: -27, 26: -27, 33: -27, 35: -27, 39: -27, 40: -27, 42: -27, 43: -27, 46: -27, 47: -27, 48: -27, 49: -27, 50: -27, 51: -27, 52: -27, 53: -27, 54: -27, 55: -27, 56: -27, 57: -27, 62: -27, 63: -27, 64: -27, 65: -27, 66: -27, 67: -27, 68: -27, 69: -27, 72: -27, 73: -27, 74: -27, 75: -27, 77: -27, 79: -27, 87: -27, 88: -27, 93: -27},
+    {1: -28, 2: -28, 3: -28, 6: -28, 8: -28, 12: -28, 13: -28, 14: -28, 20: -28, 21: -28, 25: -28, 26: -28, 33: -28, 35: -28, 39: -28, 40: -28, 42: -28, 43: -28, 46: -28, 47: -28, 48: -28, 49: -28, 50: -28, 51: -28, 52: -28, 53: -28, 54: -28, 55: -28, 56: -28, 57: -28, 62: -28, 63: -28, 64: -28, 65: -28, 66: -28, 67: -28, 68: -28, 69: -28, 72: -28, 73: -28, 74: -28, 75: -28, 77: -28, 79: -28, 87: -28, 88: -28, 93: -28},
+    {1: -29, 2: -29, 3: -29, 6: -29, 8: -29, 12: -29, 13: -29, 14: -29, 20: -29, 21: -29, 25: -29, 26: -29, 33: -29, 35: -29, 39: -29, 40: -29, 42: -29, 43: -29, 46: -29, 47: -29, 48: -29, 49: -29, 50: -29, 51: -29, 52: -29, 53: -29, 54: -29, 55: -29, 56: -29, 57: -29, 62: -29, 63: -29, 64: -29, 65: -29, 66: -29, 67: -29, 68: -29, 69: -29, 72: -29, 73: -29, 74: -29, 75: -29, 77: -29, 79: -29, 87: -29, 88: -29, 93: -29},
+    {1: -30, 2: -30, 3: -30, 6: -30, 8: -30, 12: -30, 13: -30, 14: -30, 20: -30, 21: -30, 25: -30, 26: -30, 33: -30, 35: -30, 39: -30, 40: -30, 42: -30, 43: -30, 46: -30, 47: -30, 48: -30, 49: -30, 50: -30, 51: -30, 52: -30, 53: -30, 54: -30, 55: -30, 56: -30, 57: -30, 62: -30, 63: -30, 64: -30, 65: -30, 66: -30, 67: -30, 68: -30, 69: -30, 72: -30, 73: -30, 74: -30, 75: -30, 77: -30, 79: -30, 87: -30, 88: -30, 93: -30},
+    {1: -175, 3: -175, 6: -175, 8: -175, 13: -175, 14: -175, 26: 178, 57: 179, 62: -175, 75: -175, 77: 180, 79: 181},
+    {1: -33, 2: -33, 3: -33, 6: -33, 8: -33, 12: -33, 13: -33, 14: -33, 20: -33, 21: -33, 25: -33, 26: -33, 33: -33, 35: -33, 39: -33, 40: -33, 42: -33, 43: -33, 46: -33, 47: -33, 48: -33, 49: -33, 50: -33, 51: -33, 52: -33, 53: -33, 54: -33, 55: -33, 56: -33, 57: -33, 62: -33, 63: -33, 64: -33, 65: -33, 66: -33, 67: -33, 68: -33, 69: -33, 72: -33, 73: -33, 74: -33, 75: -33, 77: -33, 79: -33, 87: -33, 88: -33, 93: -33},
+    {1: -31, 2: -31, 3: -31, 6: -31, 8: -31, 12: -31, 13: -31, 14: -31, 20: -31, 21: -31, 25: -31, 26: -31, 33: -31, 35: -31, 39: -31, 40: -31, 42: -31, 43: -31, 46: -31, 47: -31, 48: -31, 49: -31, 50: -31, 51: -31, 52: -31, 53: -31, 54: -31, 55: -31, 56: -31, 57: -31, 62: -31, 63: -31, 64: -31, 65: -31, 66: -31, 67: -31, 68: -31, 69: -31, 72: -31, 73: -31, 74: -31, 75: -31, 77: -31, 79: -31, 87: -31, 88: -31, 93: -31},
+    {1: -32, 2: -32, 3: -32, 6: -32, 8: -32, 12: -32, 13: -32, 14: -32, 20: -32, 21: -32, 25: -32, 26: -32, 33: -32, 35: -32, 39: -32, 40: -32, 42: -32, 43: -32, 46: -32, 47: -32, 48: -32, 49: -32, 50: -32, 51: -32, 52: -32, 53: -32, 54: -32, 55: -32, 56: -32, 57: -32, 62: -32, 63: -32, 64: -32, 65: -32, 66: -32, 67: -32, 68: -32, 69: -32, 72: -32, 73: -32, 74: -32, 75: -32, 77: -32, 79: -32, 87: -32, 88: -32, 93: -32},
+    {1: -34, 2: -34, 3: -34, 6: -34, 8: -34, 12: -34, 13: -34, 14: -34, 20: -34, 21: -34, 25: -34, 26: -34, 33: -34, 35: -34, 39: -34, 40: -34, 42: -34, 43: -34, 46: -34, 47: -34, 48: -34, 49: -34, 50: -34, 51: -34, 52: -34, 53: -34, 54: -34, 55: -34, 56: -34, 57: -34, 62: -34, 63: -34, 64: -34, 65: -34, 66: -34, 67: -34, 68: -34, 69: -34, 72: -34, 73: -34, 74: -34, 75: -34, 77: -34, 79: -34, 87: -34, 88: -34, 93: -34},
+    {1: -35, 2: -35, 3: -35, 6: -35, 8: -35, 12: -35, 13: -35, 14: -35, 20: -35, 21: -35, 25: -35, 26: -35, 33: -35, 35: -35, 39: -35, 40: -35, 42: -35, 43: -35, 46: -35, 47: -35, 48: -35, 49: -35, 50: -35, 51: -35, 52: -35, 53: -35, 54: -35, 55: -35, 56: -35, 57: -35, 62: -35, 63: -35, 64: -35, 65: -35, 66: -35, 67: -35, 68: -35, 69: -35, 72: -35, 73: -35, 74: -35, 75: -35, 77: -35, 79: -35, 87: -35, 88: -35, 93: -35},
+    {1: -36, 2: -36, 3: -36, 6: -36, 8: -36, 12: -36, 13: -36, 14: -36, 20: -36, 21: -36, 25: -36, 26: -36, 33: -36, 35: -36, 39: -36, 40: -36, 42: -36, 43: -36, 46: -36, 47: -36, 48: -36, 49: -36, 50: -36, 51: -36, 52: -36, 53: -36, 54: -36, 55: -36, 56: -36, 57: -36, 62: -36, 63: -36, 64: -36, 65: -36, 66: -36, 67: -36, 68: -36, 69: -36, 72: -36, 73: -36, 74: -36, 75: -36, 77: -36, 79: -36, 87: -36, 88: -36, 93: -36},
+    {1: -166, 3: -166, 6: -166, 8: -166, 13: -166, 14: -166, 26: -166, 33: 185, 35: 183, 39: 187, 40: 186, 43: 184, 49: 182, 57: -166, 62: -166, 75: -166, 77: -166, 79: -166},
+    {1: -149, 3: -149, 6: -149, 8: -149, 13: -149, 14: -149, 26: -149, 33: -149, 35: -149, 39: -149, 40: -149, 43: -149, 47: 188, 49: -149, 57: -149, 62: -149, 73: 189, 75: -149, 77: -149, 79: -149, 87: 190},
+    {1: -132, 3: -132, 6: -132, 8: -132, 13: -132, 14: -132, 26: -132, 33: -132, 35: -132, 39: -132, 40: -132, 43: -132, 47: -132, 49: -132, 50: 192, 57: -132, 62: -132, 65: 191, 73: -132, 75: -132, 77: -132, 79: -132, 87: -132},
+    {1: -125, 3: -125, 6: -125, 8: -125, 13: -125, 14: -125, 20: 194, 26: -125, 33: -125, 35: -125, 39: -125, 40: -125, 43: -125, 47: -125, 49: -125, 50: -125, 53: 195, 55: 193, 57: -125, 62: -125, 65: -125, 73: -125, 75: -125, 77: -125, 79: -125, 87: -125},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {1: -118, 3: -118, 6: -118, 8: -118, 13: -118, 14: -118, 20: -118, 26: -118, 33: -118, 35: -118, 39: -118, 40: -118, 43: -118, 47: -118, 49: -118, 50: -118, 53: -118, 55: -118, 57: -118, 62: -118, 65: -118, 73: -118, 75: -118, 77: -118, 79: -118, 87: -118},
+    {1: -103, 3: -103, 6: -103, 8: -103, 13: -103, 14: -103, 20: -103, 26: -103, 33: -103, 35: -103, 39: -103, 40: -103, 43: -103, 47: -103, 49: -103, 50: -103, 53: -103, 55: -103, 57: -103, 62: -103, 65: -103, 73: -103, 75: -103, 77: -103, 79: -103, 87: -103},
+    {1: -104, 3: -104, 6: -104, 8: -104, 13: -104, 14: -104, 20: -104, 26: -104, 33: -104, 35: -104, 39: -104, 40: -104, 43: -104, 47: -104, 49: -104, 50: -104, 53: -104, 55: -104, 57: -104, 62: -104, 65: -104, 73: -104, 75: -104, 77: -104, 79: -104, 87: -104},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {0: -6, 5: -6, 7: -6, 9: -6, 16: -6, 17: -6, 18: -6, 19: -6, 22: -6, 29: -6, 31: -6, 32: -6, 36: -6, 37: -6, 41: -6, 42: -6, 46: -6, 50: -6, 52: -6, 58: -6, 59: -6, 60: -6, 61: -6, 65: -6, 67: -6, 68: -6, 70: -6, 71: -6, 75: -6, 78: -6, 81: -6, 82: -6, 83: -6, 84: -6, 85: -6, 86: -6, 89: -6, 90: -6, 91: -6, 92: -6},
+    {46: 206},
+    {36: 43, 72: 207},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {13: 212, 72: 211},
+    {12: -225, 13: -225, 69: -225, 72: -225, 75: -225},
+    {12: -207, 13: -207, 68: -207, 69: -207, 72: -207, 75: -207},
+    {1: -95, 2: 155, 3: -95, 6: -95, 8: -95, 12: -95, 13: -95, 14: -95, 20: -95, 21: 148, 25: 146, 26: -95, 33: -95, 35: -95, 39: -95, 40: -95, 43: -95, 47: -95, 48: 152, 49: -95, 50: -95, 51: 151, 52: 215, 53: -95, 54: 149, 55: -95, 56: 147, 57: -95, 62: -95, 63: 157, 65: -95, 66: 150, 67: 214, 68: -95, 69: -95, 72: -95, 73: -95, 74: 153, 75: -95, 77: -95, 79: -95, 87: -95, 88: 154, 93: 156},
+    {12: -201, 13: -201, 14: 216, 62: 217, 68: -201, 69: -201, 72: -201, 75: -201},
+    {1: -91, 2: -91, 3: -91, 6: -91, 8: -91, 12: -91, 13: -91, 14: -91, 20: -91, 21: -91, 25: -91, 26: -91, 33: -91, 35: -91, 39: -91, 40: -91, 43: -91, 47: -91, 48: -91, 49: -91, 50: -91, 51: -91, 52: -91, 53: -91, 54: -91, 55: -91, 56: -91, 57: -91, 62: -91, 63: -91, 65: -91, 66: -91, 67: -91, 68: -91, 69: -91, 72: -91, 73: -91, 74: -91, 75: -91, 77: -91, 79: -91, 87: -91, 88: -91, 93: -91},
+    {1: -92, 2: -92, 3: -92, 6: -92, 8: -92, 12: -92, 13: -92, 14: -92, 20: -92, 21: -92, 25: -92, 26: -92, 33: -92, 35: -92, 39: -92, 40: -92, 42: 219, 43: -92, 46: 163, 47: -92, 48: -92, 49: -92, 50: -92, 51: -92, 52: -92, 53: -92, 54: -92, 55: -92, 56: -92, 57: -92, 62: -92, 63: -92, 64: 220, 65: -92, 66: -92, 67: -92, 68: -92, 69: -92, 72: -92, 73: -92, 74: -92, 75: -92, 77: -92, 79: -92, 87: -92, 88: -92, 93: -92},
+    {1: 221, 12: -195, 13: -195, 14: -195, 62: -195, 68: -195, 69: -195, 72: -195, 75: -195},
+    {1: -75, 2: -75, 3: -75, 6: -75, 8: -75, 12: -75, 13: -75, 14: -75, 20: -75, 21: -75, 25: -75, 26: -75, 33: -75, 35: -75, 39: -75, 40: -75, 42: 223, 43: -75, 46: 163, 47: -75, 48: -75, 49: -75, 50: -75, 51: -75, 52: -75, 53: -75, 54: -75, 55: -75, 56: -75, 57: -75, 62: -75, 63: -75, 64: 224, 65: -75, 66: -75, 67: -75, 68: -75, 69: -75, 72: -75, 73: -75, 74: -75, 75: -75, 77: -75, 79: -75, 87: -75, 88: -75, 93: -75},
+    {29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 58: 102, 60: 67, 61: 70, 70: 72, 78: 71, 82: 57, 84: 68},
+    {1: -40, 2: -40, 3: -40, 6: -40, 8: -40, 12: -40, 13: -40, 14: -40, 20: -40, 21: -40, 25: -40, 26: -40, 33: -40, 35: -40, 39: -40, 40: -40, 42: -40, 43: -40, 46: -40, 47: -40, 48: -40, 49: -40, 50: -40, 51: -40, 52: -40, 53: -40, 54: -40, 55: -40, 56: -40, 57: -40, 62: -40, 63: -40, 64: -40, 65: -40, 66: -40, 67: -40, 68: -40, 69: -40, 72: -40, 73: -40, 74: -40, 75: -40, 77: -40, 79: -40, 87: -40, 88: -40, 93: -40},
+    {1: -189, 6: 227, 12: -189, 13: -189, 14: -189, 62: -189, 68: -189, 69: -189, 72: -189, 75: -189},
+    {1: -65, 2: -65, 3: -65, 6: -65, 8: -65, 12: -65, 13: -65, 14: -65, 20: -65, 21: -65, 25: -65, 26: -65, 33: -65, 35: -65, 39: -65, 40: -65, 42: -65, 43: -65, 46: -65, 47: -65, 48: -65, 49: -65, 50: -65, 51: -65, 52: -65, 53: -65, 54: -65, 55: -65, 56: -65, 57: -65, 62: -65, 63: -65, 64: -65, 65: -65, 66: -65, 67: -65, 68: -65, 69: -65, 72: -65, 73: -65, 74: -65, 75: -65, 77: -65, 79: -65, 87: -65, 88: -65, 93: -65},
+    {1: -66, 2: -66, 3: -66, 6: -66, 8: -66, 12: -66, 13: -66, 14: -66, 20: -66, 21: -66, 25: -66, 26: -66, 33: -66, 35: -66, 39: -66, 40: -66, 42: -66, 43: -66, 46: -66, 47: -66, 48: -66, 49: -66, 50: -66, 51: -66, 52: -66, 53: -66, 54: -66, 55: -66, 56: -66, 57: -66, 62: -66, 63: -66, 64: -66, 65: -66, 66: -66, 67: -66, 68: -66, 69: -66, 72: -66, 73: -66, 74: -66, 75: -66, 77: -66, 79: -66, 87: -66, 88: -66, 93: -66},
+    {1: -183, 6: -183, 8: 228, 12: -183, 13: -183, 14: -183, 62: -183, 68: -183, 69: -183, 72: -183, 75: -183},
+    {1: -38, 2: -38, 3: -38, 6: -38, 8: -38, 12: -38, 13: -38, 14: -38, 20: -38, 21: -38, 25: -38, 26: -38, 33: -38, 35: -38, 39: -38, 40: -38, 42: -38, 43: -38, 46: -38, 47: -38, 48: -38, 49: -38, 50: -38, 51: -38, 52: -38, 53: -38, 54: -38, 55: -38, 56: -38, 57: -38, 62: -38, 63: -38, 64: -38, 65: -38, 66: -38, 67: -38, 68: -38, 69: -38, 72: -38, 73: -38, 74: -38, 75: -38, 77: -38, 79: -38, 87: -38, 88: -38, 93: -38},
+    {1: -39, 2: -39, 3: -39, 6: -39, 8: -39, 12: -39, 13: -39, 14: -39, 20: -39, 21: -39, 25: -39, 26: -39, 33: -39, 35: -39, 39: -39, 40: -39, 42: -39, 43: -39, 46: -39, 47: -39, 48: -39, 49: -39, 50: -39, 51: -39, 52: -39, 53: -39, 54: -39, 55: -39, 56: -39, 57: -39, 62: -39, 63: -39, 64: -39, 65: -39, 66: -39, 67: -39, 68: -39, 69: -39, 72: -39, 73: -39, 74: -39, 75: -39, 77: -39, 79: -39, 87: -39, 88: -39, 93: -39},
+    {36: 43, 46: 91},
+    {34: 234, 36: 43, 61: 70, 68: 230, 76: 235, 78: 71},
+    {1: -177, 3: 239, 6: -177, 8: -177, 12: -177, 13: -177, 14: -177, 62: -177, 68: -177, 69: -177, 72: -177, 75: -177},
+    {1: -171, 3: -171, 6: -171, 8: -171, 12: -171, 13: -171, 14: -171, 26: 240, 57: 241, 62: -171, 68: -171, 69: -171, 72: -171, 75: -171, 77: 242, 79: 243},
+    {1: -156, 3: -156, 6: -156, 8: -156, 12: -156, 13: -156, 14: -156, 26: -156, 33: 247, 35: 245, 39: 249, 40: 248, 43: 246, 49: 244, 57: -156, 62: -156, 68: -156, 69: -156, 72: -156, 75: -156, 77: -156, 79: -156},
+    {1: -136, 3: -136, 6: -136, 8: -136, 12: -136, 13: -136, 14: -136, 26: -136, 33: -136, 35: -136, 39: -136, 40: -136, 43: -136, 47: 250, 49: -136, 57: -136, 62: -136, 68: -136, 69: -136, 72: -136, 73: 251, 75: -136, 77: -136, 79: -136, 87: 252},
+    {1: -128, 3: -128, 6: -128, 8: -128, 12: -128, 13: -128, 14: -128, 26: -128, 33: -128, 35: -128, 39: -128, 40: -128, 43: -128, 47: -128, 49: -128, 50: 254, 57: -128, 62: -128, 65: 253, 68: -128, 69: -128, 72: -128, 73: -128, 75: -128, 77: -128, 79: -128, 87: -128},
+    {1: -122, 3: -122, 6: -122, 8: -122, 12: -122, 13: -122, 14: -122, 20: 256, 26: -122, 33: -122, 35: -122, 39: -122, 40: -122, 43: -122, 47: -122, 49: -122, 50: -122, 53: 257, 55: 255, 57: -122, 62: -122, 65: -122, 68: -122, 69: -122, 72: -122, 73: -122, 75: -122, 77: -122, 79: -122, 87: -122},
+    {1: -114, 3: -114, 6: -114, 8: -114, 12: -114, 13: -114, 14: -114, 20: -114, 26: -114, 33: -114, 35: -114, 39: -114, 40: -114, 43: -114, 47: -114, 49: -114, 50: -114, 53: -114, 55: -114, 57: -114, 62: -114, 65: -114, 68: -114, 69: -114, 72: -114, 73: -114, 75: -114, 77: -114, 79: -114, 87: -114},
+    {1: -101, 3: -101, 6: -101, 8: -101, 12: -101, 13: -101, 14: -101, 20: -101, 26: -101, 33: -101, 35: -101, 39: -101, 40: -101, 43: -101, 47: -101, 49: -101, 50: -101, 53: -101, 55: -101, 57: -101, 62: -101, 65: -101, 68: -101, 69: -101, 72: -101, 73: -101, 75: -101, 77: -101, 79: -101, 87: -101},
+    {1: -102, 3: -102, 6: -102, 8: -102, 12: -102, 13: -102, 14: -102, 20: -102, 26: -102, 33: -102, 35: -102, 39: -102, 40: -102, 43: -102, 47: -102, 49: -102, 50: -102, 53: -102, 55: -102, 57: -102, 62: -102, 65: -102, 68: -102, 69: -102, 72: -102, 73: -102, 75: -102, 77: -102, 79: -102, 87: -102},
+    {68: 258},
+    {13: 260, 75: 259},
+    {13: -232, 75: -232},
+    {13: -236, 25: 262, 75: -236},
+    {0: -243, 5: -243, 7: -243, 9: -243, 16: -243, 17: -243, 18: -243, 19: -243, 22: -243, 23: -243, 29: -243, 31: -243, 32: -243, 36: -243, 37: -243, 41: -243, 42: -243, 46: -243, 50: -243, 52: -243, 58: -243, 59: -243, 60: -243, 61: -243, 65: -243, 67: -243, 68: -243, 70: -243, 71: -243, 75: -243, 78: -243, 81: -243, 82: -243, 83: -243, 84: -243, 85: -243, 86: -243, 89: -243, 90: -243, 91: -243, 92: -243},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {91: 265},
+    {0: -24, 5: -24, 7: -24, 9: -24, 16: -24, 17: -24, 18: -24, 19: -24, 22: -24, 23: -24, 29: -24, 31: -24, 32: -24, 36: -24, 37: -24, 41: -24, 42: -24, 46: -24, 50: -24, 52: -24, 58: -24, 59: -24, 60: -24, 61: -24, 65: -24, 67: -24, 68: -24, 70: -24, 71: -24, 75: -24, 78: -24, 81: -24, 82: -24, 83: -24, 84: -24, 85: -24, 86: -24, 89: -24, 90: -24, 91: -24, 92: -24},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 75: -1, 78: 71, 82: 57, 84: 68, 86: 86, 89: 268, 90: 85},
+    {0: -257, 5: -257, 7: -257, 9: -257, 16: -257, 17: -257, 18: -257, 19: -257, 22: -257, 23: -257, 29: -257, 31: -257, 32: -257, 36: -257, 37: -257, 41: -257, 42: -257, 46: -257, 50: -257, 52: -257, 58: -257, 59: -257, 60: -257, 61: -257, 65: -257, 67: -257, 68: -257, 70: -257, 71: -257, 75: -257, 78: -257, 81: -257, 82: -257, 83: -257, 84: -257, 85: -257, 86: -257, 89: -257, 90: -257, 91: -257, 92: -257},
+    {75: 282},
+    {0: -259, 5: -259, 7: -259, 9: -259, 16: -259, 17: -259, 18: -259, 19: -259, 22: -259, 23: -259, 29: -259, 31: -259, 32: -259, 36: -259, 37: -259, 41: -259, 42: -259, 46: -259, 50: -259, 52: -259, 58: -259, 59: -259, 60: -259, 61: -259, 65: -259, 67: -259, 68: -259, 70: -259, 71: -259, 75: -259, 78: -259, 81: -259, 82: -259, 83: -259, 84: -259, 85: -259, 86: -259, 89: -259, 90: -259, 91: -259, 92: -259},
+    {75: 283},
+    {0: -261, 5: -261, 7: -261, 9: -261, 16: -261, 17: -261, 18: -261, 19: -261, 22: -261, 23: -261, 29: -261, 31: -261, 32: -261, 36: -261, 37: -261, 41: -261, 42: -261, 46: -261, 50: -261, 52: -261, 58: -261, 59: -261, 60: -261, 61: -261, 65: -261, 67: -261, 68: -261, 70: -261, 71: -261, 75: -261, 78: -261, 81: -261, 82: -261, 83: -261, 84: -261, 85: -261, 86: -261, 89: -261, 90: -261, 91: -261, 92: -261},
+    {13: 212, 75: 284},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {13: 212, 75: 287},
+    {10: 290, 30: 291},
+    {0: -280, 5: -280, 7: -280, 9: -280, 16: -280, 17: -280, 18: -280, 19: -280, 22: -280, 23: -280, 29: -280, 31: -280, 32: -280, 36: -280, 37: -280, 41: -280, 42: -280, 46: -280, 50: -280, 52: -280, 58: -280, 59: -280, 60: -280, 61: -280, 65: -280, 67: -280, 68: -280, 70: -280, 71: -280, 75: -280, 78: -280, 81: -280, 82: -280, 83: -280, 84: -280, 85: -280, 86: -280, 89: -280, 90: -280, 91: -280, 92: -280},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {1: -99, 3: -99, 6: -99, 8: -99, 13: -99, 14: -99, 20: -99, 26: -99, 33: -99, 35: -99, 39: -99, 40: -99, 43: -99, 47: -99, 49: -99, 50: -99, 53: -99, 55: -99, 57: -99, 62: -99, 65: -99, 73: -99, 75: -99, 77: -99, 79: -99, 87: -99},
+    {1: -100, 3: -100, 6: -100, 8: -100, 13: -100, 14: -100, 20: -100, 26: -100, 33: -100, 35: -100, 39: -100, 40: -100, 43: -100, 47: -100, 49: -100, 50: -100, 53: -100, 55: -100, 57: -100, 62: -100, 65: -100, 73: -100, 75: -100, 77: -100, 79: -100, 87: -100},
+    {5: -213, 19: -213, 29: -213, 32: -213, 36: -213, 41: -213, 42: -213, 46: -213, 50: -213, 52: -213, 58: -213, 59: -213, 60: -213, 61: -213, 65: -213, 67: -213, 70: -213, 78: -213, 82: -213, 84: -213, 86: -213, 90: -213},
+    {5: -214, 19: -214, 29: -214, 32: -214, 36: -214, 41: -214, 42: -214, 46: -214, 50: -214, 52: -214, 58: -214, 59: -214, 60: -214, 61: -214, 65: -214, 67: -214, 70: -214, 78: -214, 82: -214, 84: -214, 86: -214, 90: -214},
+    {5: -215, 19: -215, 29: -215, 32: -215, 36: -215, 41: -215, 42: -215, 46: -215, 50: -215, 52: -215, 58: -215, 59: -215, 60: -215, 61: -215, 65: -215, 67: -215, 70: -215, 78: -215, 82: -215, 84: -215, 86: -215, 90: -215},
+    {5: -216, 19: -216, 29: -216, 32: -216, 36: -216, 41: -216, 42: -216, 46: -216, 50: -216, 52: -216, 58: -216, 59: -216, 60: -216, 61: -216, 65: -216, 67: -216, 70: -216, 78: -216, 82: -216, 84: -216, 86: -216, 90: -216},
+    {5: -217, 19: -217, 29: -217, 32: -217, 36: -217, 41: -217, 42: -217, 46: -217, 50: -217, 52: -217, 58: -217, 59: -217, 60: -217, 61: -217, 65: -217, 67: -217, 70: -217, 78: -217, 82: -217, 84: -217, 86: -217, 90: -217},
+    {5: -218, 19: -218, 29: -218, 32: -218, 36: -218, 41: -218, 42: -218, 46: -218, 50: -218, 52: -218, 58: -218, 59: -218, 60: -218, 61: -218, 65: -218, 67: -218, 70: -218, 78: -218, 82: -218, 84: -218, 86: -218, 90: -218},
+    {5: -219, 19: -219, 29: -219, 32: -219, 36: -219, 41: -219, 42: -219, 46: -219, 50: -219, 52: -219, 58: -219, 59: -219, 60: -219, 61: -219, 65: -219, 67: -219, 70: -219, 78: -219, 82: -219, 84: -219, 86: -219, 90: -219},
+    {5: -220, 19: -220, 29: -220, 32: -220, 36: -220, 41: -220, 42: -220, 46: -220, 50: -220, 52: -220, 58: -220, 59: -220, 60: -220, 61: -220, 65: -220, 67: -220, 70: -220, 78: -220, 82: -220, 84: -220, 86: -220, 90: -220},
+    {5: -221, 19: -221, 29: -221, 32: -221, 36: -221, 41: -221, 42: -221, 46: -221, 50: -221, 52: -221, 58: -221, 59: -221, 60: -221, 61: -221, 65: -221, 67: -221, 70: -221, 78: -221, 82: -221, 84: -221, 86: -221, 90: -221},
+    {5: -222, 19: -222, 29: -222, 32: -222, 36: -222, 41: -222, 42: -222, 46: -222, 50: -222, 52: -222, 58: -222, 59: -222, 60: -222, 61: -222, 65: -222, 67: -222, 70: -222, 78: -222, 82: -222, 84: -222, 86: -222, 90: -222},
+    {5: -223, 19: -223, 29: -223, 32: -223, 36: -223, 41: -223, 42: -223, 46: -223, 50: -223, 52: -223, 58: -223, 59: -223, 60: -223, 61: -223, 65: -223, 67: -223, 70: -223, 78: -223, 82: -223, 84: -223, 86: -223, 90: -223},
+    {5: -224, 19: -224, 29: -224, 32: -224, 36: -224, 41: -224, 42: -224, 46: -224, 50: -224, 52: -224, 58: -224, 59: -224, 60: -224, 61: -224, 65: -224, 67: -224, 70: -224, 78: -224, 82: -224, 84: -224, 86: -224, 90: -224},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {1: -84, 2: -84, 3: -84, 6: -84, 8: -84, 13: -84, 14: -84, 20: -84, 21: -84, 25: -84, 26: -84, 33: -84, 35: -84, 39: -84, 40: -84, 42: -84, 43: -84, 46: -84, 47: -84, 48: -84, 49: -84, 50: -84, 51: -84, 52: -84, 53: -84, 54: -84, 55: -84, 56: -84, 57: -84, 62: -84, 63: -84, 64: -84, 65: -84, 66: -84, 67: -84, 73: -84, 74: -84, 75: -84, 77: -84, 79: -84, 87: -84, 88: -84, 93: -84},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {36: 43},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 72: 298, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {1: -83, 2: -83, 3: -83, 6: -83, 8: -83, 13: -83, 14: -83, 20: -83, 21: -83, 25: -83, 26: -83, 33: -83, 35: -83, 39: -83, 40: -83, 42: -83, 43: -83, 46: -83, 47: -83, 48: -83, 49: -83, 50: -83, 51: -83, 52: -83, 53: -83, 54: -83, 55: -83, 56: -83, 57: -83, 62: -83, 63: -83, 64: -83, 65: -83, 66: -83, 67: -83, 73: -83, 74: -83, 75: -83, 77: -83, 79: -83, 87: -83, 88: -83, 93: -83},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {36: 43},
+    {1: -78, 2: -78, 3: -78, 6: -78, 8: -78, 13: -78, 14: -78, 20: -78, 21: -78, 25: -78, 26: -78, 33: -78, 35: -78, 39: -78, 40: -78, 43: -78, 47: -78, 48: -78, 49: -78, 50: -78, 51: -78, 52: -78, 53: -78, 54: -78, 55: -78, 56: -78, 57: -78, 62: -78, 63: -78, 65: -78, 66: -78, 67: -78, 73: -78, 74: -78, 75: -78, 77: -78, 79: -78, 87: -78, 88: -78, 93: -78},
+    {1: -75, 2: -75, 3: -75, 6: -75, 8: -75, 13: -75, 14: -75, 20: -75, 21: -75, 25: -75, 26: -75, 33: -75, 35: -75, 39: -75, 40: -75, 42: 223, 43: -75, 46: 163, 47: -75, 48: -75, 49: -75, 50: -75, 51: -75, 52: -75, 53: -75, 54: -75, 55: -75, 56: -75, 57: -75, 62: -75, 63: -75, 64: 224, 65: -75, 66: -75, 67: -75, 73: -75, 74: -75, 75: -75, 77: -75, 79: -75, 87: -75, 88: -75, 93: -75},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 69: 305, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {13: 308, 69: 307},
+    {5: -52, 13: -52, 19: -52, 29: -52, 32: -52, 36: -52, 41: -52, 42: -52, 46: -52, 50: -52, 52: -52, 58: -52, 59: -52, 60: -52, 61: -52, 65: -52, 67: -52, 69: -52, 70: -52, 78: -52, 82: -52, 84: -52, 86: -52, 90: -52},
+    {5: -50, 19: -50, 29: -50, 32: -50, 36: -50, 41: -50, 42: -50, 46: -50, 50: -50, 52: -50, 58: -50, 59: -50, 60: -50, 61: -50, 65: -50, 67: -50, 69: -50, 70: -50, 78: -50, 82: -50, 84: -50, 86: -50, 90: -50},
+    {5: -51, 13: 309, 19: -51, 29: -51, 32: -51, 36: -51, 41: -51, 42: -51, 46: -51, 50: -51, 52: -51, 58: -51, 59: -51, 60: -51, 61: -51, 65: -51, 67: -51, 69: -51, 70: -51, 78: -51, 82: -51, 84: -51, 86: -51, 90: -51},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {1: -110, 3: -110, 6: -110, 8: -110, 12: -110, 13: -110, 14: -110, 20: -110, 26: -110, 33: -110, 35: -110, 39: -110, 40: -110, 43: -110, 47: -110, 49: -110, 50: -110, 53: -110, 55: -110, 57: -110, 62: -110, 65: -110, 68: -110, 69: -110, 72: -110, 73: -110, 75: -110, 77: -110, 79: -110, 87: -110},
+    {1: -95, 3: -95, 6: -95, 8: -95, 12: -95, 13: -95, 14: -95, 20: -95, 26: -95, 33: -95, 35: -95, 39: -95, 40: -95, 43: -95, 47: -95, 49: -95, 50: -95, 52: 215, 53: -95, 55: -95, 57: -95, 62: -95, 65: -95, 67: 214, 68: -95, 69: -95, 72: -95, 73: -95, 75: -95, 77: -95, 79: -95, 87: -95},
+    {1: -111, 3: -111, 6: -111, 8: -111, 12: -111, 13: -111, 14: -111, 20: -111, 26: -111, 33: -111, 35: -111, 39: -111, 40: -111, 43: -111, 47: -111, 49: -111, 50: -111, 53: -111, 55: -111, 57: -111, 62: -111, 65: -111, 68: -111, 69: -111, 72: -111, 73: -111, 75: -111, 77: -111, 79: -111, 87: -111},
+    {1: -108, 3: -108, 6: -108, 8: -108, 12: -108, 13: -108, 14: -108, 20: -108, 26: -108, 33: -108, 35: -108, 39: -108, 40: -108, 43: -108, 47: -108, 49: -108, 50: -108, 53: -108, 55: -108, 57: -108, 62: -108, 65: -108, 68: -108, 69: -108, 72: -108, 73: -108, 75: -108, 77: -108, 79: -108, 87: -108},
+    {1: -109, 3: -109, 6: -109, 8: -109, 12: -109, 13: -109, 14: -109, 20: -109, 26: -109, 33: -109, 35: -109, 39: -109, 40: -109, 43: -109, 47: -109, 49: -109, 50: -109, 53: -109, 55: -109, 57: -109, 62: -109, 65: -109, 68: -109, 69: -109, 72: -109, 73: -109, 75: -109, 77: -109, 79: -109, 87: -109},
+    {1: -105, 3: -105, 6: -105, 8: -105, 12: -105, 13: -105, 14: -105, 20: -105, 26: -105, 33: -105, 35: -105, 39: -105, 40: -105, 43: -105, 47: -105, 49: -105, 50: -105, 53: -105, 55: -105, 57: -105, 62: -105, 65: -105, 68: -105, 69: -105, 72: -105, 73: -105, 75: -105, 77: -105, 79: -105, 87: -105},
+    {1: -106, 3: -106, 6: -106, 8: -106, 12: -106, 13: -106, 14: -106, 20: -106, 26: -106, 33: -106, 35: -106, 39: -106, 40: -106, 43: -106, 47: -106, 49: -106, 50: -106, 53: -106, 55: -106, 57: -106, 62: -106, 65: -106, 68: -106, 69: -106, 72: -106, 73: -106, 75: -106, 77: -106, 79: -106, 87: -106},
+    {1: -107, 3: -107, 6: -107, 8: -107, 12: -107, 13: -107, 14: -107, 20: -107, 26: -107, 33: -107, 35: -107, 39: -107, 40: -107, 43: -107, 47: -107, 49: -107, 50: -107, 53: -107, 55: -107, 57: -107, 62: -107, 65: -107, 68: -107, 69: -107, 72: -107, 73: -107, 75: -107, 77: -107, 79: -107, 87: -107},
+    {1: -112, 3: -112, 6: -112, 8: -112, 12: -112, 13: -112, 14: -112, 20: -112, 26: -112, 33: -112, 35: -112, 39: -112, 40: -112, 43: -112, 47: -112, 49: -112, 50: -112, 53: -112, 55: -112, 57: -112, 62: -112, 65: -112, 68: -112, 69: -112, 72: -112, 73: -112, 75: -112, 77: -112, 79: -112, 87: -112},
+    {1: -113, 3: -113, 6: -113, 8: -113, 12: -113, 13: -113, 14: -113, 20: -113, 26: -113, 33: -113, 35: -113, 39: -113, 40: -113, 43: -113, 47: -113, 49: -113, 50: -113, 53: -113, 55: -113, 57: -113, 62: -113, 65: -113, 68: -113, 69: -113, 72: -113, 73: -113, 75: -113, 77: -113, 79: -113, 87: -113},
+    {36: 43, 72: 331},
+    {41: 333},
+    {13: 335, 72: 334},
+    {13: -287, 72: -287},
+    {0: -273, 5: -273, 7: -273, 9: -273, 16: -273, 17: -273, 18: -273, 19: -273, 22: -273, 23: -273, 29: -273, 31: -273, 32: -273, 36: -273, 37: -273, 41: -273, 42: -273, 46: -273, 50: -273, 52: -273, 58: -273, 59: -273, 60: -273, 61: -273, 65: -273, 67: -273, 68: -273, 70: -273, 71: -273, 75: -273, 78: -273, 81: -273, 82: -273, 83: -273, 84: -273, 85: -273, 86: -273, 89: -273, 90: -273, 91: -273, 92: -273},
+    {1: -44, 2: -44, 3: -44, 6: -44, 8: -44, 12: -44, 13: -44, 14: -44, 20: -44, 21: -44, 25: -44, 26: -44, 33: -44, 35: -44, 39: -44, 40: -44, 42: -44, 43: -44, 46: -44, 47: -44, 48: -44, 49: -44, 50: -44, 51: -44, 52: -44, 53: -44, 54: -44, 55: -44, 56: -44, 57: -44, 62: -44, 63: -44, 64: -44, 65: -44, 66: -44, 67: -44, 68: -44, 69: -44, 72: -44, 73: -44, 74: -44, 75: -44, 77: -44, 79: -44, 87: -44, 88: -44, 93: -44},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {1: -96, 3: -96, 6: -96, 8: -96, 12: -96, 13: -96, 14: -96, 20: -96, 26: -96, 33: -96, 35: -96, 39: -96, 40: -96, 43: -96, 47: -96, 49: -96, 50: -96, 53: -96, 55: -96, 57: -96, 62: -96, 65: -96, 68: -96, 69: -96, 72: -96, 73: -96, 75: -96, 77: -96, 79: -96, 87: -96},
+    {1: -97, 3: -97, 6: -97, 8: -97, 12: -97, 13: -97, 14: -97, 20: -97, 26: -97, 33: -97, 35: -97, 39: -97, 40: -97, 43: -97, 47: -97, 49: -97, 50: -97, 53: -97, 55: -97, 57: -97, 62: -97, 65: -97, 68: -97, 69: -97, 72: -97, 73: -97, 75: -97, 77: -97, 79: -97, 87: -97},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {1: -80, 2: -80, 3: -80, 6: -80, 8: -80, 12: -80, 13: -80, 14: -80, 20: -80, 21: -80, 25: -80, 26: -80, 33: -80, 35: -80, 39: -80, 40: -80, 42: -80, 43: -80, 46: -80, 47: -80, 48: -80, 49: -80, 50: -80, 51: -80, 52: -80, 53: -80, 54: -80, 55: -80, 56: -80, 57: -80, 62: -80, 63: -80, 64: -80, 65: -80, 66: -80, 67: -80, 68: -80, 69: -80, 72: -80, 73: -80, 74: -80, 75: -80, 77: -80, 79: -80, 87: -80, 88: -80, 93: -80},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {36: 43},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {1: -79, 2: -79, 3: -79, 6: -79, 8: -79, 12: -79, 13: -79, 14: -79, 20: -79, 21: -79, 25: -79, 26: -79, 33: -79, 35: -79, 39: -79, 40: -79, 42: -79, 43: -79, 46: -79, 47: -79, 48: -79, 49: -79, 50: -79, 51: -79, 52: -79, 53: -79, 54: -79, 55: -79, 56: -79, 57: -79, 62: -79, 63: -79, 64: -79, 65: -79, 66: -79, 67: -79, 68: -79, 69: -79, 72: -79, 73: -79, 74: -79, 75: -79, 77: -79, 79: -79, 87: -79, 88: -79, 93: -79},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {36: 43},
+    {1: -76, 2: -76, 3: -76, 6: -76, 8: -76, 12: -76, 13: -76, 14: -76, 20: -76, 21: -76, 25: -76, 26: -76, 33: -76, 35: -76, 39: -76, 40: -76, 43: -76, 47: -76, 48: -76, 49: -76, 50: -76, 51: -76, 52: -76, 53: -76, 54: -76, 55: -76, 56: -76, 57: -76, 62: -76, 63: -76, 65: -76, 66: -76, 67: -76, 68: -76, 69: -76, 72: -76, 73: -76, 74: -76, 75: -76, 77: -76, 79: -76, 87: -76, 88: -76, 93: -76},
+    {1: -75, 2: -75, 3: -75, 6: -75, 8: -75, 12: -75, 13: -75, 14: -75, 20: -75, 21: -75, 25: -75, 26: -75, 33: -75, 35: -75, 39: -75, 40: -75, 42: 223, 43: -75, 46: 163, 47: -75, 48: -75, 49: -75, 50: -75, 51: -75, 52: -75, 53: -75, 54: -75, 55: -75, 56: -75, 57: -75, 62: -75, 63: -75, 64: 224, 65: -75, 66: -75, 67: -75, 68: -75, 69: -75, 72: -75, 73: -75, 74: -75, 75: -75, 77: -75, 79: -75, 87: -75, 88: -75, 93: -75},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {46: 348},
+    {1: -54, 2: -54, 3: -54, 6: -54, 8: -54, 12: -54, 13: -54, 14: -54, 20: -54, 21: -54, 25: -54, 26: -54, 33: -54, 35: -54, 39: -54, 40: -54, 42: -54, 43: -54, 46: -54, 47: -54, 48: -54, 49: -54, 50: -54, 51: -54, 52: -54, 53: -54, 54: -54, 55: -54, 56: -54, 57: -54, 62: -54, 63: -54, 64: -54, 65: -54, 66: -54, 67: -54, 68: -54, 69: -54, 72: -54, 73: -54, 74: -54, 75: -54, 77: -54, 79: -54, 87: -54, 88: -54, 93: -54},
+    {13: 350, 68: 349},
+    {13: -57, 68: -57},
+    {12: 351},
+    {36: 43, 61: 70, 78: 71},
+    {36: 43, 61: 70, 78: 71},
+    {12: -62, 46: -62},
+    {12: -63, 46: -63},
+    {12: -64, 46: -64},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {0: -25, 5: -25, 7: -25, 9: -25, 10: -25, 16: -25, 17: -25, 18: -25, 19: -25, 22: -25, 23: -25, 29: -25, 30: -25, 31: -25, 32: -25, 36: -25, 37: -25, 41: -25, 42: -25, 46: -25, 50: -25, 52: -25, 58: -25, 59: -25, 60: -25, 61: -25, 65: -25, 67: -25, 68: -25, 70: -25, 71: -25, 75: -25, 78: -25, 81: -25, 82: -25, 83: -25, 84: -25, 85: -25, 86: -25, 89: -25, 90: -25, 91: -25, 92: -25},
+    {0: -231, 5: -231, 7: -231, 9: -231, 16: -231, 17: -231, 18: -231, 19: -231, 22: -231, 23: -231, 29: -231, 31: -231, 32: -231, 36: -231, 37: -231, 41: -231, 42: -231, 46: -231, 50: -231, 52: -231, 58: -231, 59: -231, 60: -231, 61: -231, 65: -231, 67: -231, 68: -231, 70: -231, 71: -231, 75: -231, 78: -231, 81: -231, 82: -231, 83: -231, 84: -231, 85: -231, 86: -231, 89: -231, 90: -231, 91: -231, 92: -231},
+    {36: 43},
+    {13: -237, 75: -237},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {13: -230, 75: -230},
+    {13: 212, 72: 375},
+    {46: 376},
+    {13: 212, 72: 377},
+    {75: 378},
+    {36: 43},
+    {1: -95, 2: 155, 3: -95, 6: -95, 8: -95, 13: -95, 14: -95, 20: -95, 21: 148, 25: 146, 26: -95, 33: -95, 35: -95, 39: 382, 40: -95, 43: -95, 47: -95, 48: 152, 49: -95, 50: -95, 51: 151, 52: 215, 53: -95, 54: 149, 55: -95, 56: 147, 57: -95, 62: -95, 63: 157, 65: -95, 66: 150, 67: 214, 73: -95, 74: 153, 75: -95, 77: -95, 79: -95, 87: -95, 88: 154, 93: 156},
+    {75: -255},
+    {13: 384, 75: -256},
+    {13: -227, 75: -227},
+    {12: -209, 13: -209, 39: -209, 75: -209},
+    {12: -203, 13: -203, 14: 385, 39: -203, 62: 386, 75: -203},
+    {1: 387, 12: -197, 13: -197, 14: -197, 39: -197, 62: -197, 75: -197},
+    {1: -191, 6: 388, 12: -191, 13: -191, 14: -191, 39: -191, 62: -191, 75: -191},
+    {1: -185, 6: -185, 8: 389, 12: -185, 13: -185, 14: -185, 39: -185, 62: -185, 75: -185},
+    {1: -179, 3: 390, 6: -179, 8: -179, 12: -179, 13: -179, 14: -179, 39: -179, 62: -179, 75: -179},
+    {1: -173, 3: -173, 6: -173, 8: -173, 12: -173, 13: -173, 14: -173, 26: 391, 39: -173, 57: 392, 62: -173, 75: -173, 77: 393, 79: 394},
+    {1: -161, 3: -161, 6: -161, 8: -161, 12: -161, 13: -161, 14: -161, 26: -161, 33: 398, 35: 396, 39: -161, 40: 399, 43: 397, 49: 395, 57: -161, 62: -161, 75: -161, 77: -161, 79: -161},
+    {1: -143, 3: -143, 6: -143, 8: -143, 12: -143, 13: -143, 14: -143, 26: -143, 33: -143, 35: -143, 39: -143, 40: -143, 43: -143, 47: 250, 49: -143, 57: -143, 62: -143, 73: 251, 75: -143, 77: -143, 79: -143, 87: 252},
+    {0: -258, 5: -258, 7: -258, 9: -258, 16: -258, 17: -258, 18: -258, 19: -258, 22: -258, 23: -258, 29: -258, 31: -258, 32: -258, 36: -258, 37: -258, 41: -258, 42: -258, 46: -258, 50: -258, 52: -258, 58: -258, 59: -258, 60: -258, 61: -258, 65: -258, 67: -258, 68: -258, 70: -258, 71: -258, 75: -258, 78: -258, 81: -258, 82: -258, 83: -258, 84: -258, 85: -258, 86: -258, 89: -258, 90: -258, 91: -258, 92: -258},
+    {0: -260, 5: -260, 7: -260, 9: -260, 16: -260, 17: -260, 18: -260, 19: -260, 22: -260, 23: -260, 29: -260, 31: -260, 32: -260, 36: -260, 37: -260, 41: -260, 42: -260, 46: -260, 50: -260, 52: -260, 58: -260, 59: -260, 60: -260, 61: -260, 65: -260, 67: -260, 68: -260, 70: -260, 71: -260, 75: -260, 78: -260, 81: -260, 82: -260, 83: -260, 84: -260, 85: -260, 86: -260, 89: -260, 90: -260, 91: -260, 92: -260},
+    {0: -262, 5: -262, 7: -262, 9: -262, 16: -262, 17: -262, 18: -262, 19: -262, 22: -262, 23: -262, 29: -262, 31: -262, 32: -262, 36: -262, 37: -262, 41: -262, 42: -262, 46: -262, 50: -262, 52: -262, 58: -262, 59: -262, 60: -262, 61: -262, 65: -262, 67: -262, 68: -262, 70: -262, 71: -262, 75: -262, 78: -262, 81: -262, 82: -262, 83: -262, 84: -262, 85: -262, 86: -262, 89: -262, 90: -262, 91: -262, 92: -262},
+    {13: 212, 72: 400},
+    {13: 212, 72: 401},
+    {0: -274, 5: -274, 7: -274, 9: -274, 16: -274, 17: -274, 18: -274, 19: -274, 22: -274, 23: -274, 29: -274, 31: -274, 32: -274, 36: -274, 37: -274, 41: -274, 42: -274, 46: -274, 50: -274, 52: -274, 58: -274, 59: -274, 60: -274, 61: -274, 65: -274, 67: -274, 68: -274, 70: -274, 71: -274, 75: -274, 78: -274, 81: -274, 82: -274, 83: -274, 84: -274, 85: -274, 86: -274, 89: -274, 90: -274, 91: -274, 92: -274},
+    {0: -275, 5: -275, 7: -275, 9: -275, 16: -275, 17: -275, 18: -275, 19: -275, 22: -275, 23: -275, 29: -275, 30: 291, 31: -275, 32: -275, 36: -275, 37: -275, 41: -275, 42: -275, 46: -275, 50: -275, 52: -275, 58: -275, 59: -275, 60: -275, 61: -275, 65: -275, 67: -275, 68: -275, 70: -275, 71: -275, 75: -275, 78: -275, 81: -275, 82: -275, 83: -275, 84: -275, 85: -275, 86: -275, 89: -275, 90: -275, 91: -275, 92: -275},
+    {0: -276, 5: -276, 7: -276, 9: -276, 16: -276, 17: -276, 18: -276, 19: -276, 22: -276, 23: -276, 29: -276, 31: -276, 32: -276, 36: -276, 37: -276, 41: -276, 42: -276, 46: -276, 50: -276, 52: -276, 58: -276, 59: -276, 60: -276, 61: -276, 65: -276, 67: -276, 68: -276, 70: -276, 71: -276, 75: -276, 78: -276, 81: -276, 82: -276, 83: -276, 84: -276, 85: -276, 86: -276, 89: -276, 90: -276, 91: -276, 92: -276},
+    {46: 403},
+    {41: 26},
+    {13: -212, 75: -212},
+    {12: 405},
+    {1: 164, 13: -200, 14: -200, 62: -200, 75: -200},
+    {1: -98, 3: -98, 6: -98, 8: -98, 13: -98, 14: -98, 20: -98, 26: -98, 33: -98, 35: -98, 39: -98, 40: -98, 43: -98, 47: -98, 49: -98, 50: -98, 52: 145, 53: -98, 55: -98, 57: -98, 62: -98, 65: -98, 67: 144, 73: -98, 75: -98, 77: -98, 79: -98, 87: -98},
+    {13: 212, 69: 406},
+    {1: -86, 2: -86, 3: -86, 6: -86, 8: -86, 13: -86, 14: -86, 20: -86, 21: -86, 25: -86, 26: -86, 33: -86, 35: -86, 39: -86, 40: -86, 42: -86, 43: -86, 46: -86, 47: -86, 48: -86, 49: -86, 50: -86, 51: -86, 52: -86, 53: -86, 54: -86, 55: -86, 56: -86, 57: -86, 62: -86, 63: -86, 64: -86, 65: -86, 66: -86, 67: -86, 73: -86, 74: -86, 75: -86, 77: -86, 79: -86, 87: -86, 88: -86, 93: -86},
+    {1: -87, 2: -87, 3: -87, 6: -87, 8: -87, 12: -87, 13: -87, 14: -87, 20: -87, 21: -87, 25: -87, 26: -87, 33: -87, 35: -87, 39: -87, 40: -87, 42: -87, 43: -87, 46: -87, 47: -87, 48: -87, 49: -87, 50: -87, 51: -87, 52: -87, 53: -87, 54: -87, 55: -87, 56: -87, 57: -87, 62: -87, 63: -87, 64: -87, 65: -87, 66: -87, 67: -87, 68: -87, 69: -87, 72: -87, 73: -87, 74: -87, 75: -87, 77: -87, 79: -87, 87: -87, 88: -87, 93: -87},
+    {13: 408, 72: 407},
+    {13: -89, 72: -89},
+    {1: -194, 6: 175, 13: -194, 14: -194, 62: -194, 75: -194},
+    {13: 212, 69: 409},
+    {1: -73, 2: -73, 3: -73, 6: -73, 8: -73, 13: -73, 14: -73, 20: -73, 21: -73, 25: -73, 26: -73, 33: -73, 35: -73, 39: -73, 40: -73, 42: -73, 43: -73, 46: -73, 47: -73, 48: -73, 49: -73, 50: -73, 51: -73, 52: -73, 53: -73, 54: -73, 55: -73, 56: -73, 57: -73, 62: -73, 63: -73, 64: -73, 65: -73, 66: -73, 67: -73, 73: -73, 74: -73, 75: -73, 77: -73, 79: -73, 87: -73, 88: -73, 93: -73},
+    {1: -74, 2: -74, 3: -74, 6: -74, 8: -74, 13: -74, 14: -74, 20: -74, 21: -74, 25: -74, 26: -74, 33: -74, 35: -74, 39: -74, 40: -74, 42: -74, 43: -74, 46: -74, 47: -74, 48: -74, 49: -74, 50: -74, 51: -74, 52: -74, 53: -74, 54: -74, 55: -74, 56: -74, 57: -74, 62: -74, 63: -74, 64: -74, 65: -74, 66: -74, 67: -74, 73: -74, 74: -74, 75: -74, 77: -74, 79: -74, 87: -74, 88: -74, 93: -74},
+    {1: -45, 2: -45, 3: -45, 6: -45, 8: -45, 12: -45, 13: -45, 14: -45, 20: -45, 21: -45, 25: -45, 26: -45, 33: -45, 35: -45, 39: -45, 40: -45, 42: -45, 43: -45, 46: -45, 47: -45, 48: -45, 49: -45, 50: -45, 51: -45, 52: -45, 53: -45, 54: -45, 55: -45, 56: -45, 57: -45, 62: -45, 63: -45, 64: -45, 65: -45, 66: -45, 67: -45, 68: -45, 69: -45, 72: -45, 73: -45, 74: -45, 75: -45, 77: -45, 79: -45, 87: -45, 88: -45, 93: -45},
+    {13: -48, 69: -48},
+    {1: -46, 2: -46, 3: -46, 6: -46, 8: -46, 12: -46, 13: -46, 14: -46, 20: -46, 21: -46, 25: -46, 26: -46, 33: -46, 35: -46, 39: -46, 40: -46, 42: -46, 43: -46, 46: -46, 47: -46, 48: -46, 49: -46, 50: -46, 51: -46, 52: -46, 53: -46, 54: -46, 55: -46, 56: -46, 57: -46, 62: -46, 63: -46, 64: -46, 65: -46, 66: -46, 67: -46, 68: -46, 69: -46, 72: -46, 73: -46, 74: -46, 75: -46, 77: -46, 79: -46, 87: -46, 88: -46, 93: -46},
+    {5: -1, 13: 172, 19: -1, 29: -1, 32: -1, 36: -1, 41: -1, 42: -1, 46: -1, 50: -1, 52: -1, 58: -1, 59: -1, 60: -1, 61: -1, 65: -1, 67: -1, 69: -1, 70: -1, 78: -1, 82: -1, 84: -1, 86: -1, 90: -1},
+    {5: -53, 13: -53, 19: -53, 29: -53, 32: -53, 36: -53, 41: -53, 42: -53, 46: -53, 50: -53, 52: -53, 58: -53, 59: -53, 60: -53, 61: -53, 65: -53, 67: -53, 69: -53, 70: -53, 78: -53, 82: -53, 84: -53, 86: -53, 90: -53},
+    {1: -188, 6: -188, 8: 176, 13: -188, 14: -188, 62: -188, 75: -188},
+    {1: -182, 3: 177, 6: -182, 8: -182, 13: -182, 14: -182, 62: -182, 75: -182},
+    {1: -176, 3: -176, 6: -176, 8: -176, 13: -176, 14: -176, 26: 178, 57: 179, 62: -176, 75: -176, 77: 180, 79: 181},
+    {1: -167, 3: -167, 6: -167, 8: -167, 13: -167, 14: -167, 26: -167, 33: 247, 35: 245, 39: 249, 40: 248, 43: 246, 49: 244, 57: -167, 62: -167, 75: -167, 77: -167, 79: -167},
+    {1: -168, 3: -168, 6: -168, 8: -168, 13: -168, 14: -168, 26: -168, 33: 247, 35: 245, 39: 249, 40: 248, 43: 246, 49: 244, 57: -168, 62: -168, 75: -168, 77: -168, 79: -168},
+    {1: -169, 3: -169, 6: -169, 8: -169, 13: -169, 14: -169, 26: -169, 33: 247, 35: 245, 39: 249, 40: 248, 43: 246, 49: 244, 57: -169, 62: -169, 75: -169, 77: -169, 79: -169},
+    {1: -170, 3: -170, 6: -170, 8: -170, 13: -170, 14: -170, 26: -170, 33: 247, 35: 245, 39: 249, 40: 248, 43: 246, 49: 244, 57: -170, 62: -170, 75: -170, 77: -170, 79: -170},
+    {1: -150, 3: -150, 6: -150, 8: -150, 13: -150, 14: -150, 26: -150, 33: -150, 35: -150, 39: -150, 40: -150, 43: -150, 47: 250, 49: -150, 57: -150, 62: -150, 73: 251, 75: -150, 77: -150, 79: -150, 87: 252},
+    {1: -151, 3: -151, 6: -151, 8: -151, 13: -151, 14: -151, 26: -151, 33: -151, 35: -151, 39: -151, 40: -151, 43: -151, 47: 250, 49: -151, 57: -151, 62: -151, 73: 251, 75: -151, 77: -151, 79: -151, 87: 252},
+    {1: -152, 3: -152, 6: -152, 8: -152, 13: -152, 14: -152, 26: -152, 33: -152, 35: -152, 39: -152, 40: -152, 43: -152, 47: 250, 49: -152, 57: -152, 62: -152, 73: 251, 75: -152, 77: -152, 79: -152, 87: 252},
+    {1: -153, 3: -153, 6: -153, 8: -153, 13: -153, 14: -153, 26: -153, 33: -153, 35: -153, 39: -153, 40: -153, 43: -153, 47: 250, 49: -153, 57: -153, 62: -153, 73: 251, 75: -153, 77: -153, 79: -153, 87: 252},
+    {1: -154, 3: -154, 6: -154, 8: -154, 13: -154, 14: -154, 26: -154, 33: -154, 35: -154, 39: -154, 40: -154, 43: -154, 47: 250, 49: -154, 57: -154, 62: -154, 73: 251, 75: -154, 77: -154, 79: -154, 87: 252},
+    {1: -155, 3: -155, 6: -155, 8: -155, 13: -155, 14: -155, 26: -155, 33: -155, 35: -155, 39: -155, 40: -155, 43: -155, 47: 250, 49: -155, 57: -155, 62: -155, 73: 251, 75: -155, 77: -155, 79: -155, 87: 252},
+    {1: -133, 3: -133, 6: -133, 8: -133, 13: -133, 14: -133, 26: -133, 33: -133, 35: -133, 39: -133, 40: -133, 43: -133, 47: -133, 49: -133, 50: 254, 57: -133, 62: -133, 65: 253, 73: -133, 75: -133, 77: -133, 79: -133, 87: -133},
+    {1: -134, 3: -134, 6: -134, 8: -134, 13: -134, 14: -134, 26: -134, 33: -134, 35: -134, 39: -134, 40: -134, 43: -134, 47: -134, 49: -134, 50: 254, 57: -134, 62: -134, 65: 253, 73: -134, 75: -134, 77: -134, 79: -134, 87: -134},
+    {1: -135, 3: -135, 6: -135, 8: -135, 13: -135, 14: -135, 26: -135, 33: -135, 35: -135, 39: -135, 40: -135, 43: -135, 47: -135, 49: -135, 50: 254, 57: -135, 62: -135, 65: 253, 73: -135, 75: -135, 77: -135, 79: -135, 87: -135},
+    {1: -126, 3: -126, 6: -126, 8: -126, 13: -126, 14: -126, 20: 256, 26: -126, 33: -126, 35: -126, 39: -126, 40: -126, 43: -126, 47: -126, 49: -126, 50: -126, 53: 257, 55: 255, 57: -126, 62: -126, 65: -126, 73: -126, 75: -126, 77: -126, 79: -126, 87: -126},
+    {1: -127, 3: -127, 6: -127, 8: -127, 13: -127, 14: -127, 20: 256, 26: -127, 33: -127, 35: -127, 39: -127, 40: -127, 43: -127, 47: -127, 49: -127, 50: -127, 53: 257, 55: 255, 57: -127, 62: -127, 65: -127, 73: -127, 75: -127, 77: -127, 79: -127, 87: -127},
+    {1: -119, 3: -119, 6: -119, 8: -119, 13: -119, 14: -119, 20: -119, 26: -119, 33: -119, 35: -119, 39: -119, 40: -119, 43: -119, 47: -119, 49: -119, 50: -119, 53: -119, 55: -119, 57: -119, 62: -119, 65: -119, 73: -119, 75: -119, 77: -119, 79: -119, 87: -119},
+    {1: -120, 3: -120, 6: -120, 8: -120, 13: -120, 14: -120, 20: -120, 26: -120, 33: -120, 35: -120, 39: -120, 40: -120, 43: -120, 47: -120, 49: -120, 50: -120, 53: -120, 55: -120, 57: -120, 62: -120, 65: -120, 73: -120, 75: -120, 77: -120, 79: -120, 87: -120},
+    {1: -121, 3: -121, 6: -121, 8: -121, 13: -121, 14: -121, 20: -121, 26: -121, 33: -121, 35: -121, 39: -121, 40: -121, 43: -121, 47: -121, 49: -121, 50: -121, 53: -121, 55: -121, 57: -121, 62: -121, 65: -121, 73: -121, 75: -121, 77: -121, 79: -121, 87: -121},
+    {41: 411},
+    {13: 335, 72: 412},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 68: -1, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {41: 415},
+    {36: 43},
+    {12: -226, 13: -226, 69: -226, 72: -226, 75: -226},
+    {12: -208, 13: -208, 68: -208, 69: -208, 72: -208, 75: -208},
+    {12: 417},
+    {1: 221, 12: -196, 13: -196, 14: -196, 62: -196, 68: -196, 69: -196, 72: -196, 75: -196},
+    {13: 212, 69: 418},
+    {1: -82, 2: -82, 3: -82, 6: -82, 8: -82, 12: -82, 13: -82, 14: -82, 20: -82, 21: -82, 25: -82, 26: -82, 33: -82, 35: -82, 39: -82, 40: -82, 42: -82, 43: -82, 46: -82, 47: -82, 48: -82, 49: -82, 50: -82, 51: -82, 52: -82, 53: -82, 54: -82, 55: -82, 56: -82, 57: -82, 62: -82, 63: -82, 64: -82, 65: -82, 66: -82, 67: -82, 68: -82, 69: -82, 72: -82, 73: -82, 74: -82, 75: -82, 77: -82, 79: -82, 87: -82, 88: -82, 93: -82},
+    {1: -190, 6: 227, 12: -190, 13: -190, 14: -190, 62: -190, 68: -190, 69: -190, 72: -190, 75: -190},
+    {13: 212, 69: 419},
+    {1: -68, 2: -68, 3: -68, 6: -68, 8: -68, 12: -68, 13: -68, 14: -68, 20: -68, 21: -68, 25: -68, 26: -68, 33: -68, 35: -68, 39: -68, 40: -68, 42: -68, 43: -68, 46: -68, 47: -68, 48: -68, 49: -68, 50: -68, 51: -68, 52: -68, 53: -68, 54: -68, 55: -68, 56: -68, 57: -68, 62: -68, 63: -68, 64: -68, 65: -68, 66: -68, 67: -68, 68: -68, 69: -68, 72: -68, 73: -68, 74: -68, 75: -68, 77: -68, 79: -68, 87: -68, 88: -68, 93: -68},
+    {1: -69, 2: -69, 3: -69, 6: -69, 8: -69, 12: -69, 13: -69, 14: -69, 20: -69, 21: -69, 25: -69, 26: -69, 33: -69, 35: -69, 39: -69, 40: -69, 42: -69, 43: -69, 46: -69, 47: -69, 48: -69, 49: -69, 50: -69, 51: -69, 52: -69, 53: -69, 54: -69, 55: -69, 56: -69, 57: -69, 62: -69, 63: -69, 64: -69, 65: -69, 66: -69, 67: -69, 68: -69, 69: -69, 72: -69, 73: -69, 74: -69, 75: -69, 77: -69, 79: -69, 87: -69, 88: -69, 93: -69},
+    {1: -184, 6: -184, 8: 228, 12: -184, 13: -184, 14: -184, 62: -184, 68: -184, 69: -184, 72: -184, 75: -184},
+    {1: -178, 3: 239, 6: -178, 8: -178, 12: -178, 13: -178, 14: -178, 62: -178, 68: -178, 69: -178, 72: -178, 75: -178},
+    {36: 43, 72: 420},
+    {1: -55, 2: -55, 3: -55, 6: -55, 8: -55, 12: -55, 13: -55, 14: -55, 20: -55, 21: -55, 25: -55, 26: -55, 33: -55, 35: -55, 39: -55, 40: -55, 42: -55, 43: -55, 46: -55, 47: -55, 48: -55, 49: -55, 50: -55, 51: -55, 52: -55, 53: -55, 54: -55, 55: -55, 56: -55, 57: -55, 62: -55, 63: -55, 64: -55, 65: -55, 66: -55, 67: -55, 68: -55, 69: -55, 72: -55, 73: -55, 74: -55, 75: -55, 77: -55, 79: -55, 87: -55, 88: -55, 93: -55},
+    {34: 234, 36: 43, 61: 70, 68: 422, 76: 235, 78: 71},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {46: 425},
+    {46: 426},
+    {1: -172, 3: -172, 6: -172, 8: -172, 12: -172, 13: -172, 14: -172, 26: 240, 57: 241, 62: -172, 68: -172, 69: -172, 72: -172, 75: -172, 77: 242, 79: 243},
+    {1: -157, 3: -157, 6: -157, 8: -157, 12: -157, 13: -157, 14: -157, 26: -157, 33: 247, 35: 245, 39: 249, 40: 248, 43: 246, 49: 244, 57: -157, 62: -157, 68: -157, 69: -157, 72: -157, 75: -157, 77: -157, 79: -157},
+    {1: -158, 3: -158, 6: -158, 8: -158, 12: -158, 13: -158, 14: -158, 26: -158, 33: 247, 35: 245, 39: 249, 40: 248, 43: 246, 49: 244, 57: -158, 62: -158, 68: -158, 69: -158, 72: -158, 75: -158, 77: -158, 79: -158},
+    {1: -159, 3: -159, 6: -159, 8: -159, 12: -159, 13: -159, 14: -159, 26: -159, 33: 247, 35: 245, 39: 249, 40: 248, 43: 246, 49: 244, 57: -159, 62: -159, 68: -159, 69: -159, 72: -159, 75: -159, 77: -159, 79: -159},
+    {1: -160, 3: -160, 6: -160, 8: -160, 12: -160, 13: -160, 14: -160, 26: -160, 33: 247, 35: 245, 39: 249, 40: 248, 43: 246, 49: 244, 57: -160, 62: -160, 68: -160, 69: -160, 72: -160, 75: -160, 77: -160, 79: -160},
+    {1: -137, 3: -137, 6: -137, 8: -137, 12: -137, 13: -137, 14: -137, 26: -137, 33: -137, 35: -137, 39: -137, 40: -137, 43: -137, 47: 250, 49: -137, 57: -137, 62: -137, 68: -137, 69: -137, 72: -137, 73: 251, 75: -137, 77: -137, 79: -137, 87: 252},
+    {1: -138, 3: -138, 6: -138, 8: -138, 12: -138, 13: -138, 14: -138, 26: -138, 33: -138, 35: -138, 39: -138, 40: -138, 43: -138, 47: 250, 49: -138, 57: -138, 62: -138, 68: -138, 69: -138, 72: -138, 73: 251, 75: -138, 77: -138, 79: -138, 87: 252},
+    {1: -139, 3: -139, 6: -139, 8: -139, 12: -139, 13: -139, 14: -139, 26: -139, 33: -139, 35: -139, 39: -139, 40: -139, 43: -139, 47: 250, 49: -139, 57: -139, 62: -139, 68: -139, 69: -139, 72: -139, 73: 251, 75: -139, 77: -139, 79: -139, 87: 252},
+    {1: -140, 3: -140, 6: -140, 8: -140, 12: -140, 13: -140, 14: -140, 26: -140, 33: -140, 35: -140, 39: -140, 40: -140, 43: -140, 47: 250, 49: -140, 57: -140, 62: -140, 68: -140, 69: -140, 72: -140, 73: 251, 75: -140, 77: -140, 79: -140, 87: 252},
+    {1: -141, 3: -141, 6: -141, 8: -141, 12: -141, 13: -141, 14: -141, 26: -141, 33: -141, 35: -141, 39: -141, 40: -141, 43: -141, 47: 250, 49: -141, 57: -141, 62: -141, 68: -141, 69: -141, 72: -141, 73: 251, 75: -141, 77: -141, 79: -141, 87: 252},
+    {1: -142, 3: -142, 6: -142, 8: -142, 12: -142, 13: -142, 14: -142, 26: -142, 33: -142, 35: -142, 39: -142, 40: -142, 43: -142, 47: 250, 49: -142, 57: -142, 62: -142, 68: -142, 69: -142, 72: -142, 73: 251, 75: -142, 77: -142, 79: -142, 87: 252},
+    {1: -129, 3: -129, 6: -129, 8: -129, 12: -129, 13: -129, 14: -129, 26: -129, 33: -129, 35: -129, 39: -129, 40: -129, 43: -129, 47: -129, 49: -129, 50: 254, 57: -129, 62: -129, 65: 253, 68: -129, 69: -129, 72: -129, 73: -129, 75: -129, 77: -129, 79: -129, 87: -129},
+    {1: -130, 3: -130, 6: -130, 8: -130, 12: -130, 13: -130, 14: -130, 26: -130, 33: -130, 35: -130, 39: -130, 40: -130, 43: -130, 47: -130, 49: -130, 50: 254, 57: -130, 62: -130, 65: 253, 68: -130, 69: -130, 72: -130, 73: -130, 75: -130, 77: -130, 79: -130, 87: -130},
+    {1: -131, 3: -131, 6: -131, 8: -131, 12: -131, 13: -131, 14: -131, 26: -131, 33: -131, 35: -131, 39: -131, 40: -131, 43: -131, 47: -131, 49: -131, 50: 254, 57: -131, 62: -131, 65: 253, 68: -131, 69: -131, 72: -131, 73: -131, 75: -131, 77: -131, 79: -131, 87: -131},
+    {1: -123, 3: -123, 6: -123, 8: -123, 12: -123, 13: -123, 14: -123, 20: 256, 26: -123, 33: -123, 35: -123, 39: -123, 40: -123, 43: -123, 47: -123, 49: -123, 50: -123, 53: 257, 55: 255, 57: -123, 62: -123, 65: -123, 68: -123, 69: -123, 72: -123, 73: -123, 75: -123, 77: -123, 79: -123, 87: -123},
+    {1: -124, 3: -124, 6: -124, 8: -124, 12: -124, 13: -124, 14: -124, 20: 256, 26: -124, 33: -124, 35: -124, 39: -124, 40: -124, 43: -124, 47: -124, 49: -124, 50: -124, 53: 257, 55: 255, 57: -124, 62: -124, 65: -124, 68: -124, 69: -124, 72: -124, 73: -124, 75: -124, 77: -124, 79: -124, 87: -124},
+    {1: -115, 3: -115, 6: -115, 8: -115, 12: -115, 13: -115, 14: -115, 20: -115, 26: -115, 33: -115, 35: -115, 39: -115, 40: -115, 43: -115, 47: -115, 49: -115, 50: -115, 53: -115, 55: -115, 57: -115, 62: -115, 65: -115, 68: -115, 69: -115, 72: -115, 73: -115, 75: -115, 77: -115, 79: -115, 87: -115},
+    {1: -116, 3: -116, 6: -116, 8: -116, 12: -116, 13: -116, 14: -116, 20: -116, 26: -116, 33: -116, 35: -116, 39: -116, 40: -116, 43: -116, 47: -116, 49: -116, 50: -116, 53: -116, 55: -116, 57: -116, 62: -116, 65: -116, 68: -116, 69: -116, 72: -116, 73: -116, 75: -116, 77: -116, 79: -116, 87: -116},
+    {1: -117, 3: -117, 6: -117, 8: -117, 12: -117, 13: -117, 14: -117, 20: -117, 26: -117, 33: -117, 35: -117, 39: -117, 40: -117, 43: -117, 47: -117, 49: -117, 50: -117, 53: -117, 55: -117, 57: -117, 62: -117, 65: -117, 68: -117, 69: -117, 72: -117, 73: -117, 75: -117, 77: -117, 79: -117, 87: -117},
+    {13: -233, 75: -233},
+    {13: -240, 75: -240},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 75: -1, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {13: 434, 75: 433},
+    {13: -238, 25: 437, 39: 435, 75: -238},
+    {13: -234, 75: -234},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {41: 459},
+    {0: -277, 5: -277, 7: -277, 9: -277, 16: -277, 17: -277, 18: -277, 19: -277, 22: -277, 23: -277, 29: -277, 31: -277, 32: -277, 36: -277, 37: -277, 41: -277, 42: -277, 46: -277, 50: -277, 52: -277, 58: -277, 59: -277, 60: -277, 61: -277, 65: -277, 67: -277, 68: -277, 70: -277, 71: -277, 75: -277, 78: -277, 81: -277, 82: -277, 83: -277, 84: -277, 85: -277, 86: -277, 89: -277, 90: -277, 91: -277, 92: -277},
+    {36: 43},
+    {0: -279, 5: -279, 7: -279, 9: -279, 16: -279, 17: -279, 18: -279, 19: -279, 22: -279, 23: -279, 29: -279, 31: -279, 32: -279, 36: -279, 37: -279, 41: -279, 42: -279, 46: -279, 50: -279, 52: -279, 58: -279, 59: -279, 60: -279, 61: -279, 65: -279, 67: -279, 68: -279, 70: -279, 71: -279, 75: -279, 78: -279, 81: -279, 82: -279, 83: -279, 84: -279, 85: -279, 86: -279, 89: -279, 90: -279, 91: -279, 92: -279},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {1: -85, 2: -85, 3: -85, 6: -85, 8: -85, 13: -85, 14: -85, 20: -85, 21: -85, 25: -85, 26: -85, 33: -85, 35: -85, 39: -85, 40: -85, 42: -85, 43: -85, 46: -85, 47: -85, 48: -85, 49: -85, 50: -85, 51: -85, 52: -85, 53: -85, 54: -85, 55: -85, 56: -85, 57: -85, 62: -85, 63: -85, 64: -85, 65: -85, 66: -85, 67: -85, 73: -85, 74: -85, 75: -85, 77: -85, 79: -85, 87: -85, 88: -85, 93: -85},
+    {1: -88, 2: -88, 3: -88, 6: -88, 8: -88, 12: -88, 13: -88, 14: -88, 20: -88, 21: -88, 25: -88, 26: -88, 33: -88, 35: -88, 39: -88, 40: -88, 42: -88, 43: -88, 46: -88, 47: -88, 48: -88, 49: -88, 50: -88, 51: -88, 52: -88, 53: -88, 54: -88, 55: -88, 56: -88, 57: -88, 62: -88, 63: -88, 64: -88, 65: -88, 66: -88, 67: -88, 68: -88, 69: -88, 72: -88, 73: -88, 74: -88, 75: -88, 77: -88, 79: -88, 87: -88, 88: -88, 93: -88},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {1: -72, 2: -72, 3: -72, 6: -72, 8: -72, 13: -72, 14: -72, 20: -72, 21: -72, 25: -72, 26: -72, 33: -72, 35: -72, 39: -72, 40: -72, 42: -72, 43: -72, 46: -72, 47: -72, 48: -72, 49: -72, 50: -72, 51: -72, 52: -72, 53: -72, 54: -72, 55: -72, 56: -72, 57: -72, 62: -72, 63: -72, 64: -72, 65: -72, 66: -72, 67: -72, 73: -72, 74: -72, 75: -72, 77: -72, 79: -72, 87: -72, 88: -72, 93: -72},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 69: 463, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 68: -1, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {41: 466},
+    {68: 467},
+    {68: -289},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 68: -1, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {13: -288, 72: -288},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {1: -81, 2: -81, 3: -81, 6: -81, 8: -81, 12: -81, 13: -81, 14: -81, 20: -81, 21: -81, 25: -81, 26: -81, 33: -81, 35: -81, 39: -81, 40: -81, 42: -81, 43: -81, 46: -81, 47: -81, 48: -81, 49: -81, 50: -81, 51: -81, 52: -81, 53: -81, 54: -81, 55: -81, 56: -81, 57: -81, 62: -81, 63: -81, 64: -81, 65: -81, 66: -81, 67: -81, 68: -81, 69: -81, 72: -81, 73: -81, 74: -81, 75: -81, 77: -81, 79: -81, 87: -81, 88: -81, 93: -81},
+    {1: -67, 2: -67, 3: -67, 6: -67, 8: -67, 12: -67, 13: -67, 14: -67, 20: -67, 21: -67, 25: -67, 26: -67, 33: -67, 35: -67, 39: -67, 40: -67, 42: -67, 43: -67, 46: -67, 47: -67, 48: -67, 49: -67, 50: -67, 51: -67, 52: -67, 53: -67, 54: -67, 55: -67, 56: -67, 57: -67, 62: -67, 63: -67, 64: -67, 65: -67, 66: -67, 67: -67, 68: -67, 69: -67, 72: -67, 73: -67, 74: -67, 75: -67, 77: -67, 79: -67, 87: -67, 88: -67, 93: -67},
+    {41: 470},
+    {13: 335, 72: 471},
+    {1: -56, 2: -56, 3: -56, 6: -56, 8: -56, 12: -56, 13: -56, 14: -56, 20: -56, 21: -56, 25: -56, 26: -56, 33: -56, 35: -56, 39: -56, 40: -56, 42: -56, 43: -56, 46: -56, 47: -56, 48: -56, 49: -56, 50: -56, 51: -56, 52: -56, 53: -56, 54: -56, 55: -56, 56: -56, 57: -56, 62: -56, 63: -56, 64: -56, 65: -56, 66: -56, 67: -56, 68: -56, 69: -56, 72: -56, 73: -56, 74: -56, 75: -56, 77: -56, 79: -56, 87: -56, 88: -56, 93: -56},
+    {13: -58, 68: -58},
+    {13: -59, 68: -59},
+    {72: 472},
+    {36: 43},
+    {0: -244, 5: -244, 7: -244, 9: -244, 16: -244, 17: -244, 18: -244, 19: -244, 22: -244, 23: 474, 29: -244, 31: -244, 32: -244, 36: -244, 37: -244, 41: -244, 42: -244, 46: -244, 50: -244, 52: -244, 58: -244, 59: -244, 60: -244, 61: -244, 65: -244, 67: -244, 68: -244, 70: -244, 71: -244, 75: -244, 78: -244, 81: -244, 82: -244, 83: -244, 84: -244, 85: -244, 86: -244, 89: -244, 90: -244, 91: -244, 92: -244},
+    {13: 212, 72: 475},
+    {0: -247, 5: -247, 7: -247, 9: -247, 16: -247, 17: -247, 18: -247, 19: -247, 22: -247, 23: -247, 29: -247, 31: -247, 32: -247, 36: -247, 37: -247, 41: -247, 42: -247, 46: -247, 50: -247, 52: -247, 58: -247, 59: -247, 60: -247, 61: -247, 65: -247, 67: -247, 68: -247, 70: -247, 71: -247, 75: -247, 78: -247, 81: -247, 82: -247, 83: -247, 84: -247, 85: -247, 86: -247, 89: -247, 90: -247, 91: -247, 92: -247},
+    {75: 476},
+    {72: -253, 75: -253},
+    {13: 212, 72: -254, 75: -254},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 75: -1, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {36: 43},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {13: -239, 39: 481, 75: -239},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {13: 212, 72: 483},
+    {1: -95, 2: 155, 3: -95, 6: -95, 8: -95, 12: -95, 13: -95, 14: -95, 20: -95, 21: 148, 25: 146, 26: -95, 33: -95, 35: -95, 39: -95, 40: -95, 43: -95, 47: -95, 48: 152, 49: -95, 50: -95, 51: 151, 52: 215, 53: -95, 54: 149, 55: -95, 56: 147, 57: -95, 62: -95, 63: 157, 65: -95, 66: 150, 67: 214, 73: -95, 74: 153, 75: -95, 77: -95, 79: -95, 87: -95, 88: 154, 93: 156},
+    {12: -210, 13: -210, 39: -210, 75: -210},
+    {13: -228, 75: -228},
+    {12: 484},
+    {1: 387, 12: -198, 13: -198, 14: -198, 39: -198, 62: -198, 75: -198},
+    {1: -192, 6: 388, 12: -192, 13: -192, 14: -192, 39: -192, 62: -192, 75: -192},
+    {1: -186, 6: -186, 8: 389, 12: -186, 13: -186, 14: -186, 39: -186, 62: -186, 75: -186},
+    {1: -180, 3: 390, 6: -180, 8: -180, 12: -180, 13: -180, 14: -180, 39: -180, 62: -180, 75: -180},
+    {1: -174, 3: -174, 6: -174, 8: -174, 12: -174, 13: -174, 14: -174, 26: 391, 39: -174, 57: 392, 62: -174, 75: -174, 77: 393, 79: 394},
+    {1: -162, 3: -162, 6: -162, 8: -162, 12: -162, 13: -162, 14: -162, 26: -162, 33: 247, 35: 245, 39: 249, 40: 248, 43: 246, 49: 244, 57: -162, 62: -162, 75: -162, 77: -162, 79: -162},
+    {1: -163, 3: -163, 6: -163, 8: -163, 12: -163, 13: -163, 14: -163, 26: -163, 33: 247, 35: 245, 39: 249, 40: 248, 43: 246, 49: 244, 57: -163, 62: -163, 75: -163, 77: -163, 79: -163},
+    {1: -164, 3: -164, 6: -164, 8: -164, 12: -164, 13: -164, 14: -164, 26: -164, 33: 247, 35: 245, 39: 249, 40: 248, 43: 246, 49: 244, 57: -164, 62: -164, 75: -164, 77: -164, 79: -164},
+    {1: -165, 3: -165, 6: -165, 8: -165, 12: -165, 13: -165, 14: -165, 26: -165, 33: 247, 35: 245, 39: 249, 40: 248, 43: 246, 49: 244, 57: -165, 62: -165, 75: -165, 77: -165, 79: -165},
+    {1: -144, 3: -144, 6: -144, 8: -144, 12: -144, 13: -144, 14: -144, 26: -144, 33: -144, 35: -144, 39: -144, 40: -144, 43: -144, 47: 250, 49: -144, 57: -144, 62: -144, 73: 251, 75: -144, 77: -144, 79: -144, 87: 252},
+    {1: -145, 3: -145, 6: -145, 8: -145, 12: -145, 13: -145, 14: -145, 26: -145, 33: -145, 35: -145, 39: -145, 40: -145, 43: -145, 47: 250, 49: -145, 57: -145, 62: -145, 73: 251, 75: -145, 77: -145, 79: -145, 87: 252},
+    {1: -146, 3: -146, 6: -146, 8: -146, 12: -146, 13: -146, 14: -146, 26: -146, 33: -146, 35: -146, 39: -146, 40: -146, 43: -146, 47: 250, 49: -146, 57: -146, 62: -146, 73: 251, 75: -146, 77: -146, 79: -146, 87: 252},
+    {1: -147, 3: -147, 6: -147, 8: -147, 12: -147, 13: -147, 14: -147, 26: -147, 33: -147, 35: -147, 39: -147, 40: -147, 43: -147, 47: 250, 49: -147, 57: -147, 62: -147, 73: 251, 75: -147, 77: -147, 79: -147, 87: 252},
+    {1: -148, 3: -148, 6: -148, 8: -148, 12: -148, 13: -148, 14: -148, 26: -148, 33: -148, 35: -148, 39: -148, 40: -148, 43: -148, 47: 250, 49: -148, 57: -148, 62: -148, 73: 251, 75: -148, 77: -148, 79: -148, 87: 252},
+    {0: -263, 5: -263, 7: -263, 9: -263, 16: -263, 17: -263, 18: -263, 19: -263, 22: -263, 23: -263, 29: -263, 31: -263, 32: -263, 36: -263, 37: -263, 41: -263, 42: -263, 46: -263, 50: -263, 52: -263, 58: -263, 59: -263, 60: -263, 61: -263, 65: -263, 67: -263, 68: -263, 70: -263, 71: -263, 75: -263, 78: -263, 81: -263, 82: -263, 83: -263, 84: -263, 85: -263, 86: -263, 89: -263, 90: -263, 91: -263, 92: -263},
+    {0: -264, 5: -264, 7: -264, 9: -264, 16: -264, 17: -264, 18: -264, 19: -264, 22: -264, 23: -264, 29: -264, 31: -264, 32: -264, 36: -264, 37: -264, 41: -264, 42: -264, 46: -264, 50: -264, 52: -264, 58: -264, 59: -264, 60: -264, 61: -264, 65: -264, 67: -264, 68: -264, 70: -264, 71: -264, 75: -264, 78: -264, 81: -264, 82: -264, 83: -264, 84: -264, 85: -264, 86: -264, 89: -264, 90: -264, 91: -264, 92: -264},
+    {9: 489, 18: -1, 68: -1},
+    {72: 490},
+    {13: -206, 75: -206},
+    {13: -90, 72: -90},
+    {1: -47, 2: -47, 3: -47, 6: -47, 8: -47, 12: -47, 13: -47, 14: -47, 20: -47, 21: -47, 25: -47, 26: -47, 33: -47, 35: -47, 39: -47, 40: -47, 42: -47, 43: -47, 46: -47, 47: -47, 48: -47, 49: -47, 50: -47, 51: -47, 52: -47, 53: -47, 54: -47, 55: -47, 56: -47, 57: -47, 62: -47, 63: -47, 64: -47, 65: -47, 66: -47, 67: -47, 68: -47, 69: -47, 72: -47, 73: -47, 74: -47, 75: -47, 77: -47, 79: -47, 87: -47, 88: -47, 93: -47},
+    {13: -49, 69: -49},
+    {68: 491},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 68: -1, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {1: -283, 2: -283, 3: -283, 6: -283, 8: -283, 12: -283, 13: -283, 14: -283, 20: -283, 21: -283, 25: -283, 26: -283, 33: -283, 35: -283, 39: -283, 40: -283, 42: -283, 43: -283, 46: -283, 47: -283, 48: -283, 49: -283, 50: -283, 51: -283, 52: -283, 53: -283, 54: -283, 55: -283, 56: -283, 57: -283, 62: -283, 63: -283, 64: -283, 65: -283, 66: -283, 67: -283, 68: -283, 69: -283, 72: -283, 73: -283, 74: -283, 75: -283, 77: -283, 79: -283, 87: -283, 88: -283, 93: -283},
+    {68: 493},
+    {12: -202, 13: -202, 68: -202, 69: -202, 72: -202, 75: -202},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 68: -1, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {41: 495},
+    {41: 496},
+    {13: 335, 72: 497},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {75: 499},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 72: -1, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {75: 501},
+    {13: -235, 75: -235},
+    {13: -238, 25: 437, 75: -238},
+    {13: 212, 72: 503},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {13: -241, 39: -241, 75: -241},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {18: 509, 68: 507},
+    {18: -267, 68: -267},
+    {9: 489, 18: -268, 68: -268},
+    {9: -269, 18: -269, 68: -269},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {41: 26},
+    {0: -281, 1: -285, 2: -285, 3: -285, 5: -281, 6: -285, 7: -281, 8: -285, 9: -281, 13: -285, 14: -285, 16: -281, 17: -281, 18: -281, 19: -281, 20: -285, 21: -285, 22: -281, 23: -281, 25: -285, 26: -285, 29: -281, 31: -281, 32: -281, 33: -285, 35: -285, 36: -281, 37: -281, 39: -285, 40: -285, 41: -281, 42: -281, 43: -285, 46: -281, 47: -285, 48: -285, 49: -285, 50: -281, 51: -285, 52: -281, 53: -285, 54: -285, 55: -285, 56: -285, 57: -285, 58: -281, 59: -281, 60: -281, 61: -281, 62: -285, 63: -285, 64: -285, 65: -281, 66: -285, 67: -281, 68: -281, 70: -281, 71: -281, 73: -285, 74: -285, 75: -281, 77: -285, 78: -281, 79: -285, 81: -281, 82: -281, 83: -281, 84: -281, 85: -281, 86: -281, 87: -285, 88: -285, 89: -281, 90: -281, 91: -281, 92: -281, 93: -285},
+    {68: 513},
+    {1: -284, 2: -284, 3: -284, 6: -284, 8: -284, 12: -284, 13: -284, 14: -284, 20: -284, 21: -284, 25: -284, 26: -284, 33: -284, 35: -284, 39: -284, 40: -284, 42: -284, 43: -284, 46: -284, 47: -284, 48: -284, 49: -284, 50: -284, 51: -284, 52: -284, 53: -284, 54: -284, 55: -284, 56: -284, 57: -284, 62: -284, 63: -284, 64: -284, 65: -284, 66: -284, 67: -284, 68: -284, 69: -284, 72: -284, 73: -284, 74: -284, 75: -284, 77: -284, 79: -284, 87: -284, 88: -284, 93: -284},
+    {68: 514},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 68: -1, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 68: -1, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {41: 517},
+    {0: -245, 5: -245, 7: -245, 9: -245, 16: -245, 17: -245, 18: -245, 19: -245, 22: -245, 23: -245, 29: -245, 31: -245, 32: -245, 36: -245, 37: -245, 41: -245, 42: -245, 46: -245, 50: -245, 52: -245, 58: -245, 59: -245, 60: -245, 61: -245, 65: -245, 67: -245, 68: -245, 70: -245, 71: -245, 75: -245, 78: -245, 81: -245, 82: -245, 83: -245, 84: -245, 85: -245, 86: -245, 89: -245, 90: -245, 91: -245, 92: -245},
+    {0: -246, 5: -246, 7: -246, 9: -246, 16: -246, 17: -246, 18: -246, 19: -246, 22: -246, 23: -246, 29: -246, 31: -246, 32: -246, 36: -246, 37: -246, 41: -246, 42: -246, 46: -246, 50: -246, 52: -246, 58: -246, 59: -246, 60: -246, 61: -246, 65: -246, 67: -246, 68: -246, 70: -246, 71: -246, 75: -246, 78: -246, 81: -246, 82: -246, 83: -246, 84: -246, 85: -246, 86: -246, 89: -246, 90: -246, 91: -246, 92: -246},
+    {72: 518},
+    {5: 87, 19: 84, 29: 69, 32: 110, 36: 43, 41: 111, 42: 52, 46: 25, 50: 78, 52: 83, 58: 102, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 72: -1, 78: 71, 82: 57, 84: 68, 86: 86, 90: 85},
+    {13: -239, 75: -239},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {13: 212, 72: 521},
+    {0: -250, 5: -250, 7: -250, 9: -250, 16: -250, 17: -250, 18: -250, 19: -250, 22: -250, 23: -250, 29: -250, 31: -250, 32: -250, 36: -250, 37: -250, 41: -250, 42: -250, 46: -250, 50: -250, 52: -250, 58: -250, 59: -250, 60: -250, 61: -250, 65: -250, 67: -250, 68: -250, 70: -250, 71: -250, 75: -250, 78: -250, 81: -250, 82: -250, 83: -250, 84: -250, 85: -250, 86: -250, 89: -250, 90: -250, 91: -250, 92: -250},
+    {12: -204, 13: -204, 39: -204, 75: -204},
+    {0: -265, 5: -265, 7: -265, 9: -265, 16: -265, 17: -265, 18: -265, 19: -265, 22: -265, 23: -265, 29: -265, 31: -265, 32: -265, 36: -265, 37: -265, 41: -265, 42: -265, 46: -265, 50: -265, 52: -265, 58: -265, 59: -265, 60: -265, 61: -265, 65: -265, 67: -265, 68: -265, 70: -265, 71: -265, 75: -265, 78: -265, 81: -265, 82: -265, 83: -265, 84: -265, 85: -265, 86: -265, 89: -265, 90: -265, 91: -265, 92: -265},
+    {9: 489, 68: -1},
+    {12: 523},
+    {9: -270, 18: -270, 68: -270},
+    {12: 524, 13: 212},
+    {0: -278, 5: -278, 7: -278, 9: -278, 16: -278, 17: -278, 18: -278, 19: -278, 22: -278, 23: -278, 29: -278, 30: -278, 31: -278, 32: -278, 36: -278, 37: -278, 41: -278, 42: -278, 46: -278, 50: -278, 52: -278, 58: -278, 59: -278, 60: -278, 61: -278, 65: -278, 67: -278, 68: -278, 70: -278, 71: -278, 75: -278, 78: -278, 81: -278, 82: -278, 83: -278, 84: -278, 85: -278, 86: -278, 89: -278, 90: -278, 91: -278, 92: -278},
+    {0: -282, 1: -286, 2: -286, 3: -286, 5: -282, 6: -286, 7: -282, 8: -286, 9: -282, 13: -286, 14: -286, 16: -282, 17: -282, 18: -282, 19: -282, 20: -286, 21: -286, 22: -282, 23: -282, 25: -286, 26: -286, 29: -282, 31: -282, 32: -282, 33: -286, 35: -286, 36: -282, 37: -282, 39: -286, 40: -286, 41: -282, 42: -282, 43: -286, 46: -282, 47: -286, 48: -286, 49: -286, 50: -282, 51: -286, 52: -282, 53: -286, 54: -286, 55: -286, 56: -286, 57: -286, 58: -282, 59: -282, 60: -282, 61: -282, 62: -286, 63: -286, 64: -286, 65: -282, 66: -286, 67: -282, 68: -282, 70: -282, 71: -282, 73: -286, 74: -286, 75: -282, 77: -286, 78: -282, 79: -286, 81: -282, 82: -282, 83: -282, 84: -282, 85: -282, 86: -282, 87: -286, 88: -286, 89: -282, 90: -282, 91: -282, 92: -282, 93: -286},
+    {1: -285, 2: -285, 3: -285, 6: -285, 8: -285, 12: -285, 13: -285, 14: -285, 20: -285, 21: -285, 25: -285, 26: -285, 33: -285, 35: -285, 39: -285, 40: -285, 42: -285, 43: -285, 46: -285, 47: -285, 48: -285, 49: -285, 50: -285, 51: -285, 52: -285, 53: -285, 54: -285, 55: -285, 56: -285, 57: -285, 62: -285, 63: -285, 64: -285, 65: -285, 66: -285, 67: -285, 68: -285, 69: -285, 72: -285, 73: -285, 74: -285, 75: -285, 77: -285, 79: -285, 87: -285, 88: -285, 93: -285},
+    {68: 525},
+    {68: 526},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 68: -1, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {72: 529},
+    {0: -251, 5: -251, 7: -251, 9: -251, 16: -251, 17: -251, 18: -251, 19: -251, 22: -251, 23: -251, 29: -251, 31: -251, 32: -251, 36: -251, 37: -251, 41: -251, 42: -251, 46: -251, 50: -251, 52: -251, 58: -251, 59: -251, 60: -251, 61: -251, 65: -251, 67: -251, 68: -251, 70: -251, 71: -251, 75: -251, 78: -251, 81: -251, 82: -251, 83: -251, 84: -251, 85: -251, 86: -251, 89: -251, 90: -251, 91: -251, 92: -251},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {68: 531},
+    {5: 87, 7: 35, 9: -1, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 68: -1, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {5: 87, 7: 35, 9: -1, 16: 34, 17: 41, 18: -1, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 68: -1, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {1: -286, 2: -286, 3: -286, 6: -286, 8: -286, 12: -286, 13: -286, 14: -286, 20: -286, 21: -286, 25: -286, 26: -286, 33: -286, 35: -286, 39: -286, 40: -286, 42: -286, 43: -286, 46: -286, 47: -286, 48: -286, 49: -286, 50: -286, 51: -286, 52: -286, 53: -286, 54: -286, 55: -286, 56: -286, 57: -286, 62: -286, 63: -286, 64: -286, 65: -286, 66: -286, 67: -286, 68: -286, 69: -286, 72: -286, 73: -286, 74: -286, 75: -286, 77: -286, 79: -286, 87: -286, 88: -286, 93: -286},
+    {13: -60, 68: -60},
+    {68: 534},
+    {0: -248, 5: -248, 7: -248, 9: -248, 16: -248, 17: -248, 18: -248, 19: -248, 22: -248, 23: -248, 29: -248, 31: -248, 32: -248, 36: -248, 37: -248, 41: -248, 42: -248, 46: -248, 50: -248, 52: -248, 58: -248, 59: -248, 60: -248, 61: -248, 65: -248, 67: -248, 68: -248, 70: -248, 71: -248, 75: -248, 78: -248, 81: -248, 82: -248, 83: -248, 84: -248, 85: -248, 86: -248, 89: -248, 90: -248, 91: -248, 92: -248},
+    {5: 87, 7: 35, 16: 34, 17: 41, 19: 84, 22: 31, 29: 69, 31: 33, 32: 23, 36: 43, 37: 30, 41: 26, 42: 52, 46: 25, 50: 78, 52: 83, 58: 51, 59: 88, 60: 67, 61: 70, 65: 77, 67: 82, 70: 72, 71: 36, 75: 28, 78: 71, 81: 38, 82: 57, 83: 39, 84: 68, 85: 40, 86: 86, 89: 27, 90: 85, 91: 32, 92: 37},
+    {0: -252, 5: -252, 7: -252, 9: -252, 16: -252, 17: -252, 18: -252, 19: -252, 22: -252, 23: -252, 29: -252, 31: -252, 32: -252, 36: -252, 37: -252, 41: -252, 42: -252, 46: -252, 50: -252, 52: -252, 58: -252, 59: -252, 60: -252, 61: -252, 65: -252, 67: -252, 68: -252, 70: -252, 71: -252, 75: -252, 78: -252, 81: -252, 82: -252, 83: -252, 84: -252, 85: -252, 86: -252, 89: -252, 90: -252, 91: -252, 92: -252},
+    {0: -266, 5: -266, 7: -266, 9: -266, 16: -266, 17: -266, 18: -266, 19: -266, 22: -266, 23: -266, 29: -266, 31: -266, 32: -266, 36: -266, 37: -266, 41: -266, 42: -266, 46: -266, 50: -266, 52: -266, 58: -266, 59: -266, 60: -266, 61: -266, 65: -266, 67: -266, 68: -266, 70: -266, 71: -266, 75: -266, 78: -266, 81: -266, 82: -266, 83: -266, 84: -266, 85: -266, 86: -266, 89: -266, 90: -266, 91: -266, 92: -266},
+    {9: -272, 68: -272},
+    {9: -271, 18: -271, 68: -271},
+    {13: -61, 68: -61},
+    {0: -249, 5: -249, 7: -249, 9: -249, 16: -249, 17: -249, 18: -249, 19: -249, 22: -249, 23: -249, 29: -249, 31: -249, 32: -249, 36: -249, 37: -249, 41: -249, 42: -249, 46: -249, 50: -249, 52: -249, 58: -249, 59: -249, 60: -249, 61: -249, 65: -249, 67: -249, 68: -249, 70: -249, 71: -249, 75: -249, 78: -249, 81: -249, 82: -249, 83: -249, 84: -249, 85: -249, 86: -249, 89: -249, 90: -249, 91: -249, 92: -249},
+)
+
+gotos = (
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 38: 3, 39: 10, 41: 66, 44: 29, 48: 11, 52: 7, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 82: 1, 86: 65, 88: 73, 90: 16, 92: 74, 93: 5, 94: 4, 95: 2, 96: 6, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {},
+    {},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 39: 10, 41: 66, 44: 29, 48: 11, 52: 7, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 93: 89, 96: 6, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {54: 90},
+    {},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 93, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 38: 3, 39: 10, 41: 66, 44: 29, 48: 11, 52: 7, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 93: 5, 94: 4, 95: 121, 96: 6, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {54: 124, 104: 123, 105: 122},
+    {},
+    {},
+    {},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 39: 10, 41: 66, 44: 29, 48: 11, 52: 129, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 96: 128, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {},
+    {54: 133},
+    {54: 135},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 137, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 140, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {19: 141},
+    {},
+    {},
+    {},
+    {},
+    {9: 143},
+    {},
+    {},
+    {4: 160},
+    {},
+    {4: 165},
+    {5: 59, 20: 62, 53: 106, 54: 103, 62: 58, 69: 169, 73: 168, 75: 61, 76: 63, 77: 109, 80: 105, 81: 108, 86: 65, 97: 64},
+    {35: 171, 36: 174, 37: 170, 38: 173},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 196, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 198, 102: 120},
+    {},
+    {},
+    {},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 199, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 200, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 201, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 202, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 203, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 204, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 205, 102: 120},
+    {},
+    {},
+    {50: 208, 54: 209},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 39: 10, 41: 66, 44: 29, 48: 11, 52: 129, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 96: 210, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {},
+    {},
+    {9: 213},
+    {},
+    {},
+    {4: 218},
+    {},
+    {4: 222},
+    {5: 59, 20: 62, 53: 106, 54: 103, 62: 58, 69: 226, 73: 225, 75: 61, 76: 63, 77: 109, 80: 105, 81: 108, 86: 65, 97: 64},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {54: 229},
+    {54: 236, 76: 238, 83: 232, 84: 231, 85: 233, 97: 237},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {56: 261},
+    {},
+    {1: 116, 5: 59, 6: 263, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 264, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 266, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 8: 272, 12: 278, 15: 276, 18: 277, 20: 62, 22: 99, 31: 273, 38: 270, 42: 279, 45: 271, 46: 267, 53: 106, 54: 103, 60: 269, 62: 58, 65: 275, 68: 274, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 89: 280, 91: 281, 97: 64, 101: 118, 102: 120},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 285, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 286, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {28: 288, 49: 289},
+    {},
+    {1: 116, 5: 59, 6: 292, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {1: 116, 5: 59, 6: 293, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {2: 75, 5: 59, 11: 60, 14: 53, 17: 56, 20: 62, 23: 48, 41: 66, 53: 55, 54: 103, 61: 295, 62: 58, 64: 294, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 92: 74, 97: 64, 102: 81, 103: 79},
+    {},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 296, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {54: 297},
+    {1: 116, 3: 299, 5: 59, 6: 300, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {2: 75, 5: 59, 11: 60, 14: 301, 17: 56, 20: 62, 23: 48, 41: 66, 53: 55, 54: 103, 61: 295, 62: 58, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 92: 74, 97: 64, 102: 81, 103: 79},
+    {},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 302, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {54: 303},
+    {},
+    {4: 304},
+    {1: 116, 5: 59, 6: 306, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {},
+    {},
+    {},
+    {2: 75, 5: 59, 11: 60, 17: 310, 20: 62, 23: 48, 41: 66, 53: 55, 54: 103, 61: 295, 62: 58, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 92: 74, 97: 64, 102: 81, 103: 79},
+    {2: 75, 5: 59, 11: 311, 20: 62, 23: 48, 41: 66, 53: 55, 54: 103, 61: 295, 62: 58, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 92: 74, 97: 64, 102: 81, 103: 79},
+    {2: 75, 5: 59, 20: 62, 23: 48, 41: 312, 53: 55, 54: 103, 61: 295, 62: 58, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 92: 74, 97: 64, 102: 81, 103: 79},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 313, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 314, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 315, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 316, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 317, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 318, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 319, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 320, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 321, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 322, 97: 64, 101: 118, 102: 120},
+    {1: 323, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 118, 102: 120},
+    {1: 324, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 118, 102: 120},
+    {1: 325, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 118, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 326, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 118, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 327, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 118, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 328, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 329, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 330, 102: 120},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {50: 332, 54: 209},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {1: 116, 5: 59, 6: 336, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 6: 337, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {},
+    {1: 116, 5: 59, 6: 338, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 40: 113, 53: 106, 54: 103, 60: 197, 62: 58, 63: 339, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 340, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {54: 341},
+    {1: 116, 5: 59, 10: 112, 13: 342, 16: 107, 20: 62, 22: 99, 40: 113, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 343, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {54: 344},
+    {},
+    {4: 345},
+    {1: 116, 5: 59, 10: 112, 16: 346, 20: 62, 22: 99, 40: 113, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 10: 347, 20: 62, 22: 99, 40: 113, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {54: 236, 76: 238, 85: 352, 97: 237},
+    {54: 236, 76: 238, 85: 353, 97: 237},
+    {},
+    {},
+    {},
+    {1: 116, 5: 59, 20: 62, 22: 99, 40: 354, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 355, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 356, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 357, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 358, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 359, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 360, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 361, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 362, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 363, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 364, 97: 64, 101: 118, 102: 120},
+    {1: 365, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 118, 102: 120},
+    {1: 366, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 118, 102: 120},
+    {1: 367, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 118, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 368, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 118, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 369, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 118, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 370, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 371, 102: 120},
+    {5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 97: 64, 101: 372, 102: 120},
+    {},
+    {},
+    {54: 124, 104: 373},
+    {},
+    {1: 116, 5: 59, 6: 374, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {54: 380, 106: 379, 107: 381},
+    {9: 383},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {49: 402},
+    {},
+    {},
+    {19: 404},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {36: 174, 37: 410, 38: 173},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 38: 3, 39: 10, 41: 66, 44: 29, 48: 11, 51: 413, 52: 7, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 93: 5, 94: 4, 95: 414, 96: 6, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {54: 416},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {50: 421, 54: 209},
+    {},
+    {54: 236, 76: 238, 83: 423, 85: 233, 97: 237},
+    {1: 116, 5: 59, 6: 424, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 39: 10, 41: 66, 44: 29, 48: 11, 52: 129, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 96: 427, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 428, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 39: 10, 41: 66, 44: 29, 48: 11, 52: 129, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 96: 429, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 38: 431, 40: 113, 43: 432, 47: 430, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {57: 436},
+    {},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 438, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 8: 440, 12: 278, 15: 276, 18: 277, 20: 62, 22: 99, 31: 273, 42: 279, 53: 106, 54: 103, 60: 439, 62: 58, 65: 275, 68: 274, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 89: 280, 91: 281, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 8: 441, 12: 278, 15: 276, 18: 277, 20: 62, 22: 99, 31: 273, 42: 279, 53: 106, 54: 103, 60: 439, 62: 58, 65: 275, 68: 274, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 89: 280, 91: 281, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 8: 442, 12: 278, 15: 276, 18: 277, 20: 62, 22: 99, 31: 273, 42: 279, 53: 106, 54: 103, 60: 439, 62: 58, 65: 275, 68: 274, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 89: 280, 91: 281, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 12: 278, 15: 276, 18: 277, 20: 62, 22: 99, 42: 279, 53: 106, 54: 103, 60: 197, 62: 58, 65: 443, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 89: 280, 91: 281, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 12: 278, 15: 444, 18: 277, 20: 62, 22: 99, 42: 279, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 89: 280, 91: 281, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 12: 278, 18: 445, 20: 62, 22: 99, 42: 279, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 89: 280, 91: 281, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 12: 446, 20: 62, 22: 99, 42: 279, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 89: 280, 91: 281, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 42: 447, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 89: 280, 91: 281, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 448, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 449, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 450, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 451, 91: 115, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 452, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 453, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 454, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 455, 97: 64, 101: 118, 102: 120},
+    {1: 116, 5: 59, 20: 62, 22: 99, 53: 106, 54: 103, 60: 197, 62: 58, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 91: 456, 97: 64, 101: 118, 102: 120},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 39: 10, 41: 66, 44: 29, 48: 11, 52: 129, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 96: 457, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {24: 458},
+    {},
+    {54: 460},
+    {},
+    {1: 116, 5: 59, 6: 461, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {},
+    {1: 116, 5: 59, 6: 462, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {1: 116, 5: 59, 6: 464, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 38: 3, 39: 10, 41: 66, 44: 29, 48: 11, 51: 465, 52: 7, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 93: 5, 94: 4, 95: 414, 96: 6, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {},
+    {},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 38: 3, 39: 10, 41: 66, 44: 29, 48: 11, 51: 468, 52: 7, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 93: 5, 94: 4, 95: 414, 96: 6, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {1: 116, 5: 59, 6: 469, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {50: 473, 54: 209},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 38: 431, 40: 113, 43: 432, 47: 477, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {54: 479, 107: 478},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 480, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {1: 116, 5: 59, 8: 482, 12: 278, 15: 276, 18: 277, 20: 62, 22: 99, 31: 273, 42: 279, 53: 106, 54: 103, 60: 439, 62: 58, 65: 275, 68: 274, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 89: 280, 91: 281, 97: 64, 101: 118, 102: 120},
+    {},
+    {9: 383},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {25: 488, 26: 487, 27: 485, 38: 486},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 38: 3, 39: 10, 41: 66, 44: 29, 48: 11, 51: 492, 52: 7, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 93: 5, 94: 4, 95: 414, 96: 6, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {},
+    {},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 38: 3, 39: 10, 41: 66, 44: 29, 48: 11, 51: 494, 52: 7, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 93: 5, 94: 4, 95: 414, 96: 6, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {},
+    {},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 39: 10, 41: 66, 44: 29, 48: 11, 52: 129, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 96: 498, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 38: 431, 40: 113, 43: 432, 47: 500, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {},
+    {57: 502},
+    {},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 504, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 39: 10, 41: 66, 44: 29, 48: 11, 52: 129, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 96: 505, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {1: 116, 5: 59, 8: 506, 12: 278, 15: 276, 18: 277, 20: 62, 22: 99, 31: 273, 42: 279, 53: 106, 54: 103, 60: 439, 62: 58, 65: 275, 68: 274, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 89: 280, 91: 281, 97: 64, 101: 118, 102: 120},
+    {34: 508},
+    {},
+    {25: 510},
+    {},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 40: 113, 43: 511, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {19: 512},
+    {},
+    {},
+    {},
+    {},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 38: 3, 39: 10, 41: 66, 44: 29, 48: 11, 51: 515, 52: 7, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 93: 5, 94: 4, 95: 414, 96: 6, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 38: 3, 39: 10, 41: 66, 44: 29, 48: 11, 51: 516, 52: 7, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 93: 5, 94: 4, 95: 414, 96: 6, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {},
+    {},
+    {},
+    {1: 116, 5: 59, 6: 94, 10: 112, 13: 104, 16: 107, 20: 62, 22: 99, 29: 95, 38: 431, 40: 113, 43: 432, 47: 519, 53: 106, 54: 103, 60: 96, 62: 58, 63: 100, 66: 97, 69: 101, 71: 117, 73: 98, 75: 61, 76: 63, 77: 109, 78: 119, 80: 105, 81: 108, 86: 65, 87: 114, 91: 115, 97: 64, 101: 118, 102: 120},
+    {},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 39: 10, 41: 66, 44: 29, 48: 11, 52: 129, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 96: 520, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {},
+    {},
+    {},
+    {25: 488, 26: 487, 27: 522, 38: 486},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 38: 3, 39: 10, 41: 66, 44: 29, 48: 11, 51: 527, 52: 7, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 93: 5, 94: 4, 95: 414, 96: 6, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 39: 10, 41: 66, 44: 29, 48: 11, 52: 129, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 96: 528, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 39: 10, 41: 66, 44: 29, 48: 11, 52: 129, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 96: 530, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 38: 3, 39: 10, 41: 66, 44: 29, 48: 11, 52: 7, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 93: 5, 94: 4, 95: 532, 96: 6, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 38: 3, 39: 10, 41: 66, 44: 29, 48: 11, 52: 7, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 93: 5, 94: 4, 95: 533, 96: 6, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {},
+    {},
+    {},
+    {2: 75, 5: 59, 7: 42, 11: 60, 14: 53, 17: 56, 19: 8, 20: 62, 21: 15, 23: 48, 30: 44, 32: 14, 33: 22, 39: 10, 41: 66, 44: 29, 48: 11, 52: 129, 53: 55, 54: 24, 55: 12, 58: 13, 59: 19, 61: 45, 62: 58, 64: 49, 67: 46, 70: 50, 72: 76, 74: 47, 75: 61, 76: 63, 79: 80, 81: 54, 86: 65, 88: 73, 90: 16, 92: 74, 96: 535, 97: 64, 98: 18, 99: 20, 100: 21, 102: 81, 103: 79, 108: 9, 109: 17},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+)
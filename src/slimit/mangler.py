@@ -24,28 +24,292 @@
 
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
-from slimit.scope import SymbolTable
+import json
+import re
+
+from slimit import ast
+from slimit.scope import (
+    NAME_CHARS,
+    SymbolTable,
+    get_name_sequence,
+    is_mangled_name,
+    )
+from slimit.visitors import nodevisitor
+from slimit.visitors.minvisitor import ECMAMinifier
 from slimit.visitors.scopevisitor import (
-    ScopeTreeVisitor,
-    fill_scope_references,
+    ScopeAnalysisVisitor,
     mangle_scope_tree,
-    NameManglerVisitor,
+    rename_symbols,
     )
 
+try:
+    unichr
+except NameError:
+    unichr = chr
+
+
+# properties of the built-in objects and the DOM, never mangled
+# and never given out as mangled property names
+RESERVED_PROPERTIES = frozenset("""
+    prototype constructor length name arguments caller callee
+    toString toLocaleString valueOf hasOwnProperty isPrototypeOf
+    propertyIsEnumerable __proto__ __defineGetter__ __defineSetter__
+    __lookupGetter__ __lookupSetter__ __iterator__ __noSuchMethod__
+    apply call bind create defineProperty defineProperties freeze
+    getOwnPropertyDescriptor getOwnPropertyNames getPrototypeOf isExtensible
+    isFrozen isSealed keys preventExtensions seal
+    concat every filter forEach indexOf isArray join lastIndexOf map pop
+    push reduce reduceRight reverse shift slice some sort splice unshift
+    charAt charCodeAt fromCharCode localeCompare match replace search
+    split substr substring toLowerCase toUpperCase trim
+    toFixed toExponential toPrecision MAX_VALUE MIN_VALUE NEGATIVE_INFINITY
+    POSITIVE_INFINITY E LN10 LN2 LOG10E LOG2E PI SQRT1_2 SQRT2 abs acos
+    asin atan atan2 ceil cos exp floor log max min pow random round sin
+    sqrt tan now parse UTC getTime getDate getDay getFullYear getHours
+    getMilliseconds getMinutes getMonth getSeconds getTimezoneOffset
+    setTime setDate setFullYear setHours setMilliseconds setMinutes
+    setMonth setSeconds toISOString toJSON toDateString toTimeString
+    exec test source global ignoreCase multiline lastIndex input index
+    message stack stringify
+    window document navigator location history screen self parent top
+    frames opener console log error warn info debug
+    addEventListener removeEventListener dispatchEvent attachEvent
+    detachEvent preventDefault stopPropagation returnValue cancelBubble
+    type target currentTarget srcElement relatedTarget which keyCode
+    charCode button pageX pageY clientX clientY data
+    getElementById getElementsByTagName getElementsByClassName
+    querySelector querySelectorAll createElement createTextNode
+    createDocumentFragment appendChild removeChild insertBefore
+    replaceChild cloneNode getAttribute setAttribute removeAttribute
+    hasAttribute attributes childNodes children firstChild lastChild
+    nextSibling previousSibling parentNode ownerDocument nodeType
+    nodeName nodeValue tagName id className innerHTML outerHTML
+    textContent innerText value checked selected disabled href src style
+    display width height left right offsetWidth offsetHeight offsetTop
+    offsetLeft offsetParent scrollTop scrollLeft body head
+    documentElement readyState cookie title setTimeout clearTimeout
+    setInterval clearInterval open close send status statusText
+    responseText responseXML onreadystatechange setRequestHeader
+    getResponseHeader onload onerror onclick
+    """.split())
+
+
+# 7.8.4 escape sequences of string literals
+_STRING_ESCAPE = re.compile(
+    r'\\(?:x([0-9a-fA-F]{2})|u([0-9a-fA-F]{4})|'
+    r'(0)(?![0-9])|(\r\n|[\n\r\u2028\u2029])|(.))', re.S)
+
+_SINGLE_CHAR_ESCAPES = {
+    'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t', 'v': '\v'}
+
+
+def _unescape(match):
+    hex_digits, unicode_digits, zero, line_terminator, char = match.groups()
+    if hex_digits or unicode_digits:
+        return unichr(int(hex_digits or unicode_digits, 16))
+    if zero:
+        return '\0'
+    if line_terminator:
+        return ''
+    return _SINGLE_CHAR_ESCAPES.get(char, char)
+
+
+def _string_value(literal):
+    """Return the value of a string literal written with quotes."""
+    return _STRING_ESCAPE.sub(_unescape, literal[1:-1])
+
+
+def _property_keys(tree):
+    """Yield (name, node) for the property names of the tree.
+
+    'node' is the Identifier of a dot accessor or an object literal
+    key, or the String of a key or a bracket accessor. Escapes in
+    strings are decoded, 'obj["\\x5fx"]' gives the name '_x'.
+    """
+    for node in nodevisitor.visit(tree):
+        cls = node.__class__
+        if cls is ast.DotAccessor:
+            key = node.identifier
+        elif cls is ast.Assign and node.op == ':':
+            key = node.left
+        elif cls is ast.GetPropAssign or cls is ast.SetPropAssign:
+            key = node.prop_name
+        elif (cls is ast.BracketAccessor and
+              node.expr.__class__ is ast.String):
+            key = node.expr
+        else:
+            continue
+        if key.__class__ is ast.Identifier:
+            yield key.value, key
+        elif key.__class__ is ast.String:
+            yield _string_value(key.value), key
+
+
+def mangle_properties(tree, pattern, reserved=(), property_map=None):
+    """Mangle the property names that match the regular expression.
+
+    Dot accessors, object literal keys and string keys of bracket
+    accessors are renamed, 'obj._x', 'obj["_x"]' and '{_x: 1}' get
+    the same name. Names in RESERVED_PROPERTIES and in 'reserved'
+    are left alone, so are strings used as property names in other
+    ways, like 'name in obj', which must be reserved or not match.
 
-def mangle(tree, toplevel=False):
+    Properties that occur most get the shortest names. Names of
+    properties that aren't mangled are not given out.
+
+    Args:
+        pattern: regular expression string or compiled pattern,
+        searched in the property names.
+        reserved: names that are never mangled.
+        property_map: defaults to None. Mangled names of a previous
+        run as {name: mangled}, reused where possible. Updated with
+        the names of this run, entries of properties that don't
+        occur in the tree are kept.
+    """
+    if not hasattr(pattern, 'search'):
+        pattern = re.compile(pattern)
+    search = pattern.search
+    reserved = RESERVED_PROPERTIES.union(reserved)
+    # taken names: properties of the tree that keep their names
+    taken = set(reserved)
+    keys = {}
+    order = []
+    for name, node in _property_keys(tree):
+        if name in reserved or search(name) is None:
+            taken.add(name)
+            continue
+        nodes = keys.get(name)
+        if nodes is None:
+            nodes = keys[name] = []
+            order.append(name)
+        nodes.append(node)
+
+    # sorted is stable, names used as often keep their order
+    order.sort(key=lambda name: -len(keys[name]))
+    mangled_names = {}
+    previous = property_map or {}
+    for name in order:
+        mangled = previous.get(name)
+        if (mangled is not None and mangled not in taken and
+            is_mangled_name(mangled)):
+            mangled_names[name] = mangled
+            taken.add(mangled)
+    # names of the map are kept for their properties, which may be
+    # in other files minified with the same map
+    taken.update(previous.values())
+    sequence = get_name_sequence()
+    index = 0
+    for name in order:
+        if name in mangled_names:
+            continue
+        while sequence[index] in taken:
+            index += 1
+        mangled_names[name] = sequence[index]
+        taken.add(sequence[index])
+
+    for name, nodes in keys.items():
+        mangled = mangled_names[name]
+        for node in nodes:
+            if node.__class__ is ast.Identifier:
+                node.value = mangled
+            else:
+                quote = node.value[0]
+                node.value = quote + mangled + quote
+
+    if property_map is not None:
+        property_map.update(mangled_names)
+
+
+def _output_alphabet(tree, root, toplevel):
+    """Return NAME_CHARS ordered by how often the characters occur in
+    the minified code of the tree, without the names that are going
+    to be mangled.
+    """
+    text = ECMAMinifier().visit(tree)
+    counts = dict((char, text.count(char)) for char in NAME_CHARS)
+    scopes = list(root.children) if not toplevel else [root]
+    while scopes:
+        scope = scopes.pop()
+        scopes.extend(scope.children)
+        for name, symbol in scope.symbols.items():
+            for char in name:
+                if char in counts:
+                    counts[char] -= len(symbol.occurrences)
+    # sorted is stable, characters that don't occur keep their order
+    return ''.join(sorted(NAME_CHARS, key=lambda char: -counts[char]))
+
+
+def mangle(tree, toplevel=False, by_frequency=False, for_gzip=False,
+           name_map=None, properties=None, reserved_properties=(),
+           property_map=None):
     """Mangle names.
 
     Args:
         toplevel: defaults to False. Defines if global
         scope should be mangled or not.
+        by_frequency: defaults to False. If True the symbols
+        used most often in a scope get the shortest names.
+        for_gzip: defaults to False. If True mangled names are made
+        of the characters used most in the rest of the output first,
+        which compresses better. Best used without 'by_frequency',
+        sibling scopes then give the same names to their parameters
+        and variables in the same order.
+        name_map: defaults to None. Mangled names of a previous run
+        as returned by load_name_map. Symbols keep their previous
+        names where possible, so the output of a changed file differs
+        little from the previous one. Updated with the names of this
+        run, save it with save_name_map for the next one.
+        properties: defaults to None. Regular expression of the
+        property names to mangle, like '^_'. Property names are
+        global, see mangle_properties for what is renamed.
+        reserved_properties: property names that are not mangled,
+        in addition to RESERVED_PROPERTIES.
+        property_map: defaults to None. Like 'name_map' for the
+        mangled property names.
     """
+    if properties is not None:
+        mangle_properties(
+            tree, properties, reserved_properties, property_map)
+
     sym_table = SymbolTable()
-    visitor = ScopeTreeVisitor(sym_table)
+    # builds the scope tree, fills 'refs' of the scopes and records
+    # the identifiers of every symbol in one walk over the tree
+    visitor = ScopeAnalysisVisitor(sym_table)
     visitor.visit(tree)
+    visitor.fill_references()
+
+    alphabet = None
+    if for_gzip:
+        alphabet = _output_alphabet(tree, sym_table.globals, toplevel)
+    mangle_scope_tree(
+        sym_table.globals, toplevel, by_frequency, alphabet, name_map)
+    rename_symbols(sym_table.globals)
+
+
+def load_name_map(path):
+    """Return the name map saved to the file or an empty map if the
+    file doesn't exist or is empty.
+
+    Raises ValueError if the file doesn't hold a name map.
+    """
+    try:
+        fin = open(path)
+    except IOError:
+        return {}
+    with fin:
+        text = fin.read()
+    if not text.strip():
+        return {}
+    try:
+        name_map = json.loads(text)
+    except ValueError as exc:
+        raise ValueError('Invalid name map file %s: %s' % (path, exc))
+    if not isinstance(name_map, dict):
+        raise ValueError(
+            'Invalid name map file %s: not a JSON object' % path)
+    return name_map
 
-    fill_scope_references(tree)
-    mangle_scope_tree(sym_table.globals, toplevel)
 
-    mangler = NameManglerVisitor()
-    mangler.visit(tree)
+def save_name_map(name_map, path):
+    with open(path, 'w') as fout:
+        json.dump(name_map, fout, indent=1, sort_keys=True)
@@ -27,18 +27,43 @@ __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 import sys
 import optparse
 import textwrap
+import threading
 
 from slimit import mangler
 from slimit.parser import Parser
 from slimit.visitors.minvisitor import ECMAMinifier
 
+# Building a parser (PLY lexer and LALR tables) costs more than
+# parsing a small script, so every thread keeps its own instance
+# and reuses it for all subsequent 'minify' calls
+_parsers = threading.local()
 
-def minify(text, mangle=False, mangle_toplevel=False):
-    parser = Parser()
+
+def get_parser():
+    """Return a parser instance cached for the current thread."""
+    parser = getattr(_parsers, 'parser', None)
+    if parser is None:
+        parser = _parsers.parser = Parser()
+    return parser
+
+
+def minify(text, mangle=False, mangle_toplevel=False, out=None,
+           name_map=None, mangle_props=None, property_map=None):
+    """Return the minified text.
+
+    If 'out' is given the minified code is written to that file-like
+    object as it is generated and None is returned.
+
+    'name_map', 'mangle_props' and 'property_map' are passed to
+    slimit.mangler.mangle as 'name_map', 'properties' and
+    'property_map'.
+    """
+    parser = get_parser()
     tree = parser.parse(text)
     if mangle:
-        mangler.mangle(tree, toplevel=mangle_toplevel)
-    minified = ECMAMinifier().visit(tree)
+        mangler.mangle(tree, toplevel=mangle_toplevel, name_map=name_map,
+                       properties=mangle_props, property_map=property_map)
+    minified = ECMAMinifier().visit(tree, out)
     return minified
 
 
@@ -55,6 +80,14 @@ def main(argv=None, inp=sys.stdin, out=sys.stdout):
     parser.add_option('-t', '--mangle-toplevel', action='store_true',
                       dest='mangle_toplevel', default=False,
                       help='mangle top level scope (defaults to False)')
+    parser.add_option('--name-map', dest='name_map', metavar='FILE',
+                      help='reuse the mangled names saved in FILE and '
+                      'save the names given to it')
+    parser.add_option('--mangle-props', dest='mangle_props', metavar='REGEX',
+                      help='with -m also mangle the property names that '
+                      'match REGEX, like ^_')
+    parser.add_option('--property-map', dest='property_map', metavar='FILE',
+                      help='like --name-map for the mangled property names')
 
     if argv is None:
         argv = sys.argv[1:]
@@ -65,6 +98,20 @@ def main(argv=None, inp=sys.stdin, out=sys.stdout):
     else:
         text = inp.read()
 
-    minified = minify(
-        text, mangle=options.mangle, mangle_toplevel=options.mangle_toplevel)
-    out.write(minified)
+    name_map = property_map = None
+    try:
+        if options.name_map:
+            name_map = mangler.load_name_map(options.name_map)
+        if options.property_map:
+            property_map = mangler.load_name_map(options.property_map)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    minify(text, mangle=options.mangle, mangle_toplevel=options.mangle_toplevel,
+           out=out, name_map=name_map, mangle_props=options.mangle_props,
+           property_map=property_map)
+
+    if options.name_map and options.mangle:
+        mangler.save_name_map(name_map, options.name_map)
+    if options.property_map and options.mangle and options.mangle_props:
+        mangler.save_name_map(property_map, options.property_map)
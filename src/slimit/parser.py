@@ -24,16 +24,30 @@
 
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
+import sys
+
 import ply.yacc
 
 from slimit import ast
 from slimit.lexer import Lexer
+from slimit.lrgen import LRTables, signature_digest
+from slimit.rdparser import RDParser
 
 try:
     from slimit import lextab, yacctab
 except ImportError:
     lextab, yacctab = 'lextab', 'yacctab'
 
+try:
+    from slimit import lrtab
+except ImportError:
+    lrtab = None
+
+_NO_TOKEN = object()
+
+# LRTables shared by all parsers, keyed by the yacctab signature
+_lr_tables = {}
+
 
 class Parser(object):
     """JavaScript parser(ECMA-262 5th edition grammar).
@@ -42,17 +56,39 @@ class Parser(object):
     a relational expression with the `in` operator in a `for` statement.
 
     '*nobf' stands for 'no brace or function'
+
+    'lex_backend' is passed to the lexer as its 'backend' argument.
+
+    The 'backend' argument selects the LR driver: 'ply' (the default)
+    walks the PLY tables, 'lr' uses the integer indexed tables from
+    slimit.lrtab and calls the grammar rules with plain lists, which
+    is faster and builds the same AST. 'rd' doesn't use the grammar
+    at all, the hand-written slimit.rdparser.RDParser builds the
+    same AST even faster.
+
+    With 'lazy_functions' set the 'rd' backend only matches braces of
+    function bodies, a body is parsed on the first access to
+    'elements' of its FuncDecl / FuncExpr node. Syntax errors in it
+    are raised then as well.
     """
+    backends = ('ply', 'lr', 'rd')
 
     def __init__(self, lex_optimize=True, lextab=lextab,
-                 yacc_optimize=True, yacctab=yacctab, yacc_debug=False):
+                 yacc_optimize=True, yacctab=yacctab, yacc_debug=False,
+                 lex_backend='ply', backend='ply', lazy_functions=False):
+        if backend not in self.backends:
+            raise ValueError('Unknown parser backend: %r' % backend)
+        if lazy_functions and backend != 'rd':
+            raise ValueError(
+                'lazy_functions is only supported by the rd backend')
+        self.backend = backend
         self.lex_optimize = lex_optimize
         self.lextab = lextab
         self.yacc_optimize = yacc_optimize
         self.yacctab = yacctab
         self.yacc_debug = yacc_debug
 
-        self.lexer = Lexer()
+        self.lexer = Lexer(backend=lex_backend)
         self.lexer.build(optimize=lex_optimize, lextab=lextab)
         self.tokens = self.lexer.tokens
 
@@ -60,59 +96,231 @@ class Parser(object):
             module=self, optimize=yacc_optimize,
             debug=yacc_debug, tabmodule=yacctab, start='program')
 
-        # https://github.com/rspivak/slimit/issues/29
-        # lexer.auto_semi can cause a loop in a parser
-        # when a parser error happens on a token right after
-        # a newline.
-        # We keep record of the tokens that caused p_error
-        # and if the token has already been seen - we raise
-        # a SyntaxError exception to avoid looping over and
-        # over again.
-        self._error_tokens = {}
-
-    def _has_been_seen_before(self, token):
-        if token is None:
-            return False
-        key = token.type, token.value, token.lineno, token.lexpos
-        return key in self._error_tokens
-
-    def _mark_as_seen(self, token):
-        if token is None:
-            return
-        key = token.type, token.value, token.lineno, token.lexpos
-        self._error_tokens[key] = True
+        if backend == 'lr':
+            self.lr_tables = self._get_lr_tables()
+            # bound grammar rule per production
+            self.reductions = [
+                (nonterminal, length, func and getattr(self, func))
+                for nonterminal, length, func in self.lr_tables.productions
+                ]
+        elif backend == 'rd':
+            self.rd_parser = RDParser(self.lexer, lazy=lazy_functions)
+
+    def _get_lr_tables(self):
+        signature = getattr(self.yacctab, '_lr_signature', None)
+        if not self.yacc_optimize or signature is None:
+            # the PLY tables may have been built from the grammar
+            return LRTables.from_parser(self.parser, self.tokens)
+        tables = _lr_tables.get(signature)
+        if tables is None:
+            digest = signature_digest(signature)
+            if lrtab is not None and lrtab.signature == digest:
+                tables = LRTables.from_module(lrtab)
+            else:
+                tables = LRTables.from_parser(
+                    self.parser, self.tokens, digest)
+            _lr_tables[signature] = tables
+        return tables
 
     def _raise_syntax_error(self, token):
+        if token is None:
+            raise SyntaxError('Unexpected end of input')
         raise SyntaxError(
             'Unexpected token (%s, %r) at %s:%s between %s and %s' % (
-                token.type, token.value, token.lineno, token.lexpos,
-                self.lexer.prev_token, self.lexer.token())
+                (token.type, token.value) +
+                self.lexer.position(token.lexpos) +
+                (self.lexer.prev_token, self.lexer.token()))
             )
 
     def parse(self, text, debug=False):
-        return self.parser.parse(text, lexer=self.lexer, debug=debug)
+        """Parse the text and return the root of the AST.
+
+        Instead of a text a TokenBuffer returned by 'Lexer.tokenize'
+        can be passed.
+
+        'debug' can be True or a logger object, every step of the
+        parser is then logged.
+        """
+        if debug and not hasattr(debug, 'info'):
+            debug = ply.yacc.PlyLogger(sys.stderr)
+        if self.backend == 'rd' and not debug:
+            return self.rd_parser.parse(text)
+        self.lexer.input(text)
+        if self.backend == 'lr' and not debug:
+            return self._parse_lr()
+        return self._parse(debug)
+
+    def _parse(self, debug):
+        # LR driver working on the tables built by ply.yacc.
+        #
+        # Automatic semicolon insertion (section 7.9.1 ECMA262)
+        # is a part of the driver: when the current token isn't
+        # allowed by the grammar, but a semicolon is, the semicolon
+        # is inserted if the token is '}', the end of input or is
+        # separated from the previous token by a line terminator.
+        # A semicolon is never inserted twice before the same token,
+        # otherwise it would be parsed as an empty statement.
+        parser = self.parser
+        actions = parser.action
+        goto = parser.goto
+        prods = parser.productions
+        defaulted_states = parser.defaulted_states
+        get_token = self.lexer.token
+        auto_semi = self.lexer.auto_semi
+
+        pslice = ply.yacc.YaccProduction(None)
+        pslice.lexer = self.lexer
+        pslice.parser = parser
+        end = ply.yacc.YaccSymbol()
+        end.type = '$end'
+        statestack = [0]
+        symstack = [end]
+        pslice.stack = symstack
+        state = 0
+        # the lookahead symbol and the token it was made from
+        lookahead = None
+        token = None
+        # the token the last semicolon was inserted before
+        semi_token = _NO_TOKEN
+
+        while True:
+            if state in defaulted_states:
+                t = defaulted_states[state]
+            else:
+                if lookahead is None:
+                    token = get_token()
+                    lookahead = end if token is None else token
+                t = actions[state].get(lookahead.type)
+
+            if debug:
+                debug.info('State  : %s', state)
+                debug.info('Stack  : %s . %s',
+                           ' '.join(sym.type for sym in symstack[1:]),
+                           lookahead and lookahead.type)
+
+            if t is None:
+                if token is not semi_token and 'SEMI' in actions[state]:
+                    semi = auto_semi(token)
+                    if semi is not None:
+                        if debug:
+                            debug.info('Action : Insert SEMI')
+                        semi_token = token
+                        lookahead = token = semi
+                        continue
+                self.p_error(token)
+
+            if t > 0:
+                # shift
+                if debug:
+                    debug.info('Action : Shift and goto state %s', t)
+                statestack.append(t)
+                state = t
+                symstack.append(lookahead)
+                lookahead = None
+                continue
+
+            if t == 0:
+                # accept
+                return symstack[-1].value
+
+            # reduce
+            p = prods[-t]
+            pname = p.name
+            plen = p.len
+            if debug:
+                debug.info('Action : Reduce rule [%s]', p.str)
+            sym = ply.yacc.YaccSymbol()
+            sym.type = pname
+            sym.value = None
+            if plen:
+                targ = symstack[-plen - 1:]
+                targ[0] = sym
+                del symstack[-plen:]
+                del statestack[-plen:]
+            else:
+                targ = [sym]
+            pslice.slice = targ
+            p.callable(pslice)
+            symstack.append(sym)
+            state = goto[statestack[-1]][pname]
+            statestack.append(state)
+
+    def _parse_lr(self):
+        # same as _parse, but on the integer indexed tables. Grammar
+        # rules are called with a list holding the values of the
+        # right-hand side symbols instead of a YaccProduction.
+        tables = self.lr_tables
+        terminal_index = tables.terminal_index
+        action = tables.action
+        goto = tables.goto
+        defaulted_states = tables.defaulted_states
+        reductions = self.reductions
+        end = tables.end
+        semi = tables.semi
+        get_token = self.lexer.token
+        auto_semi = self.lexer.auto_semi
+
+        statestack = [0]
+        valuestack = []
+        state = 0
+        lookahead = None
+        token = None
+        semi_token = _NO_TOKEN
+
+        while True:
+            t = defaulted_states[state]
+            if t is None:
+                if lookahead is None:
+                    token = get_token()
+                    if token is None:
+                        lookahead = end
+                    else:
+                        lookahead = terminal_index[token.type]
+                t = action[state][lookahead]
+
+                if t is None:
+                    if (token is not semi_token
+                        and action[state][semi] is not None):
+                        semi_token = token
+                        token = auto_semi(token)
+                        if token is not None:
+                            lookahead = semi
+                            continue
+                        token = semi_token
+                    self.p_error(token)
+
+            if t > 0:
+                statestack.append(t)
+                state = t
+                valuestack.append(token.value)
+                lookahead = None
+                continue
+
+            if t == 0:
+                return valuestack[-1]
+
+            nonterminal, length, func = reductions[-t]
+            if func is None:
+                # pass-through production, the value stays on the stack
+                state = goto[statestack[-2]][nonterminal]
+                statestack[-1] = state
+                continue
+            if length:
+                p = [None] + valuestack[-length:]
+                del valuestack[-length:]
+                del statestack[-length:]
+            else:
+                p = [None]
+            func(p)
+            valuestack.append(p[0])
+            state = goto[statestack[-1]][nonterminal]
+            statestack.append(state)
 
     def p_empty(self, p):
         """empty :"""
         pass
 
-    def p_auto_semi(self, p):
-        """auto_semi : error"""
-        pass
-
     def p_error(self, token):
-        # https://github.com/rspivak/slimit/issues/29
-        if self._has_been_seen_before(token):
-            self._raise_syntax_error(token)
-
-        if token is None or token.type != 'SEMI':
-            next_token = self.lexer.auto_semi(token)
-            if next_token is not None:
-                # https://github.com/rspivak/slimit/issues/29
-                self._mark_as_seen(token)
-                self.parser.errok()
-                return next_token
-
         self._raise_syntax_error(token)
 
     # Comment rules
@@ -896,9 +1104,7 @@ class Parser(object):
 
     # 12.2 Variable Statement
     def p_variable_statement(self, p):
-        """variable_statement : VAR variable_declaration_list SEMI
-                              | VAR variable_declaration_list auto_semi
-        """
+        """variable_statement : VAR variable_declaration_list SEMI"""
         p[0] = ast.VarStatement(p[2])
 
     def p_variable_declaration_list(self, p):
@@ -958,9 +1164,7 @@ class Parser(object):
 
     # 12.4 Expression Statement
     def p_expr_statement(self, p):
-        """expr_statement : expr_nobf SEMI
-                          | expr_nobf auto_semi
-        """
+        """expr_statement : expr_nobf SEMI"""
         p[0] = ast.ExprStatement(p[1])
 
     # 12.5 The if Statement
@@ -974,11 +1178,7 @@ class Parser(object):
 
     # 12.6 Iteration Statements
     def p_iteration_statement_1(self, p):
-        """
-        iteration_statement \
-            : DO statement WHILE LPAREN expr RPAREN SEMI
-            | DO statement WHILE LPAREN expr RPAREN auto_semi
-        """
+        """iteration_statement : DO statement WHILE LPAREN expr RPAREN SEMI"""
         p[0] = ast.DoWhile(predicate=p[5], statement=p[2])
 
     def p_iteration_statement_2(self, p):
@@ -1035,42 +1235,30 @@ class Parser(object):
 
     # 12.7 The continue Statement
     def p_continue_statement_1(self, p):
-        """continue_statement : CONTINUE SEMI
-                              | CONTINUE auto_semi
-        """
+        """continue_statement : CONTINUE SEMI"""
         p[0] = ast.Continue()
 
     def p_continue_statement_2(self, p):
-        """continue_statement : CONTINUE identifier SEMI
-                              | CONTINUE identifier auto_semi
-        """
+        """continue_statement : CONTINUE identifier SEMI"""
         p[0] = ast.Continue(p[2])
 
     # 12.8 The break Statement
     def p_break_statement_1(self, p):
-        """break_statement : BREAK SEMI
-                           | BREAK auto_semi
-        """
+        """break_statement : BREAK SEMI"""
         p[0] = ast.Break()
 
     def p_break_statement_2(self, p):
-        """break_statement : BREAK identifier SEMI
-                           | BREAK identifier auto_semi
-        """
+        """break_statement : BREAK identifier SEMI"""
         p[0] = ast.Break(p[2])
 
 
     # 12.9 The return Statement
     def p_return_statement_1(self, p):
-        """return_statement : RETURN SEMI
-                            | RETURN auto_semi
-        """
+        """return_statement : RETURN SEMI"""
         p[0] = ast.Return()
 
     def p_return_statement_2(self, p):
-        """return_statement : RETURN expr SEMI
-                            | RETURN expr auto_semi
-        """
+        """return_statement : RETURN expr SEMI"""
         p[0] = ast.Return(expr=p[2])
 
     # 12.10 The with Statement
@@ -1131,9 +1319,7 @@ class Parser(object):
 
     # 12.13 The throw Statement
     def p_throw_statement(self, p):
-        """throw_statement : THROW expr SEMI
-                           | THROW expr auto_semi
-        """
+        """throw_statement : THROW expr SEMI"""
         p[0] = ast.Throw(expr=p[2])
 
     # 12.14 The try Statement
@@ -1159,9 +1345,7 @@ class Parser(object):
 
     # 12.15 The debugger statement
     def p_debugger_statement(self, p):
-        """debugger_statement : DEBUGGER SEMI
-                              | DEBUGGER auto_semi
-        """
+        """debugger_statement : DEBUGGER SEMI"""
         p[0] = ast.Debugger(p[1])
 
     # 13 Function Definition
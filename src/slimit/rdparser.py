@@ -0,0 +1,673 @@
+###############################################################################
+#
+# Copyright (c) 2011 Ruslan Spivak
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+###############################################################################
+
+__author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
+
+from slimit import ast
+
+# type of the current token at the end of input
+END = '$end'
+
+# 11.5 - 11.11 binary operators and their precedence
+BINARY_PRECEDENCE = {
+    'OR': 1,
+    'AND': 2,
+    'BOR': 3,
+    'BXOR': 4,
+    'BAND': 5,
+    'EQEQ': 6, 'NE': 6, 'STREQ': 6, 'STRNEQ': 6,
+    'LT': 7, 'GT': 7, 'LE': 7, 'GE': 7, 'INSTANCEOF': 7, 'IN': 7,
+    'LSHIFT': 8, 'RSHIFT': 8, 'URSHIFT': 8,
+    'PLUS': 9, 'MINUS': 9,
+    'MULT': 10, 'DIV': 10, 'MOD': 10,
+    }
+
+UNARY_OPERATORS = frozenset([
+    'DELETE', 'VOID', 'TYPEOF', 'PLUSPLUS', 'MINUSMINUS', 'PLUS', 'MINUS',
+    'BNOT', 'NOT',
+    ])
+
+ASSIGNMENT_OPERATORS = frozenset([
+    'EQ', 'MULTEQUAL', 'DIVEQUAL', 'MODEQUAL', 'PLUSEQUAL', 'MINUSEQUAL',
+    'LSHIFTEQUAL', 'RSHIFTEQUAL', 'URSHIFTEQUAL', 'ANDEQUAL', 'XOREQUAL',
+    'OREQUAL',
+    ])
+
+LITERALS = {
+    'NUMBER': ast.Number,
+    'STRING': ast.String,
+    'REGEX': ast.Regex,
+    'TRUE': ast.Boolean,
+    'FALSE': ast.Boolean,
+    'NULL': ast.Null,
+    }
+
+# tokens that end a list of source elements
+END_OF_ELEMENTS = frozenset(['RBRACE', 'CASE', 'DEFAULT', END])
+
+# nodes that can't be on the left side of an assignment
+# or a for-in statement unless they are in parentheses
+NOT_LEFT_HAND_SIDE = (
+    ast.BinOp, ast.UnaryOp, ast.Conditional, ast.Assign, ast.Comma)
+
+
+class RDParser(object):
+    """Recursive-descent parser with a precedence climbing expression
+    parser.
+
+    Builds the same AST as the grammar in slimit.parser.Parser,
+    including the '_parens', '_mangle_candidate' and '_in_expression'
+    markers. It is stricter than the grammar in three ways, all
+    following ECMAScript 5:
+
+    - a function expression can't start a statement, 'function(){}'
+      on its own is a syntax error
+    - no semicolon is inserted where it would be parsed as an empty
+      statement, 'a:' or 'if (a)' at the end of the input or before
+      '}' are syntax errors
+    - no semicolon is inserted in the header of a for statement,
+      'for (a<newline>b<newline>c) x' is a syntax error
+
+    In the 'lazy' mode bodies of function declarations and expressions
+    are only brace matched, they are parsed on the first access to
+    'elements' of the FuncDecl / FuncExpr node. Syntax errors in a
+    body are raised at that point.
+    """
+
+    def __init__(self, lexer, lazy=False):
+        self.lexer = lexer
+        self.lazy = lazy
+        self.source = None
+        self.token = None
+        self.type = END
+        self.statements = {
+            'LBRACE': self._block,
+            'VAR': self._variable_statement,
+            'SEMI': self._empty_statement,
+            'IF': self._if_statement,
+            'DO': self._do_while_statement,
+            'WHILE': self._while_statement,
+            'FOR': self._for_statement,
+            'CONTINUE': self._continue_statement,
+            'BREAK': self._break_statement,
+            'RETURN': self._return_statement,
+            'WITH': self._with_statement,
+            'SWITCH': self._switch_statement,
+            'THROW': self._throw_statement,
+            'TRY': self._try_statement,
+            'DEBUGGER': self._debugger_statement,
+            'FUNCTION': self._function_declaration,
+            }
+
+    def parse(self, text):
+        """Parse the text or TokenBuffer and return the Program node."""
+        return ast.Program(list(self.iter_elements(text)))
+
+    def iter_elements(self, text):
+        """Parse the text or TokenBuffer and yield the top level
+        source elements one at a time.
+
+        A caller can process and drop every element before the next
+        one is parsed.
+        """
+        if self.lazy:
+            self.source = LazySource(text, self.lexer.backend)
+        self._input(text, 0)
+        statement = self._statement
+        while self.type not in END_OF_ELEMENTS:
+            yield statement()
+        if self.type != END:
+            self.error(self.token)
+
+    def parse_function_body(self, text, start):
+        """Parse the function body starting right after its '{'
+        at the offset 'start' and return its source elements.
+        """
+        self._input(text, start)
+        elements = self._source_elements()
+        if self.type != 'RBRACE':
+            self.error(self.token)
+        return elements
+
+    def error(self, token):
+        lexer = self.lexer
+        if token is None:
+            raise SyntaxError('Unexpected end of input')
+        raise SyntaxError(
+            'Unexpected token (%s, %r) at %s:%s between %s and %s' % (
+                (token.type, token.value) + lexer.position(token.lexpos) +
+                (lexer.prev_token, lexer.token()))
+            )
+
+    def _input(self, text, start):
+        self.lexer.input(text, start)
+        self._advance()
+
+    # helpers
+
+    def _advance(self):
+        token = self.token = self.lexer.token()
+        self.type = END if token is None else token.type
+
+    def _expect(self, type_):
+        if self.type != type_:
+            self.error(self.token)
+        value = self.token.value
+        self._advance()
+        return value
+
+    def _semicolon(self):
+        # 7.9 Automatic Semicolon Insertion, the lexer inserts
+        # semicolons after the restricted tokens itself
+        if self.type == 'SEMI':
+            self._advance()
+        elif not (self.type == 'RBRACE' or self.type == END
+                  or self.token.newline_before):
+            self.error(self.token)
+
+    def _identifier(self):
+        return ast.Identifier(self._expect('ID'))
+
+    # 14 Program
+
+    def _source_elements(self):
+        elements = []
+        statement = self._statement
+        while self.type not in END_OF_ELEMENTS:
+            elements.append(statement())
+        # the grammar has 'source_elements : empty'
+        return elements or None
+
+    # 12 Statements
+
+    def _statement(self):
+        method = self.statements.get(self.type)
+        if method is not None:
+            return method()
+        expr = self._expr()
+        if (self.type == 'COLON' and isinstance(expr, ast.Identifier)
+            and not getattr(expr, '_parens', False)):
+            self._advance()
+            return ast.Label(identifier=ast.Identifier(expr.value),
+                             statement=self._statement())
+        self._semicolon()
+        return ast.ExprStatement(expr)
+
+    def _block(self):
+        self._expect('LBRACE')
+        elements = self._source_elements()
+        self._expect('RBRACE')
+        return ast.Block(elements)
+
+    def _variable_statement(self):
+        self._advance()
+        declarations = self._variable_declarations(noin=False)
+        self._semicolon()
+        return ast.VarStatement(declarations)
+
+    def _variable_declarations(self, noin):
+        declarations = []
+        while True:
+            identifier = self._identifier()
+            if self.type == 'EQ':
+                self._advance()
+                declarations.append(
+                    ast.VarDecl(identifier, self._assignment_expr(noin)))
+            else:
+                declarations.append(ast.VarDecl(identifier))
+            if self.type != 'COMMA':
+                return declarations
+            self._advance()
+
+    def _empty_statement(self):
+        value = self.token.value
+        self._advance()
+        return ast.EmptyStatement(value)
+
+    def _if_statement(self):
+        self._advance()
+        self._expect('LPAREN')
+        predicate = self._expr()
+        self._expect('RPAREN')
+        consequent = self._statement()
+        alternative = None
+        if self.type == 'ELSE':
+            self._advance()
+            alternative = self._statement()
+        return ast.If(predicate=predicate, consequent=consequent,
+                      alternative=alternative)
+
+    def _do_while_statement(self):
+        self._advance()
+        statement = self._statement()
+        self._expect('WHILE')
+        self._expect('LPAREN')
+        predicate = self._expr()
+        self._expect('RPAREN')
+        self._semicolon()
+        return ast.DoWhile(predicate=predicate, statement=statement)
+
+    def _while_statement(self):
+        self._advance()
+        self._expect('LPAREN')
+        predicate = self._expr()
+        self._expect('RPAREN')
+        return ast.While(predicate=predicate, statement=self._statement())
+
+    def _for_statement(self):
+        self._advance()
+        self._expect('LPAREN')
+        if self.type == 'VAR':
+            self._advance()
+            declarations = self._variable_declarations(noin=True)
+            if self.type == 'IN' and len(declarations) == 1:
+                return self._for_in_statement(declarations[0])
+            init = ast.VarStatement(declarations)
+        elif self.type == 'SEMI':
+            init = None
+        else:
+            init = self._expr(noin=True)
+            if self.type == 'IN':
+                if not self._is_left_hand_side(init):
+                    self.error(self.token)
+                return self._for_in_statement(init)
+        self._expect('SEMI')
+        cond = None
+        if self.type != 'SEMI':
+            cond = self._expr()
+        self._expect('SEMI')
+        count = None
+        if self.type != 'RPAREN':
+            count = self._expr()
+        self._expect('RPAREN')
+        return ast.For(init=init, cond=cond, count=count,
+                       statement=self._statement())
+
+    def _for_in_statement(self, item):
+        self._advance()
+        iterable = self._expr()
+        self._expect('RPAREN')
+        return ast.ForIn(item=item, iterable=iterable,
+                         statement=self._statement())
+
+    def _continue_statement(self):
+        self._advance()
+        identifier = None
+        if self.type == 'ID':
+            identifier = self._identifier()
+        self._semicolon()
+        return ast.Continue(identifier)
+
+    def _break_statement(self):
+        self._advance()
+        identifier = None
+        if self.type == 'ID':
+            identifier = self._identifier()
+        self._semicolon()
+        return ast.Break(identifier)
+
+    def _return_statement(self):
+        self._advance()
+        expr = None
+        if self.type not in ('SEMI', 'RBRACE', END):
+            expr = self._expr()
+        self._semicolon()
+        return ast.Return(expr=expr)
+
+    def _with_statement(self):
+        self._advance()
+        self._expect('LPAREN')
+        expr = self._expr()
+        self._expect('RPAREN')
+        return ast.With(expr=expr, statement=self._statement())
+
+    def _switch_statement(self):
+        self._advance()
+        self._expect('LPAREN')
+        expr = self._expr()
+        self._expect('RPAREN')
+        self._expect('LBRACE')
+        cases = []
+        default = None
+        while self.type != 'RBRACE':
+            if self.type == 'CASE':
+                self._advance()
+                case_expr = self._expr()
+                self._expect('COLON')
+                cases.append(ast.Case(expr=case_expr,
+                                      elements=self._source_elements()))
+            elif self.type == 'DEFAULT' and default is None:
+                self._advance()
+                self._expect('COLON')
+                default = ast.Default(elements=self._source_elements())
+            else:
+                self.error(self.token)
+        self._advance()
+        return ast.Switch(expr=expr, cases=cases, default=default)
+
+    def _throw_statement(self):
+        self._advance()
+        expr = self._expr()
+        self._semicolon()
+        return ast.Throw(expr=expr)
+
+    def _try_statement(self):
+        self._advance()
+        statements = self._block()
+        catch = fin = None
+        if self.type == 'CATCH':
+            self._advance()
+            self._expect('LPAREN')
+            identifier = self._identifier()
+            self._expect('RPAREN')
+            catch = ast.Catch(identifier=identifier, elements=self._block())
+        if self.type == 'FINALLY':
+            self._advance()
+            fin = ast.Finally(elements=self._block())
+        if catch is None and fin is None:
+            self.error(self.token)
+        return ast.Try(statements=statements, catch=catch, fin=fin)
+
+    def _debugger_statement(self):
+        value = self.token.value
+        self._advance()
+        self._semicolon()
+        return ast.Debugger(value)
+
+    # 13 Function Definition
+
+    def _function_declaration(self):
+        return self._function(ast.FuncDecl, self._identifier)
+
+    def _function_expr(self):
+        return self._function(ast.FuncExpr, lambda: None)
+
+    def _function(self, cls, identifier):
+        self._advance()
+        if self.type == 'ID':
+            identifier = self._identifier
+        identifier = identifier()
+        self._expect('LPAREN')
+        parameters = None
+        if self.type != 'RPAREN':
+            parameters = self._formal_parameters()
+        self._expect('RPAREN')
+        if self.lazy:
+            return cls(identifier=identifier, parameters=parameters,
+                       elements=None, lazy_elements=self._skip_body())
+        return cls(identifier=identifier, parameters=parameters,
+                   elements=self._function_body())
+
+    def _formal_parameters(self):
+        parameters = [self._identifier()]
+        while self.type == 'COMMA':
+            self._advance()
+            parameters.append(self._identifier())
+        return parameters
+
+    def _function_body(self):
+        self._expect('LBRACE')
+        elements = self._source_elements()
+        self._expect('RBRACE')
+        return elements
+
+    def _skip_body(self):
+        if self.type != 'LBRACE':
+            self.error(self.token)
+        start = self.token.lexpos + 1
+        if self.lexer.skip_block() is None:
+            self.error(None)
+        self._advance()
+        return LazyBody(self.source, start)
+
+    # 11 Expressions
+
+    @staticmethod
+    def _is_left_hand_side(node):
+        return (not isinstance(node, NOT_LEFT_HAND_SIDE)
+                or getattr(node, '_parens', False))
+
+    def _expr(self, noin=False):
+        expr = self._assignment_expr(noin)
+        while self.type == 'COMMA':
+            self._advance()
+            expr = ast.Comma(left=expr, right=self._assignment_expr(noin))
+        return expr
+
+    def _assignment_expr(self, noin=False):
+        left = self._conditional_expr(noin)
+        if self.type not in ASSIGNMENT_OPERATORS:
+            return left
+        if not self._is_left_hand_side(left):
+            self.error(self.token)
+        op = self.token.value
+        self._advance()
+        return ast.Assign(left=left, op=op,
+                          right=self._assignment_expr(noin))
+
+    def _conditional_expr(self, noin):
+        predicate = self._binary_expr(1, noin)
+        if self.type != 'CONDOP':
+            return predicate
+        self._advance()
+        consequent = self._assignment_expr(noin)
+        self._expect('COLON')
+        return ast.Conditional(
+            predicate=predicate, consequent=consequent,
+            alternative=self._assignment_expr(noin))
+
+    def _binary_expr(self, min_precedence, noin):
+        left = self._unary_expr()
+        while True:
+            precedence = BINARY_PRECEDENCE.get(self.type)
+            if (precedence is None or precedence < min_precedence
+                or (noin and self.type == 'IN')):
+                return left
+            op = self.token.value
+            self._advance()
+            right = self._binary_expr(precedence + 1, noin)
+            left = ast.BinOp(op=op, left=left, right=right)
+
+    def _unary_expr(self):
+        if self.type in UNARY_OPERATORS:
+            op = self.token.value
+            self._advance()
+            return ast.UnaryOp(op, self._unary_expr())
+        expr = self._left_hand_side_expr()
+        if self.type == 'PLUSPLUS' or self.type == 'MINUSMINUS':
+            op = self.token.value
+            self._advance()
+            return ast.UnaryOp(op=op, value=expr, postfix=True)
+        return expr
+
+    def _left_hand_side_expr(self):
+        expr = self._member_expr()
+        if self.type != 'LPAREN':
+            return expr
+        # 11.2.3 Function Calls
+        while True:
+            if self.type == 'LPAREN':
+                expr = ast.FunctionCall(expr, self._arguments())
+            elif self.type == 'PERIOD':
+                self._advance()
+                expr = ast.DotAccessor(expr, self._identifier())
+            elif self.type == 'LBRACKET':
+                self._advance()
+                expr = ast.BracketAccessor(expr, self._expr())
+                self._expect('RBRACKET')
+            else:
+                return expr
+
+    def _member_expr(self):
+        if self.type == 'NEW':
+            self._advance()
+            identifier = self._member_expr()
+            if self.type != 'LPAREN':
+                return ast.NewExpr(identifier)
+            expr = ast.NewExpr(identifier, self._arguments())
+        elif self.type == 'FUNCTION':
+            expr = self._function_expr()
+        else:
+            expr = self._primary_expr()
+        while True:
+            if self.type == 'PERIOD':
+                self._advance()
+                expr = ast.DotAccessor(expr, self._identifier())
+            elif self.type == 'LBRACKET':
+                self._advance()
+                expr = ast.BracketAccessor(expr, self._expr())
+                self._expect('RBRACKET')
+            else:
+                return expr
+
+    def _arguments(self):
+        self._advance()
+        if self.type == 'RPAREN':
+            self._advance()
+            return None
+        args = [self._assignment_expr()]
+        while self.type == 'COMMA':
+            self._advance()
+            args.append(self._assignment_expr())
+        self._expect('RPAREN')
+        return args
+
+    def _primary_expr(self):
+        type_ = self.type
+        if type_ == 'ID':
+            expr = ast.Identifier(self.token.value)
+            expr._mangle_candidate = True
+            expr._in_expression = True
+        elif type_ in LITERALS:
+            expr = LITERALS[type_](self.token.value)
+        elif type_ == 'THIS':
+            expr = ast.This()
+        elif type_ == 'LPAREN':
+            self._advance()
+            expr = self._expr()
+            expr._parens = True
+            self._expect('RPAREN')
+            return expr
+        elif type_ == 'LBRACKET':
+            return self._array_literal()
+        elif type_ == 'LBRACE':
+            return self._object_literal()
+        else:
+            self.error(self.token)
+        self._advance()
+        return expr
+
+    def _array_literal(self):
+        self._advance()
+        items = []
+        while True:
+            while self.type == 'COMMA':
+                items.append(ast.Elision(self.token.value))
+                self._advance()
+            if self.type == 'RBRACKET':
+                break
+            items.append(self._assignment_expr())
+            if self.type == 'RBRACKET':
+                break
+            self._expect('COMMA')
+        self._advance()
+        return ast.Array(items=items)
+
+    def _object_literal(self):
+        self._advance()
+        properties = []
+        while self.type != 'RBRACE':
+            properties.append(self._property_assignment())
+            if self.type != 'COMMA':
+                break
+            self._advance()
+        self._expect('RBRACE')
+        return ast.Object(properties=properties)
+
+    def _property_assignment(self):
+        if self.type == 'GETPROP':
+            self._advance()
+            prop_name = self._property_name()
+            self._expect('LPAREN')
+            self._expect('RPAREN')
+            return ast.GetPropAssign(
+                prop_name=prop_name, elements=self._function_body())
+        if self.type == 'SETPROP':
+            self._advance()
+            prop_name = self._property_name()
+            self._expect('LPAREN')
+            parameters = self._formal_parameters()
+            self._expect('RPAREN')
+            return ast.SetPropAssign(
+                prop_name=prop_name, parameters=parameters,
+                elements=self._function_body())
+        left = self._property_name()
+        op = self._expect('COLON')
+        return ast.Assign(left=left, op=op, right=self._assignment_expr())
+
+    def _property_name(self):
+        type_ = self.type
+        if type_ == 'ID':
+            prop_name = ast.Identifier(self.token.value)
+        elif type_ == 'STRING':
+            prop_name = ast.String(self.token.value)
+        elif type_ == 'NUMBER':
+            prop_name = ast.Number(self.token.value)
+        else:
+            self.error(self.token)
+        self._advance()
+        return prop_name
+
+
+class LazySource(object):
+    """Input of a parse in the lazy mode.
+
+    Function bodies found in it are parsed on demand with a parser of
+    its own, the parser and its lexer are created on the first use.
+    Bodies of nested functions are parsed with the same parser.
+    """
+
+    def __init__(self, text, lex_backend):
+        self.text = text
+        self.lex_backend = lex_backend
+        self.parser = None
+
+    def parse_function_body(self, start):
+        if self.parser is None:
+            # the lexer module depends on ply, import it on demand
+            from slimit.lexer import Lexer
+            self.parser = RDParser(Lexer(backend=self.lex_backend), lazy=True)
+            self.parser.source = self
+        return self.parser.parse_function_body(self.text, start)
+
+
+class LazyBody(object):
+    """Function body to parse on the first access to 'elements'."""
+
+    def __init__(self, source, start):
+        self.source = source
+        self.start = start
+
+    def __call__(self):
+        return self.source.parse_function_body(self.start)
@@ -0,0 +1,275 @@
+###############################################################################
+#
+# Copyright (c) 2011 Ruslan Spivak
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+###############################################################################
+
+__author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
+
+import re
+
+import ply.lex
+
+from slimit.lexer import Lexer
+
+# PLY compiles the master regular expression with re.VERBOSE,
+# so the same flag is used here to get identical matches
+_VERBOSE = re.VERBOSE
+
+_ascii_id_match = re.compile(r'[a-zA-Z_$][0-9a-zA-Z_$]*').match
+_id_match = re.compile(Lexer.identifier, _VERBOSE).match
+# lookahead part of the GETPROP and SETPROP rules
+_prop_name_match = re.compile(r'\s' + Lexer.identifier, _VERBOSE).match
+_number_match = re.compile(Lexer.t_NUMBER, _VERBOSE).match
+_string_match = re.compile(Lexer.string, _VERBOSE).match
+_block_comment_match = re.compile(Lexer.t_BLOCK_COMMENT, _VERBOSE).match
+_regex_match = re.compile(Lexer.t_regex_REGEX, _VERBOSE).match
+_line_terminator_match = re.compile(Lexer.t_LINE_TERMINATOR).match
+_not_line_terminator_match = re.compile(r'[^\r\n]*').match
+_whitespace_match = re.compile(r'[ \t]*').match
+
+DIGITS = frozenset('0123456789')
+QUOTES = frozenset('\'"')
+KEYWORDS = Lexer.keywords_dict
+
+
+def _make_token(type_, value, lineno, lexpos):
+    token = ply.lex.LexToken()
+    token.type = type_
+    token.value = value
+    token.lineno = lineno
+    token.lexpos = lexpos
+    return token
+
+
+# character classes used to dispatch on the first character of a token
+(IDENTIFIER, NUMBER, DOT, STRING, LINE_TERMINATOR, SLASH, PUNCTUATOR,
+ WHITESPACE) = range(8)
+
+CHAR_CLASSES = {}
+for _char in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_$':
+    CHAR_CLASSES[_char] = IDENTIFIER
+for _char in '0123456789':
+    CHAR_CLASSES[_char] = NUMBER
+for _char in '\'"':
+    CHAR_CLASSES[_char] = STRING
+for _char in '\n\r':
+    CHAR_CLASSES[_char] = LINE_TERMINATOR
+for _char in ' \t':
+    CHAR_CLASSES[_char] = WHITESPACE
+
+# {punctuator: token type}
+PUNCTUATORS = {}
+for _name in Lexer.tokens:
+    _rule = getattr(Lexer, 't_' + _name, None)
+    if (isinstance(_rule, str) and
+        _name not in ('NUMBER', 'LINE_COMMENT', 'BLOCK_COMMENT',
+                      'LINE_TERMINATOR')):
+        PUNCTUATORS[_rule.replace('\\', '')] = _name
+
+# {first character: lengths of punctuators that start with it, longest first}
+PUNCTUATOR_LENGTHS = {}
+for _punctuator in PUNCTUATORS:
+    PUNCTUATOR_LENGTHS.setdefault(_punctuator[0], set()).add(len(_punctuator))
+for _char, _lengths in PUNCTUATOR_LENGTHS.items():
+    PUNCTUATOR_LENGTHS[_char] = tuple(sorted(_lengths, reverse=True))
+    CHAR_CLASSES[_char] = PUNCTUATOR
+CHAR_CLASSES['.'] = DOT
+CHAR_CLASSES['/'] = SLASH
+
+del _name, _rule, _punctuator, _char, _lengths
+
+
+class Scanner(object):
+    """Hand-written scanner that produces the same tokens as PLY.
+
+    It implements the subset of the 'ply.lex.Lexer' interface used by
+    'slimit.lexer.Lexer' and can be used as its backend:
+
+    >>> from slimit.lexer import Lexer
+    >>> lexer = Lexer(backend='scanner')
+    >>> lexer.input('a = 1;')
+    >>> for token in lexer:
+    ...     print(token)
+    ...
+    LexToken(ID,'a',1,0)
+    LexToken(EQ,'=',1,2)
+    LexToken(NUMBER,'1',1,4)
+    LexToken(SEMI,';',1,5)
+
+    Instead of trying every rule of the master regular expression in
+    turn the scanner dispatches on the first character of a token.
+    Regular expressions that deal with unicode are only used when
+    a non-ASCII character is encountered.
+    """
+
+    def __init__(self, module):
+        # 'module' provides error handling functions, see 'ply.lex.lex'
+        self.errorf = module.t_error
+        self.regex_errorf = module.t_regex_error
+        self.lexstate = 'INITIAL'
+        self.lexdata = None
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+        # start position of the last scanned token
+        self.tokpos = 0
+
+    def input(self, text):
+        self.lexdata = text
+        self.lexpos = 0
+        self.lexlen = len(text)
+
+    def begin(self, state):
+        self.lexstate = state
+
+    def skip(self, n):
+        self.lexpos += n
+
+    def token(self):
+        type_ = self.scan()
+        if type_ is None:
+            return None
+        pos = self.tokpos
+        value = self.lexdata[pos:self.lexpos]
+        if type_ == 'STRING':
+            # remove escape + new line sequence used for strings
+            # written across multiple lines of code
+            value = value.replace('\\\n', '')
+        return _make_token(type_, value, self.lineno, pos)
+
+    def scan(self):
+        """Advance to the next token and return its type.
+
+        No token object is created: the token spans lexdata from
+        'tokpos' up to the new value of 'lexpos'. Returns None at the
+        end of input.
+        """
+        data = self.lexdata
+        length = self.lexlen
+        pos = self.lexpos
+        while pos < length:
+            char = data[pos]
+            char_class = CHAR_CLASSES.get(char)
+            if char_class == WHITESPACE:
+                pos = _whitespace_match(data, pos).end()
+                continue
+
+            self.tokpos = pos
+            if self.lexstate == 'regex':
+                type_ = self._scan_regex(pos)
+            elif char_class == IDENTIFIER:
+                end = _ascii_id_match(data, pos).end()
+                if end < length and data[end] >= u'\x80':
+                    end = _id_match(data, pos).end()
+                self.lexpos = end
+                value = data[pos:end]
+                if value == 'get' and _prop_name_match(data, end):
+                    return 'GETPROP'
+                elif value == 'set' and _prop_name_match(data, end):
+                    return 'SETPROP'
+                return KEYWORDS.get(value, 'ID')
+            elif char_class == PUNCTUATOR:
+                for size in PUNCTUATOR_LENGTHS[char]:
+                    type_ = PUNCTUATORS.get(data[pos:pos + size])
+                    if type_ is not None:
+                        self.lexpos = pos + size
+                        return type_
+            elif char_class == LINE_TERMINATOR:
+                self.lexpos = _line_terminator_match(data, pos).end()
+                return 'LINE_TERMINATOR'
+            elif char_class == NUMBER or (
+                char_class == DOT and data[pos + 1:pos + 2] in DIGITS):
+                self.lexpos = _number_match(data, pos).end()
+                return 'NUMBER'
+            elif char_class == DOT:
+                self.lexpos = pos + 1
+                return 'PERIOD'
+            else:
+                type_ = self._scan_other(pos)
+
+            if type_ is not None:
+                return type_
+            # an illegal character has been skipped by the error function
+            pos = self.lexpos
+
+        self.lexpos = pos
+        return None
+
+    def _scan_other(self, pos):
+        """Scan less frequent tokens: strings, comments, slashes
+        and identifiers that start with a non-ASCII character."""
+        data = self.lexdata
+        char = data[pos]
+        if char in QUOTES:
+            match = _string_match(data, pos)
+            if match is None:
+                return self._error(pos, self.errorf)
+            self.lexpos = match.end()
+            return 'STRING'
+
+        if char == '/':
+            next_char = data[pos + 1:pos + 2]
+            if next_char == '/':
+                self.lexpos = _not_line_terminator_match(data, pos).end()
+                return 'LINE_COMMENT'
+            if next_char == '*':
+                match = _block_comment_match(data, pos)
+                # an unterminated comment is scanned as punctuators
+                if match is not None:
+                    self.lexpos = match.end()
+                    return 'BLOCK_COMMENT'
+            if next_char == '=':
+                self.lexpos = pos + 2
+                return 'DIVEQUAL'
+            self.lexpos = pos + 1
+            return 'DIV'
+
+        if char >= u'\x80':
+            match = _id_match(data, pos)
+            if match is not None:
+                self.lexpos = match.end()
+                return KEYWORDS.get(match.group(), 'ID')
+
+        return self._error(pos, self.errorf)
+
+    def _scan_regex(self, pos):
+        match = _regex_match(self.lexdata, pos)
+        if match is None:
+            return self._error(pos, self.regex_errorf)
+        self.lexpos = match.end()
+        return 'REGEX'
+
+    def _error(self, pos, errorf):
+        # mimic PLY: the error function is expected to skip
+        # characters, after that scanning continues
+        token = ply.lex.LexToken()
+        token.type = 'error'
+        token.value = self.lexdata[pos:]
+        token.lineno = self.lineno
+        token.lexpos = pos
+        token.lexer = self
+        self.lexpos = pos
+        errorf(token)
+        if self.lexpos == pos:
+            raise ply.lex.LexError(
+                "Scanning error. Illegal character '%s'" % self.lexdata[pos],
+                self.lexdata[pos:])
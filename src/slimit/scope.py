@@ -24,7 +24,7 @@
 
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
-import itertools
+import re
 
 try:
     from collections import OrderedDict
@@ -36,13 +36,80 @@ from slimit.lexer import Lexer
 
 ID_CHARS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
 
-def powerset(iterable):
-    """powerset('abc') -> a b c ab ac bc abc"""
-    s = list(iterable)
-    for chars in itertools.chain.from_iterable(
-        itertools.combinations(s, r) for r in range(1, len(s)+1)
-        ):
-        yield ''.join(chars)
+# characters of mangled names: a name starts with one of ID_CHARS,
+# '$' and '_' are only used after it because libraries use them
+# as global names
+NAME_CHARS = ID_CHARS + '0123456789$_'
+
+# names that mangled names must not be equal to
+_RESERVED = frozenset(list(Lexer.keywords_dict) + [
+    'arguments', 'eval', 'undefined', 'NaN', 'Infinity'])
+
+_IS_NAME = re.compile(r'^[%s][%s]*$' % (
+    ID_CHARS, re.escape(NAME_CHARS))).match
+
+
+def is_mangled_name(name):
+    """Return True if the name could have been given out by a
+    NameSequence, like the names of a map from a previous run.
+    """
+    return name not in _RESERVED and _IS_NAME(name) is not None
+
+
+class NameSequence(object):
+    """Mangled names in the order they are given out.
+
+    The n-th name is n written in bijective numeration with the
+    leading characters of the alphabet (ID_CHARS) as the digits of
+    the first character and all of them as the digits of the others:
+    a, b, ..., Z, aa, ba, ..., Za, a0, ..., Z_, aaa, ...
+
+    Names are computed as they are needed and kept, a sequence is
+    shared by all scopes that use the same alphabet. Reserved words
+    are left out.
+    """
+
+    def __init__(self, alphabet=NAME_CHARS):
+        self.first_chars = ''.join(
+            char for char in alphabet if char in ID_CHARS)
+        self.chars = alphabet
+        self.names = []
+        self.count = 0
+
+    def __getitem__(self, index):
+        names = self.names
+        while len(names) <= index:
+            name = self.get_name(self.count)
+            self.count += 1
+            if name not in _RESERVED:
+                names.append(name)
+        return names[index]
+
+    def get_name(self, number):
+        """Return the number written with the sequence's digits."""
+        first_chars = self.first_chars
+        chars = self.chars
+        name = [first_chars[number % len(first_chars)]]
+        number //= len(first_chars)
+        while number:
+            number -= 1
+            name.append(chars[number % len(chars)])
+            number //= len(chars)
+        return ''.join(name)
+
+
+_name_sequence = None
+
+def get_name_sequence():
+    """Return the NameSequence of NAME_CHARS shared by all scopes.
+
+    Sequences of other alphabets are made for one mangle run, they
+    vary with the code.
+    """
+    global _name_sequence
+    if _name_sequence is None:
+        _name_sequence = NameSequence()
+    return _name_sequence
 
 
 class SymbolTable(object):
@@ -72,7 +139,11 @@ class Scope(object):
         # add ourselves as a child to the enclosing scope
         if enclosing_scope is not None:
             self.enclosing_scope.add_child(self)
-        self.base54 = powerset(ID_CHARS)
+        # candidates for mangled names and the index of the next one
+        self.names = get_name_sequence()
+        self.name_index = 0
+        # names the symbols can't be mangled to, see get_next_mangled_name
+        self.forbidden = None
 
     def __contains__(self, sym):
         return sym.name in self.symbols
@@ -85,41 +156,72 @@ class Scope(object):
         # track scope for every symbol
         sym.scope = self
 
-    def resolve(self, name):
+    def resolve(self, name, cache=None):
+        """Return the symbol the name refers to in this scope or None.
+
+        'cache' is an optional dict {(scope, name): symbol} shared by
+        lookups made once all symbols are defined. A name that isn't
+        defined in this scope is stored in it for every scope passed
+        on the way up, later lookups stop at the first scope found in
+        it.
+        """
         sym = self.symbols.get(name)
         if sym is not None:
             return sym
-        elif self.enclosing_scope is not None:
-            return self.enclosing_scope.resolve(name)
+        scope = self.enclosing_scope
+        if cache is None:
+            while scope is not None:
+                sym = scope.symbols.get(name)
+                if sym is not None:
+                    return sym
+                scope = scope.enclosing_scope
+            return None
+        passed = [(self, name)]
+        while scope is not None:
+            key = (scope, name)
+            if key in cache:
+                sym = cache[key]
+                break
+            sym = scope.symbols.get(name)
+            if sym is not None:
+                break
+            passed.append(key)
+            scope = scope.enclosing_scope
+        for key in passed:
+            cache[key] = sym
+        return sym
 
     def get_enclosing_scope(self):
         return self.enclosing_scope
 
-    def _get_scope_with_mangled(self, name):
-        """Return a scope containing passed mangled name."""
-        scope = self
-        while True:
-            parent = scope.get_enclosing_scope()
-            if parent is None:
-                return
-
-            if name in parent.rev_mangled:
-                return parent
+    def get_forbidden_names(self):
+        """Return the set of names this scope can't mangle its symbols to.
 
-            scope = parent
+        These are the names under which the names of the parent scopes
+        referenced in this scope or any sub-scope appear in the output:
 
-    def _get_scope_with_symbol(self, name):
-        """Return a scope containing passed name as a symbol name."""
-        scope = self
-        while True:
-            parent = scope.get_enclosing_scope()
-            if parent is None:
-                return
+        1. the mangled name of a referenced name that is mangled
 
-            if name in parent.symbols:
-                return parent
+        2. the original name of a referenced name that is not mangled
 
-            scope = parent
+        The parent scopes must be mangled already.
+        """
+        forbidden = set()
+        for name, scope in self.refs.items():
+            if scope is not self:
+                forbidden.add(scope.mangled.get(name, name))
+        return forbidden
+
+    def can_mangle_to(self, mangled):
+        """Return True if a symbol of this scope can be mangled to the
+        name, like a name given in a previous run.
+        """
+        forbidden = self.forbidden
+        if forbidden is None:
+            forbidden = self.forbidden = self.get_forbidden_names()
+        return (mangled not in forbidden and
+                mangled not in self.rev_mangled and
+                is_mangled_name(mangled))
 
     def get_next_mangled_name(self):
         """
@@ -131,30 +233,23 @@ class Scope(object):
            if it's not mangled and we reference it in this scope
            or any sub-scope.
 
+        Both are checked against the set of 'get_forbidden_names',
+        built on the first call. Candidates are taken from 'names'
+        starting at 'name_index', names already given in this scope
+        are skipped.
         """
-        while True:
-            mangled = next(self.base54)
-
-            # case 1
-            ancestor = self._get_scope_with_mangled(mangled)
-            if (ancestor is not None
-                and self.refs.get(ancestor.rev_mangled[mangled]) is ancestor
-                ):
-                continue
-
-            # case 2
-            ancestor = self._get_scope_with_symbol(mangled)
-            if (ancestor is not None
-                and self.refs.get(mangled) is ancestor
-                and mangled not in ancestor.mangled
-                ):
-                continue
-
-            # make sure a new mangled name is not a reserved word
-            if mangled.upper() in Lexer.keywords:
-                continue
-
-            return mangled
+        forbidden = self.forbidden
+        if forbidden is None:
+            forbidden = self.forbidden = self.get_forbidden_names()
+        rev_mangled = self.rev_mangled
+        names = self.names
+        index = self.name_index
+        mangled = names[index]
+        while mangled in forbidden or mangled in rev_mangled:
+            index += 1
+            mangled = names[index]
+        self.name_index = index + 1
+        return mangled
 
 
 class GlobalScope(Scope):
@@ -169,6 +264,9 @@ class Symbol(object):
     def __init__(self, name):
         self.name = name
         self.scope = None
+        # Identifier nodes that resolve to the symbol and are
+        # mangling candidates, filled by ScopeAnalysisVisitor
+        self.occurrences = []
 
 
 class VarSymbol(Symbol):
@@ -116,3 +116,55 @@ class CmdTestCase(unittest.TestCase):
             main(inp=inp, out=out)
 
         self.assertEqual('var a=5;', out.getvalue())
+
+    def test_main_name_map(self):
+        from slimit.minifier import main
+        # an empty file, like a missing one, is an empty map
+        fd, map_path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            main(['-m', '-t', '--name-map', map_path, self.path],
+                 out=StringIO())
+            self.assertTrue(os.path.getsize(map_path) > 0)
+            out = StringIO()
+            inp = StringIO('var added = 1, global = 5;')
+            main(['-m', '-t', '--name-map', map_path], inp=inp, out=out)
+            self.assertEqual('var b=1,a=5;', out.getvalue())
+        finally:
+            os.remove(map_path)
+
+    def test_main_invalid_name_map(self):
+        from slimit.minifier import main
+        fd, map_path = tempfile.mkstemp()
+        with os.fdopen(fd, 'w') as fout:
+            fout.write('{"": ')
+        old_err = sys.stderr
+        sys.stderr = err = StringIO()
+        try:
+            self.assertRaises(
+                SystemExit, main, ['-m', '--name-map', map_path, self.path],
+                out=StringIO())
+        finally:
+            sys.stderr = old_err
+            os.remove(map_path)
+        self.assertTrue(
+            'Invalid name map file %s' % map_path in err.getvalue())
+
+    def test_main_mangle_props(self):
+        from slimit.minifier import main
+        fd, map_path = tempfile.mkstemp()
+        os.close(fd)
+        os.remove(map_path)
+        try:
+            out = StringIO()
+            inp = StringIO('o._a = o._b;')
+            main(['-m', '--mangle-props', '^_', '--property-map', map_path],
+                 inp=inp, out=out)
+            self.assertEqual('o.a=o.b;', out.getvalue())
+            out = StringIO()
+            inp = StringIO('o._b = o._c;')
+            main(['-m', '--mangle-props', '^_', '--property-map', map_path],
+                 inp=inp, out=out)
+            self.assertEqual('o.b=o.c;', out.getvalue())
+        finally:
+            os.remove(map_path)
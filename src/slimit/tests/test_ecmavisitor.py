@@ -24,6 +24,7 @@
 
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
+import io
 import textwrap
 import unittest
 
@@ -54,6 +55,27 @@ class ECMAVisitorTestCase(unittest.TestCase):
     def setUp(self):
         self.maxDiff = 2000
 
+    def test_out(self):
+        text = textwrap.dedent("""
+        function f(a) {
+          switch (a) {
+            case 1:
+              return {
+                b: [1,,2]
+              };
+            default:
+              if (a) {
+                g();
+              }
+          }
+        }
+        """).strip()
+        tree = Parser().parse('\n'.join([text] * 3000))
+        out = io.StringIO()
+        self.assertTrue(tree.to_ecma(out) is None)
+        self.assertMultiLineEqual(out.getvalue(), tree.to_ecma())
+        self.assertEqual(tree.children()[0].to_ecma(), text)
+
     TEST_CASES = [
         ################################
         # block
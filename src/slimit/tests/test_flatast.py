@@ -0,0 +1,79 @@
+###############################################################################
+#
+# Copyright (c) 2011 Ruslan Spivak
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+###############################################################################
+
+__author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
+
+import textwrap
+import unittest
+
+from slimit import ast, flatast, mangler
+from slimit.parser import Parser
+from slimit.visitors.minvisitor import ECMAMinifier
+
+
+class FlatTreeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = Parser(backend='rd')
+
+    def test_round_trip(self):
+        from slimit.tests.test_ecmavisitor import ECMAVisitorTestCase
+        for text in ECMAVisitorTestCase.TEST_CASES:
+            text = textwrap.dedent(text).strip()
+            expected = self.parser.parse(text).to_ecma()
+            tree = flatast.parse(text, self.parser)
+            # the proxies work with the visitors
+            self.assertMultiLineEqual(tree.root.to_ecma(), expected)
+            self.assertMultiLineEqual(tree.node().to_ecma(), expected)
+            self.assertMultiLineEqual(
+                flatast.FlatTree.from_node(
+                    self.parser.parse(text)).node().to_ecma(),
+                expected)
+
+    def test_markers(self):
+        text = 'var a = (b + c); function f(x) { return x++ + a; }'
+        tree = flatast.parse(text, self.parser)
+        minified = self.parser.parse(text)
+        mangler.mangle(minified, toplevel=True)
+        node = tree.node()
+        mangler.mangle(node, toplevel=True)
+        self.assertEqual(
+            ECMAMinifier().visit(node), ECMAMinifier().visit(minified))
+
+    def test_proxy(self):
+        tree = flatast.parse('foo.bar(1, "x");', self.parser)
+        call = tree.root.children()[0].expr
+        self.assertTrue(isinstance(call, ast.FunctionCall))
+        self.assertTrue(isinstance(call.identifier.node, ast.Identifier))
+        self.assertEqual(call.identifier.node.value, 'foo')
+        self.assertEqual([arg.value for arg in call.args], ['1', '"x"'])
+        self.assertEqual(list(call), [call.identifier] + call.args)
+        self.assertFalse(getattr(call, '_parens', False))
+        self.assertRaises(AttributeError, setattr, call, 'args', [])
+        # strings are stored once
+        self.assertEqual(len(tree.strings), 4)
+
+    def test_parse_needs_rd_backend(self):
+        self.assertRaises(
+            ValueError, flatast.parse, 'a', Parser(backend='lr'))
@@ -287,11 +287,100 @@ world"''',
         ]
 
 
+class ScannerTestCase(LexerTestCase):
+    """Run the same test cases against the hand-written scanner."""
+
+    def _get_lexer(self):
+        lexer = Lexer(backend='scanner')
+        return lexer
+
+    def _get_tokens(self, backend, text):
+        lexer = Lexer(backend=backend)
+        lexer.input(text)
+        return [(token.type, token.value, token.lineno, token.lexpos)
+                for token in lexer]
+
+    def test_same_tokens_as_ply(self):
+        text = u"""
+        var \u00e9t\u00e9 = {get x() { return 1; }, set x(v) {}};
+        /* block
+           comment */ a >>>= b >>= c >> d !== e; // line comment
+        x = .5 + 0x1F + 017 + 1e3 / y /= 2;
+        s = 'multi\\
+        line' + "dbl";
+        """
+        self.assertListEqual(
+            self._get_tokens('scanner', text), self._get_tokens('ply', text))
+
+    def test_unknown_backend(self):
+        self.assertRaises(ValueError, Lexer, backend='unknown')
+
+
+class TokenBufferTestCase(unittest.TestCase):
+
+    TEXT = u"""
+    var a = b / c, re = /ab+c/g; // comment
+    x = (y) / 2 /* block */ + 'multi\\
+    line';
+    return
+    a
+    """
+
+    def _get_tokens(self, lexer, text):
+        lexer.input(text)
+        return [(token.type, token.value, token.lineno, token.lexpos)
+                for token in lexer]
+
+    def test_buffer_tokens(self):
+        for backend in Lexer.backends:
+            lexer = Lexer(backend=backend)
+            buffer = lexer.tokenize(self.TEXT)
+            self.assertListEqual(
+                self._get_tokens(lexer, buffer),
+                self._get_tokens(lexer, self.TEXT))
+
+    def test_newline_before(self):
+        text = 'a // b\nc /* d */ e /* \n */ f\r\n\n g'
+        for backend in Lexer.backends:
+            lexer = Lexer(backend=backend)
+            for source in (text, lexer.tokenize(text)):
+                lexer.input(source)
+                self.assertListEqual(
+                    [(token.value, token.newline_before) for token in lexer],
+                    [('a', False), ('c', True), ('e', False), ('f', True),
+                     ('g', True)])
+
+    def test_comments_between_tokens(self):
+        # the token before a comment decides between division and regex
+        text = 'a /* x */ / b; f(/**/ /re/g, // c\n/*\n*//x/) /**/'
+        for backend in Lexer.backends:
+            lexer = Lexer(backend=backend)
+            for source in (text, lexer.tokenize(text)):
+                lexer.input(source)
+                self.assertListEqual(
+                    [token.value for token in lexer],
+                    ['a', '/', 'b', ';', 'f', '(', '/re/g', ',', '/x/', ')'])
+
+    def test_position(self):
+        lexer = Lexer()
+        lexer.input('a = 1;\n\nfoo(\r\n  bar);')
+        tokens = list(lexer)
+        self.assertEqual(lexer.position(tokens[0].lexpos), (1, 1))
+        self.assertEqual(lexer.position(tokens[4].lexpos), (3, 1))
+        self.assertEqual(lexer.position(tokens[6].lexpos), (4, 3))
+
+
 def test_suite():
     return unittest.TestSuite((
         unittest.makeSuite(LexerTestCase),
+        unittest.makeSuite(ScannerTestCase),
+        unittest.makeSuite(TokenBufferTestCase),
         doctest.DocFileSuite(
             '../lexer.py',
             optionflags=doctest.NORMALIZE_WHITESPACE|doctest.ELLIPSIS
             ),
+        doctest.DocFileSuite(
+            '../scanner.py',
+            optionflags=doctest.NORMALIZE_WHITESPACE|doctest.ELLIPSIS
+            ),
         ))
@@ -24,6 +24,7 @@
 
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
+import re
 import textwrap
 import unittest
 
@@ -157,3 +158,215 @@ class ManglerTestCase(unittest.TestCase):
          }
          """),
         ]
+
+    def test_single_pass_analysis(self):
+        from slimit.scope import SymbolTable
+        from slimit.visitors import scopevisitor
+        parser = Parser()
+        for input, expected in self.TEST_CASES:
+            tree = parser.parse(input)
+            sym_table = SymbolTable()
+            scopevisitor.ScopeTreeVisitor(sym_table).visit(tree)
+            scopevisitor.fill_scope_references(tree)
+            scopevisitor.mangle_scope_tree(sym_table.globals, True)
+            scopevisitor.NameManglerVisitor().visit(tree)
+            self.assertMultiLineEqual(
+                tree.to_ecma(), textwrap.dedent(expected).strip())
+
+        tree = parser.parse('function f(a) { a = a + 1; return a.a; }')
+        sym_table = SymbolTable()
+        visitor = scopevisitor.ScopeAnalysisVisitor(sym_table)
+        visitor.visit(tree)
+        visitor.fill_references()
+        func = sym_table.globals.symbols['f']
+        self.assertEqual(len(func.occurrences), 1)
+        # the property name isn't an occurrence of the parameter
+        self.assertEqual(len(func.symbols['a'].occurrences), 4)
+        self.assertTrue(func.refs['a'] is func)
+
+    def test_forbidden_names(self):
+        from slimit.scope import SymbolTable
+        from slimit.visitors import scopevisitor
+        tree = Parser().parse(
+            'var a = 1; function f(b) { var c; return a + b + c; }')
+        sym_table = SymbolTable()
+        visitor = scopevisitor.ScopeAnalysisVisitor(sym_table)
+        visitor.visit(tree)
+        visitor.fill_references()
+        scopevisitor.mangle_scope_tree(sym_table.globals, False)
+        func = sym_table.globals.symbols['f']
+        # the global 'a' isn't mangled and is referenced in 'f'
+        self.assertEqual(func.get_forbidden_names(), set(['a']))
+        self.assertEqual(func.mangled, {'b': 'b', 'c': 'c'})
+
+    def test_resolve_cache(self):
+        from slimit.scope import SymbolTable, LocalScope, VarSymbol
+        globals_ = SymbolTable().globals
+        symbol = VarSymbol('a')
+        globals_.define(symbol)
+        outer = LocalScope(globals_)
+        inner = LocalScope(outer)
+        cache = {}
+        self.assertTrue(inner.resolve('a', cache) is symbol)
+        self.assertTrue(cache[(outer, 'a')] is symbol)
+        self.assertTrue(outer.resolve('a', cache) is symbol)
+        self.assertTrue(inner.resolve('b', cache) is None)
+        self.assertTrue((globals_, 'b') in cache)
+        self.assertTrue(inner.resolve('a') is symbol)
+
+    def test_by_frequency(self):
+        text = 'function f(x, y) { y = y + y; return y; }'
+        tree = Parser().parse(text)
+        mangle(tree, toplevel=True)
+        self.assertEqual(
+            tree.to_ecma(),
+            'function a(a, b) {\n  b = b + b;\n  return b;\n}')
+        tree = Parser().parse(text)
+        mangle(tree, toplevel=True, by_frequency=True)
+        # 'y' is used more often than 'x' and gets the first name
+        self.assertEqual(
+            tree.to_ecma(),
+            'function a(b, a) {\n  a = a + a;\n  return a;\n}')
+
+    def test_for_gzip(self):
+        tree = Parser().parse('function f(x) { return x + eeeeee; }')
+        mangle(tree, for_gzip=True)
+        # 'e' is the character used most in the rest of the output
+        self.assertEqual(
+            tree.to_ecma(), 'function f(e) {\n  return e + eeeeee;\n}')
+
+    def test_name_sequence(self):
+        from slimit.scope import NameSequence, get_name_sequence
+        names = NameSequence()
+        self.assertEqual([names[index] for index in range(3)], ['a', 'b', 'c'])
+        self.assertEqual(names[51], 'Z')
+        self.assertEqual(names[52], 'aa')
+        # two character names aren't limited to sorted distinct letters
+        first = [names[index] for index in range(52 * 64)]
+        self.assertEqual(len(set(first)), len(first))
+        self.assertTrue('ba' in first and 'a0' in first and 'a$' in first)
+        for name in ['do', 'if', 'in', '$a', '_a', '0a']:
+            self.assertFalse(name in first)
+        self.assertTrue(get_name_sequence() is get_name_sequence())
+
+    def test_name_sequences_are_not_kept(self):
+        # sequences of the alphabets of for_gzip runs go with the run
+        import gc
+        from slimit.scope import NameSequence, get_name_sequence
+
+        def count():
+            gc.collect()
+            return sum(1 for obj in gc.get_objects()
+                       if isinstance(obj, NameSequence))
+
+        get_name_sequence()
+        before = count()
+        for text in ['function f(x) { return x + "zz"; }',
+                     'function f(x) { return x + "QQ"; }',
+                     'function f(x) { return x + "$$"; }']:
+            mangle(Parser().parse(text), for_gzip=True)
+        self.assertEqual(count(), before)
+
+    def test_name_map(self):
+        name_map = {}
+        tree = Parser().parse('function f(x, y) { return x + y; }')
+        mangle(tree, toplevel=True, name_map=name_map)
+        self.assertEqual(
+            name_map, {'': {'f': 'a'}, '/f': {'x': 'a', 'y': 'b'}})
+        # 'w' would take the first name if mangled from scratch
+        tree = Parser().parse('function f(w, x, y) { return w + x + y; }')
+        mangle(tree, toplevel=True, name_map=name_map)
+        self.assertEqual(
+            tree.to_ecma(), 'function a(c, a, b) {\n  return c + a + b;\n}')
+        self.assertEqual(name_map['/f'], {'w': 'c', 'x': 'a', 'y': 'b'})
+        # a previous name that would shadow a referenced name isn't reused
+        tree = Parser().parse(
+            'var z; function f(x, y) { return x + y + z; }')
+        mangle(tree, toplevel=True, name_map={
+            '': {'z': 'b', 'f': 'a'}, '/f': {'x': 'b', 'y': 'do'}})
+        self.assertEqual(
+            tree.to_ecma(),
+            'var b;\nfunction a(a, c) {\n  return a + c + b;\n}')
+
+    def test_mangle_properties(self):
+        property_map = {}
+        tree = Parser().parse(textwrap.dedent("""
+        var o = {_x: 1, '_y': 2, get _z() { return this._x; }, a: 3};
+        o._y = o['_x'] + o._y + o._y + o.length + o['_a b'];
+        """))
+        mangle(tree, properties='^_', property_map=property_map)
+        # 'a' is a property of the code and isn't given out
+        self.assertEqual(
+            property_map, {'_y': 'b', '_x': 'c', '_z': 'd', '_a b': 'e'})
+        self.assertMultiLineEqual(tree.to_ecma(), textwrap.dedent("""
+        var o = {
+          c: 1,
+          'b': 2,
+          get d() {
+            return this.c;
+          },
+          a: 3
+        };
+        o.b = o['c'] + o.b + o.b + o.length + o['e'];
+        """).strip())
+        # reserved names and names of the map
+        tree = Parser().parse('o._x = o._w + o._constructor + o.a;')
+        mangle(tree, properties=re.compile('^_'),
+               reserved_properties=['_w'], property_map=property_map)
+        self.assertEqual(tree.to_ecma(), 'o.c = o._w + o.f + o.a;')
+        self.assertEqual(property_map['_constructor'], 'f')
+        tree = Parser().parse('o.length = o.x;')
+        mangle(tree, properties='.')
+        self.assertEqual(tree.to_ecma(), 'o.length = o.a;')
+
+    def test_mangle_properties_escapes(self):
+        # escaped and plain spellings of a name get the same name
+        tree = Parser().parse(textwrap.dedent(r"""
+        o._x = {'_\u0079': 1, "\_z": 2, 'a\'b': 3};
+        f(o["\x5fx"], o._x, o._y, o['_\x7a'], o['_\n'], o['a\'b']);
+        """))
+        property_map = {}
+        mangle(tree, properties='^_', property_map=property_map)
+        self.assertEqual(
+            property_map, {'_x': 'a', '_y': 'b', '_z': 'c', '_\n': 'd'})
+        self.assertMultiLineEqual(tree.to_ecma(), textwrap.dedent("""
+        o.a = {
+          'b': 1,
+          "c": 2,
+          'a\\'b': 3
+        };
+        f(o["a"], o.a, o.b, o['c'], o['d'], o['a\\'b']);
+        """).strip())
+
+    def test_load_name_map(self):
+        import os
+        import tempfile
+        from slimit.mangler import load_name_map
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            self.assertEqual(load_name_map(path), {})
+            for text in ['{"": ', '[1]']:
+                with open(path, 'w') as fout:
+                    fout.write(text)
+                self.assertRaises(ValueError, load_name_map, path)
+        finally:
+            os.remove(path)
+        self.assertEqual(load_name_map(path), {})
+
+    def test_scope_paths(self):
+        from slimit.scope import SymbolTable
+        from slimit.visitors import scopevisitor
+        tree = Parser().parse(textwrap.dedent("""
+        function f() { function g() {} }
+        (function () { var g = function () {}; })();
+        (function () {})();
+        function f() {}
+        """))
+        sym_table = SymbolTable()
+        scopevisitor.ScopeAnalysisVisitor(sym_table).visit(tree)
+        self.assertEqual(
+            [path for path, scope in
+             scopevisitor.get_scope_paths(sym_table.globals)],
+            ['', '/f', '/f/g', '/(anonymous)', '/(anonymous)/(anonymous)',
+             '/(anonymous)#1', '/f#1'])
@@ -24,9 +24,12 @@
 
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
+import io
+import threading
 import unittest
 
 from slimit import minify
+from slimit.minifier import get_parser
 
 
 def decorator(cls):
@@ -44,6 +47,70 @@ def decorator(cls):
     return cls
 
 
+class ParserCacheTestCase(unittest.TestCase):
+
+    def test_parser_is_cached_per_thread(self):
+        parser = get_parser()
+        self.assertIs(parser, get_parser())
+
+        parsers = []
+        thread = threading.Thread(target=lambda: parsers.append(get_parser()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(parser, parsers[0])
+
+    def test_minify_after_syntax_error(self):
+        self.assertRaises(SyntaxError, minify, 'var a;\n, b;')
+        self.assertEqual(minify('var a;\nb'), 'var a;b;')
+
+
+class MinifyOutTestCase(unittest.TestCase):
+
+    def test_out(self):
+        text = """
+        function f(a) {
+          if (a) { if (a.b) return (a); } else do { a-- } while (a);
+          try { g() } catch (e) { return {} } finally { h() }
+        }
+        """
+        out = io.StringIO()
+        self.assertTrue(minify(text, mangle=True, out=out) is None)
+        self.assertEqual(out.getvalue(), minify(text, mangle=True))
+
+    def test_writer_chunks(self):
+        from slimit.visitors.writer import Writer
+        out = io.StringIO()
+        writer = Writer(out, chunk_size=2)
+        writer.write('a')
+        position = writer.hold()
+        writer.write('b')
+        writer.write('c')
+        writer.flush()
+        self.assertEqual(out.getvalue(), '')
+        writer.release(position, '{')
+        writer.write('}')
+        writer.flush()
+        self.assertEqual(out.getvalue(), 'a{bc}')
+
+    def test_nested_prefixes(self):
+        # a keyword whose spacing depends on the next fragment
+        # followed by another one
+        for text, expected in [
+            ('if (a) b = 1; else return c;', 'if(a)b=1;else return c;'),
+            ('if (a) b = 1; else return (c);', 'if(a)b=1;else return c;'),
+            ('function g() { if (a) b(); else do { c() } while (d) }',
+             'function g(){if(a)b();else do c();while(d);}'),
+            ('function f() { try { return a; } catch (e) {} }',
+             'function f(){try{return a;}catch(e){}}'),
+            ('function f() { try { return a; } finally { return {}; } }',
+             'function f(){try{return a;}finally{return{};}}'),
+            ]:
+            self.assertEqual(minify(text), expected)
+            out = io.StringIO()
+            minify(text, out=out)
+            self.assertEqual(out.getvalue(), expected)
+
+
 @decorator
 class MinifierTestCase(unittest.TestCase):
 
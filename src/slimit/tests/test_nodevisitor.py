@@ -27,6 +27,135 @@ __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 import doctest
 import unittest
 
+from slimit import ast
+from slimit.parser import Parser
+from slimit.visitors import nodevisitor
+from slimit.visitors.nodevisitor import ASTVisitor, dispatch_table
+
+
+class NodeVisitorTestCase(unittest.TestCase):
+
+    def _values(self, tree, **kwargs):
+        return [getattr(node, 'value', node.__class__.__name__)
+                for node in nodevisitor.visit(tree, **kwargs)]
+
+    def test_order(self):
+        tree = Parser().parse('a = b(c);')
+        self.assertEqual(
+            self._values(tree),
+            ['ExprStatement', 'Assign', 'a', 'FunctionCall', 'b', 'c'])
+        self.assertEqual(
+            self._values(tree, order='post'),
+            ['a', 'b', 'c', 'FunctionCall', 'Assign', 'ExprStatement'])
+        self.assertRaises(
+            ValueError, nodevisitor.NodeVisitor().visit, tree, order='in')
+
+    def test_prune(self):
+        tree = Parser().parse('a = b(c); d;')
+        prune = lambda node: isinstance(node, ast.FunctionCall)
+        for order, expected in [
+            ('pre', ['ExprStatement', 'Assign', 'a', 'FunctionCall',
+                     'ExprStatement', 'd']),
+            ('post', ['a', 'FunctionCall', 'Assign', 'ExprStatement',
+                      'd', 'ExprStatement']),
+            ]:
+            self.assertEqual(
+                self._values(tree, order=order, prune=prune), expected)
+
+    def test_deep_tree(self):
+        # deeper than the recursion limit
+        node = ast.Identifier('a')
+        for _ in range(5000):
+            node = ast.BinOp('+', node, ast.Identifier('b'))
+        self.assertEqual(len(list(nodevisitor.visit(node))), 10000)
+        self.assertEqual(
+            len(list(nodevisitor.visit(node, order='post'))), 10000)
+
+    def test_children_override(self):
+        # a node class of its own that lists its children with
+        # children() instead of child_fields
+        class Pair(ast.Node):
+            __slots__ = ('first', 'second')
+
+            def __init__(self, first, second):
+                self.first = first
+                self.second = second
+
+            def children(self):
+                return [self.first, None, self.second]
+
+        class Names(ASTVisitor):
+            def __init__(self):
+                self.names = []
+
+            def visit_Identifier(self, node):
+                self.names.append(node.value)
+
+        tree = ast.Program([ast.ExprStatement(Pair(
+            ast.Identifier('a'),
+            ast.BinOp('+', ast.Identifier('b'), ast.Identifier('c'))))])
+        self.assertEqual(
+            self._values(tree),
+            ['ExprStatement', 'Pair', 'a', 'BinOp', 'b', 'c'])
+        visitor = Names()
+        visitor.visit(tree)
+        self.assertEqual(visitor.names, ['a', 'b', 'c'])
+
+
+class DispatchTestCase(unittest.TestCase):
+
+    def test_subclass_overrides(self):
+        class Counter(ASTVisitor):
+            def __init__(self):
+                self.names = []
+
+            def visit_Identifier(self, node):
+                self.names.append(node.value)
+
+        class Skipper(Counter):
+            def visit_FunctionCall(self, node):
+                self.names.append('call')
+
+        tree = Parser().parse('a = b(c);')
+        for cls, expected in [
+            (Counter, ['a', 'b', 'c']),
+            (Skipper, ['a', 'call']),
+            (Counter, ['a', 'b', 'c']),
+            ]:
+            visitor = cls()
+            visitor.visit(tree)
+            self.assertEqual(visitor.names, expected)
+        self.assertTrue(dispatch_table(Counter) is dispatch_table(Counter))
+        self.assertFalse(dispatch_table(Counter) is dispatch_table(Skipper))
+
+    def test_getattr_dispatch(self):
+        class Names(ASTVisitor):
+            def __init__(self):
+                self.names = []
+
+            def __getattr__(self, name):
+                if name == 'visit_Identifier':
+                    return lambda node: self.names.append(node.value)
+                raise AttributeError(name)
+
+        visitor = Names()
+        visitor.visit(Parser().parse('a = b(c);'))
+        self.assertEqual(visitor.names, ['a', 'b', 'c'])
+
+    def test_visitor_classes_are_freed(self):
+        import gc
+        import weakref
+
+        class Counter(ASTVisitor):
+            def visit_Identifier(self, node):
+                pass
+
+        Counter().visit(Parser().parse('a = b(c);'))
+        ref = weakref.ref(Counter)
+        del Counter
+        gc.collect()
+        self.assertTrue(ref() is None)
+
 
 def test_suite():
     return unittest.TestSuite((
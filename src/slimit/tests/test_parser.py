@@ -27,8 +27,9 @@ __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 import textwrap
 import unittest
 
-from slimit import ast
+from slimit import ast, mangler
 from slimit.parser import Parser
+from slimit.visitors.minvisitor import ECMAMinifier
 from slimit.visitors import nodevisitor
 
 
@@ -58,6 +59,7 @@ class ParserTestCase(unittest.TestCase):
         parser.parse('var $_ = function(x){}(window);\n')
 
     # XXX: function expression ?
+    # the 'rd' backend rejects it, see test_rd_backend_is_stricter
     def _test_function_expression(self):
         text = """
         if (true) {
@@ -115,6 +117,156 @@ class ParserTestCase(unittest.TestCase):
         parser = Parser()
         self.assertRaises(SyntaxError, parser.parse, text)
 
+    def test_syntax_error_position(self):
+        text = 'var a = 1;\nvar b = 2;\n  , c;'
+        try:
+            Parser().parse(text)
+        except SyntaxError as exc:
+            self.assertTrue(' at 3:3 ' in str(exc), str(exc))
+        else:
+            self.fail('SyntaxError not raised')
+
+    def test_parser_can_be_reused(self):
+        parser = Parser()
+        text = 'function f(x) { return x + 1 }'
+        first = parser.parse(text).to_ecma()
+        self.assertEqual(first, parser.parse(text).to_ecma())
+        # a syntax error doesn't leave any state behind
+        self.assertRaises(SyntaxError, parser.parse, 'var a;\n, b;')
+        self.assertRaises(TypeError, parser.parse, 'x = /[/')
+        self.assertEqual(first, parser.parse(text).to_ecma())
+
+    def test_scanner_lex_backend(self):
+        text = textwrap.dedent("""
+        var re = /ab+c/g, x = a / b / c;
+        obj = {get name() { return this._name; }};
+        function f(x) {
+          return x
+        }
+        """)
+        self.assertMultiLineEqual(
+            Parser(lex_backend='scanner').parse(text).to_ecma(),
+            Parser().parse(text).to_ecma()
+            )
+
+    def _minify(self, parser, text):
+        tree = parser.parse(text)
+        mangler.mangle(tree, toplevel=True)
+        return ECMAMinifier().visit(tree)
+
+    def test_backends(self):
+        from slimit.tests.test_ecmavisitor import ECMAVisitorTestCase
+        from slimit.tests.test_minifier import MinifierTestCase
+        texts = ECMAVisitorTestCase.TEST_CASES + [
+            input for input, expected in
+            ASITestCase.TEST_CASES + MinifierTestCase.TEST_CASES]
+        ply_parser = Parser()
+        for backend in ('lr', 'rd'):
+            parser = Parser(backend=backend)
+            for text in texts:
+                text = textwrap.dedent(text).strip()
+                self.assertMultiLineEqual(
+                    parser.parse(text).to_ecma(),
+                    ply_parser.parse(text).to_ecma()
+                    )
+                # mangling depends on the markers set by the parser
+                self.assertMultiLineEqual(
+                    self._minify(parser, text),
+                    self._minify(ply_parser, text)
+                    )
+            for text in ['var a;\n, b;', 'throw\n1', 'a\n)', '{ a',
+                         'a + b = 1', 'for (a + b in c) ;', '(a): b']:
+                self.assertRaises(SyntaxError, parser.parse, text)
+
+    def test_rd_backend_is_stricter(self):
+        # differences listed in the RDParser docstring
+        ply_parser = Parser()
+        parser = Parser(backend='rd')
+        for text in ['function() {}', 'x; function() { foo; }',
+                     'a:', 'if (a)', 'while (a)', '{ a: }',
+                     'for (a\nb\nc) x', 'for (a;\nb\nc) x']:
+            ply_parser.parse(text)
+            self.assertRaises(SyntaxError, parser.parse, text)
+
+    def test_unknown_backend(self):
+        self.assertRaises(ValueError, Parser, backend='unknown')
+
+    def test_lazy_functions(self):
+        text = textwrap.dedent("""
+        var f = function(a) {
+          if (a) { return /}/.test(a) }
+          function g() { return {b: '}'} }
+          return g
+        };
+        function h() { x = 1 }
+        """)
+        parser = Parser(backend='rd')
+        lazy_parser = Parser(backend='rd', lazy_functions=True)
+        for input in [text, lazy_parser.lexer.tokenize(text)]:
+            tree = lazy_parser.parse(input)
+            func = tree.children()[1]
+            self.assertTrue(func._lazy_elements is not None)
+            self.assertEqual(func.identifier.value, 'h')
+            self.assertMultiLineEqual(
+                tree.to_ecma(), parser.parse(text).to_ecma())
+            self.assertTrue(func._lazy_elements is None)
+        self.assertRaises(
+            ValueError, Parser, backend='lr', lazy_functions=True)
+
+    def test_lazy_functions_syntax_error(self):
+        parser = Parser(backend='rd', lazy_functions=True)
+        tree = parser.parse('function f() { a b }')
+        func = tree.children()[0]
+        self.assertRaises(SyntaxError, getattr, func, 'elements')
+        self.assertRaises(SyntaxError, parser.parse, 'function f() { {}')
+
+    def test_nodes_have_slots(self):
+        from slimit.tests.test_ecmavisitor import ECMAVisitorTestCase
+        for text in ECMAVisitorTestCase.TEST_CASES:
+            tree = Parser().parse(textwrap.dedent(text))
+            mangler.mangle(tree, toplevel=True)
+            for node in nodevisitor.visit(tree):
+                self.assertFalse(hasattr(node, '__dict__'), node)
+
+    def test_plain_node(self):
+        child = ast.Identifier('a')
+        node = ast.Node([child])
+        self.assertEqual(node.children(), [child])
+        self.assertEqual(list(node), [child])
+        self.assertEqual(ast.Node().children(), [])
+        self.assertEqual(
+            [n.value for n in nodevisitor.visit(ast.Node([child]))
+             if isinstance(n, ast.Identifier)], ['a'])
+
+    def test_child_fields(self):
+        tree = Parser().parse(
+            'x = {get a() {}}; new A(b, c); try {} finally { d }')
+        get_prop = tree.children()[0].expr.right.properties[0]
+        self.assertEqual(list(get_prop), [get_prop.prop_name])
+        new_expr = tree.children()[1].expr
+        self.assertEqual(
+            [child.value for child in new_expr], ['A', 'b', 'c'])
+        for node in nodevisitor.visit(tree):
+            children = [child for child in node.children()
+                        if child is not None]
+            self.assertEqual(list(node), children)
+            visited = []
+            node.each_child(visited.append)
+            self.assertEqual(visited, children)
+
+    def test_parse_token_buffer(self):
+        text = textwrap.dedent("""
+        var re = /ab+c/g, x = a / b / c;
+        function f(x) {
+          return
+          x
+        }
+        """)
+        parser = Parser()
+        buffer = parser.lexer.tokenize(text)
+        self.assertMultiLineEqual(
+            parser.parse(buffer).to_ecma(), parser.parse(text).to_ecma())
+
 
 @decorator
 class ASITestCase(unittest.TestCase):
@@ -239,5 +391,12 @@ class ASITestCase(unittest.TestCase):
         # ASI at lexer level should insert ';' after throw
         self.assertRaises(SyntaxError, parser.parse, input)
 
+    def test_semicolon_is_not_inserted_twice(self):
+        # a semicolon that would be parsed as an empty statement
+        # is not inserted
+        parser = Parser()
+        for text in ['a\n)', '{ a', 'a = \n}']:
+            self.assertRaises(SyntaxError, parser.parse, text)
+
 
 
@@ -25,373 +25,471 @@
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
 from slimit import ast
+from slimit.visitors.nodevisitor import dispatch_table
+from slimit.visitors.writer import Writer
 
 
 class ECMAVisitor(object):
+    """Pretty printer.
+
+    The visit methods write fragments of the output to a Writer, the
+    indentation of nested blocks is kept on a stack of indent strings
+    instead of re-indenting the text of the children.
+    """
 
     def __init__(self):
-        self.indent_level = 0
+        self.indents = ['']
+        self.writer = None
 
     def _make_indent(self):
-        return ' ' * self.indent_level
-
-    def visit(self, node):
-        method = 'visit_%s' % node.__class__.__name__
-        return getattr(self, method, self.generic_visit)(node)
+        return self.indents[-1]
+
+    def visit(self, node, out=None):
+        """Return the code of the node.
+
+        If 'out' is given the code is written to that file-like
+        object instead.
+        """
+        self.writer = Writer(out)
+        self.emit(node)
+        if out is None:
+            return self.writer.getvalue()
+        self.writer.flush(force=True)
+
+    def emit(self, node):
+        return dispatch_table(self.__class__)[node.__class__](self, node)
+
+    def _emit_list(self, nodes, separator=', '):
+        write = self.writer.write
+        emit = self.emit
+        for index, node in enumerate(nodes):
+            if index:
+                write(separator)
+            emit(node)
+
+    def _emit_lines(self, nodes, separator='\n'):
+        """Write the nodes indented one level deeper than the current
+        line, separated by 'separator'.
+        """
+        indents = self.indents
+        indent = indents[-1] + '  '
+        indents.append(indent)
+        writer = self.writer
+        write = writer.write
+        emit = self.emit
+        for index, node in enumerate(nodes):
+            if index:
+                write(separator)
+            write(indent)
+            emit(node)
+            writer.flush()
+        indents.pop()
+
+    def _emit_body(self, elements):
+        write = self.writer.write
+        write(' {\n')
+        self._emit_lines(elements)
+        write('\n')
+        write(self.indents[-1])
+        write('}')
 
     def generic_visit(self, node):
-        return 'GEN: %r' % node
+        self.writer.write('GEN: %r' % node)
 
     def visit_Program(self, node):
-        return '\n'.join(self.visit(child) for child in node)
+        writer = self.writer
+        for index, child in enumerate(node):
+            if index:
+                writer.write('\n')
+            self.emit(child)
+            writer.flush()
 
     def visit_Block(self, node):
-        s = '{\n'
-        self.indent_level += 2
-        s += '\n'.join(
-            self._make_indent() + self.visit(child) for child in node)
-        self.indent_level -= 2
-        s += '\n' + self._make_indent() + '}'
-        return s
+        write = self.writer.write
+        write('{\n')
+        self._emit_lines(node)
+        write('\n')
+        write(self.indents[-1])
+        write('}')
 
     def visit_VarStatement(self, node):
-        s = 'var %s;' % ', '.join(self.visit(child) for child in node)
-        return s
+        self.writer.write('var ')
+        self._emit_list(node)
+        self.writer.write(';')
 
     def visit_VarDecl(self, node):
-        output = []
-        output.append(self.visit(node.identifier))
+        self.emit(node.identifier)
         if node.initializer is not None:
-            output.append(' = %s' % self.visit(node.initializer))
-        return ''.join(output)
+            self.writer.write(' = ')
+            self.emit(node.initializer)
 
     def visit_Identifier(self, node):
-        return node.value
+        self.writer.write(node.value)
 
     def visit_Assign(self, node):
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        self.emit(node.left)
         if node.op == ':':
-            template = '%s%s %s'
+            write(': ')
         else:
-            template = '%s %s %s'
-        if getattr(node, '_parens', False):
-            template = '(%s)' % template
-        return template % (
-            self.visit(node.left), node.op, self.visit(node.right))
+            write(' %s ' % node.op)
+        self.emit(node.right)
+        if parens:
+            write(')')
 
     def visit_GetPropAssign(self, node):
-        template = 'get %s() {\n%s\n%s}'
-        if getattr(node, '_parens', False):
-            template = '(%s)' % template
-        self.indent_level += 2
-        body = '\n'.join(
-            (self._make_indent() + self.visit(el))
-            for el in node.elements
-            )
-        self.indent_level -= 2
-        tail = self._make_indent()
-        return template % (self.visit(node.prop_name), body, tail)
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        write('get ')
+        self.emit(node.prop_name)
+        write('()')
+        self._emit_body(node.elements)
+        if parens:
+            write(')')
 
     def visit_SetPropAssign(self, node):
-        template = 'set %s(%s) {\n%s\n%s}'
-        if getattr(node, '_parens', False):
-            template = '(%s)' % template
         if len(node.parameters) > 1:
             raise SyntaxError(
                 'Setter functions must have one argument: %s' % node)
-        params = ','.join(self.visit(param) for param in node.parameters)
-        self.indent_level += 2
-        body = '\n'.join(
-            (self._make_indent() + self.visit(el))
-            for el in node.elements
-            )
-        self.indent_level -= 2
-        tail = self._make_indent()
-        return template % (self.visit(node.prop_name), params, body, tail)
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        write('set ')
+        self.emit(node.prop_name)
+        write('(')
+        self._emit_list(node.parameters, ',')
+        write(')')
+        self._emit_body(node.elements)
+        if parens:
+            write(')')
 
     def visit_Number(self, node):
-        return node.value
+        self.writer.write(node.value)
 
     def visit_Comma(self, node):
-        s = '%s, %s' % (self.visit(node.left), self.visit(node.right))
-        if getattr(node, '_parens', False):
-            s = '(' + s + ')'
-        return s
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        self.emit(node.left)
+        write(', ')
+        self.emit(node.right)
+        if parens:
+            write(')')
 
     def visit_EmptyStatement(self, node):
-        return node.value
+        self.writer.write(node.value)
 
     def visit_If(self, node):
-        s = 'if ('
+        write = self.writer.write
+        write('if (')
         if node.predicate is not None:
-            s += self.visit(node.predicate)
-        s += ') '
-        s += self.visit(node.consequent)
+            self.emit(node.predicate)
+        write(') ')
+        self.emit(node.consequent)
         if node.alternative is not None:
-            s += ' else '
-            s += self.visit(node.alternative)
-        return s
+            write(' else ')
+            self.emit(node.alternative)
 
     def visit_Boolean(self, node):
-        return node.value
+        self.writer.write(node.value)
 
     def visit_For(self, node):
-        s = 'for ('
+        write = self.writer.write
+        write('for (')
         if node.init is not None:
-            s += self.visit(node.init)
+            self.emit(node.init)
         if node.init is None:
-            s += ' ; '
+            write(' ; ')
         elif isinstance(node.init, (ast.Assign, ast.Comma, ast.FunctionCall,
                                     ast.UnaryOp, ast.Identifier, ast.BinOp,
                                     ast.Conditional, ast.Regex, ast.NewExpr)):
-            s += '; '
+            write('; ')
         else:
-            s += ' '
+            write(' ')
         if node.cond is not None:
-            s += self.visit(node.cond)
-        s += '; '
+            self.emit(node.cond)
+        write('; ')
         if node.count is not None:
-            s += self.visit(node.count)
-        s += ') ' + self.visit(node.statement)
-        return s
+            self.emit(node.count)
+        write(') ')
+        self.emit(node.statement)
 
     def visit_ForIn(self, node):
+        write = self.writer.write
         if isinstance(node.item, ast.VarDecl):
-            template = 'for (var %s in %s) '
+            write('for (var ')
         else:
-            template = 'for (%s in %s) '
-        s = template % (self.visit(node.item), self.visit(node.iterable))
-        s += self.visit(node.statement)
-        return s
+            write('for (')
+        self.emit(node.item)
+        write(' in ')
+        self.emit(node.iterable)
+        write(') ')
+        self.emit(node.statement)
 
     def visit_BinOp(self, node):
-        if getattr(node, '_parens', False):
-            template = '(%s %s %s)'
-        else:
-            template = '%s %s %s'
-        return template % (
-            self.visit(node.left), node.op, self.visit(node.right))
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        self.emit(node.left)
+        write(' %s ' % node.op)
+        self.emit(node.right)
+        if parens:
+            write(')')
 
     def visit_UnaryOp(self, node):
-        s = self.visit(node.value)
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
         if node.postfix:
-            s += node.op
-        elif node.op in ('delete', 'void', 'typeof'):
-            s = '%s %s' % (node.op, s)
+            self.emit(node.value)
+            write(node.op)
         else:
-            s = '%s%s' % (node.op, s)
-        if getattr(node, '_parens', False):
-            s = '(%s)' % s
-        return s
+            if node.op in ('delete', 'void', 'typeof'):
+                write(node.op + ' ')
+            else:
+                write(node.op)
+            self.emit(node.value)
+        if parens:
+            write(')')
 
     def visit_ExprStatement(self, node):
-        return '%s;' % self.visit(node.expr)
+        self.emit(node.expr)
+        self.writer.write(';')
 
     def visit_DoWhile(self, node):
-        s = 'do '
-        s += self.visit(node.statement)
-        s += ' while (%s);' % self.visit(node.predicate)
-        return s
+        write = self.writer.write
+        write('do ')
+        self.emit(node.statement)
+        write(' while (')
+        self.emit(node.predicate)
+        write(');')
 
     def visit_While(self, node):
-        s = 'while (%s) ' % self.visit(node.predicate)
-        s += self.visit(node.statement)
-        return s
+        write = self.writer.write
+        write('while (')
+        self.emit(node.predicate)
+        write(') ')
+        self.emit(node.statement)
 
     def visit_Null(self, node):
-        return 'null'
+        self.writer.write('null')
 
     def visit_String(self, node):
-        return node.value
+        self.writer.write(node.value)
 
     def visit_Continue(self, node):
         if node.identifier is not None:
-            s = 'continue %s;' % self.visit_Identifier(node.identifier)
+            self.writer.write('continue ')
+            self.visit_Identifier(node.identifier)
+            self.writer.write(';')
         else:
-            s = 'continue;'
-        return s
+            self.writer.write('continue;')
 
     def visit_Break(self, node):
         if node.identifier is not None:
-            s = 'break %s;' % self.visit_Identifier(node.identifier)
+            self.writer.write('break ')
+            self.visit_Identifier(node.identifier)
+            self.writer.write(';')
         else:
-            s = 'break;'
-        return s
+            self.writer.write('break;')
 
     def visit_Return(self, node):
         if node.expr is None:
-            return 'return;'
+            self.writer.write('return;')
         else:
-            return 'return %s;' % self.visit(node.expr)
+            self.writer.write('return ')
+            self.emit(node.expr)
+            self.writer.write(';')
 
     def visit_With(self, node):
-        s = 'with (%s) ' % self.visit(node.expr)
-        s += self.visit(node.statement)
-        return s
+        write = self.writer.write
+        write('with (')
+        self.emit(node.expr)
+        write(') ')
+        self.emit(node.statement)
 
     def visit_Label(self, node):
-        s = '%s: %s' % (
-            self.visit(node.identifier), self.visit(node.statement))
-        return s
+        self.emit(node.identifier)
+        self.writer.write(': ')
+        self.emit(node.statement)
 
     def visit_Switch(self, node):
-        s = 'switch (%s) {\n' % self.visit(node.expr)
-        self.indent_level += 2
+        write = self.writer.write
+        write('switch (')
+        self.emit(node.expr)
+        write(') {\n')
+        indents = self.indents
+        indent = indents[-1] + '  '
+        indents.append(indent)
         for case in node.cases:
-            s += self._make_indent() + self.visit_Case(case)
+            write(indent)
+            self.visit_Case(case)
         if node.default is not None:
-            s += self.visit_Default(node.default)
-        self.indent_level -= 2
-        s += self._make_indent() + '}'
-        return s
+            self.visit_Default(node.default)
+        indents.pop()
+        write(indents[-1])
+        write('}')
 
     def visit_Case(self, node):
-        s = 'case %s:\n' % self.visit(node.expr)
-        self.indent_level += 2
-        elements = '\n'.join(self._make_indent() + self.visit(element)
-                             for element in node.elements)
-        if elements:
-            s += elements + '\n'
-        self.indent_level -= 2
-        return s
+        write = self.writer.write
+        write('case ')
+        self.emit(node.expr)
+        write(':\n')
+        if node.elements:
+            self._emit_lines(node.elements)
+            write('\n')
 
     def visit_Default(self, node):
-        s = self._make_indent() + 'default:\n'
-        self.indent_level += 2
-        s += '\n'.join(self._make_indent() + self.visit(element)
-                       for element in node.elements)
+        write = self.writer.write
+        write(self.indents[-1])
+        write('default:\n')
+        self._emit_lines(node.elements)
         if node.elements is not None:
-            s += '\n'
-        self.indent_level -= 2
-        return s
+            write('\n')
 
     def visit_Throw(self, node):
-        s = 'throw %s;' % self.visit(node.expr)
-        return s
+        self.writer.write('throw ')
+        self.emit(node.expr)
+        self.writer.write(';')
 
     def visit_Debugger(self, node):
-        return '%s;' % node.value
+        self.writer.write('%s;' % node.value)
 
     def visit_Try(self, node):
-        s = 'try '
-        s += self.visit(node.statements)
+        write = self.writer.write
+        write('try ')
+        self.emit(node.statements)
         if node.catch is not None:
-            s += ' ' + self.visit(node.catch)
+            write(' ')
+            self.emit(node.catch)
         if node.fin is not None:
-            s += ' ' + self.visit(node.fin)
-        return s
+            write(' ')
+            self.emit(node.fin)
 
     def visit_Catch(self, node):
-        s = 'catch (%s) %s' % (
-            self.visit(node.identifier), self.visit(node.elements))
-        return s
+        write = self.writer.write
+        write('catch (')
+        self.emit(node.identifier)
+        write(') ')
+        self.emit(node.elements)
 
     def visit_Finally(self, node):
-        s = 'finally %s' % self.visit(node.elements)
-        return s
+        self.writer.write('finally ')
+        self.emit(node.elements)
 
     def visit_FuncDecl(self, node):
-        self.indent_level += 2
-        elements = '\n'.join(self._make_indent() + self.visit(element)
-                             for element in node.elements)
-        self.indent_level -= 2
-
-        s = 'function %s(%s) {\n%s' % (
-            self.visit(node.identifier),
-            ', '.join(self.visit(param) for param in node.parameters),
-            elements,
-            )
-        s += '\n' + self._make_indent() + '}'
-        return s
+        write = self.writer.write
+        write('function ')
+        self.emit(node.identifier)
+        write('(')
+        self._emit_list(node.parameters)
+        write(')')
+        self._emit_body(node.elements)
 
     def visit_FuncExpr(self, node):
-        self.indent_level += 2
-        elements = '\n'.join(self._make_indent() + self.visit(element)
-                             for element in node.elements)
-        self.indent_level -= 2
-
-        ident = node.identifier
-        ident = '' if ident is None else ' %s' % self.visit(ident)
-
-        header = 'function%s(%s)'
-        if getattr(node, '_parens', False):
-            header = '(' + header
-        s = (header + ' {\n%s') % (
-            ident,
-            ', '.join(self.visit(param) for param in node.parameters),
-            elements,
-            )
-        s += '\n' + self._make_indent() + '}'
-        if getattr(node, '_parens', False):
-            s += ')'
-        return s
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        write('function')
+        if node.identifier is not None:
+            write(' ')
+            self.emit(node.identifier)
+        write('(')
+        self._emit_list(node.parameters)
+        write(')')
+        self._emit_body(node.elements)
+        if parens:
+            write(')')
 
     def visit_Conditional(self, node):
-        if getattr(node, '_parens', False):
-            template = '(%s ? %s : %s)'
-        else:
-            template = '%s ? %s : %s'
-
-        s = template % (
-            self.visit(node.predicate),
-            self.visit(node.consequent), self.visit(node.alternative))
-        return s
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        self.emit(node.predicate)
+        write(' ? ')
+        self.emit(node.consequent)
+        write(' : ')
+        self.emit(node.alternative)
+        if parens:
+            write(')')
 
     def visit_Regex(self, node):
         if getattr(node, '_parens', False):
-            return '(%s)' % node.value
+            self.writer.write('(%s)' % node.value)
         else:
-            return node.value
+            self.writer.write(node.value)
 
     def visit_NewExpr(self, node):
-        s = 'new %s(%s)' % (
-            self.visit(node.identifier),
-            ', '.join(self.visit(arg) for arg in node.args)
-            )
-        return s
+        write = self.writer.write
+        write('new ')
+        self.emit(node.identifier)
+        write('(')
+        self._emit_list(node.args)
+        write(')')
 
     def visit_DotAccessor(self, node):
-        if getattr(node, '_parens', False):
-            template = '(%s.%s)'
-        else:
-            template = '%s.%s'
-        s = template % (self.visit(node.node), self.visit(node.identifier))
-        return s
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        self.emit(node.node)
+        write('.')
+        self.emit(node.identifier)
+        if parens:
+            write(')')
 
     def visit_BracketAccessor(self, node):
-        s = '%s[%s]' % (self.visit(node.node), self.visit(node.expr))
-        return s
+        write = self.writer.write
+        self.emit(node.node)
+        write('[')
+        self.emit(node.expr)
+        write(']')
 
     def visit_FunctionCall(self, node):
-        s = '%s(%s)' % (self.visit(node.identifier),
-                        ', '.join(self.visit(arg) for arg in node.args))
-        if getattr(node, '_parens', False):
-            s = '(' + s + ')'
-        return s
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        self.emit(node.identifier)
+        write('(')
+        self._emit_list(node.args)
+        write(')')
+        if parens:
+            write(')')
 
     def visit_Object(self, node):
-        s = '{\n'
-        self.indent_level += 2
-        s += ',\n'.join(self._make_indent() + self.visit(prop)
-                        for prop in node.properties)
-        self.indent_level -= 2
+        write = self.writer.write
+        write('{\n')
+        self._emit_lines(node.properties, ',\n')
         if node.properties:
-            s += '\n'
-        s += self._make_indent() + '}'
-        return s
+            write('\n')
+        write(self.indents[-1])
+        write('}')
 
     def visit_Array(self, node):
-        s = '['
+        write = self.writer.write
+        write('[')
         length = len(node.items) - 1
         for index, item in enumerate(node.items):
             if isinstance(item, ast.Elision):
-                s += ','
+                write(',')
             elif index != length:
-                s += self.visit(item) + ','
+                self.emit(item)
+                write(',')
             else:
-                s += self.visit(item)
-        s += ']'
-        return s
+                self.emit(item)
+        write(']')
 
     def visit_This(self, node):
-        return 'this'
-
+        self.writer.write('this')
@@ -28,6 +28,8 @@ import re
 
 from slimit import ast
 from slimit.lexer import Lexer
+from slimit.visitors.nodevisitor import dispatch_table
+from slimit.visitors.writer import Writer
 
 _HAS_ID_MATCH = re.compile('^%s$' % Lexer.identifier).match
 
@@ -35,363 +37,442 @@ def _is_identifier(value):
     return _HAS_ID_MATCH(value) and value not in Lexer.keywords_dict
 
 
+
+
 class ECMAMinifier(object):
+    """Minified code generator.
+
+    The visit methods write fragments of the output to a Writer
+    instead of returning strings, choices that depend on the output of
+    a child, like the space after 'return', are made by the writer
+    when the child writes its first fragment.
+    """
 
     def __init__(self):
         self.in_block = 0
         self.ifelse_stack = []
-
-    def visit(self, node):
-        method = 'visit_%s' % node.__class__.__name__
-        return getattr(self, method, self.generic_visit)(node)
+        self.writer = None
+
+    def visit(self, node, out=None):
+        """Return the minified code of the node.
+
+        If 'out' is given the code is written to that file-like
+        object instead.
+        """
+        self.writer = Writer(out)
+        self.emit(node)
+        if out is None:
+            return self.writer.getvalue()
+        self.writer.flush(force=True)
+
+    def emit(self, node):
+        return dispatch_table(self.__class__)[node.__class__](self, node)
+
+    def _emit_list(self, nodes, separator):
+        write = self.writer.write
+        emit = self.emit
+        for index, node in enumerate(nodes):
+            if index:
+                write(separator)
+            emit(node)
+
+    def _emit_elements(self, elements):
+        emit = self.emit
+        flush = self.writer.flush
+        for element in elements:
+            emit(element)
+            flush()
 
     def generic_visit(self, node):
-        return 'GEN: %r' % node
+        self.writer.write('GEN: %r' % node)
 
     def visit_Program(self, node):
-        return ''.join(self.visit(child) for child in node)
+        self._emit_elements(node)
 
     def visit_Block(self, node):
-        children = [self.visit(child) for child in node]
+        children = node.children()
         if len(children) == 1:
-            return children[0]
+            self.emit(children[0])
         else:
-            return '{%s}' % ''.join(children)
+            self.writer.write('{')
+            for child in children:
+                self.emit(child)
+            self.writer.write('}')
 
     def visit_VarStatement(self, node):
-        s = 'var %s;' % ','.join(self.visit(child) for child in node)
-        return s
+        self.writer.write('var ')
+        self._emit_list(node, ',')
+        self.writer.write(';')
 
     def visit_VarDecl(self, node):
-        output = []
-        output.append(self.visit(node.identifier))
+        self.emit(node.identifier)
         if node.initializer is not None:
-            output.append('=%s' % self.visit(node.initializer))
-        return ''.join(output)
+            self.writer.write('=')
+            self.emit(node.initializer)
 
     def visit_Identifier(self, node):
-        return node.value
+        self.writer.write(node.value)
 
     def visit_Assign(self, node):
-        template = '%s%s%s'
-        if getattr(node, '_parens', False):
-            template = '(%s)' % template
-        return template % (
-            self.visit(node.left), node.op, self.visit(node.right))
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        self.emit(node.left)
+        write(node.op)
+        self.emit(node.right)
+        if parens:
+            write(')')
 
     def visit_GetPropAssign(self, node):
-        template = 'get %s(){%s}'
-        if getattr(node, '_parens', False):
-            template = '(%s)' % template
-        return template % (
-            self.visit(node.prop_name),
-            ''.join(self.visit(element) for element in node.elements)
-            )
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        write('get ')
+        self.emit(node.prop_name)
+        write('(){')
+        self._emit_elements(node.elements)
+        write('}')
+        if parens:
+            write(')')
 
     def visit_SetPropAssign(self, node):
-        template = 'set %s(%s){%s}'
-        if getattr(node, '_parens', False):
-            template = '(%s)' % template
         if len(node.parameters) > 1:
             raise SyntaxError(
                 'Setter functions must have one argument: %s' % node)
-        return template % (
-            self.visit(node.prop_name),
-            ''.join(self.visit(param) for param in node.parameters),
-            ''.join(self.visit(element) for element in node.elements)
-            )
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        write('set ')
+        self.emit(node.prop_name)
+        write('(')
+        self._emit_list(node.parameters, '')
+        write('){')
+        self._emit_elements(node.elements)
+        write('}')
+        if parens:
+            write(')')
 
     def visit_Number(self, node):
-        return node.value
+        self.writer.write(node.value)
 
     def visit_Comma(self, node):
-        template = '%s,%s'
-        if getattr(node, '_parens', False):
-            template = '(%s)' % template
-        return template % (self.visit(node.left), self.visit(node.right))
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        self.emit(node.left)
+        write(',')
+        self.emit(node.right)
+        if parens:
+            write(')')
 
     def visit_EmptyStatement(self, node):
-        return node.value
+        self.writer.write(node.value)
 
     def visit_If(self, node):
+        writer = self.writer
         has_alternative = node.alternative is not None
 
         def _is_singleline_block(n):
             return isinstance(n, ast.Block) and (len(n.children()) == 1)
 
-        s = 'if('
+        writer.write('if(')
         if node.predicate is not None:
-            s += self.visit(node.predicate)
-        s += ')'
+            self.emit(node.predicate)
+        writer.write(')')
 
         # if we are an 'if..else' statement and 'if' part contains only
         # one statement
         if has_alternative and _is_singleline_block(node.consequent):
             self.ifelse_stack.append({'if_in_ifelse': False})
-            consequent = self.visit(node.consequent)
+            position = writer.hold()
+            self.emit(node.consequent)
             record = self.ifelse_stack.pop()
             if record['if_in_ifelse']:
-                s += '{%s}' % consequent
+                writer.release(position, '{')
+                writer.write('}')
             else:
-                s += consequent
+                writer.release(position)
         elif has_alternative:
             # we are an 'if..else' statement and 'if' part contains
             # myltiple statements
-            s += self.visit(node.consequent)
+            self.emit(node.consequent)
         else:
             # 'if' without alternative - mark it so that an enclosing
             # 'if..else' can act on it and add braces around 'if' part
             if self.ifelse_stack:
                 self.ifelse_stack[-1]['if_in_ifelse'] = True
-            s += self.visit(node.consequent)
+            self.emit(node.consequent)
 
         if has_alternative:
-            alternative = self.visit(node.alternative)
-            if alternative.startswith(('(', '{')):
-                s += 'else%s' % alternative
-            else:
-                s += 'else %s' % alternative
-        return s
+            writer.prefix(('(', '{'), 'else', 'else ')
+            self.emit(node.alternative)
 
     def visit_Boolean(self, node):
-        return node.value
+        self.writer.write(node.value)
 
     def visit_For(self, node):
-        s = 'for('
+        write = self.writer.write
+        write('for(')
         if node.init is not None:
-            s += self.visit(node.init)
+            self.emit(node.init)
         if node.init is None:
-            s += ';'
+            write(';')
         elif isinstance(node.init, (ast.Assign, ast.Comma, ast.Conditional,
                                     ast.FunctionCall, ast.UnaryOp,
                                     ast.Identifier)):
-            s += ';'
-        else:
-            s += ''
+            write(';')
         if node.cond is not None:
-            s += self.visit(node.cond)
-        s += ';'
+            self.emit(node.cond)
+        write(';')
         if node.count is not None:
-            s += self.visit(node.count)
-        s += ')' + self.visit(node.statement)
-        return s
+            self.emit(node.count)
+        write(')')
+        self.emit(node.statement)
 
     def visit_ForIn(self, node):
+        write = self.writer.write
         if isinstance(node.item, ast.VarDecl):
-            template = 'for(var %s in %s)'
+            write('for(var ')
         else:
-            template = 'for(%s in %s)'
-        s = template % (self.visit(node.item), self.visit(node.iterable))
-        s += self.visit(node.statement)
-        return s
+            write('for(')
+        self.emit(node.item)
+        write(' in ')
+        self.emit(node.iterable)
+        write(')')
+        self.emit(node.statement)
 
     def visit_BinOp(self, node):
+        write = self.writer.write
         if node.op in ('instanceof', 'in'):
-            template = '%s %s %s'
+            op = ' %s ' % node.op
         elif (node.op == '+' and
               isinstance(node.right, ast.UnaryOp) and
               node.right.op == '++' and not node.right.postfix
               ):
             # make a space between + and ++
             # https://github.com/rspivak/slimit/issues/26
-            template = '%s%s %s'
+            op = '+ '
         else:
-            template = '%s%s%s'
-        if getattr(node, '_parens', False):
-            template = '(%s)' % template
-        return template % (
-            self.visit(node.left), node.op, self.visit(node.right))
+            op = node.op
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        self.emit(node.left)
+        write(op)
+        self.emit(node.right)
+        if parens:
+            write(')')
 
     def visit_UnaryOp(self, node):
-        s = self.visit(node.value)
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
         if node.postfix:
-            s += node.op
+            self.emit(node.value)
+            write(node.op)
         elif node.op in ('delete', 'void', 'typeof'):
-            s = '%s %s' % (node.op, s)
+            write(node.op + ' ')
+            self.emit(node.value)
         else:
-            s = '%s%s' % (node.op, s)
-        if getattr(node, '_parens', False):
-            s = '(%s)' % s
-        return s
+            write(node.op)
+            self.emit(node.value)
+        if parens:
+            write(')')
 
     def visit_ExprStatement(self, node):
-        return '%s;' % self.visit(node.expr)
+        self.emit(node.expr)
+        self.writer.write(';')
 
     def visit_DoWhile(self, node):
-        statement = self.visit(node.statement)
-        if statement.startswith(('{', '(')):
-            s = 'do%s' % statement
-        else:
-            s = 'do %s' % statement
-        s += 'while(%s);' % self.visit(node.predicate)
-        return s
+        writer = self.writer
+        writer.prefix(('{', '('), 'do', 'do ')
+        self.emit(node.statement)
+        writer.write('while(')
+        self.emit(node.predicate)
+        writer.write(');')
 
     def visit_While(self, node):
-        s = 'while(%s)' % self.visit(node.predicate)
-        s += self.visit(node.statement)
-        return s
+        write = self.writer.write
+        write('while(')
+        self.emit(node.predicate)
+        write(')')
+        self.emit(node.statement)
 
     def visit_Null(self, node):
-        return 'null'
+        self.writer.write('null')
 
     def visit_String(self, node):
-        return node.value
+        self.writer.write(node.value)
 
     def visit_Continue(self, node):
+        write = self.writer.write
         if node.identifier is not None:
-            s = 'continue %s;' % self.visit_Identifier(node.identifier)
+            write('continue ')
+            self.visit_Identifier(node.identifier)
+            write(';')
         else:
-            s = 'continue;'
-        return s
+            write('continue;')
 
     def visit_Break(self, node):
+        write = self.writer.write
         if node.identifier is not None:
-            s = 'break %s;' % self.visit_Identifier(node.identifier)
+            write('break ')
+            self.visit_Identifier(node.identifier)
+            write(';')
         else:
-            s = 'break;'
-        return s
+            write('break;')
 
     def visit_Return(self, node):
+        writer = self.writer
         if node.expr is None:
-            return 'return;'
+            writer.write('return;')
+            return
 
-        expr_text = self.visit(node.expr)
-        if expr_text.startswith(('(', '{')):
-            return 'return%s;' % expr_text
-        else:
-            return 'return %s;' % expr_text
+        writer.prefix(('(', '{'), 'return', 'return ')
+        self.emit(node.expr)
+        writer.write(';')
 
     def visit_With(self, node):
-        s = 'with(%s)' % self.visit(node.expr)
-        s += self.visit(node.statement)
-        return s
+        write = self.writer.write
+        write('with(')
+        self.emit(node.expr)
+        write(')')
+        self.emit(node.statement)
 
     def visit_Label(self, node):
-        s = '%s:%s' % (
-            self.visit(node.identifier), self.visit(node.statement))
-        return s
+        self.emit(node.identifier)
+        self.writer.write(':')
+        self.emit(node.statement)
 
     def visit_Switch(self, node):
-        s = 'switch(%s){' % self.visit(node.expr)
+        write = self.writer.write
+        write('switch(')
+        self.emit(node.expr)
+        write('){')
         for case in node.cases:
-            s += self.visit_Case(case)
+            self.visit_Case(case)
         if node.default is not None:
-            s += self.visit_Default(node.default)
-        s += '}'
-        return s
+            self.visit_Default(node.default)
+        write('}')
 
     def visit_Case(self, node):
-        s = 'case %s:' % self.visit(node.expr)
-        elements = ''.join(self.visit(element) for element in node.elements)
-        if elements:
-            s += elements
-        return s
+        write = self.writer.write
+        write('case ')
+        self.emit(node.expr)
+        write(':')
+        self._emit_elements(node.elements)
 
     def visit_Default(self, node):
-        s = 'default:'
-        s += ''.join(self.visit(element) for element in node.elements)
-        if node.elements is not None:
-            s += ''
-        return s
+        self.writer.write('default:')
+        self._emit_elements(node.elements)
 
     def visit_Throw(self, node):
-        s = 'throw %s;' % self.visit(node.expr)
-        return s
+        write = self.writer.write
+        write('throw ')
+        self.emit(node.expr)
+        write(';')
 
     def visit_Debugger(self, node):
-        return '%s;' % node.value
+        self.writer.write('%s;' % node.value)
+
+    def _emit_braced(self, node, keyword):
+        # the keyword followed by the node in braces, unless
+        # its code is already in braces
+        writer = self.writer
+        choice = writer.prefix(('{',), keyword, keyword + '{')
+        self.emit(node)
+        if not choice[-1]:
+            writer.write('}')
 
     def visit_Try(self, node):
-        result = self.visit(node.statements)
-        if result.startswith('{'):
-            s = 'try%s' % result
-        else:
-            s = 'try{%s}' % result
+        self._emit_braced(node.statements, 'try')
         if node.catch is not None:
-            s += self.visit(node.catch)
+            self.emit(node.catch)
         if node.fin is not None:
-            s += self.visit(node.fin)
-        return s
+            self.emit(node.fin)
 
     def visit_Catch(self, node):
-        ident = self.visit(node.identifier)
-        result = self.visit(node.elements)
-        if result.startswith('{'):
-            s = 'catch(%s)%s' % (ident, result)
-        else:
-            s = 'catch(%s){%s}' % (ident, result)
-        return s
+        write = self.writer.write
+        write('catch(')
+        self.emit(node.identifier)
+        write(')')
+        self._emit_braced(node.elements, '')
 
     def visit_Finally(self, node):
-        result = self.visit(node.elements)
-        if result.startswith('{'):
-            s = 'finally%s' % result
-        else:
-            s = 'finally{%s}' % result
-        return s
+        self._emit_braced(node.elements, 'finally')
 
     def visit_FuncDecl(self, node):
-        elements = ''.join(self.visit(element) for element in node.elements)
-        s = 'function %s(%s){%s' % (
-            self.visit(node.identifier),
-            ','.join(self.visit(param) for param in node.parameters),
-            elements,
-            )
-        s += '}'
-        return s
+        write = self.writer.write
+        write('function ')
+        self.emit(node.identifier)
+        write('(')
+        self._emit_list(node.parameters, ',')
+        write('){')
+        self._emit_elements(node.elements)
+        write('}')
 
     def visit_FuncExpr(self, node):
-        elements = ''.join(self.visit(element) for element in node.elements)
-
-        ident = node.identifier
-        ident = '' if ident is None else ' %s' % self.visit(ident)
-
-        header = 'function%s(%s)'
-        if getattr(node, '_parens', False):
-            header = '(' + header
-        s = (header + '{%s') % (
-            ident,
-            ','.join(self.visit(param) for param in node.parameters),
-            elements,
-            )
-        s += '}'
-        if getattr(node, '_parens', False):
-            s += ')'
-        return s
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        write('function')
+        if node.identifier is not None:
+            write(' ')
+            self.emit(node.identifier)
+        write('(')
+        self._emit_list(node.parameters, ',')
+        write('){')
+        self._emit_elements(node.elements)
+        write('}')
+        if parens:
+            write(')')
 
     def visit_Conditional(self, node):
-        if getattr(node, '_parens', False):
-            template = '(%s?%s:%s)'
-        else:
-            template = '%s?%s:%s'
-
-        s = template % (
-            self.visit(node.predicate),
-            self.visit(node.consequent), self.visit(node.alternative))
-        return s
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        self.emit(node.predicate)
+        write('?')
+        self.emit(node.consequent)
+        write(':')
+        self.emit(node.alternative)
+        if parens:
+            write(')')
 
     def visit_Regex(self, node):
         if getattr(node, '_parens', False):
-            return '(%s)' % node.value
+            self.writer.write('(%s)' % node.value)
         else:
-            return node.value
+            self.writer.write(node.value)
 
     def visit_NewExpr(self, node):
-        s = 'new %s(%s)' % (
-            self.visit(node.identifier),
-            ','.join(self.visit(arg) for arg in node.args)
-            )
-        return s
+        write = self.writer.write
+        write('new ')
+        self.emit(node.identifier)
+        write('(')
+        self._emit_list(node.args, ',')
+        write(')')
 
     def visit_DotAccessor(self, node):
-        if getattr(node, '_parens', False):
-            template = '(%s.%s)'
-        else:
-            template = '%s.%s'
-        s = template % (self.visit(node.node), self.visit(node.identifier))
-        return s
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        self.emit(node.node)
+        write('.')
+        self.emit(node.identifier)
+        if parens:
+            write(')')
 
     def visit_BracketAccessor(self, node):
+        write = self.writer.write
         if isinstance(node.expr, ast.String):
             value = node.expr.value
             # remove single or double quotes around the value, but not both
@@ -400,38 +481,46 @@ class ECMAMinifier(object):
             elif value.startswith('"'):
                 value = value.strip('"')
             if _is_identifier(value):
-                s = '%s.%s' % (self.visit(node.node), value)
-                return s
+                self.emit(node.node)
+                write('.' + value)
+                return
 
-        s = '%s[%s]' % (self.visit(node.node), self.visit(node.expr))
-        return s
+        self.emit(node.node)
+        write('[')
+        self.emit(node.expr)
+        write(']')
 
     def visit_FunctionCall(self, node):
-        template = '%s(%s)'
-        if getattr(node, '_parens', False):
-            template = '(%s)' % template
-
-        s = template % (self.visit(node.identifier),
-                        ','.join(self.visit(arg) for arg in node.args))
-        return s
+        write = self.writer.write
+        parens = getattr(node, '_parens', False)
+        if parens:
+            write('(')
+        self.emit(node.identifier)
+        write('(')
+        self._emit_list(node.args, ',')
+        write(')')
+        if parens:
+            write(')')
 
     def visit_Object(self, node):
-        s = '{%s}' % ','.join(self.visit(prop) for prop in node.properties)
-        return s
+        write = self.writer.write
+        write('{')
+        self._emit_list(node.properties, ',')
+        write('}')
 
     def visit_Array(self, node):
-        s = '['
+        write = self.writer.write
+        write('[')
         length = len(node.items) - 1
         for index, item in enumerate(node.items):
             if isinstance(item, ast.Elision):
-                s += ','
+                write(',')
             elif index != length:
-                s += self.visit(item) + ','
+                self.emit(item)
+                write(',')
             else:
-                s += self.visit(item)
-        s += ']'
-        return s
+                self.emit(item)
+        write(']')
 
     def visit_This(self, node):
-        return 'this'
-
+        self.writer.write('this')
@@ -25,6 +25,60 @@
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
 
+def _instance_method(name):
+    # for visitor classes that provide visit methods with __getattr__,
+    # the method is looked up on the instance on every visit
+    def visit(self, node):
+        return getattr(self, name, self.generic_visit)(node)
+    return visit
+
+
+class _DispatchTable(dict):
+    """Visit methods of a visitor class keyed by node class.
+
+    A method is looked up once per node class, the first time a node
+    of the class is visited. Methods are found on the visitor class,
+    visit methods set on an instance are not called.
+    """
+
+    def __init__(self, visitor_class):
+        self.visitor_class = visitor_class
+
+    def __missing__(self, node_class):
+        visitor_class = self.visitor_class
+        name = 'visit_%s' % node_class.__name__
+        method = getattr(visitor_class, name, None)
+        if method is None:
+            if hasattr(visitor_class, '__getattr__'):
+                method = _instance_method(name)
+            else:
+                method = visitor_class.generic_visit
+        self[node_class] = method
+        return method
+
+
+def dispatch_table(visitor_class):
+    """Return the table of visit methods shared by all instances of
+    the visitor class.
+
+    'visit' methods use it instead of formatting the method name and
+    calling getattr for every node:
+
+        def visit(self, node):
+            return dispatch_table(self.__class__)[node.__class__](
+                self, node)
+
+    Every subclass gets a table of its own, so the methods it
+    overrides are found. The table is an attribute of the class and
+    goes away with it.
+    """
+    try:
+        return visitor_class.__dict__['_dispatch_table']
+    except KeyError:
+        table = visitor_class._dispatch_table = _DispatchTable(visitor_class)
+        return table
+
+
 class ASTVisitor(object):
     """Base class for custom AST node visitors.
 
@@ -61,26 +115,61 @@ class ASTVisitor(object):
     """
 
     def visit(self, node):
-        method = 'visit_%s' % node.__class__.__name__
-        return getattr(self, method, self.generic_visit)(node)
+        return dispatch_table(self.__class__)[node.__class__](self, node)
 
     def generic_visit(self, node):
-        for child in node:
-            self.visit(child)
+        node.each_child(self.visit)
 
 
 class NodeVisitor(object):
     """Simple node visitor."""
 
-    def visit(self, node):
-        """Returns a generator that walks all children recursively."""
-        for child in node:
-            yield child
-            for subchild in self.visit(child):
-                yield subchild
+    def visit(self, node, order='pre', prune=None):
+        """Returns a generator that walks all descendants of the node.
+
+        'order' is 'pre' to get a node before its children or 'post'
+        to get it after them. Children of a node for which 'prune'
+        returns True are skipped, the node itself is still returned.
+
+        The walk keeps a stack of child iterators instead of recursing,
+        every node is yielded once and the depth of the tree is not
+        limited by the recursion limit.
+        """
+        if order == 'pre':
+            return self._pre_order(node, prune)
+        if order == 'post':
+            return self._post_order(node, prune)
+        raise ValueError('Unknown order: %r' % order)
+
+    @staticmethod
+    def _pre_order(node, prune):
+        stack = [iter(node)]
+        while stack:
+            for child in stack[-1]:
+                yield child
+                if prune is None or not prune(child):
+                    stack.append(iter(child))
+                break
+            else:
+                stack.pop()
+
+    @staticmethod
+    def _post_order(node, prune):
+        stack = [(node, iter(node))]
+        while stack:
+            for child in stack[-1][1]:
+                if prune is not None and prune(child):
+                    yield child
+                else:
+                    stack.append((child, iter(child)))
+                break
+            else:
+                parent = stack.pop()[0]
+                if stack:
+                    yield parent
 
 
-def visit(node):
+def visit(node, order='pre', prune=None):
     visitor = NodeVisitor()
-    for child in visitor.visit(node):
+    for child in visitor.visit(node, order, prune):
         yield child
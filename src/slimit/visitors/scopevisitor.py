@@ -25,13 +25,14 @@
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
 from slimit import ast
-from slimit.scope import VarSymbol, FuncSymbol, LocalScope, SymbolTable
+from slimit.scope import (
+    VarSymbol, FuncSymbol, LocalScope, SymbolTable, NameSequence)
+from slimit.visitors.nodevisitor import dispatch_table
 
 
 class Visitor(object):
     def visit(self, node):
-        method = 'visit_%s' % node.__class__.__name__
-        return getattr(self, method, self.generic_visit)(node)
+        return dispatch_table(self.__class__)[node.__class__](self, node)
 
     def generic_visit(self, node):
         if node is None:
@@ -40,8 +41,7 @@ class Visitor(object):
             for child in node:
                 self.visit(child)
         else:
-            for child in node.children():
-                self.visit(child)
+            node.each_child(self.visit)
 
 
 class ScopeTreeVisitor(Visitor):
@@ -56,7 +56,7 @@ class ScopeTreeVisitor(Visitor):
         symbol = VarSymbol(name=ident.value)
         if symbol not in self.current_scope:
             self.current_scope.define(symbol)
-        ident.scope = self.current_scope
+        self.visit_Identifier(ident)
         self.visit(node.initializer)
 
     def visit_Identifier(self, node):
@@ -79,7 +79,7 @@ class ScopeTreeVisitor(Visitor):
         self.current_scope = func_sym
         for ident in node.parameters:
             self.current_scope.define(VarSymbol(ident.value))
-            ident.scope = self.current_scope
+            self.visit_Identifier(ident)
 
         for element in node.elements:
             self.visit(element)
@@ -99,17 +99,81 @@ class ScopeTreeVisitor(Visitor):
         existing_symbol = self.current_scope.symbols.get(ident.value)
         if existing_symbol is None:
             self.current_scope.define(VarSymbol(ident.value))
-        ident.scope = self.current_scope
+        self.visit_Identifier(ident)
 
         for element in node.elements:
             self.visit(element)
 
+
+class ScopeAnalysisVisitor(ScopeTreeVisitor):
+    """Builds scope tree and collects references in a single pass.
+
+    While the tree is walked the identifiers that reference a name or
+    are mangling candidates are recorded. Names can only be resolved
+    once all declarations are known, so 'fill_references' resolves
+    the recorded identifiers afterwards: it fills 'refs' of the scopes
+    like RefVisitor does and appends the mangling candidates to
+    'occurrences' of the symbol they resolve to.
+    """
+
+    def __init__(self, sym_table):
+        ScopeTreeVisitor.__init__(self, sym_table)
+        self.identifiers = []
+
+    def visit_Identifier(self, node):
+        node.scope = self.current_scope
+        if (getattr(node, '_in_expression', False) or
+            getattr(node, '_mangle_candidate', False)):
+            self.identifiers.append(node)
+
+    def fill_references(self):
+        cache = {}
+        for node in self.identifiers:
+            name = node.value
+            scope = node.scope
+            symbol = scope.symbols.get(name)
+            if symbol is None:
+                symbol = scope.resolve(name, cache)
+                if symbol is None:
+                    continue
+            if (getattr(node, '_in_expression', False) and
+                scope.refs.get(name) is not symbol.scope):
+                _add_reference(name, scope, symbol.scope)
+            if getattr(node, '_mangle_candidate', False):
+                symbol.occurrences.append(node)
+        self.identifiers = []
+
+
+def _add_reference(name, scope, orig_scope):
+    """Put referenced name in 'ref' dictionary of a scope.
+
+    Walks up the scope tree and adds the name to 'ref' of every scope
+    up in the tree until a scope that defines referenced name is reached.
+    Stops early at a scope that already has the reference, the scopes
+    above it have it as well.
+    """
+    refs = scope.refs
+    while refs.get(name) is not orig_scope:
+        refs[name] = orig_scope
+        if scope is orig_scope:
+            break
+        scope = scope.get_enclosing_scope()
+        refs = scope.refs
+
+
 class RefVisitor(Visitor):
-    """Fill 'ref' attribute in scopes."""
+    """Fill 'ref' attribute in scopes.
+
+    References are collected while the tree is walked and added to the
+    scopes by 'fill_refs', once for every distinct name and scope.
+    """
+
+    def __init__(self):
+        self.references = {}
 
     def visit_Identifier(self, node):
         if self._is_id_in_expr(node):
-            self._fill_scope_refs(node.value, node.scope)
+            self.references[(node.scope, node.value)] = None
 
     @staticmethod
     def _is_id_in_expr(node):
@@ -119,51 +183,142 @@ class RefVisitor(Visitor):
             getattr(node, '_in_expression', False)
             )
 
+    def fill_refs(self):
+        cache = {}
+        for scope, name in self.references:
+            self._fill_scope_refs(name, scope, cache)
+        self.references = {}
+
     @staticmethod
-    def _fill_scope_refs(name, scope):
+    def _fill_scope_refs(name, scope, cache=None):
         """Put referenced name in 'ref' dictionary of a scope.
 
         Walks up the scope tree and adds the name to 'ref' of every scope
         up in the tree until a scope that defines referenced name is reached.
         """
-        symbol = scope.resolve(name)
+        symbol = scope.resolve(name, cache)
         if symbol is None:
             return
+        _add_reference(name, scope, symbol.scope)
 
-        orig_scope = symbol.scope
-        scope.refs[name] = orig_scope
-        while scope is not orig_scope:
-            scope = scope.get_enclosing_scope()
-            scope.refs[name] = orig_scope
 
+def _count_occurrences(symbol):
+    return -len(symbol.occurrences)
 
-def mangle_scope_tree(root, toplevel):
+
+def get_scope_paths(root):
+    """Return a list of (path, scope) pairs for a scope tree.
+
+    The path of the root is '' and a sub-scope adds '/' and the name
+    of its function to the path of its parent. Anonymous functions
+    are named '(anonymous)', a name used by more than one sibling
+    gets '#1', '#2', ... from its second use on. Paths only change
+    for the functions after an added or removed sibling with the
+    same name.
+    """
+    paths = []
+    stack = [('', root)]
+    while stack:
+        path, scope = stack.pop()
+        paths.append((path, scope))
+        seen = {}
+        children = []
+        for child in scope.children:
+            name = getattr(child, 'name', None) or '(anonymous)'
+            count = seen.get(name, 0)
+            seen[name] = count + 1
+            if count:
+                name = '%s#%d' % (name, count)
+            children.append(('%s/%s' % (path, name), child))
+        # keep parents before children and siblings in source order
+        stack.extend(reversed(children))
+    return paths
+
+
+def mangle_scope_tree(root, toplevel, by_frequency=False, alphabet=None,
+                      name_map=None):
     """Walk over a scope tree and mangle symbol names.
 
     Args:
         toplevel: Defines if global scope should be mangled or not.
+        by_frequency: defaults to False. If True the shortest names
+        of a scope go to its symbols with the most 'occurrences',
+        otherwise names are given in the order symbols are defined.
+        alphabet: defaults to NAME_CHARS. Characters mangled names are
+        made of, in the order they are used, see NameSequence.
+        name_map: defaults to None. Dictionary
+        {scope path: {name: mangled name}} of a previous run, see
+        get_scope_paths. A symbol keeps its previous mangled name if
+        its scope can still use it. The dictionary is then replaced
+        with the names given by this run.
     """
-    def mangle(scope):
+    sequence = None if alphabet is None else NameSequence(alphabet)
+    previous = {}
+    if name_map is not None:
+        previous = dict(name_map)
+        name_map.clear()
+
+    def mangle(scope, path):
         # don't mangle global scope if not specified otherwise
         if scope.get_enclosing_scope() is None and not toplevel:
             return
-        for name in scope.symbols:
+        if sequence is not None:
+            scope.names = sequence
+        names = scope.symbols
+        if by_frequency:
+            # sorted is stable, symbols used equally often keep
+            # the definition order
+            names = [symbol.name for symbol in sorted(
+                scope.symbols.values(), key=_count_occurrences)]
+        reused = previous.get(path)
+        if reused:
+            # previous names first, new names must not take them
+            remaining = []
+            for name in names:
+                mangled_name = reused.get(name)
+                if (mangled_name is not None and
+                    scope.can_mangle_to(mangled_name)):
+                    scope.mangled[name] = mangled_name
+                    scope.rev_mangled[mangled_name] = name
+                else:
+                    remaining.append(name)
+            names = remaining
+        for name in names:
             mangled_name = scope.get_next_mangled_name()
             scope.mangled[name] = mangled_name
             scope.rev_mangled[mangled_name] = name
+        if name_map is not None and scope.mangled:
+            name_map[path] = dict(scope.mangled)
 
-    def visit(node):
-        mangle(node)
-        for child in node.children:
-            visit(child)
-
-    visit(root)
+    for path, scope in get_scope_paths(root):
+        mangle(scope, path)
 
 
 def fill_scope_references(tree):
     """Fill 'ref' scope attribute with values."""
     visitor = RefVisitor()
     visitor.visit(tree)
+    visitor.fill_refs()
+
+
+def rename_symbols(root):
+    """Change the recorded occurrences of the symbols of a scope tree
+    to their mangled names.
+
+    Needs the 'occurrences' collected by ScopeAnalysisVisitor, does
+    the same as NameManglerVisitor without walking the parsed tree.
+    """
+    scopes = [root]
+    while scopes:
+        scope = scopes.pop()
+        mangled = scope.mangled
+        if mangled:
+            for name, symbol in scope.symbols.items():
+                mangled_name = mangled.get(name)
+                if mangled_name is not None:
+                    for node in symbol.occurrences:
+                        node.value = mangled_name
+        scopes.extend(scope.children)
 
 
 class NameManglerVisitor(Visitor):
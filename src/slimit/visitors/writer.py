@@ -0,0 +1,92 @@
+###############################################################################
+#
+# Copyright (c) 2011 Ruslan Spivak
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+###############################################################################
+
+__author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
+
+
+class Writer(object):
+    """Output of the code generating visitors.
+
+    Fragments are collected in a list and joined once at the end, or
+    written to the file-like object 'fp' in chunks as the output
+    grows.
+    """
+
+    def __init__(self, fp=None, chunk_size=4096):
+        self.fragments = []
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.pending = None
+        self.held = 0
+
+    def write(self, text):
+        if self.pending is not None and text:
+            self._resolve(text)
+        self.fragments.append(text)
+
+    def _resolve(self, text):
+        pending = self.pending
+        self.pending = None
+        pending[3] = text.startswith(pending[0])
+        self.fragments.append(pending[1] if pending[3] else pending[2])
+
+    def prefix(self, chars, matched, unmatched):
+        """Write 'matched' before the next non-empty fragment if the
+        fragment starts with one of 'chars' and 'unmatched' otherwise.
+
+        Returns a list whose last item is set to True or False when
+        the choice is made.
+        """
+        if self.pending is not None:
+            # a prefix still waiting for its fragment is followed by
+            # this one, both choices of which start like 'matched'
+            self._resolve(matched)
+        pending = self.pending = [chars, matched, unmatched, None]
+        return pending
+
+    def hold(self):
+        """Keep the fragments written from now on in memory, so text
+        can be inserted before them with 'release'.
+        """
+        self.held += 1
+        return len(self.fragments)
+
+    def release(self, position, text=None):
+        """Release a 'hold' and insert the text at its position."""
+        self.held -= 1
+        if text is not None:
+            self.fragments.insert(position, text)
+
+    def flush(self, force=False):
+        """Write the collected fragments to 'fp' once there are
+        'chunk_size' of them or if 'force' is set.
+        """
+        fragments = self.fragments
+        if (self.fp is not None and not self.held and
+            (force or len(fragments) >= self.chunk_size)):
+            self.fp.write(''.join(fragments))
+            del fragments[:]
+
+    def getvalue(self):
+        return ''.join(self.fragments)
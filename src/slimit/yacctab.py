@@ -1,4 +1,4 @@
-# coding=utf-8
+
 # yacctab.py
 # This file is automatically generated. Do not edit.
 # pylint: disable=W,C,R
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'programAND ANDEQUAL BAND BLOCK_COMMENT BNOT BOR BREAK BXOR CASE CATCH CLASS COLON COMMA CONDOP CONST CONTINUE DEBUGGER DEFAULT DELETE DIV DIVEQUAL DO ELSE ENUM EQ EQEQ EXPORT EXTENDS FALSE FINALLY FOR FUNCTION GE GETPROP GT ID IF IMPORT IN INSTANCEOF LBRACE LBRACKET LE LINE_COMMENT LINE_TERMINATOR LPAREN LSHIFT LSHIFTEQUAL LT MINUS MINUSEQUAL MINUSMINUS MOD MODEQUAL MULT MULTEQUAL NE NEW NOT NULL NUMBER OR OREQUAL PERIOD PLUS PLUSEQUAL PLUSPLUS RBRACE RBRACKET REGEX RETURN RPAREN RSHIFT RSHIFTEQUAL SEMI SETPROP STREQ STRING STRNEQ SUPER SWITCH THIS THROW TRUE TRY TYPEOF URSHIFT URSHIFTEQUAL VAR VOID WHILE WITH XOREQUALempty :auto_semi : errorprogram : source_elementssource_elements : empty\n                           | source_element_list\n        source_element_list : source_element\n                               | source_element_list source_element\n        source_element : statement\n                          | function_declaration\n        statement : block\n                     | variable_statement\n                     | empty_statement\n                     | expr_statement\n                     | if_statement\n                     | iteration_statement\n                     | continue_statement\n                     | break_statement\n                     | return_statement\n                     | with_statement\n                     | switch_statement\n                     | labelled_statement\n                     | throw_statement\n                     | try_statement\n                     | debugger_statement\n                     | function_declaration\n        block : LBRACE source_elements RBRACEliteral : null_literal\n                   | boolean_literal\n                   | numeric_literal\n                   | string_literal\n                   | regex_literal\n        boolean_literal : TRUE\n                           | FALSE\n        null_literal : NULLnumeric_literal : NUMBERstring_literal : STRINGregex_literal : REGEXidentifier : IDprimary_expr : primary_expr_no_brace\n                        | object_literal\n        primary_expr_no_brace : identifierprimary_expr_no_brace : THISprimary_expr_no_brace : literal\n                                 | array_literal\n        primary_expr_no_brace : LPAREN expr RPARENarray_literal : LBRACKET elision_opt RBRACKETarray_literal : LBRACKET element_list RBRACKET\n                         | LBRACKET element_list COMMA elision_opt RBRACKET\n        element_list : elision_opt assignment_expr\n                        | element_list COMMA elision_opt assignment_expr\n        elision_opt : emptyelision_opt : elisionelision : COMMA\n                   | elision COMMA\n        object_literal : LBRACE RBRACE\n                          | LBRACE property_list RBRACE\n                          | LBRACE property_list COMMA RBRACE\n        property_list : property_assignment\n                         | property_list COMMA property_assignment\n        property_assignment              : property_name COLON assignment_expr\n             | GETPROP property_name LPAREN RPAREN LBRACE function_body RBRACE\n             | SETPROP property_name LPAREN formal_parameter_list RPAREN                    LBRACE function_body RBRACE\n        property_name : identifier\n                         | string_literal\n                         | numeric_literal\n        member_expr : primary_expr\n                       | function_expr\n                       | member_expr LBRACKET expr RBRACKET\n                       | member_expr PERIOD identifier\n                       | NEW member_expr arguments\n        member_expr_nobf : primary_expr_no_brace\n                            | function_expr\n                            | member_expr_nobf LBRACKET expr RBRACKET\n                            | member_expr_nobf PERIOD identifier\n                            | NEW member_expr arguments\n        new_expr : member_expr\n                    | NEW new_expr\n        new_expr_nobf : member_expr_nobf\n                         | NEW new_expr\n        call_expr : member_expr arguments\n                     | call_expr arguments\n                     | call_expr LBRACKET expr RBRACKET\n                     | call_expr PERIOD identifier\n        call_expr_nobf : member_expr_nobf arguments\n                          | call_expr_nobf arguments\n                          | call_expr_nobf LBRACKET expr RBRACKET\n                          | call_expr_nobf PERIOD identifier\n        arguments : LPAREN RPAREN\n                     | LPAREN argument_list RPAREN\n        argument_list : assignment_expr\n                         | argument_list COMMA assignment_expr\n        left_hand_side_expr : new_expr\n                               | call_expr\n        left_hand_side_expr_nobf : new_expr_nobf\n                                    | call_expr_nobf\n        postfix_expr : left_hand_side_expr\n                        | left_hand_side_expr PLUSPLUS\n                        | left_hand_side_expr MINUSMINUS\n        postfix_expr_nobf : left_hand_side_expr_nobf\n                             | left_hand_side_expr_nobf PLUSPLUS\n                             | left_hand_side_expr_nobf MINUSMINUS\n        unary_expr : postfix_expr\n                      | unary_expr_common\n        unary_expr_nobf : postfix_expr_nobf\n                           | unary_expr_common\n        unary_expr_common : DELETE unary_expr\n                             | VOID unary_expr\n                             | TYPEOF unary_expr\n                             | PLUSPLUS unary_expr\n                             | MINUSMINUS unary_expr\n                             | PLUS unary_expr\n                             | MINUS unary_expr\n                             | BNOT unary_expr\n                             | NOT unary_expr\n        multiplicative_expr : unary_expr\n                               | multiplicative_expr MULT unary_expr\n                               | multiplicative_expr DIV unary_expr\n                               | multiplicative_expr MOD unary_expr\n        multiplicative_expr_nobf : unary_expr_nobf\n                                    | multiplicative_expr_nobf MULT unary_expr\n                                    | multiplicative_expr_nobf DIV unary_expr\n                                    | multiplicative_expr_nobf MOD unary_expr\n        additive_expr : multiplicative_expr\n                         | additive_expr PLUS multiplicative_expr\n                         | additive_expr MINUS multiplicative_expr\n        additive_expr_nobf : multiplicative_expr_nobf\n                              | additive_expr_nobf PLUS multiplicative_expr\n                              | additive_expr_nobf MINUS multiplicative_expr\n        shift_expr : additive_expr\n                      | shift_expr LSHIFT additive_expr\n                      | shift_expr RSHIFT additive_expr\n                      | shift_expr URSHIFT additive_expr\n        shift_expr_nobf : additive_expr_nobf\n                           | shift_expr_nobf LSHIFT additive_expr\n                           | shift_expr_nobf RSHIFT additive_expr\n                           | shift_expr_nobf URSHIFT additive_expr\n        relational_expr : shift_expr\n                           | relational_expr LT shift_expr\n                           | relational_expr GT shift_expr\n                           | relational_expr LE shift_expr\n                           | relational_expr GE shift_expr\n                           | relational_expr INSTANCEOF shift_expr\n                           | relational_expr IN shift_expr\n        relational_expr_noin : shift_expr\n                                | relational_expr_noin LT shift_expr\n                                | relational_expr_noin GT shift_expr\n                                | relational_expr_noin LE shift_expr\n                                | relational_expr_noin GE shift_expr\n                                | relational_expr_noin INSTANCEOF shift_expr\n        relational_expr_nobf : shift_expr_nobf\n                                | relational_expr_nobf LT shift_expr\n                                | relational_expr_nobf GT shift_expr\n                                | relational_expr_nobf LE shift_expr\n                                | relational_expr_nobf GE shift_expr\n                                | relational_expr_nobf INSTANCEOF shift_expr\n                                | relational_expr_nobf IN shift_expr\n        equality_expr : relational_expr\n                         | equality_expr EQEQ relational_expr\n                         | equality_expr NE relational_expr\n                         | equality_expr STREQ relational_expr\n                         | equality_expr STRNEQ relational_expr\n        equality_expr_noin : relational_expr_noin\n                              | equality_expr_noin EQEQ relational_expr\n                              | equality_expr_noin NE relational_expr\n                              | equality_expr_noin STREQ relational_expr\n                              | equality_expr_noin STRNEQ relational_expr\n        equality_expr_nobf : relational_expr_nobf\n                              | equality_expr_nobf EQEQ relational_expr\n                              | equality_expr_nobf NE relational_expr\n                              | equality_expr_nobf STREQ relational_expr\n                              | equality_expr_nobf STRNEQ relational_expr\n        bitwise_and_expr : equality_expr\n                            | bitwise_and_expr BAND equality_expr\n        bitwise_and_expr_noin             : equality_expr_noin\n            | bitwise_and_expr_noin BAND equality_expr_noin\n        bitwise_and_expr_nobf             : equality_expr_nobf\n            | bitwise_and_expr_nobf BAND equality_expr_nobf\n        bitwise_xor_expr : bitwise_and_expr\n                            | bitwise_xor_expr BXOR bitwise_and_expr\n        \n        bitwise_xor_expr_noin             : bitwise_and_expr_noin\n            | bitwise_xor_expr_noin BXOR bitwise_and_expr_noin\n        \n        bitwise_xor_expr_nobf             : bitwise_and_expr_nobf\n            | bitwise_xor_expr_nobf BXOR bitwise_and_expr_nobf\n        bitwise_or_expr : bitwise_xor_expr\n                           | bitwise_or_expr BOR bitwise_xor_expr\n        \n        bitwise_or_expr_noin             : bitwise_xor_expr_noin\n            | bitwise_or_expr_noin BOR bitwise_xor_expr_noin\n        \n        bitwise_or_expr_nobf             : bitwise_xor_expr_nobf\n            | bitwise_or_expr_nobf BOR bitwise_xor_expr_nobf\n        logical_and_expr : bitwise_or_expr\n                            | logical_and_expr AND bitwise_or_expr\n        \n        logical_and_expr_noin : bitwise_or_expr_noin\n                              | logical_and_expr_noin AND bitwise_or_expr_noin\n        \n        logical_and_expr_nobf : bitwise_or_expr_nobf\n                              | logical_and_expr_nobf AND bitwise_or_expr_nobf\n        logical_or_expr : logical_and_expr\n                           | logical_or_expr OR logical_and_expr\n        logical_or_expr_noin : logical_and_expr_noin\n                                | logical_or_expr_noin OR logical_and_expr_noin\n        logical_or_expr_nobf : logical_and_expr_nobf\n                                | logical_or_expr_nobf OR logical_and_expr_nobf\n        \n        conditional_expr             : logical_or_expr\n            | logical_or_expr CONDOP assignment_expr COLON assignment_expr\n        \n        conditional_expr_noin             : logical_or_expr_noin\n            | logical_or_expr_noin CONDOP assignment_expr_noin COLON                   assignment_expr_noin\n        \n        conditional_expr_nobf             : logical_or_expr_nobf\n            | logical_or_expr_nobf CONDOP assignment_expr COLON assignment_expr\n        \n        assignment_expr             : conditional_expr\n            | left_hand_side_expr assignment_operator assignment_expr\n        \n        assignment_expr_noin             : conditional_expr_noin\n            | left_hand_side_expr assignment_operator assignment_expr_noin\n        \n        assignment_expr_nobf             : conditional_expr_nobf\n            | left_hand_side_expr_nobf assignment_operator assignment_expr\n        assignment_operator : EQ\n                               | MULTEQUAL\n                               | DIVEQUAL\n                               | MODEQUAL\n                               | PLUSEQUAL\n                               | MINUSEQUAL\n                               | LSHIFTEQUAL\n                               | RSHIFTEQUAL\n                               | URSHIFTEQUAL\n                               | ANDEQUAL\n                               | XOREQUAL\n                               | OREQUAL\n        expr : assignment_expr\n                | expr COMMA assignment_expr\n        expr_noin : assignment_expr_noin\n                     | expr_noin COMMA assignment_expr_noin\n        expr_nobf : assignment_expr_nobf\n                     | expr_nobf COMMA assignment_expr\n        variable_statement : VAR variable_declaration_list SEMI\n                              | VAR variable_declaration_list auto_semi\n        \n        variable_declaration_list             : variable_declaration\n            | variable_declaration_list COMMA variable_declaration\n        \n        variable_declaration_list_noin             : variable_declaration_noin\n            | variable_declaration_list_noin COMMA variable_declaration_noin\n        variable_declaration : identifier\n                                | identifier initializer\n        variable_declaration_noin : identifier\n                                     | identifier initializer_noin\n        initializer : EQ assignment_exprinitializer_noin : EQ assignment_expr_noinempty_statement : SEMIexpr_statement : expr_nobf SEMI\n                          | expr_nobf auto_semi\n        if_statement : IF LPAREN expr RPAREN statementif_statement : IF LPAREN expr RPAREN statement ELSE statement\n        iteration_statement             : DO statement WHILE LPAREN expr RPAREN SEMI\n            | DO statement WHILE LPAREN expr RPAREN auto_semi\n        iteration_statement : WHILE LPAREN expr RPAREN statement\n        iteration_statement             : FOR LPAREN expr_noin_opt SEMI expr_opt SEMI expr_opt RPAREN                   statement\n            | FOR LPAREN VAR variable_declaration_list_noin SEMI expr_opt SEMI                  expr_opt RPAREN statement\n        \n        iteration_statement             : FOR LPAREN left_hand_side_expr IN expr RPAREN statement\n        \n        iteration_statement :             FOR LPAREN VAR identifier IN expr RPAREN statement\n        \n        iteration_statement           : FOR LPAREN VAR identifier initializer_noin IN expr RPAREN statement\n        expr_opt : empty\n                    | expr\n        expr_noin_opt : empty\n                         | expr_noin\n        continue_statement : CONTINUE SEMI\n                              | CONTINUE auto_semi\n        continue_statement : CONTINUE identifier SEMI\n                              | CONTINUE identifier auto_semi\n        break_statement : BREAK SEMI\n                           | BREAK auto_semi\n        break_statement : BREAK identifier SEMI\n                           | BREAK identifier auto_semi\n        return_statement : RETURN SEMI\n                            | RETURN auto_semi\n        return_statement : RETURN expr SEMI\n                            | RETURN expr auto_semi\n        with_statement : WITH LPAREN expr RPAREN statementswitch_statement : SWITCH LPAREN expr RPAREN case_block\n        case_block             : LBRACE case_clauses_opt RBRACE\n            | LBRACE case_clauses_opt default_clause case_clauses_opt RBRACE\n        case_clauses_opt : empty\n                            | case_clauses\n        case_clauses : case_clause\n                        | case_clauses case_clause\n        case_clause : CASE expr COLON source_elementsdefault_clause : DEFAULT COLON source_elementslabelled_statement : identifier COLON statementthrow_statement : THROW expr SEMI\n                           | THROW expr auto_semi\n        try_statement : TRY block catchtry_statement : TRY block finallytry_statement : TRY block catch finallycatch : CATCH LPAREN identifier RPAREN blockfinally : FINALLY blockdebugger_statement : DEBUGGER SEMI\n                              | DEBUGGER auto_semi\n        \n        function_declaration             : FUNCTION identifier LPAREN RPAREN LBRACE function_body RBRACE\n            | FUNCTION identifier LPAREN formal_parameter_list RPAREN LBRACE                  function_body RBRACE\n        \n        function_expr             : FUNCTION LPAREN RPAREN LBRACE function_body RBRACE\n            | FUNCTION LPAREN formal_parameter_list RPAREN                 LBRACE function_body RBRACE\n        \n        function_expr             : FUNCTION identifier LPAREN RPAREN LBRACE function_body RBRACE\n            | FUNCTION identifier LPAREN formal_parameter_list RPAREN                 LBRACE function_body RBRACE\n        formal_parameter_list : identifier\n                                 | formal_parameter_list COMMA identifier\n        function_body : source_elements'
-
-_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,28,89,125,126,128,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,413,415,438,440,468,469,502,509,510,511,517,519,524,525,532,540,542,543,547,],[-1,0,-3,-4,-5,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-244,-7,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-288,-290,-247,-251,-273,-274,-293,-248,-249,-250,-254,-275,-289,-294,-255,-252,-256,-276,-253,]),'FUNCTION':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,167,169,170,172,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,319,320,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,419,421,422,426,428,438,440,444,446,448,468,469,477,481,485,487,492,494,495,500,502,506,507,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[23,23,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,110,23,-244,23,110,110,110,-1,110,110,110,110,110,110,110,110,110,-7,23,110,-245,-246,110,-2,110,-25,110,110,-261,-262,-265,-266,-269,-270,110,110,-291,-292,110,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,110,110,110,110,110,110,110,-53,-51,-52,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-283,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-26,-232,-233,110,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-1,-54,23,110,23,110,23,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,23,-288,-290,110,110,110,23,23,110,-247,-251,110,110,110,-273,-274,23,23,23,110,110,23,110,110,-293,23,23,-248,-249,-250,110,23,-254,-275,-289,-294,23,23,-255,23,23,23,-252,23,-256,-276,-253,]),'LBRACE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,40,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,167,169,172,176,178,179,180,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,213,216,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,302,319,320,342,344,345,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,415,416,419,421,422,423,426,428,431,438,440,444,446,448,468,469,477,481,482,483,485,487,492,494,495,500,501,502,506,507,508,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[26,26,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,111,26,-244,26,111,111,26,111,-1,111,111,111,111,111,111,111,111,111,-7,26,111,-245,-246,111,-2,111,-25,111,111,-261,-262,-265,-266,-269,-270,111,111,-291,-292,111,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,111,111,111,111,111,-53,-51,-52,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,344,-283,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,-26,-232,-233,111,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,26,-1,-54,422,26,426,111,26,111,26,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,26,470,-288,-290,111,111,111,26,477,26,111,481,-247,-251,111,111,111,-273,-274,26,26,506,507,26,111,111,26,111,111,26,-293,26,26,529,-248,-249,-250,111,26,-254,-275,-289,-294,26,26,-255,26,26,26,-252,26,-256,-276,-253,]),'VAR':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,126,128,131,133,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,344,386,388,411,413,415,422,426,438,440,468,469,477,481,485,494,502,506,507,509,510,511,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[27,27,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,27,-244,27,-7,27,-245,-246,-2,-25,275,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,27,27,27,27,-288,-290,27,27,-247,-251,-273,-274,27,27,27,27,-293,27,27,-248,-249,-250,27,-254,-275,-289,-294,27,27,-255,27,27,27,-252,27,-256,-276,-253,]),'SEMI':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,26,28,29,31,34,35,36,41,42,43,44,45,46,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,89,92,94,95,96,97,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,122,123,124,125,126,128,131,133,134,135,136,137,138,139,140,141,142,145,147,148,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,216,217,220,221,224,228,231,232,236,264,265,266,268,270,274,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,297,298,299,300,303,305,306,308,309,312,314,315,316,318,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,344,347,348,350,352,353,355,356,357,358,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,388,389,390,391,392,411,413,415,417,418,420,422,426,429,430,433,438,440,441,442,443,444,447,450,451,452,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,472,474,477,478,480,481,485,486,488,489,490,493,494,502,504,506,507,509,510,511,514,515,517,518,519,524,525,526,529,530,532,533,535,536,537,540,541,542,543,547,],[28,28,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-41,28,-244,125,28,134,137,140,147,-230,-38,-212,-99,-206,-94,-95,-200,-78,-194,-71,-72,-188,-42,-43,-44,-182,-27,-28,-29,-30,-31,-176,-34,-32,-33,-35,-36,-37,-167,-150,-133,-126,-119,-104,-105,-7,28,-226,-208,-96,-202,-92,-93,-196,-76,-41,-190,-66,-67,-184,-39,-40,-178,-172,-157,-137,-129,-123,-115,-102,-103,265,-234,-238,-245,-246,-2,-25,-1,-261,-262,289,-265,-266,291,-269,-270,293,297,-291,-292,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-283,-45,-97,-98,-81,-80,-77,-76,-55,-26,-232,-233,-239,-231,389,-96,-259,-260,-228,-210,-204,-198,-192,-186,-180,-174,-162,-144,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-213,-201,-99,-87,-88,-195,-74,-75,-46,-47,-189,-183,-177,-168,-169,-170,-171,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,28,-227,-209,-197,-83,-191,-69,-70,-185,-179,-56,-173,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-235,-242,28,28,-1,444,-240,-236,28,-288,-290,-86,-89,-73,28,28,-82,-68,-57,-247,-251,487,-257,-258,-1,-241,-96,-211,-229,-199,-193,-187,-181,-175,-163,-164,-165,-166,-145,-146,-147,-148,-149,-273,-274,-207,-48,28,-295,-203,28,28,510,513,-237,-240,-243,28,-293,-296,28,28,-248,-249,-250,-241,28,-254,-205,-275,-289,-294,-297,28,28,-255,28,28,28,-298,-252,28,-256,-276,-253,]),'IF':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,126,128,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,344,386,388,411,413,415,422,426,438,440,468,469,477,481,485,494,502,506,507,509,510,511,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[30,30,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,30,-244,30,-7,30,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,30,30,30,30,-288,-290,30,30,-247,-251,-273,-274,30,30,30,30,-293,30,30,-248,-249,-250,30,-254,-275,-289,-294,30,30,-255,30,30,30,-252,30,-256,-276,-253,]),'DO':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,126,128,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,344,386,388,411,413,415,422,426,438,440,468,469,477,481,485,494,502,506,507,509,510,511,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[31,31,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,31,-244,31,-7,31,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,31,31,31,31,-288,-290,31,31,-247,-251,-273,-274,31,31,31,31,-293,31,31,-248,-249,-250,31,-254,-275,-289,-294,31,31,-255,31,31,31,-252,31,-256,-276,-253,]),'WHILE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,126,128,130,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,344,386,388,411,413,415,422,426,438,440,468,469,477,481,485,494,502,506,507,509,510,511,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[32,32,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,32,-244,32,-7,32,-245,-246,-2,272,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,32,32,32,32,-288,-290,32,32,-247,-251,-273,-274,32,32,32,32,-293,32,32,-248,-249,-250,32,-254,-275,-289,-294,32,32,-255,32,32,32,-252,32,-256,-276,-253,]),'FOR':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,126,128,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,344,386,388,411,413,415,422,426,438,440,468,469,477,481,485,494,502,506,507,509,510,511,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[33,33,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,33,-244,33,-7,33,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,33,33,33,33,-288,-290,33,33,-247,-251,-273,-274,33,33,33,33,-293,33,33,-248,-249,-250,33,-254,-275,-289,-294,33,33,-255,33,33,33,-252,33,-256,-276,-253,]),'CONTINUE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,126,128,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,344,386,388,411,413,415,422,426,438,440,468,469,477,481,485,494,502,506,507,509,510,511,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[34,34,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,34,-244,34,-7,34,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,34,34,34,34,-288,-290,34,34,-247,-251,-273,-274,34,34,34,34,-293,34,34,-248,-249,-250,34,-254,-275,-289,-294,34,34,-255,34,34,34,-252,34,-256,-276,-253,]),'BREAK':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,126,128,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,344,386,388,411,413,415,422,426,438,440,468,469,477,481,485,494,502,506,507,509,510,511,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[35,35,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,35,-244,35,-7,35,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,35,35,35,35,-288,-290,35,35,-247,-251,-273,-274,35,35,35,35,-293,35,35,-248,-249,-250,35,-254,-275,-289,-294,35,35,-255,35,35,35,-252,35,-256,-276,-253,]),'RETURN':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,126,128,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,344,386,388,411,413,415,422,426,438,440,468,469,477,481,485,494,502,506,507,509,510,511,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[36,36,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,36,-244,36,-7,36,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,36,36,36,36,-288,-290,36,36,-247,-251,-273,-274,36,36,36,36,-293,36,36,-248,-249,-250,36,-254,-275,-289,-294,36,36,-255,36,36,36,-252,36,-256,-276,-253,]),'WITH':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,126,128,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,344,386,388,411,413,415,422,426,438,440,468,469,477,481,485,494,502,506,507,509,510,511,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[37,37,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,37,-244,37,-7,37,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,37,37,37,37,-288,-290,37,37,-247,-251,-273,-274,37,37,37,37,-293,37,37,-248,-249,-250,37,-254,-275,-289,-294,37,37,-255,37,37,37,-252,37,-256,-276,-253,]),'SWITCH':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,126,128,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,344,386,388,411,413,415,422,426,438,440,468,469,477,481,485,494,502,506,507,509,510,511,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[38,38,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,38,-244,38,-7,38,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,38,38,38,38,-288,-290,38,38,-247,-251,-273,-274,38,38,38,38,-293,38,38,-248,-249,-250,38,-254,-275,-289,-294,38,38,-255,38,38,38,-252,38,-256,-276,-253,]),'THROW':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,126,128,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,344,386,388,411,413,415,422,426,438,440,468,469,477,481,485,494,502,506,507,509,510,511,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[39,39,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,39,-244,39,-7,39,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,39,39,39,39,-288,-290,39,39,-247,-251,-273,-274,39,39,39,39,-293,39,39,-248,-249,-250,39,-254,-275,-289,-294,39,39,-255,39,39,39,-252,39,-256,-276,-253,]),'TRY':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,126,128,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,344,386,388,411,413,415,422,426,438,440,468,469,477,481,485,494,502,506,507,509,510,511,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[40,40,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,40,-244,40,-7,40,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,40,40,40,40,-288,-290,40,40,-247,-251,-273,-274,40,40,40,40,-293,40,40,-248,-249,-250,40,-254,-275,-289,-294,40,40,-255,40,40,40,-252,40,-256,-276,-253,]),'DEBUGGER':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,126,128,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,344,386,388,411,413,415,422,426,438,440,468,469,477,481,485,494,502,506,507,509,510,511,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[41,41,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,41,-244,41,-7,41,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,41,41,41,41,-288,-290,41,41,-247,-251,-273,-274,41,41,41,41,-293,41,41,-248,-249,-250,41,-254,-275,-289,-294,41,41,-255,41,41,41,-252,41,-256,-276,-253,]),'ID':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,27,28,31,34,35,36,39,51,52,77,78,82,83,84,85,86,87,88,89,91,92,102,110,111,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,167,168,169,170,172,173,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,212,216,218,219,222,223,225,226,227,229,230,233,234,240,241,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,269,275,289,290,291,292,293,294,297,298,299,300,319,320,344,346,359,361,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,414,415,416,419,421,422,426,428,437,438,440,444,445,446,448,468,469,477,481,485,487,492,494,495,500,502,506,507,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[43,43,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,43,43,43,43,-244,43,43,43,43,43,43,-1,43,43,43,43,43,43,43,43,43,-7,43,43,43,43,43,-245,-246,43,-2,43,-25,43,43,-261,-262,-265,-266,-269,-270,43,43,-291,-292,43,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,43,43,43,43,43,43,43,43,43,-53,-51,-52,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-283,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-26,-232,-233,43,43,43,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-1,-54,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-288,43,-290,43,43,43,43,43,43,43,-247,-251,43,43,43,43,-273,-274,43,43,43,43,43,43,43,43,-293,43,43,-248,-249,-250,43,43,-254,-275,-289,-294,43,43,-255,43,43,43,-252,43,-256,-276,-253,]),'NEW':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,167,169,170,172,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,319,320,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,419,421,422,426,428,438,440,444,446,448,468,469,477,481,485,487,492,494,495,500,502,506,507,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[51,51,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,102,51,-244,51,102,102,102,-1,102,102,102,102,102,102,102,102,102,-7,51,102,-245,-246,102,-2,102,-25,102,102,-261,-262,-265,-266,-269,-270,102,102,-291,-292,102,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,102,51,102,102,51,102,102,-53,-51,-52,51,51,51,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-283,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-26,-232,-233,102,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-1,-54,51,102,51,102,51,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,51,-288,-290,102,102,102,51,51,102,-247,-251,102,102,102,-273,-274,51,51,51,102,102,51,102,102,-293,51,51,-248,-249,-250,102,51,-254,-275,-289,-294,51,51,-255,51,51,51,-252,51,-256,-276,-253,]),'THIS':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,167,169,170,172,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,319,320,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,419,421,422,426,428,438,440,444,446,448,468,469,477,481,485,487,492,494,495,500,502,506,507,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[57,57,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,57,57,-244,57,57,57,57,-1,57,57,57,57,57,57,57,57,57,-7,57,57,-245,-246,57,-2,57,-25,57,57,-261,-262,-265,-266,-269,-270,57,57,-291,-292,57,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,57,57,57,57,57,57,57,-53,-51,-52,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-283,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-26,-232,-233,57,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-1,-54,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-288,-290,57,57,57,57,57,57,-247,-251,57,57,57,-273,-274,57,57,57,57,57,57,57,57,-293,57,57,-248,-249,-250,57,57,-254,-275,-289,-294,57,57,-255,57,57,57,-252,57,-256,-276,-253,]),'LPAREN':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,28,30,31,32,33,36,37,38,39,43,48,50,51,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,77,78,82,83,84,85,86,87,88,89,90,92,99,101,102,103,105,106,108,109,110,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,217,218,219,222,223,224,225,227,228,229,232,233,234,235,236,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,272,289,290,291,292,293,294,297,298,299,300,301,308,309,314,315,316,318,319,320,344,352,355,356,360,362,363,364,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,417,418,419,420,421,422,426,428,429,430,433,438,440,444,446,448,468,469,474,477,478,481,485,487,492,494,495,500,502,504,506,507,509,510,511,513,515,517,519,524,525,526,529,530,532,533,535,536,537,540,541,542,543,547,],[25,25,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,91,-41,25,25,-244,129,25,132,133,25,143,144,25,-38,169,169,25,-1,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,25,25,25,25,25,25,25,25,25,-7,212,25,169,169,25,-41,-66,-67,-39,-40,91,-245,-246,25,-2,25,-25,25,25,-261,-262,-265,-266,-269,-270,25,25,-291,-292,25,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,25,25,-85,25,25,25,-84,25,169,25,-53,-51,-52,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-283,-45,25,25,25,25,-81,25,25,-80,25,169,25,25,359,-55,-63,-64,-65,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-26,-232,-233,25,387,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,414,-87,-88,-74,-75,-46,-47,-1,-54,25,-83,-69,-70,-56,25,436,437,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-288,-290,25,-86,-89,25,-73,25,25,25,25,-82,-68,-57,-247,-251,25,25,25,-273,-274,-48,25,-295,25,25,25,25,25,25,25,-293,-296,25,25,-248,-249,-250,25,25,-254,-275,-289,-294,-297,25,25,-255,25,25,25,-298,-252,25,-256,-276,-253,]),'LBRACKET':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,28,31,36,39,43,48,50,51,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,77,78,82,83,84,85,86,87,88,89,92,99,101,102,103,105,106,108,109,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,217,218,219,222,223,224,225,227,228,229,232,233,234,236,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,308,309,314,315,316,318,319,320,344,352,355,356,360,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,417,418,419,420,421,422,426,428,429,430,433,438,440,444,446,448,468,469,474,477,478,481,485,487,492,494,495,500,502,504,506,507,509,510,511,513,515,517,519,524,525,526,529,530,532,533,535,536,537,540,541,542,543,547,],[52,52,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-41,52,52,-244,52,52,52,-38,167,172,52,-1,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,52,52,52,52,52,52,52,52,52,-7,52,225,229,52,-41,-66,-67,-39,-40,-245,-246,52,-2,52,-25,52,52,-261,-262,-265,-266,-269,-270,52,52,-291,-292,52,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,52,52,-85,52,52,52,-84,52,229,52,-53,-51,-52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-283,-45,52,52,52,52,-81,52,52,-80,52,229,52,52,-55,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-26,-232,-233,52,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-87,-88,-74,-75,-46,-47,-1,-54,52,-83,-69,-70,-56,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-288,-290,52,-86,-89,52,-73,52,52,52,52,-82,-68,-57,-247,-251,52,52,52,-273,-274,-48,52,-295,52,52,52,52,52,52,52,-293,-296,52,52,-248,-249,-250,52,52,-254,-275,-289,-294,-297,52,52,-255,52,52,52,-298,-252,52,-256,-276,-253,]),'NULL':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,167,169,170,172,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,319,320,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,419,421,422,426,428,438,440,444,446,448,468,469,477,481,485,487,492,494,495,500,502,506,507,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[67,67,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,67,67,-244,67,67,67,67,-1,67,67,67,67,67,67,67,67,67,-7,67,67,-245,-246,67,-2,67,-25,67,67,-261,-262,-265,-266,-269,-270,67,67,-291,-292,67,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,67,67,67,67,67,67,67,-53,-51,-52,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-283,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-26,-232,-233,67,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-1,-54,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-288,-290,67,67,67,67,67,67,-247,-251,67,67,67,-273,-274,67,67,67,67,67,67,67,67,-293,67,67,-248,-249,-250,67,67,-254,-275,-289,-294,67,67,-255,67,67,67,-252,67,-256,-276,-253,]),'TRUE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,167,169,170,172,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,319,320,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,419,421,422,426,428,438,440,444,446,448,468,469,477,481,485,487,492,494,495,500,502,506,507,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[68,68,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,68,68,-244,68,68,68,68,-1,68,68,68,68,68,68,68,68,68,-7,68,68,-245,-246,68,-2,68,-25,68,68,-261,-262,-265,-266,-269,-270,68,68,-291,-292,68,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,68,68,68,68,68,68,68,-53,-51,-52,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-283,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-26,-232,-233,68,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-1,-54,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-288,-290,68,68,68,68,68,68,-247,-251,68,68,68,-273,-274,68,68,68,68,68,68,68,68,-293,68,68,-248,-249,-250,68,68,-254,-275,-289,-294,68,68,-255,68,68,68,-252,68,-256,-276,-253,]),'FALSE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,167,169,170,172,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,319,320,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,419,421,422,426,428,438,440,444,446,448,468,469,477,481,485,487,492,494,495,500,502,506,507,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[69,69,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,69,69,-244,69,69,69,69,-1,69,69,69,69,69,69,69,69,69,-7,69,69,-245,-246,69,-2,69,-25,69,69,-261,-262,-265,-266,-269,-270,69,69,-291,-292,69,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,69,69,69,69,69,69,69,-53,-51,-52,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-283,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-26,-232,-233,69,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-1,-54,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-288,-290,69,69,69,69,69,69,-247,-251,69,69,69,-273,-274,69,69,69,69,69,69,69,69,-293,69,69,-248,-249,-250,69,69,-254,-275,-289,-294,69,69,-255,69,69,69,-252,69,-256,-276,-253,]),'NUMBER':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,111,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,167,169,170,172,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,218,219,222,223,225,227,229,233,234,240,241,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,319,320,344,361,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,419,421,422,426,428,438,440,444,446,448,468,469,477,481,485,487,492,494,495,500,502,506,507,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[70,70,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,70,70,-244,70,70,70,70,-1,70,70,70,70,70,70,70,70,70,-7,70,70,70,-245,-246,70,-2,70,-25,70,70,-261,-262,-265,-266,-269,-270,70,70,-291,-292,70,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,70,70,70,70,70,70,70,-53,-51,-52,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-283,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-26,-232,-233,70,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-1,-54,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-288,-290,70,70,70,70,70,70,-247,-251,70,70,70,-273,-274,70,70,70,70,70,70,70,70,-293,70,70,-248,-249,-250,70,70,-254,-275,-289,-294,70,70,-255,70,70,70,-252,70,-256,-276,-253,]),'STRING':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,111,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,167,169,170,172,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,218,219,222,223,225,227,229,233,234,240,241,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,319,320,344,361,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,419,421,422,426,428,438,440,444,446,448,468,469,477,481,485,487,492,494,495,500,502,506,507,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[71,71,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,71,71,-244,71,71,71,71,-1,71,71,71,71,71,71,71,71,71,-7,71,71,71,-245,-246,71,-2,71,-25,71,71,-261,-262,-265,-266,-269,-270,71,71,-291,-292,71,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,71,71,71,71,71,71,71,-53,-51,-52,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-283,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-26,-232,-233,71,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-1,-54,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-288,-290,71,71,71,71,71,71,-247,-251,71,71,71,-273,-274,71,71,71,71,71,71,71,71,-293,71,71,-248,-249,-250,71,71,-254,-275,-289,-294,71,71,-255,71,71,71,-252,71,-256,-276,-253,]),'REGEX':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,167,169,170,172,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,319,320,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,419,421,422,426,428,438,440,444,446,448,468,469,477,481,485,487,492,494,495,500,502,506,507,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[72,72,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,72,72,-244,72,72,72,72,-1,72,72,72,72,72,72,72,72,72,-7,72,72,-245,-246,72,-2,72,-25,72,72,-261,-262,-265,-266,-269,-270,72,72,-291,-292,72,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,72,72,72,72,72,72,72,-53,-51,-52,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-283,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-26,-232,-233,72,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-1,-54,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-288,-290,72,72,72,72,72,72,-247,-251,72,72,72,-273,-274,72,72,72,72,72,72,72,72,-293,72,72,-248,-249,-250,72,72,-254,-275,-289,-294,72,72,-255,72,72,72,-252,72,-256,-276,-253,]),'DELETE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,52,77,78,82,83,84,85,86,87,88,89,92,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,167,169,170,172,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,319,320,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,419,421,422,426,428,438,440,444,446,448,468,469,477,481,485,487,492,494,495,500,502,506,507,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[84,84,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,84,84,-244,84,84,84,-1,84,84,84,84,84,84,84,84,84,-7,84,-245,-246,84,-2,84,-25,84,84,-261,-262,-265,-266,-269,-270,84,84,-291,-292,84,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,84,84,84,84,84,84,84,-53,-51,-52,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-283,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-26,-232,-233,84,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-1,-54,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-288,-290,84,84,84,84,84,84,-247,-251,84,84,84,-273,-274,84,84,84,84,84,84,84,84,-293,84,84,-248,-249,-250,84,84,-254,-275,-289,-294,84,84,-255,84,84,84,-252,84,-256,-276,-253,]),'VOID':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,52,77,78,82,83,84,85,86,87,88,89,92,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,167,169,170,172,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,319,320,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,419,421,422,426,428,438,440,444,446,448,468,469,477,481,485,487,492,494,495,500,502,506,507,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[85,85,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,85,85,-244,85,85,85,-1,85,85,85,85,85,85,85,85,85,-7,85,-245,-246,85,-2,85,-25,85,85,-261,-262,-265,-266,-269,-270,85,85,-291,-292,85,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,85,85,85,85,85,85,85,-53,-51,-52,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-283,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-26,-232,-233,85,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-1,-54,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-288,-290,85,85,85,85,85,85,-247,-251,85,85,85,-273,-274,85,85,85,85,85,85,85,85,-293,85,85,-248,-249,-250,85,85,-254,-275,-289,-294,85,85,-255,85,85,85,-252,85,-256,-276,-253,]),'TYPEOF':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,52,77,78,82,83,84,85,86,87,88,89,92,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,167,169,170,172,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,319,320,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,419,421,422,426,428,438,440,444,446,448,468,469,477,481,485,487,492,494,495,500,502,506,507,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[86,86,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,86,86,-244,86,86,86,-1,86,86,86,86,86,86,86,86,86,-7,86,-245,-246,86,-2,86,-25,86,86,-261,-262,-265,-266,-269,-270,86,86,-291,-292,86,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,86,86,86,86,86,86,86,-53,-51,-52,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-283,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-26,-232,-233,86,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-1,-54,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-288,-290,86,86,86,86,86,86,-247,-251,86,86,86,-273,-274,86,86,86,86,86,86,86,86,-293,86,86,-248,-249,-250,86,86,-254,-275,-289,-294,86,86,-255,86,86,86,-252,86,-256,-276,-253,]),'PLUSPLUS':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,28,31,36,39,43,45,47,48,50,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,77,78,82,83,84,85,86,87,88,89,92,96,98,99,101,103,105,106,108,109,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,216,217,218,219,222,223,224,225,227,228,229,231,232,233,234,236,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,276,289,290,291,292,293,294,297,298,299,300,306,308,309,314,315,316,318,319,320,344,352,355,356,360,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,417,418,419,420,421,422,426,428,429,430,433,438,440,444,446,448,450,468,469,474,477,478,481,485,487,492,494,495,500,502,504,506,507,509,510,511,513,515,517,519,524,525,526,529,530,532,533,535,536,537,540,541,542,543,547,],[82,82,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-41,82,82,-244,82,82,82,-38,150,-94,-95,-78,-1,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,82,82,82,82,82,82,82,82,82,-7,82,220,-92,-93,-76,-41,-66,-67,-39,-40,-245,-246,82,-2,82,-25,82,82,-261,-262,-265,-266,-269,-270,82,82,-291,-292,82,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,82,82,-85,82,82,82,-84,82,-79,-76,82,-53,-51,-52,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,220,-283,-45,82,82,82,82,-81,82,82,-80,82,-77,-76,82,82,-55,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-26,-232,-233,82,220,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,150,-87,-88,-74,-75,-46,-47,-1,-54,82,-83,-69,-70,-56,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-288,-290,82,-86,-89,82,-73,82,82,82,82,-82,-68,-57,-247,-251,82,82,82,220,-273,-274,-48,82,-295,82,82,82,82,82,82,82,-293,-296,82,82,-248,-249,-250,82,82,-254,-275,-289,-294,-297,82,82,-255,82,82,82,-298,-252,82,-256,-276,-253,]),'MINUSMINUS':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,28,31,36,39,43,45,47,48,50,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,77,78,82,83,84,85,86,87,88,89,92,96,98,99,101,103,105,106,108,109,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,216,217,218,219,222,223,224,225,227,228,229,231,232,233,234,236,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,276,289,290,291,292,293,294,297,298,299,300,306,308,309,314,315,316,318,319,320,344,352,355,356,360,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,417,418,419,420,421,422,426,428,429,430,433,438,440,444,446,448,450,468,469,474,477,478,481,485,487,492,494,495,500,502,504,506,507,509,510,511,513,515,517,519,524,525,526,529,530,532,533,535,536,537,540,541,542,543,547,],[83,83,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-41,83,83,-244,83,83,83,-38,151,-94,-95,-78,-1,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,83,83,83,83,83,83,83,83,83,-7,83,221,-92,-93,-76,-41,-66,-67,-39,-40,-245,-246,83,-2,83,-25,83,83,-261,-262,-265,-266,-269,-270,83,83,-291,-292,83,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,83,83,-85,83,83,83,-84,83,-79,-76,83,-53,-51,-52,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,221,-283,-45,83,83,83,83,-81,83,83,-80,83,-77,-76,83,83,-55,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-26,-232,-233,83,221,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,151,-87,-88,-74,-75,-46,-47,-1,-54,83,-83,-69,-70,-56,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-288,-290,83,-86,-89,83,-73,83,83,83,83,-82,-68,-57,-247,-251,83,83,83,221,-273,-274,-48,83,-295,83,83,83,83,83,83,83,-293,-296,83,83,-248,-249,-250,83,83,-254,-275,-289,-294,-297,83,83,-255,83,83,83,-298,-252,83,-256,-276,-253,]),'PLUS':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,28,31,36,39,43,45,47,48,50,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,96,98,99,101,103,105,106,108,109,116,117,118,119,120,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,216,217,218,219,220,221,222,223,224,225,227,228,229,231,232,233,234,236,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,276,289,290,291,292,293,294,297,298,299,300,306,308,309,314,315,316,318,319,320,334,335,336,337,338,339,340,341,344,352,355,356,360,362,376,377,378,379,380,381,382,383,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,417,418,419,420,421,422,426,428,429,430,433,438,440,444,446,448,450,468,469,474,477,478,481,485,487,492,494,495,500,502,504,506,507,509,510,511,513,515,517,519,524,525,526,529,530,532,533,535,536,537,540,541,542,543,547,],[77,77,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-41,77,77,-244,77,77,77,-38,-99,-94,-95,-78,-1,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,197,-126,77,77,-119,-104,-105,77,77,77,77,77,77,77,-7,77,-96,-92,-93,-76,-41,-66,-67,-39,-40,259,-123,-115,-102,-103,-245,-246,77,-2,77,-25,77,77,-261,-262,-265,-266,-269,-270,77,77,-291,-292,77,-100,-101,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,77,77,-85,77,77,77,-84,77,-79,-76,77,-53,-51,-52,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-283,-45,77,77,-97,-98,77,77,-81,77,77,-80,77,-77,-76,77,77,-55,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-26,-232,-233,77,-96,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-99,-87,-88,-74,-75,-46,-47,-1,-54,259,259,259,-127,-128,-120,-121,-122,77,-83,-69,-70,-56,77,259,259,259,-124,-125,-116,-117,-118,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-288,-290,77,-86,-89,77,-73,77,77,77,77,-82,-68,-57,-247,-251,77,77,77,-96,-273,-274,-48,77,-295,77,77,77,77,77,77,77,-293,-296,77,77,-248,-249,-250,77,77,-254,-275,-289,-294,-297,77,77,-255,77,77,77,-298,-252,77,-256,-276,-253,]),'MINUS':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,28,31,36,39,43,45,47,48,50,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,96,98,99,101,103,105,106,108,109,116,117,118,119,120,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,170,171,172,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,216,217,218,219,220,221,222,223,224,225,227,228,229,231,232,233,234,236,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,276,289,290,291,292,293,294,297,298,299,300,306,308,309,314,315,316,318,319,320,334,335,336,337,338,339,340,341,344,352,355,356,360,362,376,377,378,379,380,381,382,383,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,417,418,419,420,421,422,426,428,429,430,433,438,440,444,446,448,450,468,469,474,477,478,481,485,487,492,494,495,500,502,504,506,507,509,510,511,513,515,517,519,524,525,526,529,530,532,533,535,536,537,540,541,542,543,547,],[78,78,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-41,78,78,-244,78,78,78,-38,-99,-94,-95,-78,-1,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,198,-126,78,78,-119,-104,-105,78,78,78,78,78,78,78,-7,78,-96,-92,-93,-76,-41,-66,-67,-39,-40,260,-123,-115,-102,-103,-245,-246,78,-2,78,-25,78,78,-261,-262,-265,-266,-269,-270,78,78,-291,-292,78,-100,-101,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,78,78,-85,78,78,78,-84,78,-79,-76,78,-53,-51,-52,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-283,-45,78,78,-97,-98,78,78,-81,78,78,-80,78,-77,-76,78,78,-55,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-26,-232,-233,78,-96,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-99,-87,-88,-74,-75,-46,-47,-1,-54,260,260,260,-127,-128,-120,-121,-122,78,-83,-69,-70,-56,78,260,260,260,-124,-125,-116,-117,-118,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-288,-290,78,-86,-89,78,-73,78,78,78,78,-82,-68,-57,-247,-251,78,78,78,-96,-273,-274,-48,78,-295,78,78,78,78,78,78,78,-293,-296,78,78,-248,-249,-250,78,78,-254,-275,-289,-294,-297,78,78,-255,78,78,78,-298,-252,78,-256,-276,-253,]),'BNOT':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,52,77,78,82,83,84,85,86,87,88,89,92,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,167,169,170,172,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,319,320,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,419,421,422,426,428,438,440,444,446,448,468,469,477,481,485,487,492,494,495,500,502,506,507,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[87,87,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,87,87,-244,87,87,87,-1,87,87,87,87,87,87,87,87,87,-7,87,-245,-246,87,-2,87,-25,87,87,-261,-262,-265,-266,-269,-270,87,87,-291,-292,87,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,87,87,87,87,87,87,87,-53,-51,-52,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-283,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-26,-232,-233,87,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-1,-54,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-288,-290,87,87,87,87,87,87,-247,-251,87,87,87,-273,-274,87,87,87,87,87,87,87,87,-293,87,87,-248,-249,-250,87,87,-254,-275,-289,-294,87,87,-255,87,87,87,-252,87,-256,-276,-253,]),'NOT':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,52,77,78,82,83,84,85,86,87,88,89,92,125,126,127,128,129,131,132,133,134,135,137,138,140,141,143,144,147,148,149,152,153,154,155,156,157,158,159,160,161,162,163,164,165,167,169,170,172,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,216,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,269,289,290,291,292,293,294,297,298,299,300,319,320,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,413,415,416,419,421,422,426,428,438,440,444,446,448,468,469,477,481,485,487,492,494,495,500,502,506,507,509,510,511,513,515,517,519,524,525,529,530,532,533,535,536,540,541,542,543,547,],[88,88,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,88,88,-244,88,88,88,-1,88,88,88,88,88,88,88,88,88,-7,88,-245,-246,88,-2,88,-25,88,88,-261,-262,-265,-266,-269,-270,88,88,-291,-292,88,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,88,88,88,88,88,88,88,-53,-51,-52,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-283,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-26,-232,-233,88,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-1,-54,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-288,-290,88,88,88,88,88,88,-247,-251,88,88,88,-273,-274,88,88,88,88,88,88,88,88,-293,88,88,-248,-249,-250,88,88,-254,-275,-289,-294,88,88,-255,88,88,88,-252,88,-256,-276,-253,]),'RBRACE':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,43,57,58,59,61,62,63,64,65,67,68,69,70,71,72,89,95,96,97,98,99,100,101,103,104,105,106,107,108,109,111,112,113,114,115,116,117,118,119,120,121,125,126,128,131,134,135,137,138,140,141,147,148,202,203,204,205,206,207,208,209,210,211,216,217,220,221,224,228,231,232,236,237,238,264,265,266,289,290,291,292,293,294,297,298,299,300,309,316,318,344,348,350,352,353,355,356,357,358,360,361,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,413,415,418,422,424,425,426,429,430,433,434,435,438,440,468,469,470,474,476,477,478,479,480,481,496,497,498,499,502,503,504,505,506,507,509,510,511,517,519,520,522,524,525,526,527,528,529,532,534,535,536,537,538,539,540,542,543,544,545,546,547,],[-4,-5,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-1,-244,-38,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,-7,-208,-96,-202,-92,-93,-196,-76,-41,-190,-66,-67,-184,-39,-40,236,-178,-172,-157,-137,-129,-123,-115,-102,-103,264,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-283,-45,-97,-98,-81,-80,-77,-76,-55,360,-58,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-88,-46,-47,-1,-209,-197,-83,-191,-69,-70,-185,-179,-56,433,-173,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-288,-290,-89,-1,478,-301,-1,-82,-68,-57,-59,-60,-247,-251,-273,-274,-1,-48,502,-1,-295,504,-203,-1,519,-277,-278,-279,-293,525,-296,526,-1,-1,-248,-249,-250,-254,-275,-1,-280,-289,-294,-297,537,538,-1,-255,543,-1,-1,-298,-61,546,-252,-256,-276,-282,-281,-62,-253,]),'CASE':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,28,89,125,126,128,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,413,415,438,440,468,469,470,498,499,502,509,510,511,517,519,520,522,524,525,532,535,536,540,542,543,544,545,547,],[-4,-5,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-244,-7,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-288,-290,-247,-251,-273,-274,500,500,-279,-293,-248,-249,-250,-254,-275,500,-280,-289,-294,-255,-1,-1,-252,-256,-276,-282,-281,-253,]),'DEFAULT':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,28,89,125,126,128,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,413,415,438,440,468,469,470,496,497,498,499,502,509,510,511,517,519,522,524,525,532,536,540,542,543,545,547,],[-4,-5,-6,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-244,-7,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-288,-290,-247,-251,-273,-274,-1,521,-277,-278,-279,-293,-248,-249,-250,-254,-275,-280,-289,-294,-255,-1,-252,-256,-276,-281,-253,]),'ELSE':([8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,28,125,126,128,131,134,135,137,138,140,141,147,148,216,264,265,266,289,290,291,292,293,294,297,298,299,300,413,415,438,440,468,469,502,509,510,511,517,519,524,525,532,540,542,543,547,],[-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-244,-245,-246,-2,-25,-261,-262,-265,-266,-269,-270,-291,-292,-283,-26,-232,-233,-263,-264,-267,-268,-271,-272,-284,-285,-286,-287,-288,-290,485,-251,-273,-274,-293,-248,-249,-250,-254,-275,-289,-294,-255,-252,-256,-276,-253,]),'COLON':([24,43,57,58,59,61,62,63,64,65,67,68,69,70,71,72,94,95,96,97,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,239,242,243,244,280,281,282,283,284,285,286,287,288,304,309,316,318,347,348,349,350,352,353,355,356,357,358,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,418,429,430,433,450,451,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,474,478,480,504,518,521,523,526,537,],[92,-38,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,-226,-208,-96,-202,-92,-93,-196,-76,-41,-190,-66,-67,-184,-39,-40,-178,-172,-157,-137,-129,-123,-115,-102,-103,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,362,-63,-64,-65,-210,-204,-198,-192,-186,-180,-174,-162,-144,416,-88,-46,-47,-227,-209,428,-197,-83,-191,-69,-70,-185,-179,-56,-173,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-89,-82,-68,-57,-96,-211,495,-199,-193,-187,-181,-175,-163,-164,-165,-166,-145,-146,-147,-148,-149,-48,-295,-203,-296,-205,535,536,-297,-298,]),'PERIOD':([24,43,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,99,101,103,105,106,108,109,166,171,175,217,224,228,232,236,308,309,314,315,316,318,352,355,356,360,417,418,420,429,430,433,474,478,502,504,525,526,537,],[-41,-38,168,173,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,226,230,-41,-66,-67,-39,-40,-85,-84,230,-45,-81,-80,230,-55,-87,-88,-74,-75,-46,-47,-83,-69,-70,-56,-86,-89,-73,-82,-68,-57,-48,-295,-297,-296,-298,-297,-298,]),'EQ':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,124,166,171,174,175,217,224,228,231,232,236,276,308,309,314,315,316,318,352,355,356,360,391,417,418,420,429,430,433,450,474,478,490,502,504,525,526,537,],[-41,-38,152,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,152,-92,-93,-76,-41,-66,-67,-39,-40,269,-85,-84,-79,-76,-45,-81,-80,-77,-76,-55,152,-87,-88,-74,-75,-46,-47,-83,-69,-70,-56,448,-86,-89,-73,-82,-68,-57,152,-48,-295,448,-297,-296,-298,-297,-298,]),'MULTEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,166,171,174,175,217,224,228,231,232,236,276,308,309,314,315,316,318,352,355,356,360,417,418,420,429,430,433,450,474,478,502,504,525,526,537,],[-41,-38,153,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,153,-92,-93,-76,-41,-66,-67,-39,-40,-85,-84,-79,-76,-45,-81,-80,-77,-76,-55,153,-87,-88,-74,-75,-46,-47,-83,-69,-70,-56,-86,-89,-73,-82,-68,-57,153,-48,-295,-297,-296,-298,-297,-298,]),'DIVEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,166,171,174,175,217,224,228,231,232,236,276,308,309,314,315,316,318,352,355,356,360,417,418,420,429,430,433,450,474,478,502,504,525,526,537,],[-41,-38,154,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,154,-92,-93,-76,-41,-66,-67,-39,-40,-85,-84,-79,-76,-45,-81,-80,-77,-76,-55,154,-87,-88,-74,-75,-46,-47,-83,-69,-70,-56,-86,-89,-73,-82,-68,-57,154,-48,-295,-297,-296,-298,-297,-298,]),'MODEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,166,171,174,175,217,224,228,231,232,236,276,308,309,314,315,316,318,352,355,356,360,417,418,420,429,430,433,450,474,478,502,504,525,526,537,],[-41,-38,155,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,155,-92,-93,-76,-41,-66,-67,-39,-40,-85,-84,-79,-76,-45,-81,-80,-77,-76,-55,155,-87,-88,-74,-75,-46,-47,-83,-69,-70,-56,-86,-89,-73,-82,-68,-57,155,-48,-295,-297,-296,-298,-297,-298,]),'PLUSEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,166,171,174,175,217,224,228,231,232,236,276,308,309,314,315,316,318,352,355,356,360,417,418,420,429,430,433,450,474,478,502,504,525,526,537,],[-41,-38,156,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,156,-92,-93,-76,-41,-66,-67,-39,-40,-85,-84,-79,-76,-45,-81,-80,-77,-76,-55,156,-87,-88,-74,-75,-46,-47,-83,-69,-70,-56,-86,-89,-73,-82,-68,-57,156,-48,-295,-297,-296,-298,-297,-298,]),'MINUSEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,166,171,174,175,217,224,228,231,232,236,276,308,309,314,315,316,318,352,355,356,360,417,418,420,429,430,433,450,474,478,502,504,525,526,537,],[-41,-38,157,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,157,-92,-93,-76,-41,-66,-67,-39,-40,-85,-84,-79,-76,-45,-81,-80,-77,-76,-55,157,-87,-88,-74,-75,-46,-47,-83,-69,-70,-56,-86,-89,-73,-82,-68,-57,157,-48,-295,-297,-296,-298,-297,-298,]),'LSHIFTEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,166,171,174,175,217,224,228,231,232,236,276,308,309,314,315,316,318,352,355,356,360,417,418,420,429,430,433,450,474,478,502,504,525,526,537,],[-41,-38,158,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,158,-92,-93,-76,-41,-66,-67,-39,-40,-85,-84,-79,-76,-45,-81,-80,-77,-76,-55,158,-87,-88,-74,-75,-46,-47,-83,-69,-70,-56,-86,-89,-73,-82,-68,-57,158,-48,-295,-297,-296,-298,-297,-298,]),'RSHIFTEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,166,171,174,175,217,224,228,231,232,236,276,308,309,314,315,316,318,352,355,356,360,417,418,420,429,430,433,450,474,478,502,504,525,526,537,],[-41,-38,159,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,159,-92,-93,-76,-41,-66,-67,-39,-40,-85,-84,-79,-76,-45,-81,-80,-77,-76,-55,159,-87,-88,-74,-75,-46,-47,-83,-69,-70,-56,-86,-89,-73,-82,-68,-57,159,-48,-295,-297,-296,-298,-297,-298,]),'URSHIFTEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,166,171,174,175,217,224,228,231,232,236,276,308,309,314,315,316,318,352,355,356,360,417,418,420,429,430,433,450,474,478,502,504,525,526,537,],[-41,-38,160,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,160,-92,-93,-76,-41,-66,-67,-39,-40,-85,-84,-79,-76,-45,-81,-80,-77,-76,-55,160,-87,-88,-74,-75,-46,-47,-83,-69,-70,-56,-86,-89,-73,-82,-68,-57,160,-48,-295,-297,-296,-298,-297,-298,]),'ANDEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,166,171,174,175,217,224,228,231,232,236,276,308,309,314,315,316,318,352,355,356,360,417,418,420,429,430,433,450,474,478,502,504,525,526,537,],[-41,-38,161,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,161,-92,-93,-76,-41,-66,-67,-39,-40,-85,-84,-79,-76,-45,-81,-80,-77,-76,-55,161,-87,-88,-74,-75,-46,-47,-83,-69,-70,-56,-86,-89,-73,-82,-68,-57,161,-48,-295,-297,-296,-298,-297,-298,]),'XOREQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,166,171,174,175,217,224,228,231,232,236,276,308,309,314,315,316,318,352,355,356,360,417,418,420,429,430,433,450,474,478,502,504,525,526,537,],[-41,-38,162,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,162,-92,-93,-76,-41,-66,-67,-39,-40,-85,-84,-79,-76,-45,-81,-80,-77,-76,-55,162,-87,-88,-74,-75,-46,-47,-83,-69,-70,-56,-86,-89,-73,-82,-68,-57,162,-48,-295,-297,-296,-298,-297,-298,]),'OREQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,166,171,174,175,217,224,228,231,232,236,276,308,309,314,315,316,318,352,355,356,360,417,418,420,429,430,433,450,474,478,502,504,525,526,537,],[-41,-38,163,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,163,-92,-93,-76,-41,-66,-67,-39,-40,-85,-84,-79,-76,-45,-81,-80,-77,-76,-55,163,-87,-88,-74,-75,-46,-47,-83,-69,-70,-56,-86,-89,-73,-82,-68,-57,163,-48,-295,-297,-296,-298,-297,-298,]),'MULT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,76,79,80,81,96,98,99,101,103,105,106,108,109,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,306,308,309,314,315,316,318,337,338,339,340,341,352,355,356,360,379,380,381,382,383,417,418,420,429,430,433,450,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,199,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,261,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,-99,-87,-88,-74,-75,-46,-47,261,261,-120,-121,-122,-83,-69,-70,-56,261,261,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,-48,-295,-297,-296,-298,-297,-298,]),'DIV':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,76,79,80,81,96,98,99,101,103,105,106,108,109,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,306,308,309,314,315,316,318,337,338,339,340,341,352,355,356,360,379,380,381,382,383,417,418,420,429,430,433,450,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,200,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,262,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,-99,-87,-88,-74,-75,-46,-47,262,262,-120,-121,-122,-83,-69,-70,-56,262,262,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,-48,-295,-297,-296,-298,-297,-298,]),'MOD':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,76,79,80,81,96,98,99,101,103,105,106,108,109,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,306,308,309,314,315,316,318,337,338,339,340,341,352,355,356,360,379,380,381,382,383,417,418,420,429,430,433,450,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,201,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,263,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,-99,-87,-88,-74,-75,-46,-47,263,263,-120,-121,-122,-83,-69,-70,-56,263,263,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,-48,-295,-297,-296,-298,-297,-298,]),'LSHIFT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,288,306,308,309,314,315,316,318,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,355,356,360,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,194,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,256,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,256,-99,-87,-88,-74,-75,-46,-47,256,256,256,256,256,256,-134,-135,-136,-127,-128,-120,-121,-122,-83,-69,-70,-56,256,256,256,256,256,256,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,256,256,256,256,256,-48,-295,-297,-296,-298,-297,-298,]),'RSHIFT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,288,306,308,309,314,315,316,318,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,355,356,360,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,195,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,257,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,257,-99,-87,-88,-74,-75,-46,-47,257,257,257,257,257,257,-134,-135,-136,-127,-128,-120,-121,-122,-83,-69,-70,-56,257,257,257,257,257,257,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,257,257,257,257,257,-48,-295,-297,-296,-298,-297,-298,]),'URSHIFT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,288,306,308,309,314,315,316,318,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,355,356,360,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,196,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,258,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,258,-99,-87,-88,-74,-75,-46,-47,258,258,258,258,258,258,-134,-135,-136,-127,-128,-120,-121,-122,-83,-69,-70,-56,258,258,258,258,258,258,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,258,258,258,258,258,-48,-295,-297,-296,-298,-297,-298,]),'LT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,287,288,306,308,309,314,315,316,318,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,355,356,360,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,459,460,461,462,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,188,-150,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,250,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,406,-144,-99,-87,-88,-74,-75,-46,-47,250,250,250,250,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-83,-69,-70,-56,250,250,250,250,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,250,250,250,250,-145,-146,-147,-148,-149,-48,-295,-297,-296,-298,-297,-298,]),'GT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,287,288,306,308,309,314,315,316,318,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,355,356,360,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,459,460,461,462,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,189,-150,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,251,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,407,-144,-99,-87,-88,-74,-75,-46,-47,251,251,251,251,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-83,-69,-70,-56,251,251,251,251,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,251,251,251,251,-145,-146,-147,-148,-149,-48,-295,-297,-296,-298,-297,-298,]),'LE':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,287,288,306,308,309,314,315,316,318,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,355,356,360,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,459,460,461,462,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,190,-150,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,252,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,408,-144,-99,-87,-88,-74,-75,-46,-47,252,252,252,252,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-83,-69,-70,-56,252,252,252,252,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,252,252,252,252,-145,-146,-147,-148,-149,-48,-295,-297,-296,-298,-297,-298,]),'GE':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,287,288,306,308,309,314,315,316,318,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,355,356,360,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,459,460,461,462,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,191,-150,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,253,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,409,-144,-99,-87,-88,-74,-75,-46,-47,253,253,253,253,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-83,-69,-70,-56,253,253,253,253,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,253,253,253,253,-145,-146,-147,-148,-149,-48,-295,-297,-296,-298,-297,-298,]),'INSTANCEOF':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,287,288,306,308,309,314,315,316,318,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,355,356,360,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,459,460,461,462,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,192,-150,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,254,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,410,-144,-99,-87,-88,-74,-75,-46,-47,254,254,254,254,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-83,-69,-70,-56,254,254,254,254,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,254,254,254,254,-145,-146,-147,-148,-149,-48,-295,-297,-296,-298,-297,-298,]),'IN':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,280,281,282,283,284,285,286,287,288,306,308,309,314,315,316,318,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,355,356,360,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,391,417,418,420,429,430,433,447,450,451,454,455,456,457,458,459,460,461,462,463,464,465,466,467,474,478,493,502,504,518,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,193,-150,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,255,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,393,-210,-204,-198,-192,-186,-180,-174,-162,-144,-99,-87,-88,-74,-75,-46,-47,255,255,255,255,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-83,-69,-70,-56,255,255,255,255,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,446,-86,-89,-73,-82,-68,-57,492,-96,-211,-199,-193,-187,-181,-175,255,255,255,255,-145,-146,-147,-148,-149,-48,-295,-243,-297,-296,-205,-298,-297,-298,]),'EQEQ':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,113,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,286,287,288,306,308,309,314,315,316,318,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,355,356,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,458,459,460,461,462,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,184,-34,-32,-33,-35,-36,-37,-167,-150,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,246,-157,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,402,-162,-144,-99,-87,-88,-74,-75,-46,-47,184,-168,-169,-170,-171,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-83,-69,-70,-56,246,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,402,-163,-164,-165,-166,-145,-146,-147,-148,-149,-48,-295,-297,-296,-298,-297,-298,]),'NE':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,113,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,286,287,288,306,308,309,314,315,316,318,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,355,356,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,458,459,460,461,462,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,185,-34,-32,-33,-35,-36,-37,-167,-150,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,247,-157,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,403,-162,-144,-99,-87,-88,-74,-75,-46,-47,185,-168,-169,-170,-171,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-83,-69,-70,-56,247,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,403,-163,-164,-165,-166,-145,-146,-147,-148,-149,-48,-295,-297,-296,-298,-297,-298,]),'STREQ':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,113,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,286,287,288,306,308,309,314,315,316,318,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,355,356,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,458,459,460,461,462,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,186,-34,-32,-33,-35,-36,-37,-167,-150,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,248,-157,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,404,-162,-144,-99,-87,-88,-74,-75,-46,-47,186,-168,-169,-170,-171,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-83,-69,-70,-56,248,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,404,-163,-164,-165,-166,-145,-146,-147,-148,-149,-48,-295,-297,-296,-298,-297,-298,]),'STRNEQ':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,113,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,286,287,288,306,308,309,314,315,316,318,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,355,356,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,458,459,460,461,462,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,-27,-28,-29,-30,-31,187,-34,-32,-33,-35,-36,-37,-167,-150,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,249,-157,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,405,-162,-144,-99,-87,-88,-74,-75,-46,-47,187,-168,-169,-170,-171,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-83,-69,-70,-56,249,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,405,-163,-164,-165,-166,-145,-146,-147,-148,-149,-48,-295,-297,-296,-298,-297,-298,]),'BAND':([24,43,45,47,48,50,54,55,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,112,113,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,285,286,287,288,306,308,309,314,315,316,318,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,355,356,358,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,457,458,459,460,461,462,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,-42,-43,-44,183,-27,-28,-29,-30,-31,-176,-34,-32,-33,-35,-36,-37,-167,-150,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,-39,-40,245,-172,-157,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,401,-174,-162,-144,-99,-87,-88,-74,-75,-46,-47,183,-177,-168,-169,-170,-171,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-83,-69,-70,245,-56,-173,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,401,-175,-163,-164,-165,-166,-145,-146,-147,-148,-149,-48,-295,-297,-296,-298,-297,-298,]),'BXOR':([24,43,45,47,48,50,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,107,108,109,112,113,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,284,285,286,287,288,306,308,309,314,315,316,318,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,355,356,357,358,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,456,457,458,459,460,461,462,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,-71,-72,182,-42,-43,-44,-182,-27,-28,-29,-30,-31,-176,-34,-32,-33,-35,-36,-37,-167,-150,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,-66,-67,234,-39,-40,-178,-172,-157,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,400,-180,-174,-162,-144,-99,-87,-88,-74,-75,-46,-47,182,-183,-177,-168,-169,-170,-171,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-83,-69,-70,234,-179,-56,-173,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,400,-181,-175,-163,-164,-165,-166,-145,-146,-147,-148,-149,-48,-295,-297,-296,-298,-297,-298,]),'BOR':([24,43,45,47,48,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,283,284,285,286,287,288,306,308,309,312,314,315,316,318,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,352,353,355,356,357,358,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,455,456,457,458,459,460,461,462,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,-78,181,-71,-72,-188,-42,-43,-44,-182,-27,-28,-29,-30,-31,-176,-34,-32,-33,-35,-36,-37,-167,-150,-133,-126,-119,-104,-105,-96,-92,-93,-76,-41,233,-66,-67,-184,-39,-40,-178,-172,-157,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,399,-186,-180,-174,-162,-144,-99,-87,-88,181,-74,-75,-46,-47,-189,-183,-177,-168,-169,-170,-171,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-83,233,-69,-70,-185,-179,-56,-173,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,399,-187,-181,-175,-163,-164,-165,-166,-145,-146,-147,-148,-149,-48,-295,-297,-296,-298,-297,-298,]),'AND':([24,43,45,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,282,283,284,285,286,287,288,305,306,308,309,312,314,315,316,318,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,350,352,353,355,356,357,358,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,454,455,456,457,458,459,460,461,462,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,-94,-95,170,-78,-194,-71,-72,-188,-42,-43,-44,-182,-27,-28,-29,-30,-31,-176,-34,-32,-33,-35,-36,-37,-167,-150,-133,-126,-119,-104,-105,-96,-92,-93,227,-76,-41,-190,-66,-67,-184,-39,-40,-178,-172,-157,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,398,-192,-186,-180,-174,-162,-144,170,-99,-87,-88,-195,-74,-75,-46,-47,-189,-183,-177,-168,-169,-170,-171,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,227,-83,-191,-69,-70,-185,-179,-56,-173,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,398,-193,-187,-181,-175,-163,-164,-165,-166,-145,-146,-147,-148,-149,-48,-295,-297,-296,-298,-297,-298,]),'CONDOP':([24,43,45,46,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,97,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,281,282,283,284,285,286,287,288,305,306,308,309,312,314,315,316,318,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,350,352,353,355,356,357,358,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,454,455,456,457,458,459,460,461,462,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,164,-94,-95,-200,-78,-194,-71,-72,-188,-42,-43,-44,-182,-27,-28,-29,-30,-31,-176,-34,-32,-33,-35,-36,-37,-167,-150,-133,-126,-119,-104,-105,-96,222,-92,-93,-196,-76,-41,-190,-66,-67,-184,-39,-40,-178,-172,-157,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,396,-198,-192,-186,-180,-174,-162,-144,-201,-99,-87,-88,-195,-74,-75,-46,-47,-189,-183,-177,-168,-169,-170,-171,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-197,-83,-191,-69,-70,-185,-179,-56,-173,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,-199,-193,-187,-181,-175,-163,-164,-165,-166,-145,-146,-147,-148,-149,-48,-295,-297,-296,-298,-297,-298,]),'OR':([24,43,45,46,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,97,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,276,281,282,283,284,285,286,287,288,305,306,308,309,312,314,315,316,318,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,350,352,353,355,356,357,358,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,417,418,420,429,430,433,450,454,455,456,457,458,459,460,461,462,463,464,465,466,467,474,478,502,504,525,526,537,],[-41,-38,-99,165,-94,-95,-200,-78,-194,-71,-72,-188,-42,-43,-44,-182,-27,-28,-29,-30,-31,-176,-34,-32,-33,-35,-36,-37,-167,-150,-133,-126,-119,-104,-105,-96,223,-92,-93,-196,-76,-41,-190,-66,-67,-184,-39,-40,-178,-172,-157,-137,-129,-123,-115,-102,-103,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-96,397,-198,-192,-186,-180,-174,-162,-144,-201,-99,-87,-88,-195,-74,-75,-46,-47,-189,-183,-177,-168,-169,-170,-171,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-197,-83,-191,-69,-70,-185,-179,-56,-173,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-86,-89,-73,-82,-68,-57,-96,-199,-193,-187,-181,-175,-163,-164,-165,-166,-145,-146,-147,-148,-149,-48,-295,-297,-296,-298,-297,-298,]),'COMMA':([24,29,42,43,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,93,94,95,96,97,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,122,123,124,142,145,150,151,166,171,174,175,177,178,180,202,203,204,205,206,207,208,209,210,211,214,215,217,220,221,224,228,231,232,236,237,238,268,270,271,273,276,278,279,280,281,282,283,284,285,286,287,288,295,296,303,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,343,347,348,350,351,352,353,354,355,356,357,358,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,390,391,392,417,418,420,427,429,430,432,433,434,435,439,443,447,449,450,451,452,454,455,456,457,458,459,460,461,462,463,464,465,466,467,472,473,474,475,478,480,484,489,490,491,493,502,504,514,516,518,523,525,526,537,538,546,],[-41,127,-230,-38,-212,-99,-206,-94,-95,-200,-78,178,-194,-71,-72,-188,-42,-43,-44,-182,-27,-28,-29,-30,-31,-176,-34,-32,-33,-35,-36,-37,-167,-150,-133,-126,-119,-104,-105,218,-226,-208,-96,-202,-92,-93,-196,-76,-41,-190,-66,-67,-184,-39,-40,-178,-172,-157,-137,-129,-123,-115,-102,-103,267,-234,-238,218,218,-100,-101,-85,-84,-79,-76,319,-53,320,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,346,-299,-45,-97,-98,-81,-80,-77,-76,-55,361,-58,-239,-231,218,218,-96,395,-228,-210,-204,-198,-192,-186,-180,-174,-162,-144,218,218,-213,-201,-99,218,-87,-88,419,-90,-195,218,-74,-75,-46,-49,-47,178,-54,-189,-183,-177,-168,-169,-170,-171,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,346,-227,-209,-197,218,-83,-191,218,-69,-70,-185,-179,-56,-173,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-235,-242,445,-240,-236,-86,-89,-73,-300,-82,-68,346,-57,-59,-60,218,218,-241,218,-96,-211,-229,-199,-193,-187,-181,-175,-163,-164,-165,-166,-145,-146,-147,-148,-149,-207,-91,-48,-50,-295,-203,346,-237,-240,218,-243,-297,-296,-241,218,-205,218,-298,-297,-298,-61,-62,]),'error':([24,29,34,35,36,41,42,43,44,45,46,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,94,95,96,97,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,122,123,124,136,139,142,145,150,151,166,171,174,175,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,268,270,303,305,306,308,309,312,314,315,316,318,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,347,348,350,352,353,355,356,357,358,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,417,418,420,429,430,433,472,474,478,480,486,502,504,525,526,537,],[-41,128,128,128,128,128,-230,-38,-212,-99,-206,-94,-95,-200,-78,-194,-71,-72,-188,-42,-43,-44,-182,-27,-28,-29,-30,-31,-176,-34,-32,-33,-35,-36,-37,-167,-150,-133,-126,-119,-104,-105,-226,-208,-96,-202,-92,-93,-196,-76,-41,-190,-66,-67,-184,-39,-40,-178,-172,-157,-137,-129,-123,-115,-102,-103,128,-234,-238,128,128,128,128,-100,-101,-85,-84,-79,-76,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,-239,-231,-213,-201,-99,-87,-88,-195,-74,-75,-46,-47,-189,-183,-177,-168,-169,-170,-171,-151,-152,-153,-154,-155,-156,-134,-135,-136,-127,-128,-120,-121,-122,-227,-209,-197,-83,-191,-69,-70,-185,-179,-56,-173,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-235,-242,-86,-89,-73,-82,-68,-57,-207,-48,-295,-203,128,-297,-296,-298,-297,-298,]),'RPAREN':([43,57,58,59,61,62,63,64,65,67,68,69,70,71,72,91,93,94,95,96,97,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,169,202,203,204,205,206,207,208,209,210,211,212,214,215,217,220,221,224,228,231,232,236,271,273,295,296,309,310,311,316,318,343,347,348,350,352,353,355,356,357,358,359,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,418,427,429,430,432,433,436,439,442,443,449,471,473,474,478,480,484,487,491,504,512,513,516,526,531,537,],[-38,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,213,217,-226,-208,-96,-202,-92,-93,-196,-76,-41,-190,-66,-67,-184,-39,-40,-178,-172,-157,-137,-129,-123,-115,-102,-103,309,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,342,345,-299,-45,-97,-98,-81,-80,-77,-76,-55,386,388,411,412,-88,418,-90,-46,-47,423,-227,-209,-197,-83,-191,-69,-70,-185,-179,431,-56,-173,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-89,-300,-82,-68,482,-57,483,486,-257,-258,494,501,-91,-48,-295,-203,508,-1,515,-296,530,-1,533,-297,541,-298,]),'RBRACKET':([43,52,57,58,59,61,62,63,64,65,67,68,69,70,71,72,94,95,96,97,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,176,177,178,179,180,202,203,204,205,206,207,208,209,210,211,217,220,221,224,228,231,232,236,307,309,313,316,317,318,319,320,347,348,350,351,352,353,354,355,356,357,358,360,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,418,421,429,430,433,474,475,478,480,504,526,537,],[-38,-1,-42,-43,-44,-27,-28,-29,-30,-31,-34,-32,-33,-35,-36,-37,-226,-208,-96,-202,-92,-93,-196,-76,-41,-190,-66,-67,-184,-39,-40,-178,-172,-157,-137,-129,-123,-115,-102,-103,316,318,-53,-51,-52,-111,-96,-112,-109,-110,-106,-107,-108,-113,-114,-45,-97,-98,-81,-80,-77,-76,-55,417,-88,420,-46,-49,-47,-1,-54,-227,-209,-197,429,-83,-191,430,-69,-70,-185,-179,-56,-173,-158,-159,-160,-161,-138,-139,-140,-141,-142,-143,-130,-131,-132,-124,-125,-116,-117,-118,-89,474,-82,-68,-57,-48,-50,-295,-203,-296,-297,-298,]),'GETPROP':([111,361,],[240,240,]),'SETPROP':([111,361,],[241,241,]),'CATCH':([146,264,],[301,-26,]),'FINALLY':([146,264,299,524,],[302,-26,302,-289,]),}
+_lr_signature = 'programAND ANDEQUAL BAND BLOCK_COMMENT BNOT BOR BREAK BXOR CASE CATCH CLASS COLON COMMA CONDOP CONST CONTINUE DEBUGGER DEFAULT DELETE DIV DIVEQUAL DO ELSE ENUM EQ EQEQ EXPORT EXTENDS FALSE FINALLY FOR FUNCTION GE GETPROP GT ID IF IMPORT IN INSTANCEOF LBRACE LBRACKET LE LINE_COMMENT LINE_TERMINATOR LPAREN LSHIFT LSHIFTEQUAL LT MINUS MINUSEQUAL MINUSMINUS MOD MODEQUAL MULT MULTEQUAL NE NEW NOT NULL NUMBER OR OREQUAL PERIOD PLUS PLUSEQUAL PLUSPLUS RBRACE RBRACKET REGEX RETURN RPAREN RSHIFT RSHIFTEQUAL SEMI SETPROP STREQ STRING STRNEQ SUPER SWITCH THIS THROW TRUE TRY TYPEOF URSHIFT URSHIFTEQUAL VAR VOID WHILE WITH XOREQUALempty :program : source_elementssource_elements : empty\n                           | source_element_list\n        source_element_list : source_element\n                               | source_element_list source_element\n        source_element : statement\n                          | function_declaration\n        statement : block\n                     | variable_statement\n                     | empty_statement\n                     | expr_statement\n                     | if_statement\n                     | iteration_statement\n                     | continue_statement\n                     | break_statement\n                     | return_statement\n                     | with_statement\n                     | switch_statement\n                     | labelled_statement\n                     | throw_statement\n                     | try_statement\n                     | debugger_statement\n                     | function_declaration\n        block : LBRACE source_elements RBRACEliteral : null_literal\n                   | boolean_literal\n                   | numeric_literal\n                   | string_literal\n                   | regex_literal\n        boolean_literal : TRUE\n                           | FALSE\n        null_literal : NULLnumeric_literal : NUMBERstring_literal : STRINGregex_literal : REGEXidentifier : IDprimary_expr : primary_expr_no_brace\n                        | object_literal\n        primary_expr_no_brace : identifierprimary_expr_no_brace : THISprimary_expr_no_brace : literal\n                                 | array_literal\n        primary_expr_no_brace : LPAREN expr RPARENarray_literal : LBRACKET elision_opt RBRACKETarray_literal : LBRACKET element_list RBRACKET\n                         | LBRACKET element_list COMMA elision_opt RBRACKET\n        element_list : elision_opt assignment_expr\n                        | element_list COMMA elision_opt assignment_expr\n        elision_opt : emptyelision_opt : elisionelision : COMMA\n                   | elision COMMA\n        object_literal : LBRACE RBRACE\n                          | LBRACE property_list RBRACE\n                          | LBRACE property_list COMMA RBRACE\n        property_list : property_assignment\n                         | property_list COMMA property_assignment\n        property_assignment              : property_name COLON assignment_expr\n             | GETPROP property_name LPAREN RPAREN LBRACE function_body RBRACE\n             | SETPROP property_name LPAREN formal_parameter_list RPAREN                    LBRACE function_body RBRACE\n        property_name : identifier\n                         | string_literal\n                         | numeric_literal\n        member_expr : primary_expr\n                       | function_expr\n                       | member_expr LBRACKET expr RBRACKET\n                       | member_expr PERIOD identifier\n                       | NEW member_expr arguments\n        member_expr_nobf : primary_expr_no_brace\n                            | function_expr\n                            | member_expr_nobf LBRACKET expr RBRACKET\n                            | member_expr_nobf PERIOD identifier\n                            | NEW member_expr arguments\n        new_expr : member_expr\n                    | NEW new_expr\n        new_expr_nobf : member_expr_nobf\n                         | NEW new_expr\n        call_expr : member_expr arguments\n                     | call_expr arguments\n                     | call_expr LBRACKET expr RBRACKET\n                     | call_expr PERIOD identifier\n        call_expr_nobf : member_expr_nobf arguments\n                          | call_expr_nobf arguments\n                          | call_expr_nobf LBRACKET expr RBRACKET\n                          | call_expr_nobf PERIOD identifier\n        arguments : LPAREN RPAREN\n                     | LPAREN argument_list RPAREN\n        argument_list : assignment_expr\n                         | argument_list COMMA assignment_expr\n        left_hand_side_expr : new_expr\n                               | call_expr\n        left_hand_side_expr_nobf : new_expr_nobf\n                                    | call_expr_nobf\n        postfix_expr : left_hand_side_expr\n                        | left_hand_side_expr PLUSPLUS\n                        | left_hand_side_expr MINUSMINUS\n        postfix_expr_nobf : left_hand_side_expr_nobf\n                             | left_hand_side_expr_nobf PLUSPLUS\n                             | left_hand_side_expr_nobf MINUSMINUS\n        unary_expr : postfix_expr\n                      | unary_expr_common\n        unary_expr_nobf : postfix_expr_nobf\n                           | unary_expr_common\n        unary_expr_common : DELETE unary_expr\n                             | VOID unary_expr\n                             | TYPEOF unary_expr\n                             | PLUSPLUS unary_expr\n                             | MINUSMINUS unary_expr\n                             | PLUS unary_expr\n                             | MINUS unary_expr\n                             | BNOT unary_expr\n                             | NOT unary_expr\n        multiplicative_expr : unary_expr\n                               | multiplicative_expr MULT unary_expr\n                               | multiplicative_expr DIV unary_expr\n                               | multiplicative_expr MOD unary_expr\n        multiplicative_expr_nobf : unary_expr_nobf\n                                    | multiplicative_expr_nobf MULT unary_expr\n                                    | multiplicative_expr_nobf DIV unary_expr\n                                    | multiplicative_expr_nobf MOD unary_expr\n        additive_expr : multiplicative_expr\n                         | additive_expr PLUS multiplicative_expr\n                         | additive_expr MINUS multiplicative_expr\n        additive_expr_nobf : multiplicative_expr_nobf\n                              | additive_expr_nobf PLUS multiplicative_expr\n                              | additive_expr_nobf MINUS multiplicative_expr\n        shift_expr : additive_expr\n                      | shift_expr LSHIFT additive_expr\n                      | shift_expr RSHIFT additive_expr\n                      | shift_expr URSHIFT additive_expr\n        shift_expr_nobf : additive_expr_nobf\n                           | shift_expr_nobf LSHIFT additive_expr\n                           | shift_expr_nobf RSHIFT additive_expr\n                           | shift_expr_nobf URSHIFT additive_expr\n        relational_expr : shift_expr\n                           | relational_expr LT shift_expr\n                           | relational_expr GT shift_expr\n                           | relational_expr LE shift_expr\n                           | relational_expr GE shift_expr\n                           | relational_expr INSTANCEOF shift_expr\n                           | relational_expr IN shift_expr\n        relational_expr_noin : shift_expr\n                                | relational_expr_noin LT shift_expr\n                                | relational_expr_noin GT shift_expr\n                                | relational_expr_noin LE shift_expr\n                                | relational_expr_noin GE shift_expr\n                                | relational_expr_noin INSTANCEOF shift_expr\n        relational_expr_nobf : shift_expr_nobf\n                                | relational_expr_nobf LT shift_expr\n                                | relational_expr_nobf GT shift_expr\n                                | relational_expr_nobf LE shift_expr\n                                | relational_expr_nobf GE shift_expr\n                                | relational_expr_nobf INSTANCEOF shift_expr\n                                | relational_expr_nobf IN shift_expr\n        equality_expr : relational_expr\n                         | equality_expr EQEQ relational_expr\n                         | equality_expr NE relational_expr\n                         | equality_expr STREQ relational_expr\n                         | equality_expr STRNEQ relational_expr\n        equality_expr_noin : relational_expr_noin\n                              | equality_expr_noin EQEQ relational_expr\n                              | equality_expr_noin NE relational_expr\n                              | equality_expr_noin STREQ relational_expr\n                              | equality_expr_noin STRNEQ relational_expr\n        equality_expr_nobf : relational_expr_nobf\n                              | equality_expr_nobf EQEQ relational_expr\n                              | equality_expr_nobf NE relational_expr\n                              | equality_expr_nobf STREQ relational_expr\n                              | equality_expr_nobf STRNEQ relational_expr\n        bitwise_and_expr : equality_expr\n                            | bitwise_and_expr BAND equality_expr\n        bitwise_and_expr_noin             : equality_expr_noin\n            | bitwise_and_expr_noin BAND equality_expr_noin\n        bitwise_and_expr_nobf             : equality_expr_nobf\n            | bitwise_and_expr_nobf BAND equality_expr_nobf\n        bitwise_xor_expr : bitwise_and_expr\n                            | bitwise_xor_expr BXOR bitwise_and_expr\n        \n        bitwise_xor_expr_noin             : bitwise_and_expr_noin\n            | bitwise_xor_expr_noin BXOR bitwise_and_expr_noin\n        \n        bitwise_xor_expr_nobf             : bitwise_and_expr_nobf\n            | bitwise_xor_expr_nobf BXOR bitwise_and_expr_nobf\n        bitwise_or_expr : bitwise_xor_expr\n                           | bitwise_or_expr BOR bitwise_xor_expr\n        \n        bitwise_or_expr_noin             : bitwise_xor_expr_noin\n            | bitwise_or_expr_noin BOR bitwise_xor_expr_noin\n        \n        bitwise_or_expr_nobf             : bitwise_xor_expr_nobf\n            | bitwise_or_expr_nobf BOR bitwise_xor_expr_nobf\n        logical_and_expr : bitwise_or_expr\n                            | logical_and_expr AND bitwise_or_expr\n        \n        logical_and_expr_noin : bitwise_or_expr_noin\n                              | logical_and_expr_noin AND bitwise_or_expr_noin\n        \n        logical_and_expr_nobf : bitwise_or_expr_nobf\n                              | logical_and_expr_nobf AND bitwise_or_expr_nobf\n        logical_or_expr : logical_and_expr\n                           | logical_or_expr OR logical_and_expr\n        logical_or_expr_noin : logical_and_expr_noin\n                                | logical_or_expr_noin OR logical_and_expr_noin\n        logical_or_expr_nobf : logical_and_expr_nobf\n                                | logical_or_expr_nobf OR logical_and_expr_nobf\n        \n        conditional_expr             : logical_or_expr\n            | logical_or_expr CONDOP assignment_expr COLON assignment_expr\n        \n        conditional_expr_noin             : logical_or_expr_noin\n            | logical_or_expr_noin CONDOP assignment_expr_noin COLON                   assignment_expr_noin\n        \n        conditional_expr_nobf             : logical_or_expr_nobf\n            | logical_or_expr_nobf CONDOP assignment_expr COLON assignment_expr\n        \n        assignment_expr             : conditional_expr\n            | left_hand_side_expr assignment_operator assignment_expr\n        \n        assignment_expr_noin             : conditional_expr_noin\n            | left_hand_side_expr assignment_operator assignment_expr_noin\n        \n        assignment_expr_nobf             : conditional_expr_nobf\n            | left_hand_side_expr_nobf assignment_operator assignment_expr\n        assignment_operator : EQ\n                               | MULTEQUAL\n                               | DIVEQUAL\n                               | MODEQUAL\n                               | PLUSEQUAL\n                               | MINUSEQUAL\n                               | LSHIFTEQUAL\n                               | RSHIFTEQUAL\n                               | URSHIFTEQUAL\n                               | ANDEQUAL\n                               | XOREQUAL\n                               | OREQUAL\n        expr : assignment_expr\n                | expr COMMA assignment_expr\n        expr_noin : assignment_expr_noin\n                     | expr_noin COMMA assignment_expr_noin\n        expr_nobf : assignment_expr_nobf\n                     | expr_nobf COMMA assignment_expr\n        variable_statement : VAR variable_declaration_list SEMI\n        variable_declaration_list             : variable_declaration\n            | variable_declaration_list COMMA variable_declaration\n        \n        variable_declaration_list_noin             : variable_declaration_noin\n            | variable_declaration_list_noin COMMA variable_declaration_noin\n        variable_declaration : identifier\n                                | identifier initializer\n        variable_declaration_noin : identifier\n                                     | identifier initializer_noin\n        initializer : EQ assignment_exprinitializer_noin : EQ assignment_expr_noinempty_statement : SEMIexpr_statement : expr_nobf SEMIif_statement : IF LPAREN expr RPAREN statementif_statement : IF LPAREN expr RPAREN statement ELSE statementiteration_statement : DO statement WHILE LPAREN expr RPAREN SEMIiteration_statement : WHILE LPAREN expr RPAREN statement\n        iteration_statement             : FOR LPAREN expr_noin_opt SEMI expr_opt SEMI expr_opt RPAREN                   statement\n            | FOR LPAREN VAR variable_declaration_list_noin SEMI expr_opt SEMI                  expr_opt RPAREN statement\n        \n        iteration_statement             : FOR LPAREN left_hand_side_expr IN expr RPAREN statement\n        \n        iteration_statement :             FOR LPAREN VAR identifier IN expr RPAREN statement\n        \n        iteration_statement           : FOR LPAREN VAR identifier initializer_noin IN expr RPAREN statement\n        expr_opt : empty\n                    | expr\n        expr_noin_opt : empty\n                         | expr_noin\n        continue_statement : CONTINUE SEMIcontinue_statement : CONTINUE identifier SEMIbreak_statement : BREAK SEMIbreak_statement : BREAK identifier SEMIreturn_statement : RETURN SEMIreturn_statement : RETURN expr SEMIwith_statement : WITH LPAREN expr RPAREN statementswitch_statement : SWITCH LPAREN expr RPAREN case_block\n        case_block             : LBRACE case_clauses_opt RBRACE\n            | LBRACE case_clauses_opt default_clause case_clauses_opt RBRACE\n        case_clauses_opt : empty\n                            | case_clauses\n        case_clauses : case_clause\n                        | case_clauses case_clause\n        case_clause : CASE expr COLON source_elementsdefault_clause : DEFAULT COLON source_elementslabelled_statement : identifier COLON statementthrow_statement : THROW expr SEMItry_statement : TRY block catchtry_statement : TRY block finallytry_statement : TRY block catch finallycatch : CATCH LPAREN identifier RPAREN blockfinally : FINALLY blockdebugger_statement : DEBUGGER SEMI\n        function_declaration             : FUNCTION identifier LPAREN RPAREN LBRACE function_body RBRACE\n            | FUNCTION identifier LPAREN formal_parameter_list RPAREN LBRACE                  function_body RBRACE\n        \n        function_expr             : FUNCTION LPAREN RPAREN LBRACE function_body RBRACE\n            | FUNCTION LPAREN formal_parameter_list RPAREN                 LBRACE function_body RBRACE\n        \n        function_expr             : FUNCTION identifier LPAREN RPAREN LBRACE function_body RBRACE\n            | FUNCTION identifier LPAREN formal_parameter_list RPAREN                 LBRACE function_body RBRACE\n        formal_parameter_list : identifier\n                                 | formal_parameter_list COMMA identifier\n        function_body : source_elements'
+    
+_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,28,89,125,129,132,134,136,142,210,258,259,282,283,284,287,288,289,402,404,427,429,457,458,491,498,499,505,507,512,513,520,528,530,531,535,],[-1,0,-2,-3,-4,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-242,-6,-243,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,-277,-279,-244,-247,-263,-264,-281,-245,-246,-250,-265,-278,-282,-251,-248,-252,-266,-249,]),'FUNCTION':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,161,163,164,166,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,308,309,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,408,410,411,415,417,427,429,433,435,437,457,458,466,470,474,476,481,483,484,489,491,495,496,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[23,23,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,110,23,-242,23,110,110,110,-1,110,110,110,110,110,110,110,110,110,-6,23,110,-243,110,110,-24,110,110,-257,-259,-261,110,110,-280,110,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,110,110,110,110,110,110,110,-52,-50,-51,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-273,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-25,-231,110,-258,-260,-262,-274,-275,-276,-1,-53,23,110,23,110,23,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,23,-277,-279,110,110,110,23,23,110,-244,-247,110,110,110,-263,-264,23,23,23,110,110,23,110,110,-281,23,23,-245,-246,110,23,-250,-265,-278,-282,23,23,-251,23,23,23,-248,23,-252,-266,-249,]),'LBRACE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,40,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,161,163,166,170,172,173,174,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,207,210,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,291,308,309,331,333,334,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,404,405,408,410,411,412,415,417,420,427,429,433,435,437,457,458,466,470,471,472,474,476,481,483,484,489,490,491,495,496,497,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[26,26,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,111,26,-242,26,111,111,26,111,-1,111,111,111,111,111,111,111,111,111,-6,26,111,-243,111,111,-24,111,111,-257,-259,-261,111,111,-280,111,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,111,111,111,111,111,-52,-50,-51,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,333,-273,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,-25,-231,111,-258,-260,-262,-274,-275,-276,26,-1,-53,411,26,415,111,26,111,26,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,26,459,-277,-279,111,111,111,26,466,26,111,470,-244,-247,111,111,111,-263,-264,26,26,495,496,26,111,111,26,111,111,26,-281,26,26,517,-245,-246,111,26,-250,-265,-278,-282,26,26,-251,26,26,26,-248,26,-252,-266,-249,]),'VAR':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,129,131,132,134,136,142,210,258,259,282,283,284,287,288,289,333,375,377,400,402,404,411,415,427,429,457,458,466,470,474,483,491,495,496,498,499,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[27,27,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,27,-242,27,-6,27,-243,-24,268,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,27,27,27,27,-277,-279,27,27,-244,-247,-263,-264,27,27,27,27,-281,27,27,-245,-246,27,-250,-265,-278,-282,27,27,-251,27,27,27,-248,27,-252,-266,-249,]),'SEMI':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,26,28,29,31,34,35,36,41,42,43,44,45,46,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,89,92,94,95,96,97,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,122,123,124,125,129,131,132,133,134,135,136,137,140,142,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,210,211,214,215,218,222,225,226,230,258,259,261,263,267,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,287,288,289,292,294,295,297,298,301,303,304,305,307,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,333,336,337,339,341,342,344,345,346,347,349,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,377,378,379,380,381,400,402,404,406,407,409,411,415,418,419,422,427,429,430,431,432,433,436,439,440,441,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,461,463,466,467,469,470,474,475,477,478,479,482,483,491,493,495,496,498,499,502,503,505,506,507,512,513,514,517,518,520,521,523,524,525,528,529,530,531,535,],[28,28,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-40,28,-242,125,28,132,134,136,142,-229,-37,-211,-98,-205,-93,-94,-199,-77,-193,-70,-71,-187,-41,-42,-43,-181,-26,-27,-28,-29,-30,-175,-33,-31,-32,-34,-35,-36,-166,-149,-132,-125,-118,-103,-104,-6,28,-225,-207,-95,-201,-91,-92,-195,-75,-40,-189,-65,-66,-183,-38,-39,-177,-171,-156,-136,-128,-122,-114,-101,-102,259,-232,-236,-243,-24,-1,-257,282,-259,283,-261,284,287,-280,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-273,-44,-96,-97,-80,-79,-76,-75,-54,-25,-231,-237,-230,378,-95,-255,-256,-227,-209,-203,-197,-191,-185,-179,-173,-161,-143,-258,-260,-262,-274,-275,-276,-212,-200,-98,-86,-87,-194,-73,-74,-45,-46,-188,-182,-176,-167,-168,-169,-170,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,28,-226,-208,-196,-82,-190,-68,-69,-184,-178,-55,-172,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-233,-240,28,28,-1,433,-238,-234,28,-277,-279,-85,-88,-72,28,28,-81,-67,-56,-244,-247,476,-253,-254,-1,-239,-95,-210,-228,-198,-192,-186,-180,-174,-162,-163,-164,-165,-144,-145,-146,-147,-148,-263,-264,-206,-47,28,-283,-202,28,28,499,501,-235,-238,-241,28,-281,-284,28,28,-245,-246,-239,28,-250,-204,-265,-278,-282,-285,28,28,-251,28,28,28,-286,-248,28,-252,-266,-249,]),'IF':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,129,132,134,136,142,210,258,259,282,283,284,287,288,289,333,375,377,400,402,404,411,415,427,429,457,458,466,470,474,483,491,495,496,498,499,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[30,30,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,30,-242,30,-6,30,-243,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,30,30,30,30,-277,-279,30,30,-244,-247,-263,-264,30,30,30,30,-281,30,30,-245,-246,30,-250,-265,-278,-282,30,30,-251,30,30,30,-248,30,-252,-266,-249,]),'DO':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,129,132,134,136,142,210,258,259,282,283,284,287,288,289,333,375,377,400,402,404,411,415,427,429,457,458,466,470,474,483,491,495,496,498,499,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[31,31,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,31,-242,31,-6,31,-243,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,31,31,31,31,-277,-279,31,31,-244,-247,-263,-264,31,31,31,31,-281,31,31,-245,-246,31,-250,-265,-278,-282,31,31,-251,31,31,31,-248,31,-252,-266,-249,]),'WHILE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,128,129,132,134,136,142,210,258,259,282,283,284,287,288,289,333,375,377,400,402,404,411,415,427,429,457,458,466,470,474,483,491,495,496,498,499,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[32,32,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,32,-242,32,-6,32,-243,265,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,32,32,32,32,-277,-279,32,32,-244,-247,-263,-264,32,32,32,32,-281,32,32,-245,-246,32,-250,-265,-278,-282,32,32,-251,32,32,32,-248,32,-252,-266,-249,]),'FOR':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,129,132,134,136,142,210,258,259,282,283,284,287,288,289,333,375,377,400,402,404,411,415,427,429,457,458,466,470,474,483,491,495,496,498,499,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[33,33,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,33,-242,33,-6,33,-243,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,33,33,33,33,-277,-279,33,33,-244,-247,-263,-264,33,33,33,33,-281,33,33,-245,-246,33,-250,-265,-278,-282,33,33,-251,33,33,33,-248,33,-252,-266,-249,]),'CONTINUE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,129,132,134,136,142,210,258,259,282,283,284,287,288,289,333,375,377,400,402,404,411,415,427,429,457,458,466,470,474,483,491,495,496,498,499,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[34,34,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,34,-242,34,-6,34,-243,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,34,34,34,34,-277,-279,34,34,-244,-247,-263,-264,34,34,34,34,-281,34,34,-245,-246,34,-250,-265,-278,-282,34,34,-251,34,34,34,-248,34,-252,-266,-249,]),'BREAK':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,129,132,134,136,142,210,258,259,282,283,284,287,288,289,333,375,377,400,402,404,411,415,427,429,457,458,466,470,474,483,491,495,496,498,499,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[35,35,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,35,-242,35,-6,35,-243,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,35,35,35,35,-277,-279,35,35,-244,-247,-263,-264,35,35,35,35,-281,35,35,-245,-246,35,-250,-265,-278,-282,35,35,-251,35,35,35,-248,35,-252,-266,-249,]),'RETURN':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,129,132,134,136,142,210,258,259,282,283,284,287,288,289,333,375,377,400,402,404,411,415,427,429,457,458,466,470,474,483,491,495,496,498,499,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[36,36,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,36,-242,36,-6,36,-243,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,36,36,36,36,-277,-279,36,36,-244,-247,-263,-264,36,36,36,36,-281,36,36,-245,-246,36,-250,-265,-278,-282,36,36,-251,36,36,36,-248,36,-252,-266,-249,]),'WITH':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,129,132,134,136,142,210,258,259,282,283,284,287,288,289,333,375,377,400,402,404,411,415,427,429,457,458,466,470,474,483,491,495,496,498,499,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[37,37,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,37,-242,37,-6,37,-243,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,37,37,37,37,-277,-279,37,37,-244,-247,-263,-264,37,37,37,37,-281,37,37,-245,-246,37,-250,-265,-278,-282,37,37,-251,37,37,37,-248,37,-252,-266,-249,]),'SWITCH':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,129,132,134,136,142,210,258,259,282,283,284,287,288,289,333,375,377,400,402,404,411,415,427,429,457,458,466,470,474,483,491,495,496,498,499,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[38,38,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,38,-242,38,-6,38,-243,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,38,38,38,38,-277,-279,38,38,-244,-247,-263,-264,38,38,38,38,-281,38,38,-245,-246,38,-250,-265,-278,-282,38,38,-251,38,38,38,-248,38,-252,-266,-249,]),'THROW':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,129,132,134,136,142,210,258,259,282,283,284,287,288,289,333,375,377,400,402,404,411,415,427,429,457,458,466,470,474,483,491,495,496,498,499,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[39,39,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,39,-242,39,-6,39,-243,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,39,39,39,39,-277,-279,39,39,-244,-247,-263,-264,39,39,39,39,-281,39,39,-245,-246,39,-250,-265,-278,-282,39,39,-251,39,39,39,-248,39,-252,-266,-249,]),'TRY':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,129,132,134,136,142,210,258,259,282,283,284,287,288,289,333,375,377,400,402,404,411,415,427,429,457,458,466,470,474,483,491,495,496,498,499,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[40,40,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,40,-242,40,-6,40,-243,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,40,40,40,40,-277,-279,40,40,-244,-247,-263,-264,40,40,40,40,-281,40,40,-245,-246,40,-250,-265,-278,-282,40,40,-251,40,40,40,-248,40,-252,-266,-249,]),'DEBUGGER':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,125,129,132,134,136,142,210,258,259,282,283,284,287,288,289,333,375,377,400,402,404,411,415,427,429,457,458,466,470,474,483,491,495,496,498,499,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[41,41,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,41,-242,41,-6,41,-243,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,41,41,41,41,-277,-279,41,41,-244,-247,-263,-264,41,41,41,41,-281,41,41,-245,-246,41,-250,-265,-278,-282,41,41,-251,41,41,41,-248,41,-252,-266,-249,]),'ID':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,27,28,31,34,35,36,39,51,52,77,78,82,83,84,85,86,87,88,89,91,92,102,110,111,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,161,162,163,164,166,167,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,206,210,212,213,216,217,219,220,221,223,224,227,228,234,235,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,262,268,282,283,284,287,288,289,308,309,333,335,348,350,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,403,404,405,408,410,411,415,417,426,427,429,433,434,435,437,457,458,466,470,474,476,481,483,484,489,491,495,496,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[43,43,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,43,43,43,43,-242,43,43,43,43,43,43,-1,43,43,43,43,43,43,43,43,43,-6,43,43,43,43,43,-243,43,43,-24,43,43,-257,-259,-261,43,43,-280,43,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,43,43,43,43,43,43,43,43,43,-52,-50,-51,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-273,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-25,-231,43,43,43,-258,-260,-262,-274,-275,-276,-1,-53,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-277,43,-279,43,43,43,43,43,43,43,-244,-247,43,43,43,43,-263,-264,43,43,43,43,43,43,43,43,-281,43,43,-245,-246,43,43,-250,-265,-278,-282,43,43,-251,43,43,43,-248,43,-252,-266,-249,]),'NEW':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,161,163,164,166,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,308,309,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,408,410,411,415,417,427,429,433,435,437,457,458,466,470,474,476,481,483,484,489,491,495,496,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[51,51,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,102,51,-242,51,102,102,102,-1,102,102,102,102,102,102,102,102,102,-6,51,102,-243,102,102,-24,102,102,-257,-259,-261,102,102,-280,102,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,102,51,102,102,51,102,102,-52,-50,-51,51,51,51,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-273,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-25,-231,102,-258,-260,-262,-274,-275,-276,-1,-53,51,102,51,102,51,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,51,-277,-279,102,102,102,51,51,102,-244,-247,102,102,102,-263,-264,51,51,51,102,102,51,102,102,-281,51,51,-245,-246,102,51,-250,-265,-278,-282,51,51,-251,51,51,51,-248,51,-252,-266,-249,]),'THIS':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,161,163,164,166,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,308,309,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,408,410,411,415,417,427,429,433,435,437,457,458,466,470,474,476,481,483,484,489,491,495,496,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[57,57,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,57,57,-242,57,57,57,57,-1,57,57,57,57,57,57,57,57,57,-6,57,57,-243,57,57,-24,57,57,-257,-259,-261,57,57,-280,57,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,57,57,57,57,57,57,57,-52,-50,-51,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-273,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-25,-231,57,-258,-260,-262,-274,-275,-276,-1,-53,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-277,-279,57,57,57,57,57,57,-244,-247,57,57,57,-263,-264,57,57,57,57,57,57,57,57,-281,57,57,-245,-246,57,57,-250,-265,-278,-282,57,57,-251,57,57,57,-248,57,-252,-266,-249,]),'LPAREN':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,28,30,31,32,33,36,37,38,39,43,48,50,51,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,77,78,82,83,84,85,86,87,88,89,90,92,99,101,102,103,105,106,108,109,110,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,163,164,165,166,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,211,212,213,216,217,218,219,221,222,223,226,227,228,229,230,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,265,282,283,284,287,288,289,290,297,298,303,304,305,307,308,309,333,341,344,345,349,351,352,353,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,406,407,408,409,410,411,415,417,418,419,422,427,429,433,435,437,457,458,463,466,467,470,474,476,481,483,484,489,491,493,495,496,498,499,501,503,505,507,512,513,514,517,518,520,521,523,524,525,528,529,530,531,535,],[25,25,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,91,-40,25,25,-242,127,25,130,131,25,138,139,25,-37,163,163,25,-1,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,25,25,25,25,25,25,25,25,25,-6,206,25,163,163,25,-40,-65,-66,-38,-39,91,-243,25,25,-24,25,25,-257,-259,-261,25,25,-280,25,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,25,25,-84,25,25,25,-83,25,163,25,-52,-50,-51,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-273,-44,25,25,25,25,-80,25,25,-79,25,163,25,25,348,-54,-62,-63,-64,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-25,-231,25,376,-258,-260,-262,-274,-275,-276,403,-86,-87,-73,-74,-45,-46,-1,-53,25,-82,-68,-69,-55,25,425,426,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-277,-279,25,-85,-88,25,-72,25,25,25,25,-81,-67,-56,-244,-247,25,25,25,-263,-264,-47,25,-283,25,25,25,25,25,25,25,-281,-284,25,25,-245,-246,25,25,-250,-265,-278,-282,-285,25,25,-251,25,25,25,-286,-248,25,-252,-266,-249,]),'LBRACKET':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,28,31,36,39,43,48,50,51,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,77,78,82,83,84,85,86,87,88,89,92,99,101,102,103,105,106,108,109,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,163,164,165,166,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,211,212,213,216,217,218,219,221,222,223,226,227,228,230,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,297,298,303,304,305,307,308,309,333,341,344,345,349,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,406,407,408,409,410,411,415,417,418,419,422,427,429,433,435,437,457,458,463,466,467,470,474,476,481,483,484,489,491,493,495,496,498,499,501,503,505,507,512,513,514,517,518,520,521,523,524,525,528,529,530,531,535,],[52,52,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-40,52,52,-242,52,52,52,-37,161,166,52,-1,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,52,52,52,52,52,52,52,52,52,-6,52,219,223,52,-40,-65,-66,-38,-39,-243,52,52,-24,52,52,-257,-259,-261,52,52,-280,52,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,52,52,-84,52,52,52,-83,52,223,52,-52,-50,-51,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-273,-44,52,52,52,52,-80,52,52,-79,52,223,52,52,-54,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-25,-231,52,-258,-260,-262,-274,-275,-276,-86,-87,-73,-74,-45,-46,-1,-53,52,-82,-68,-69,-55,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-277,-279,52,-85,-88,52,-72,52,52,52,52,-81,-67,-56,-244,-247,52,52,52,-263,-264,-47,52,-283,52,52,52,52,52,52,52,-281,-284,52,52,-245,-246,52,52,-250,-265,-278,-282,-285,52,52,-251,52,52,52,-286,-248,52,-252,-266,-249,]),'NULL':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,161,163,164,166,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,308,309,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,408,410,411,415,417,427,429,433,435,437,457,458,466,470,474,476,481,483,484,489,491,495,496,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[67,67,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,67,67,-242,67,67,67,67,-1,67,67,67,67,67,67,67,67,67,-6,67,67,-243,67,67,-24,67,67,-257,-259,-261,67,67,-280,67,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,67,67,67,67,67,67,67,-52,-50,-51,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-273,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-25,-231,67,-258,-260,-262,-274,-275,-276,-1,-53,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-277,-279,67,67,67,67,67,67,-244,-247,67,67,67,-263,-264,67,67,67,67,67,67,67,67,-281,67,67,-245,-246,67,67,-250,-265,-278,-282,67,67,-251,67,67,67,-248,67,-252,-266,-249,]),'TRUE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,161,163,164,166,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,308,309,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,408,410,411,415,417,427,429,433,435,437,457,458,466,470,474,476,481,483,484,489,491,495,496,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[68,68,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,68,68,-242,68,68,68,68,-1,68,68,68,68,68,68,68,68,68,-6,68,68,-243,68,68,-24,68,68,-257,-259,-261,68,68,-280,68,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,68,68,68,68,68,68,68,-52,-50,-51,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-273,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-25,-231,68,-258,-260,-262,-274,-275,-276,-1,-53,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-277,-279,68,68,68,68,68,68,-244,-247,68,68,68,-263,-264,68,68,68,68,68,68,68,68,-281,68,68,-245,-246,68,68,-250,-265,-278,-282,68,68,-251,68,68,68,-248,68,-252,-266,-249,]),'FALSE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,161,163,164,166,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,308,309,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,408,410,411,415,417,427,429,433,435,437,457,458,466,470,474,476,481,483,484,489,491,495,496,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[69,69,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,69,69,-242,69,69,69,69,-1,69,69,69,69,69,69,69,69,69,-6,69,69,-243,69,69,-24,69,69,-257,-259,-261,69,69,-280,69,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,69,69,69,69,69,69,69,-52,-50,-51,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-273,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-25,-231,69,-258,-260,-262,-274,-275,-276,-1,-53,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-277,-279,69,69,69,69,69,69,-244,-247,69,69,69,-263,-264,69,69,69,69,69,69,69,69,-281,69,69,-245,-246,69,69,-250,-265,-278,-282,69,69,-251,69,69,69,-248,69,-252,-266,-249,]),'NUMBER':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,111,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,161,163,164,166,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,212,213,216,217,219,221,223,227,228,234,235,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,308,309,333,350,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,408,410,411,415,417,427,429,433,435,437,457,458,466,470,474,476,481,483,484,489,491,495,496,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[70,70,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,70,70,-242,70,70,70,70,-1,70,70,70,70,70,70,70,70,70,-6,70,70,70,-243,70,70,-24,70,70,-257,-259,-261,70,70,-280,70,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,70,70,70,70,70,70,70,-52,-50,-51,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-273,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-25,-231,70,-258,-260,-262,-274,-275,-276,-1,-53,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-277,-279,70,70,70,70,70,70,-244,-247,70,70,70,-263,-264,70,70,70,70,70,70,70,70,-281,70,70,-245,-246,70,70,-250,-265,-278,-282,70,70,-251,70,70,70,-248,70,-252,-266,-249,]),'STRING':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,111,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,161,163,164,166,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,212,213,216,217,219,221,223,227,228,234,235,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,308,309,333,350,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,408,410,411,415,417,427,429,433,435,437,457,458,466,470,474,476,481,483,484,489,491,495,496,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[71,71,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,71,71,-242,71,71,71,71,-1,71,71,71,71,71,71,71,71,71,-6,71,71,71,-243,71,71,-24,71,71,-257,-259,-261,71,71,-280,71,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,71,71,71,71,71,71,71,-52,-50,-51,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-273,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-25,-231,71,-258,-260,-262,-274,-275,-276,-1,-53,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-277,-279,71,71,71,71,71,71,-244,-247,71,71,71,-263,-264,71,71,71,71,71,71,71,71,-281,71,71,-245,-246,71,71,-250,-265,-278,-282,71,71,-251,71,71,71,-248,71,-252,-266,-249,]),'REGEX':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,161,163,164,166,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,308,309,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,408,410,411,415,417,427,429,433,435,437,457,458,466,470,474,476,481,483,484,489,491,495,496,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[72,72,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,72,72,-242,72,72,72,72,-1,72,72,72,72,72,72,72,72,72,-6,72,72,-243,72,72,-24,72,72,-257,-259,-261,72,72,-280,72,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,72,72,72,72,72,72,72,-52,-50,-51,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-273,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-25,-231,72,-258,-260,-262,-274,-275,-276,-1,-53,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-277,-279,72,72,72,72,72,72,-244,-247,72,72,72,-263,-264,72,72,72,72,72,72,72,72,-281,72,72,-245,-246,72,72,-250,-265,-278,-282,72,72,-251,72,72,72,-248,72,-252,-266,-249,]),'DELETE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,52,77,78,82,83,84,85,86,87,88,89,92,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,161,163,164,166,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,308,309,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,408,410,411,415,417,427,429,433,435,437,457,458,466,470,474,476,481,483,484,489,491,495,496,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[84,84,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,84,84,-242,84,84,84,-1,84,84,84,84,84,84,84,84,84,-6,84,-243,84,84,-24,84,84,-257,-259,-261,84,84,-280,84,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,84,84,84,84,84,84,84,-52,-50,-51,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-273,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-25,-231,84,-258,-260,-262,-274,-275,-276,-1,-53,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-277,-279,84,84,84,84,84,84,-244,-247,84,84,84,-263,-264,84,84,84,84,84,84,84,84,-281,84,84,-245,-246,84,84,-250,-265,-278,-282,84,84,-251,84,84,84,-248,84,-252,-266,-249,]),'VOID':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,52,77,78,82,83,84,85,86,87,88,89,92,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,161,163,164,166,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,308,309,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,408,410,411,415,417,427,429,433,435,437,457,458,466,470,474,476,481,483,484,489,491,495,496,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[85,85,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,85,85,-242,85,85,85,-1,85,85,85,85,85,85,85,85,85,-6,85,-243,85,85,-24,85,85,-257,-259,-261,85,85,-280,85,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,85,85,85,85,85,85,85,-52,-50,-51,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-273,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-25,-231,85,-258,-260,-262,-274,-275,-276,-1,-53,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-277,-279,85,85,85,85,85,85,-244,-247,85,85,85,-263,-264,85,85,85,85,85,85,85,85,-281,85,85,-245,-246,85,85,-250,-265,-278,-282,85,85,-251,85,85,85,-248,85,-252,-266,-249,]),'TYPEOF':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,52,77,78,82,83,84,85,86,87,88,89,92,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,161,163,164,166,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,308,309,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,408,410,411,415,417,427,429,433,435,437,457,458,466,470,474,476,481,483,484,489,491,495,496,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[86,86,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,86,86,-242,86,86,86,-1,86,86,86,86,86,86,86,86,86,-6,86,-243,86,86,-24,86,86,-257,-259,-261,86,86,-280,86,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,86,86,86,86,86,86,86,-52,-50,-51,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-273,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-25,-231,86,-258,-260,-262,-274,-275,-276,-1,-53,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-277,-279,86,86,86,86,86,86,-244,-247,86,86,86,-263,-264,86,86,86,86,86,86,86,86,-281,86,86,-245,-246,86,86,-250,-265,-278,-282,86,86,-251,86,86,86,-248,86,-252,-266,-249,]),'PLUSPLUS':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,28,31,36,39,43,45,47,48,50,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,77,78,82,83,84,85,86,87,88,89,92,96,98,99,101,103,105,106,108,109,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,163,164,165,166,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,210,211,212,213,216,217,218,219,221,222,223,225,226,227,228,230,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,269,282,283,284,287,288,289,295,297,298,303,304,305,307,308,309,333,341,344,345,349,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,406,407,408,409,410,411,415,417,418,419,422,427,429,433,435,437,439,457,458,463,466,467,470,474,476,481,483,484,489,491,493,495,496,498,499,501,503,505,507,512,513,514,517,518,520,521,523,524,525,528,529,530,531,535,],[82,82,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-40,82,82,-242,82,82,82,-37,144,-93,-94,-77,-1,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,82,82,82,82,82,82,82,82,82,-6,82,214,-91,-92,-75,-40,-65,-66,-38,-39,-243,82,82,-24,82,82,-257,-259,-261,82,82,-280,82,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,82,82,-84,82,82,82,-83,82,-78,-75,82,-52,-50,-51,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,214,-273,-44,82,82,82,82,-80,82,82,-79,82,-76,-75,82,82,-54,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-25,-231,82,214,-258,-260,-262,-274,-275,-276,144,-86,-87,-73,-74,-45,-46,-1,-53,82,-82,-68,-69,-55,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-277,-279,82,-85,-88,82,-72,82,82,82,82,-81,-67,-56,-244,-247,82,82,82,214,-263,-264,-47,82,-283,82,82,82,82,82,82,82,-281,-284,82,82,-245,-246,82,82,-250,-265,-278,-282,-285,82,82,-251,82,82,82,-286,-248,82,-252,-266,-249,]),'MINUSMINUS':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,28,31,36,39,43,45,47,48,50,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,77,78,82,83,84,85,86,87,88,89,92,96,98,99,101,103,105,106,108,109,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,163,164,165,166,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,210,211,212,213,216,217,218,219,221,222,223,225,226,227,228,230,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,269,282,283,284,287,288,289,295,297,298,303,304,305,307,308,309,333,341,344,345,349,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,406,407,408,409,410,411,415,417,418,419,422,427,429,433,435,437,439,457,458,463,466,467,470,474,476,481,483,484,489,491,493,495,496,498,499,501,503,505,507,512,513,514,517,518,520,521,523,524,525,528,529,530,531,535,],[83,83,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-40,83,83,-242,83,83,83,-37,145,-93,-94,-77,-1,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,83,83,83,83,83,83,83,83,83,-6,83,215,-91,-92,-75,-40,-65,-66,-38,-39,-243,83,83,-24,83,83,-257,-259,-261,83,83,-280,83,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,83,83,-84,83,83,83,-83,83,-78,-75,83,-52,-50,-51,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,215,-273,-44,83,83,83,83,-80,83,83,-79,83,-76,-75,83,83,-54,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-25,-231,83,215,-258,-260,-262,-274,-275,-276,145,-86,-87,-73,-74,-45,-46,-1,-53,83,-82,-68,-69,-55,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-277,-279,83,-85,-88,83,-72,83,83,83,83,-81,-67,-56,-244,-247,83,83,83,215,-263,-264,-47,83,-283,83,83,83,83,83,83,83,-281,-284,83,83,-245,-246,83,83,-250,-265,-278,-282,-285,83,83,-251,83,83,83,-286,-248,83,-252,-266,-249,]),'PLUS':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,28,31,36,39,43,45,47,48,50,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,96,98,99,101,103,105,106,108,109,116,117,118,119,120,125,126,127,129,130,131,132,134,136,138,139,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,163,164,165,166,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,212,213,214,215,216,217,218,219,221,222,223,225,226,227,228,230,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,269,282,283,284,287,288,289,295,297,298,303,304,305,307,308,309,323,324,325,326,327,328,329,330,333,341,344,345,349,351,365,366,367,368,369,370,371,372,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,406,407,408,409,410,411,415,417,418,419,422,427,429,433,435,437,439,457,458,463,466,467,470,474,476,481,483,484,489,491,493,495,496,498,499,501,503,505,507,512,513,514,517,518,520,521,523,524,525,528,529,530,531,535,],[77,77,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-40,77,77,-242,77,77,77,-37,-98,-93,-94,-77,-1,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,191,-125,77,77,-118,-103,-104,77,77,77,77,77,77,77,-6,77,-95,-91,-92,-75,-40,-65,-66,-38,-39,253,-122,-114,-101,-102,-243,77,77,-24,77,77,-257,-259,-261,77,77,-280,77,-99,-100,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,77,77,-84,77,77,77,-83,77,-78,-75,77,-52,-50,-51,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-273,-44,77,77,-96,-97,77,77,-80,77,77,-79,77,-76,-75,77,77,-54,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-25,-231,77,-95,-258,-260,-262,-274,-275,-276,-98,-86,-87,-73,-74,-45,-46,-1,-53,253,253,253,-126,-127,-119,-120,-121,77,-82,-68,-69,-55,77,253,253,253,-123,-124,-115,-116,-117,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-277,-279,77,-85,-88,77,-72,77,77,77,77,-81,-67,-56,-244,-247,77,77,77,-95,-263,-264,-47,77,-283,77,77,77,77,77,77,77,-281,-284,77,77,-245,-246,77,77,-250,-265,-278,-282,-285,77,77,-251,77,77,77,-286,-248,77,-252,-266,-249,]),'MINUS':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,28,31,36,39,43,45,47,48,50,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,96,98,99,101,103,105,106,108,109,116,117,118,119,120,125,126,127,129,130,131,132,134,136,138,139,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,163,164,165,166,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,212,213,214,215,216,217,218,219,221,222,223,225,226,227,228,230,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,269,282,283,284,287,288,289,295,297,298,303,304,305,307,308,309,323,324,325,326,327,328,329,330,333,341,344,345,349,351,365,366,367,368,369,370,371,372,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,406,407,408,409,410,411,415,417,418,419,422,427,429,433,435,437,439,457,458,463,466,467,470,474,476,481,483,484,489,491,493,495,496,498,499,501,503,505,507,512,513,514,517,518,520,521,523,524,525,528,529,530,531,535,],[78,78,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-40,78,78,-242,78,78,78,-37,-98,-93,-94,-77,-1,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,192,-125,78,78,-118,-103,-104,78,78,78,78,78,78,78,-6,78,-95,-91,-92,-75,-40,-65,-66,-38,-39,254,-122,-114,-101,-102,-243,78,78,-24,78,78,-257,-259,-261,78,78,-280,78,-99,-100,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,78,78,-84,78,78,78,-83,78,-78,-75,78,-52,-50,-51,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-273,-44,78,78,-96,-97,78,78,-80,78,78,-79,78,-76,-75,78,78,-54,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-25,-231,78,-95,-258,-260,-262,-274,-275,-276,-98,-86,-87,-73,-74,-45,-46,-1,-53,254,254,254,-126,-127,-119,-120,-121,78,-82,-68,-69,-55,78,254,254,254,-123,-124,-115,-116,-117,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-277,-279,78,-85,-88,78,-72,78,78,78,78,-81,-67,-56,-244,-247,78,78,78,-95,-263,-264,-47,78,-283,78,78,78,78,78,78,78,-281,-284,78,78,-245,-246,78,78,-250,-265,-278,-282,-285,78,78,-251,78,78,78,-286,-248,78,-252,-266,-249,]),'BNOT':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,52,77,78,82,83,84,85,86,87,88,89,92,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,161,163,164,166,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,308,309,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,408,410,411,415,417,427,429,433,435,437,457,458,466,470,474,476,481,483,484,489,491,495,496,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[87,87,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,87,87,-242,87,87,87,-1,87,87,87,87,87,87,87,87,87,-6,87,-243,87,87,-24,87,87,-257,-259,-261,87,87,-280,87,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,87,87,87,87,87,87,87,-52,-50,-51,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-273,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-25,-231,87,-258,-260,-262,-274,-275,-276,-1,-53,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-277,-279,87,87,87,87,87,87,-244,-247,87,87,87,-263,-264,87,87,87,87,87,87,87,87,-281,87,87,-245,-246,87,87,-250,-265,-278,-282,87,87,-251,87,87,87,-248,87,-252,-266,-249,]),'NOT':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,52,77,78,82,83,84,85,86,87,88,89,92,125,126,127,129,130,131,132,134,136,138,139,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,161,163,164,166,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,210,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,262,282,283,284,287,288,289,308,309,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,405,408,410,411,415,417,427,429,433,435,437,457,458,466,470,474,476,481,483,484,489,491,495,496,498,499,501,503,505,507,512,513,517,518,520,521,523,524,528,529,530,531,535,],[88,88,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,88,88,-242,88,88,88,-1,88,88,88,88,88,88,88,88,88,-6,88,-243,88,88,-24,88,88,-257,-259,-261,88,88,-280,88,-213,-214,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,88,88,88,88,88,88,88,-52,-50,-51,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-273,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-25,-231,88,-258,-260,-262,-274,-275,-276,-1,-53,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-277,-279,88,88,88,88,88,88,-244,-247,88,88,88,-263,-264,88,88,88,88,88,88,88,88,-281,88,88,-245,-246,88,88,-250,-265,-278,-282,88,88,-251,88,88,88,-248,88,-252,-266,-249,]),'RBRACE':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,43,57,58,59,61,62,63,64,65,67,68,69,70,71,72,89,95,96,97,98,99,100,101,103,104,105,106,107,108,109,111,112,113,114,115,116,117,118,119,120,121,125,129,132,134,136,142,196,197,198,199,200,201,202,203,204,205,210,211,214,215,218,222,225,226,230,231,232,258,259,282,283,284,287,288,289,298,305,307,333,337,339,341,342,344,345,346,347,349,350,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,402,404,407,411,413,414,415,418,419,422,423,424,427,429,457,458,459,463,465,466,467,468,469,470,485,486,487,488,491,492,493,494,495,496,498,499,505,507,508,510,512,513,514,515,516,517,520,522,523,524,525,526,527,528,530,531,532,533,534,535,],[-3,-4,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-1,-242,-37,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,-6,-207,-95,-201,-91,-92,-195,-75,-40,-189,-65,-66,-183,-38,-39,230,-177,-171,-156,-136,-128,-122,-114,-101,-102,258,-243,-24,-257,-259,-261,-280,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-273,-44,-96,-97,-80,-79,-76,-75,-54,349,-57,-25,-231,-258,-260,-262,-274,-275,-276,-87,-45,-46,-1,-208,-196,-82,-190,-68,-69,-184,-178,-55,422,-172,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-277,-279,-88,-1,467,-289,-1,-81,-67,-56,-58,-59,-244,-247,-263,-264,-1,-47,491,-1,-283,493,-202,-1,507,-267,-268,-269,-281,513,-284,514,-1,-1,-245,-246,-250,-265,-1,-270,-278,-282,-285,525,526,-1,-251,531,-1,-1,-286,-60,534,-248,-252,-266,-272,-271,-61,-249,]),'CASE':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,28,89,125,129,132,134,136,142,210,258,259,282,283,284,287,288,289,402,404,427,429,457,458,459,487,488,491,498,499,505,507,508,510,512,513,520,523,524,528,530,531,532,533,535,],[-3,-4,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-242,-6,-243,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,-277,-279,-244,-247,-263,-264,489,489,-269,-281,-245,-246,-250,-265,489,-270,-278,-282,-251,-1,-1,-248,-252,-266,-272,-271,-249,]),'DEFAULT':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,28,89,125,129,132,134,136,142,210,258,259,282,283,284,287,288,289,402,404,427,429,457,458,459,485,486,487,488,491,498,499,505,507,510,512,513,520,524,528,530,531,533,535,],[-3,-4,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-242,-6,-243,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,-277,-279,-244,-247,-263,-264,-1,509,-267,-268,-269,-281,-245,-246,-250,-265,-270,-278,-282,-251,-1,-248,-252,-266,-271,-249,]),'ELSE':([8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,28,125,129,132,134,136,142,210,258,259,282,283,284,287,288,289,402,404,427,429,457,458,491,498,499,505,507,512,513,520,528,530,531,535,],[-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-242,-243,-24,-257,-259,-261,-280,-273,-25,-231,-258,-260,-262,-274,-275,-276,-277,-279,474,-247,-263,-264,-281,-245,-246,-250,-265,-278,-282,-251,-248,-252,-266,-249,]),'COLON':([24,43,57,58,59,61,62,63,64,65,67,68,69,70,71,72,94,95,96,97,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,233,236,237,238,273,274,275,276,277,278,279,280,281,293,298,305,307,336,337,338,339,341,342,344,345,346,347,349,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,407,418,419,422,439,440,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,463,467,469,493,506,509,511,514,525,],[92,-37,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,-225,-207,-95,-201,-91,-92,-195,-75,-40,-189,-65,-66,-183,-38,-39,-177,-171,-156,-136,-128,-122,-114,-101,-102,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,351,-62,-63,-64,-209,-203,-197,-191,-185,-179,-173,-161,-143,405,-87,-45,-46,-226,-208,417,-196,-82,-190,-68,-69,-184,-178,-55,-172,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-88,-81,-67,-56,-95,-210,484,-198,-192,-186,-180,-174,-162,-163,-164,-165,-144,-145,-146,-147,-148,-47,-283,-202,-284,-204,523,524,-285,-286,]),'PERIOD':([24,43,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,99,101,103,105,106,108,109,160,165,169,211,218,222,226,230,297,298,303,304,305,307,341,344,345,349,406,407,409,418,419,422,463,467,491,493,513,514,525,],[-40,-37,162,167,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,220,224,-40,-65,-66,-38,-39,-84,-83,224,-44,-80,-79,224,-54,-86,-87,-73,-74,-45,-46,-82,-68,-69,-55,-85,-88,-72,-81,-67,-56,-47,-283,-285,-284,-286,-285,-286,]),'EQ':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,124,160,165,168,169,211,218,222,225,226,230,269,297,298,303,304,305,307,341,344,345,349,380,406,407,409,418,419,422,439,463,467,479,491,493,513,514,525,],[-40,-37,146,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,146,-91,-92,-75,-40,-65,-66,-38,-39,262,-84,-83,-78,-75,-44,-80,-79,-76,-75,-54,146,-86,-87,-73,-74,-45,-46,-82,-68,-69,-55,437,-85,-88,-72,-81,-67,-56,146,-47,-283,437,-285,-284,-286,-285,-286,]),'MULTEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,160,165,168,169,211,218,222,225,226,230,269,297,298,303,304,305,307,341,344,345,349,406,407,409,418,419,422,439,463,467,491,493,513,514,525,],[-40,-37,147,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,147,-91,-92,-75,-40,-65,-66,-38,-39,-84,-83,-78,-75,-44,-80,-79,-76,-75,-54,147,-86,-87,-73,-74,-45,-46,-82,-68,-69,-55,-85,-88,-72,-81,-67,-56,147,-47,-283,-285,-284,-286,-285,-286,]),'DIVEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,160,165,168,169,211,218,222,225,226,230,269,297,298,303,304,305,307,341,344,345,349,406,407,409,418,419,422,439,463,467,491,493,513,514,525,],[-40,-37,148,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,148,-91,-92,-75,-40,-65,-66,-38,-39,-84,-83,-78,-75,-44,-80,-79,-76,-75,-54,148,-86,-87,-73,-74,-45,-46,-82,-68,-69,-55,-85,-88,-72,-81,-67,-56,148,-47,-283,-285,-284,-286,-285,-286,]),'MODEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,160,165,168,169,211,218,222,225,226,230,269,297,298,303,304,305,307,341,344,345,349,406,407,409,418,419,422,439,463,467,491,493,513,514,525,],[-40,-37,149,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,149,-91,-92,-75,-40,-65,-66,-38,-39,-84,-83,-78,-75,-44,-80,-79,-76,-75,-54,149,-86,-87,-73,-74,-45,-46,-82,-68,-69,-55,-85,-88,-72,-81,-67,-56,149,-47,-283,-285,-284,-286,-285,-286,]),'PLUSEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,160,165,168,169,211,218,222,225,226,230,269,297,298,303,304,305,307,341,344,345,349,406,407,409,418,419,422,439,463,467,491,493,513,514,525,],[-40,-37,150,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,150,-91,-92,-75,-40,-65,-66,-38,-39,-84,-83,-78,-75,-44,-80,-79,-76,-75,-54,150,-86,-87,-73,-74,-45,-46,-82,-68,-69,-55,-85,-88,-72,-81,-67,-56,150,-47,-283,-285,-284,-286,-285,-286,]),'MINUSEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,160,165,168,169,211,218,222,225,226,230,269,297,298,303,304,305,307,341,344,345,349,406,407,409,418,419,422,439,463,467,491,493,513,514,525,],[-40,-37,151,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,151,-91,-92,-75,-40,-65,-66,-38,-39,-84,-83,-78,-75,-44,-80,-79,-76,-75,-54,151,-86,-87,-73,-74,-45,-46,-82,-68,-69,-55,-85,-88,-72,-81,-67,-56,151,-47,-283,-285,-284,-286,-285,-286,]),'LSHIFTEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,160,165,168,169,211,218,222,225,226,230,269,297,298,303,304,305,307,341,344,345,349,406,407,409,418,419,422,439,463,467,491,493,513,514,525,],[-40,-37,152,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,152,-91,-92,-75,-40,-65,-66,-38,-39,-84,-83,-78,-75,-44,-80,-79,-76,-75,-54,152,-86,-87,-73,-74,-45,-46,-82,-68,-69,-55,-85,-88,-72,-81,-67,-56,152,-47,-283,-285,-284,-286,-285,-286,]),'RSHIFTEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,160,165,168,169,211,218,222,225,226,230,269,297,298,303,304,305,307,341,344,345,349,406,407,409,418,419,422,439,463,467,491,493,513,514,525,],[-40,-37,153,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,153,-91,-92,-75,-40,-65,-66,-38,-39,-84,-83,-78,-75,-44,-80,-79,-76,-75,-54,153,-86,-87,-73,-74,-45,-46,-82,-68,-69,-55,-85,-88,-72,-81,-67,-56,153,-47,-283,-285,-284,-286,-285,-286,]),'URSHIFTEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,160,165,168,169,211,218,222,225,226,230,269,297,298,303,304,305,307,341,344,345,349,406,407,409,418,419,422,439,463,467,491,493,513,514,525,],[-40,-37,154,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,154,-91,-92,-75,-40,-65,-66,-38,-39,-84,-83,-78,-75,-44,-80,-79,-76,-75,-54,154,-86,-87,-73,-74,-45,-46,-82,-68,-69,-55,-85,-88,-72,-81,-67,-56,154,-47,-283,-285,-284,-286,-285,-286,]),'ANDEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,160,165,168,169,211,218,222,225,226,230,269,297,298,303,304,305,307,341,344,345,349,406,407,409,418,419,422,439,463,467,491,493,513,514,525,],[-40,-37,155,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,155,-91,-92,-75,-40,-65,-66,-38,-39,-84,-83,-78,-75,-44,-80,-79,-76,-75,-54,155,-86,-87,-73,-74,-45,-46,-82,-68,-69,-55,-85,-88,-72,-81,-67,-56,155,-47,-283,-285,-284,-286,-285,-286,]),'XOREQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,160,165,168,169,211,218,222,225,226,230,269,297,298,303,304,305,307,341,344,345,349,406,407,409,418,419,422,439,463,467,491,493,513,514,525,],[-40,-37,156,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,156,-91,-92,-75,-40,-65,-66,-38,-39,-84,-83,-78,-75,-44,-80,-79,-76,-75,-54,156,-86,-87,-73,-74,-45,-46,-82,-68,-69,-55,-85,-88,-72,-81,-67,-56,156,-47,-283,-285,-284,-286,-285,-286,]),'OREQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,103,105,106,108,109,160,165,168,169,211,218,222,225,226,230,269,297,298,303,304,305,307,341,344,345,349,406,407,409,418,419,422,439,463,467,491,493,513,514,525,],[-40,-37,157,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,157,-91,-92,-75,-40,-65,-66,-38,-39,-84,-83,-78,-75,-44,-80,-79,-76,-75,-54,157,-86,-87,-73,-74,-45,-46,-82,-68,-69,-55,-85,-88,-72,-81,-67,-56,157,-47,-283,-285,-284,-286,-285,-286,]),'MULT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,76,79,80,81,96,98,99,101,103,105,106,108,109,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,295,297,298,303,304,305,307,326,327,328,329,330,341,344,345,349,368,369,370,371,372,406,407,409,418,419,422,439,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,193,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,255,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,-98,-86,-87,-73,-74,-45,-46,255,255,-119,-120,-121,-82,-68,-69,-55,255,255,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,-47,-283,-285,-284,-286,-285,-286,]),'DIV':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,76,79,80,81,96,98,99,101,103,105,106,108,109,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,295,297,298,303,304,305,307,326,327,328,329,330,341,344,345,349,368,369,370,371,372,406,407,409,418,419,422,439,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,194,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,256,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,-98,-86,-87,-73,-74,-45,-46,256,256,-119,-120,-121,-82,-68,-69,-55,256,256,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,-47,-283,-285,-284,-286,-285,-286,]),'MOD':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,76,79,80,81,96,98,99,101,103,105,106,108,109,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,295,297,298,303,304,305,307,326,327,328,329,330,341,344,345,349,368,369,370,371,372,406,407,409,418,419,422,439,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,195,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,257,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,-98,-86,-87,-73,-74,-45,-46,257,257,-119,-120,-121,-82,-68,-69,-55,257,257,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,-47,-283,-285,-284,-286,-285,-286,]),'LSHIFT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,281,295,297,298,303,304,305,307,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,344,345,349,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,188,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,250,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,250,-98,-86,-87,-73,-74,-45,-46,250,250,250,250,250,250,-133,-134,-135,-126,-127,-119,-120,-121,-82,-68,-69,-55,250,250,250,250,250,250,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,250,250,250,250,250,-47,-283,-285,-284,-286,-285,-286,]),'RSHIFT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,281,295,297,298,303,304,305,307,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,344,345,349,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,189,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,251,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,251,-98,-86,-87,-73,-74,-45,-46,251,251,251,251,251,251,-133,-134,-135,-126,-127,-119,-120,-121,-82,-68,-69,-55,251,251,251,251,251,251,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,251,251,251,251,251,-47,-283,-285,-284,-286,-285,-286,]),'URSHIFT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,281,295,297,298,303,304,305,307,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,344,345,349,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,190,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,252,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,252,-98,-86,-87,-73,-74,-45,-46,252,252,252,252,252,252,-133,-134,-135,-126,-127,-119,-120,-121,-82,-68,-69,-55,252,252,252,252,252,252,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,252,252,252,252,252,-47,-283,-285,-284,-286,-285,-286,]),'LT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,280,281,295,297,298,303,304,305,307,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,344,345,349,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,448,449,450,451,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,182,-149,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,244,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,395,-143,-98,-86,-87,-73,-74,-45,-46,244,244,244,244,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,-82,-68,-69,-55,244,244,244,244,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,244,244,244,244,-144,-145,-146,-147,-148,-47,-283,-285,-284,-286,-285,-286,]),'GT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,280,281,295,297,298,303,304,305,307,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,344,345,349,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,448,449,450,451,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,183,-149,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,245,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,396,-143,-98,-86,-87,-73,-74,-45,-46,245,245,245,245,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,-82,-68,-69,-55,245,245,245,245,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,245,245,245,245,-144,-145,-146,-147,-148,-47,-283,-285,-284,-286,-285,-286,]),'LE':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,280,281,295,297,298,303,304,305,307,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,344,345,349,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,448,449,450,451,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,184,-149,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,246,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,397,-143,-98,-86,-87,-73,-74,-45,-46,246,246,246,246,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,-82,-68,-69,-55,246,246,246,246,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,246,246,246,246,-144,-145,-146,-147,-148,-47,-283,-285,-284,-286,-285,-286,]),'GE':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,280,281,295,297,298,303,304,305,307,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,344,345,349,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,448,449,450,451,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,185,-149,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,247,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,398,-143,-98,-86,-87,-73,-74,-45,-46,247,247,247,247,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,-82,-68,-69,-55,247,247,247,247,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,247,247,247,247,-144,-145,-146,-147,-148,-47,-283,-285,-284,-286,-285,-286,]),'INSTANCEOF':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,280,281,295,297,298,303,304,305,307,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,344,345,349,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,448,449,450,451,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,186,-149,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,248,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,399,-143,-98,-86,-87,-73,-74,-45,-46,248,248,248,248,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,-82,-68,-69,-55,248,248,248,248,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,248,248,248,248,-144,-145,-146,-147,-148,-47,-283,-285,-284,-286,-285,-286,]),'IN':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,273,274,275,276,277,278,279,280,281,295,297,298,303,304,305,307,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,344,345,349,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,380,406,407,409,418,419,422,436,439,440,443,444,445,446,447,448,449,450,451,452,453,454,455,456,463,467,482,491,493,506,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,187,-149,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,249,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,382,-209,-203,-197,-191,-185,-179,-173,-161,-143,-98,-86,-87,-73,-74,-45,-46,249,249,249,249,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,-82,-68,-69,-55,249,249,249,249,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,435,-85,-88,-72,-81,-67,-56,481,-95,-210,-198,-192,-186,-180,-174,249,249,249,249,-144,-145,-146,-147,-148,-47,-283,-241,-285,-284,-204,-286,-285,-286,]),'EQEQ':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,113,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,279,280,281,295,297,298,303,304,305,307,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,344,345,349,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,447,448,449,450,451,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,178,-33,-31,-32,-34,-35,-36,-166,-149,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,240,-156,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,391,-161,-143,-98,-86,-87,-73,-74,-45,-46,178,-167,-168,-169,-170,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,-82,-68,-69,-55,240,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,391,-162,-163,-164,-165,-144,-145,-146,-147,-148,-47,-283,-285,-284,-286,-285,-286,]),'NE':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,113,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,279,280,281,295,297,298,303,304,305,307,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,344,345,349,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,447,448,449,450,451,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,179,-33,-31,-32,-34,-35,-36,-166,-149,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,241,-156,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,392,-161,-143,-98,-86,-87,-73,-74,-45,-46,179,-167,-168,-169,-170,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,-82,-68,-69,-55,241,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,392,-162,-163,-164,-165,-144,-145,-146,-147,-148,-47,-283,-285,-284,-286,-285,-286,]),'STREQ':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,113,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,279,280,281,295,297,298,303,304,305,307,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,344,345,349,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,447,448,449,450,451,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,180,-33,-31,-32,-34,-35,-36,-166,-149,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,242,-156,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,393,-161,-143,-98,-86,-87,-73,-74,-45,-46,180,-167,-168,-169,-170,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,-82,-68,-69,-55,242,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,393,-162,-163,-164,-165,-144,-145,-146,-147,-148,-47,-283,-285,-284,-286,-285,-286,]),'STRNEQ':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,113,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,279,280,281,295,297,298,303,304,305,307,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,344,345,349,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,447,448,449,450,451,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,-26,-27,-28,-29,-30,181,-33,-31,-32,-34,-35,-36,-166,-149,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,243,-156,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,394,-161,-143,-98,-86,-87,-73,-74,-45,-46,181,-167,-168,-169,-170,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,-82,-68,-69,-55,243,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,394,-162,-163,-164,-165,-144,-145,-146,-147,-148,-47,-283,-285,-284,-286,-285,-286,]),'BAND':([24,43,45,47,48,50,54,55,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,108,109,112,113,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,278,279,280,281,295,297,298,303,304,305,307,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,344,345,347,349,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,446,447,448,449,450,451,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,-41,-42,-43,177,-26,-27,-28,-29,-30,-175,-33,-31,-32,-34,-35,-36,-166,-149,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,-38,-39,239,-171,-156,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,390,-173,-161,-143,-98,-86,-87,-73,-74,-45,-46,177,-176,-167,-168,-169,-170,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,-82,-68,-69,239,-55,-172,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,390,-174,-162,-163,-164,-165,-144,-145,-146,-147,-148,-47,-283,-285,-284,-286,-285,-286,]),'BXOR':([24,43,45,47,48,50,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,105,106,107,108,109,112,113,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,277,278,279,280,281,295,297,298,303,304,305,307,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,344,345,346,347,349,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,445,446,447,448,449,450,451,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,-70,-71,176,-41,-42,-43,-181,-26,-27,-28,-29,-30,-175,-33,-31,-32,-34,-35,-36,-166,-149,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,-65,-66,228,-38,-39,-177,-171,-156,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,389,-179,-173,-161,-143,-98,-86,-87,-73,-74,-45,-46,176,-182,-176,-167,-168,-169,-170,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,-82,-68,-69,228,-178,-55,-172,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,389,-180,-174,-162,-163,-164,-165,-144,-145,-146,-147,-148,-47,-283,-285,-284,-286,-285,-286,]),'BOR':([24,43,45,47,48,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,276,277,278,279,280,281,295,297,298,301,303,304,305,307,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,341,342,344,345,346,347,349,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,444,445,446,447,448,449,450,451,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,-77,175,-70,-71,-187,-41,-42,-43,-181,-26,-27,-28,-29,-30,-175,-33,-31,-32,-34,-35,-36,-166,-149,-132,-125,-118,-103,-104,-95,-91,-92,-75,-40,227,-65,-66,-183,-38,-39,-177,-171,-156,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,388,-185,-179,-173,-161,-143,-98,-86,-87,175,-73,-74,-45,-46,-188,-182,-176,-167,-168,-169,-170,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,-82,227,-68,-69,-184,-178,-55,-172,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,388,-186,-180,-174,-162,-163,-164,-165,-144,-145,-146,-147,-148,-47,-283,-285,-284,-286,-285,-286,]),'AND':([24,43,45,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,275,276,277,278,279,280,281,294,295,297,298,301,303,304,305,307,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,339,341,342,344,345,346,347,349,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,443,444,445,446,447,448,449,450,451,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,-93,-94,164,-77,-193,-70,-71,-187,-41,-42,-43,-181,-26,-27,-28,-29,-30,-175,-33,-31,-32,-34,-35,-36,-166,-149,-132,-125,-118,-103,-104,-95,-91,-92,221,-75,-40,-189,-65,-66,-183,-38,-39,-177,-171,-156,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,387,-191,-185,-179,-173,-161,-143,164,-98,-86,-87,-194,-73,-74,-45,-46,-188,-182,-176,-167,-168,-169,-170,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,221,-82,-190,-68,-69,-184,-178,-55,-172,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,387,-192,-186,-180,-174,-162,-163,-164,-165,-144,-145,-146,-147,-148,-47,-283,-285,-284,-286,-285,-286,]),'CONDOP':([24,43,45,46,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,97,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,274,275,276,277,278,279,280,281,294,295,297,298,301,303,304,305,307,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,339,341,342,344,345,346,347,349,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,443,444,445,446,447,448,449,450,451,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,158,-93,-94,-199,-77,-193,-70,-71,-187,-41,-42,-43,-181,-26,-27,-28,-29,-30,-175,-33,-31,-32,-34,-35,-36,-166,-149,-132,-125,-118,-103,-104,-95,216,-91,-92,-195,-75,-40,-189,-65,-66,-183,-38,-39,-177,-171,-156,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,385,-197,-191,-185,-179,-173,-161,-143,-200,-98,-86,-87,-194,-73,-74,-45,-46,-188,-182,-176,-167,-168,-169,-170,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,-196,-82,-190,-68,-69,-184,-178,-55,-172,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,-198,-192,-186,-180,-174,-162,-163,-164,-165,-144,-145,-146,-147,-148,-47,-283,-285,-284,-286,-285,-286,]),'OR':([24,43,45,46,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,97,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,144,145,160,165,168,169,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,269,274,275,276,277,278,279,280,281,294,295,297,298,301,303,304,305,307,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,339,341,342,344,345,346,347,349,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,406,407,409,418,419,422,439,443,444,445,446,447,448,449,450,451,452,453,454,455,456,463,467,491,493,513,514,525,],[-40,-37,-98,159,-93,-94,-199,-77,-193,-70,-71,-187,-41,-42,-43,-181,-26,-27,-28,-29,-30,-175,-33,-31,-32,-34,-35,-36,-166,-149,-132,-125,-118,-103,-104,-95,217,-91,-92,-195,-75,-40,-189,-65,-66,-183,-38,-39,-177,-171,-156,-136,-128,-122,-114,-101,-102,-99,-100,-84,-83,-78,-75,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,-95,386,-197,-191,-185,-179,-173,-161,-143,-200,-98,-86,-87,-194,-73,-74,-45,-46,-188,-182,-176,-167,-168,-169,-170,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,-196,-82,-190,-68,-69,-184,-178,-55,-172,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-85,-88,-72,-81,-67,-56,-95,-198,-192,-186,-180,-174,-162,-163,-164,-165,-144,-145,-146,-147,-148,-47,-283,-285,-284,-286,-285,-286,]),'COMMA':([24,29,42,43,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,93,94,95,96,97,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,122,123,124,137,140,144,145,160,165,168,169,171,172,174,196,197,198,199,200,201,202,203,204,205,208,209,211,214,215,218,222,225,226,230,231,232,261,263,264,266,269,271,272,273,274,275,276,277,278,279,280,281,285,286,292,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,332,336,337,339,340,341,342,343,344,345,346,347,349,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,379,380,381,406,407,409,416,418,419,421,422,423,424,428,432,436,438,439,440,441,443,444,445,446,447,448,449,450,451,452,453,454,455,456,461,462,463,464,467,469,473,478,479,480,482,491,493,502,504,506,511,513,514,525,526,534,],[-40,126,-229,-37,-211,-98,-205,-93,-94,-199,-77,172,-193,-70,-71,-187,-41,-42,-43,-181,-26,-27,-28,-29,-30,-175,-33,-31,-32,-34,-35,-36,-166,-149,-132,-125,-118,-103,-104,212,-225,-207,-95,-201,-91,-92,-195,-75,-40,-189,-65,-66,-183,-38,-39,-177,-171,-156,-136,-128,-122,-114,-101,-102,260,-232,-236,212,212,-99,-100,-84,-83,-78,-75,308,-52,309,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,335,-287,-44,-96,-97,-80,-79,-76,-75,-54,350,-57,-237,-230,212,212,-95,384,-227,-209,-203,-197,-191,-185,-179,-173,-161,-143,212,212,-212,-200,-98,212,-86,-87,408,-89,-194,212,-73,-74,-45,-48,-46,172,-53,-188,-182,-176,-167,-168,-169,-170,-150,-151,-152,-153,-154,-155,-133,-134,-135,-126,-127,-119,-120,-121,335,-226,-208,-196,212,-82,-190,212,-68,-69,-184,-178,-55,-172,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-233,-240,434,-238,-234,-85,-88,-72,-288,-81,-67,335,-56,-58,-59,212,212,-239,212,-95,-210,-228,-198,-192,-186,-180,-174,-162,-163,-164,-165,-144,-145,-146,-147,-148,-206,-90,-47,-49,-283,-202,335,-235,-238,212,-241,-285,-284,-239,212,-204,212,-286,-285,-286,-60,-61,]),'RPAREN':([43,57,58,59,61,62,63,64,65,67,68,69,70,71,72,91,93,94,95,96,97,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,163,196,197,198,199,200,201,202,203,204,205,206,208,209,211,214,215,218,222,225,226,230,264,266,285,286,298,299,300,305,307,332,336,337,339,341,342,344,345,346,347,348,349,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,407,416,418,419,421,422,425,428,431,432,438,460,462,463,467,469,473,476,480,493,500,501,504,514,519,525,],[-37,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,207,211,-225,-207,-95,-201,-91,-92,-195,-75,-40,-189,-65,-66,-183,-38,-39,-177,-171,-156,-136,-128,-122,-114,-101,-102,298,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,331,334,-287,-44,-96,-97,-80,-79,-76,-75,-54,375,377,400,401,-87,407,-89,-45,-46,412,-226,-208,-196,-82,-190,-68,-69,-184,-178,420,-55,-172,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-88,-288,-81,-67,471,-56,472,475,-253,-254,483,490,-90,-47,-283,-202,497,-1,503,-284,518,-1,521,-285,529,-286,]),'RBRACKET':([43,52,57,58,59,61,62,63,64,65,67,68,69,70,71,72,94,95,96,97,98,99,100,101,103,104,105,106,107,108,109,112,113,114,115,116,117,118,119,120,170,171,172,173,174,196,197,198,199,200,201,202,203,204,205,211,214,215,218,222,225,226,230,296,298,302,305,306,307,308,309,336,337,339,340,341,342,343,344,345,346,347,349,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,407,410,418,419,422,463,464,467,469,493,514,525,],[-37,-1,-41,-42,-43,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,-225,-207,-95,-201,-91,-92,-195,-75,-40,-189,-65,-66,-183,-38,-39,-177,-171,-156,-136,-128,-122,-114,-101,-102,305,307,-52,-50,-51,-110,-95,-111,-108,-109,-105,-106,-107,-112,-113,-44,-96,-97,-80,-79,-76,-75,-54,406,-87,409,-45,-48,-46,-1,-53,-226,-208,-196,418,-82,-190,419,-68,-69,-184,-178,-55,-172,-157,-158,-159,-160,-137,-138,-139,-140,-141,-142,-129,-130,-131,-123,-124,-115,-116,-117,-88,463,-81,-67,-56,-47,-49,-283,-202,-284,-285,-286,]),'GETPROP':([111,350,],[234,234,]),'SETPROP':([111,350,],[235,235,]),'CATCH':([141,258,],[290,-25,]),'FINALLY':([141,258,288,512,],[291,-25,291,-278,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'source_elements':([0,26,344,422,426,477,481,506,507,529,535,536,],[2,121,425,425,425,425,425,425,425,425,544,545,]),'empty':([0,26,52,133,319,344,389,422,426,444,470,477,481,487,506,507,513,520,529,535,536,],[3,3,179,277,179,3,442,3,3,442,497,3,3,442,3,3,442,497,3,3,3,]),'source_element_list':([0,26,344,422,426,477,481,506,507,529,535,536,],[4,4,4,4,4,4,4,4,4,4,4,4,]),'source_element':([0,4,26,344,422,426,477,481,506,507,529,535,536,],[5,89,5,5,5,5,5,5,5,5,5,5,5,]),'statement':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[6,6,6,130,216,6,438,440,468,6,6,6,6,509,517,6,6,532,6,540,542,6,6,547,]),'function_declaration':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[7,7,7,131,131,7,131,131,131,7,7,7,7,131,131,7,7,131,7,131,131,7,7,131,]),'block':([0,4,26,31,40,92,302,344,386,388,411,422,426,477,481,485,494,501,506,507,515,529,530,533,535,536,541,],[8,8,8,8,146,8,415,8,8,8,8,8,8,8,8,8,8,524,8,8,8,8,8,8,8,8,8,]),'variable_statement':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'empty_statement':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'expr_statement':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'if_statement':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'iteration_statement':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'continue_statement':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'break_statement':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'return_statement':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'with_statement':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'switch_statement':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'labelled_statement':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'throw_statement':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'try_statement':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'debugger_statement':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'identifier':([0,4,23,25,26,27,31,34,35,36,39,51,77,78,82,83,84,85,86,87,88,91,92,102,110,111,127,129,132,133,143,144,149,164,165,167,168,169,170,172,173,176,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,212,218,219,222,223,225,226,227,229,230,233,234,240,241,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,267,269,275,344,346,359,361,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,414,416,419,421,422,426,428,437,444,445,446,448,477,481,485,487,492,494,495,500,506,507,513,515,529,530,533,535,536,541,],[24,24,90,103,24,124,24,136,139,103,103,103,103,103,103,103,103,103,103,103,103,215,24,103,235,242,103,103,103,103,103,103,103,103,103,103,308,103,103,103,314,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,215,103,103,103,103,103,352,103,103,355,103,103,242,242,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,124,103,391,24,427,215,242,103,24,103,24,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,24,471,103,103,103,24,24,103,215,103,490,103,103,24,24,24,103,103,24,103,103,24,24,103,24,24,24,24,24,24,24,]),'expr_nobf':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'assignment_expr_nobf':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'conditional_expr_nobf':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'left_hand_side_expr_nobf':([0,4,26,31,92,165,170,181,182,183,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[45,45,45,45,45,306,306,306,306,306,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'logical_or_expr_nobf':([0,4,26,31,92,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'new_expr_nobf':([0,4,26,31,92,165,170,181,182,183,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'call_expr_nobf':([0,4,26,31,92,165,170,181,182,183,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'logical_and_expr_nobf':([0,4,26,31,92,165,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[49,49,49,49,49,305,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'member_expr_nobf':([0,4,26,31,92,165,170,181,182,183,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'bitwise_or_expr_nobf':([0,4,26,31,92,165,170,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[53,53,53,53,53,53,312,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'primary_expr_no_brace':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,127,129,132,133,143,144,149,164,165,167,169,170,172,176,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,416,419,421,422,426,428,444,446,448,477,481,485,487,492,494,495,500,506,507,513,515,529,530,533,535,536,541,],[54,54,108,54,54,108,108,108,108,108,108,108,108,108,108,108,108,54,108,108,108,108,108,108,108,108,108,54,108,108,54,108,108,54,54,54,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,54,108,54,108,54,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,54,108,108,108,54,54,108,108,108,108,54,54,54,108,108,54,108,108,54,54,108,54,54,54,54,54,54,54,]),'function_expr':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,127,129,132,133,143,144,149,164,165,167,169,170,172,176,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,416,419,421,422,426,428,444,446,448,477,481,485,487,492,494,495,500,506,507,513,515,529,530,533,535,536,541,],[55,55,106,55,55,106,106,106,106,106,106,106,106,106,106,106,106,55,106,106,106,106,106,106,106,106,106,55,106,106,55,106,106,55,55,55,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,55,106,55,106,55,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,55,106,106,106,55,55,106,106,106,106,55,55,55,106,106,55,106,106,55,55,106,55,55,55,55,55,55,55,]),'bitwise_xor_expr_nobf':([0,4,26,31,92,165,170,181,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[56,56,56,56,56,56,56,321,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,127,129,132,133,143,144,149,164,165,167,169,170,172,176,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,416,419,421,422,426,428,444,446,448,477,481,485,487,492,494,495,500,506,507,513,515,529,530,533,535,536,541,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'array_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,127,129,132,133,143,144,149,164,165,167,169,170,172,176,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,416,419,421,422,426,428,444,446,448,477,481,485,487,492,494,495,500,506,507,513,515,529,530,533,535,536,541,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'bitwise_and_expr_nobf':([0,4,26,31,92,165,170,181,182,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[60,60,60,60,60,60,60,60,322,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'null_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,127,129,132,133,143,144,149,164,165,167,169,170,172,176,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,416,419,421,422,426,428,444,446,448,477,481,485,487,492,494,495,500,506,507,513,515,529,530,533,535,536,541,],[61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'boolean_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,127,129,132,133,143,144,149,164,165,167,169,170,172,176,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,416,419,421,422,426,428,444,446,448,477,481,485,487,492,494,495,500,506,507,513,515,529,530,533,535,536,541,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'numeric_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,111,127,129,132,133,143,144,149,164,165,167,169,170,172,176,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,240,241,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,344,361,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,416,419,421,422,426,428,444,446,448,477,481,485,487,492,494,495,500,506,507,513,515,529,530,533,535,536,541,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,244,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,244,244,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,244,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'string_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,111,127,129,132,133,143,144,149,164,165,167,169,170,172,176,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,240,241,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,344,361,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,416,419,421,422,426,428,444,446,448,477,481,485,487,492,494,495,500,506,507,513,515,529,530,533,535,536,541,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,243,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,243,243,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,243,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'regex_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,127,129,132,133,143,144,149,164,165,167,169,170,172,176,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,416,419,421,422,426,428,444,446,448,477,481,485,487,492,494,495,500,506,507,513,515,529,530,533,535,536,541,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'equality_expr_nobf':([0,4,26,31,92,165,170,181,182,183,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[66,66,66,66,66,66,66,66,66,323,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'relational_expr_nobf':([0,4,26,31,92,165,170,181,182,183,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,]),'shift_expr_nobf':([0,4,26,31,92,165,170,181,182,183,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,]),'additive_expr_nobf':([0,4,26,31,92,165,170,181,182,183,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'multiplicative_expr_nobf':([0,4,26,31,92,165,170,181,182,183,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'unary_expr_nobf':([0,4,26,31,92,165,170,181,182,183,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'postfix_expr_nobf':([0,4,26,31,92,165,170,181,182,183,344,386,388,411,422,426,477,481,485,494,506,507,515,529,530,533,535,536,541,],[80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,]),'unary_expr_common':([0,4,25,26,31,36,39,77,78,82,83,84,85,86,87,88,92,127,129,132,133,143,144,149,164,165,167,169,170,172,176,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,344,362,386,387,388,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,416,419,421,422,426,428,444,446,448,477,481,485,487,492,494,495,500,506,507,513,515,529,530,533,535,536,541,],[81,81,120,81,81,120,120,120,120,120,120,120,120,120,120,120,81,120,120,120,120,120,120,120,120,81,120,120,81,120,120,81,81,81,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,81,120,81,120,81,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,81,120,120,120,81,81,120,120,120,120,81,81,81,120,120,81,120,120,81,81,120,81,81,81,81,81,81,81,]),'expr':([25,36,39,129,132,143,144,167,172,225,229,387,389,393,444,446,487,492,500,513,],[93,142,145,271,273,295,296,307,313,351,354,439,443,449,443,491,443,516,523,443,]),'assignment_expr':([25,36,39,127,129,132,143,144,149,164,167,169,172,176,218,219,222,225,229,269,362,387,389,393,416,419,421,428,444,446,487,492,500,513,],[94,94,94,270,94,94,94,94,303,304,94,311,94,317,347,348,349,94,94,385,435,94,94,94,472,473,475,480,94,94,94,94,94,94,]),'conditional_expr':([25,36,39,127,129,132,143,144,149,164,167,169,172,176,218,219,222,225,229,269,362,387,389,393,416,419,421,428,444,446,487,492,500,513,],[95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,]),'left_hand_side_expr':([25,36,39,77,78,82,83,84,85,86,87,88,127,129,132,133,143,144,149,164,167,169,172,176,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,362,387,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,416,419,421,428,444,446,448,487,492,495,500,513,],[96,96,96,203,203,203,203,203,203,203,203,203,96,96,96,276,96,96,96,96,96,96,96,96,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,96,96,96,203,96,203,96,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,96,96,96,96,96,450,450,450,203,203,203,203,203,203,203,203,203,203,203,203,203,203,96,96,96,96,96,96,450,96,96,450,96,96,]),'logical_or_expr':([25,36,39,127,129,132,143,144,149,164,167,169,172,176,218,219,222,225,229,269,362,387,389,393,416,419,421,428,444,446,487,492,500,513,],[97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,]),'new_expr':([25,36,39,51,77,78,82,83,84,85,86,87,88,102,127,129,132,133,143,144,149,164,167,169,172,176,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,362,387,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,416,419,421,428,444,446,448,487,492,495,500,513,],[98,98,98,174,98,98,98,98,98,98,98,98,98,231,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,]),'call_expr':([25,36,39,77,78,82,83,84,85,86,87,88,127,129,132,133,143,144,149,164,167,169,172,176,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,362,387,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,416,419,421,428,444,446,448,487,492,495,500,513,],[99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,]),'logical_and_expr':([25,36,39,127,129,132,143,144,149,164,167,169,172,176,218,219,222,223,225,229,269,362,387,389,393,416,419,421,428,444,446,487,492,500,513,],[100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,350,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,]),'member_expr':([25,36,39,51,77,78,82,83,84,85,86,87,88,102,127,129,132,133,143,144,149,164,167,169,172,176,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,362,387,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,416,419,421,428,444,446,448,487,492,495,500,513,],[101,101,101,175,101,101,101,101,101,101,101,101,101,232,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,]),'bitwise_or_expr':([25,36,39,127,129,132,143,144,149,164,167,169,172,176,218,219,222,223,225,227,229,269,362,387,389,393,416,419,421,428,444,446,487,492,500,513,],[104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,353,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,]),'primary_expr':([25,36,39,51,77,78,82,83,84,85,86,87,88,102,127,129,132,133,143,144,149,164,167,169,172,176,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,362,387,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,416,419,421,428,444,446,448,487,492,495,500,513,],[105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,]),'bitwise_xor_expr':([25,36,39,127,129,132,143,144,149,164,167,169,172,176,218,219,222,223,225,227,229,233,269,362,387,389,393,416,419,421,428,444,446,487,492,500,513,],[107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,357,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,]),'object_literal':([25,36,39,51,77,78,82,83,84,85,86,87,88,102,127,129,132,133,143,144,149,164,167,169,172,176,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,362,387,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,416,419,421,428,444,446,448,487,492,495,500,513,],[109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,]),'bitwise_and_expr':([25,36,39,127,129,132,143,144,149,164,167,169,172,176,218,219,222,223,225,227,229,233,234,269,362,387,389,393,416,419,421,428,444,446,487,492,500,513,],[112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,358,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,]),'equality_expr':([25,36,39,127,129,132,143,144,149,164,167,169,172,176,218,219,222,223,225,227,229,233,234,245,269,362,387,389,393,416,419,421,428,444,446,487,492,500,513,],[113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,365,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,]),'relational_expr':([25,36,39,127,129,132,143,144,149,164,167,169,172,176,184,185,186,187,218,219,222,223,225,227,229,233,234,245,246,247,248,249,269,362,387,389,393,402,403,404,405,416,419,421,428,444,446,487,492,500,513,],[114,114,114,114,114,114,114,114,114,114,114,114,114,114,324,325,326,327,114,114,114,114,114,114,114,114,114,114,366,367,368,369,114,114,114,114,114,459,460,461,462,114,114,114,114,114,114,114,114,114,114,]),'shift_expr':([25,36,39,127,129,132,133,143,144,149,164,167,169,172,176,184,185,186,187,188,189,190,191,192,193,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,269,362,387,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,416,419,421,428,444,446,448,487,492,495,500,513,],[115,115,115,115,115,115,288,115,115,115,115,115,115,115,115,115,115,115,115,328,329,330,331,332,333,115,115,115,115,115,115,115,115,115,115,115,115,115,115,370,371,372,373,374,375,115,115,115,115,115,288,288,288,288,288,288,288,288,115,115,115,115,463,464,465,466,467,115,115,115,115,115,115,288,115,115,288,115,115,]),'additive_expr':([25,36,39,127,129,132,133,143,144,149,164,167,169,172,176,184,185,186,187,188,189,190,191,192,193,194,195,196,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,269,362,387,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,416,419,421,428,444,446,448,487,492,495,500,513,],[116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,334,335,336,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,376,377,378,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,]),'multiplicative_expr':([25,36,39,127,129,132,133,143,144,149,164,167,169,172,176,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,269,362,387,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,416,419,421,428,444,446,448,487,492,495,500,513,],[117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,337,338,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,379,380,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,]),'unary_expr':([25,36,39,77,78,82,83,84,85,86,87,88,127,129,132,133,143,144,149,164,167,169,172,176,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,362,387,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,416,419,421,428,444,446,448,487,492,495,500,513,],[118,118,118,202,204,205,206,207,208,209,210,211,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,339,340,341,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,381,382,383,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,]),'postfix_expr':([25,36,39,77,78,82,83,84,85,86,87,88,127,129,132,133,143,144,149,164,167,169,172,176,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,218,219,222,223,225,227,229,233,234,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,269,362,387,389,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,416,419,421,428,444,446,448,487,492,495,500,513,],[119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,]),'variable_declaration_list':([27,],[122,]),'variable_declaration':([27,267,],[123,384,]),'auto_semi':([29,34,35,36,41,122,136,139,142,145,486,],[126,135,138,141,148,266,290,292,294,298,511,]),'assignment_operator':([45,96,276,450,],[149,219,394,394,]),'arguments':([48,50,99,101,175,232,],[166,171,224,228,315,356,]),'elision_opt':([52,319,],[176,421,]),'element_list':([52,],[177,]),'elision':([52,319,],[180,180,]),'formal_parameter_list':([91,212,359,437,],[214,343,432,484,]),'property_list':([111,],[237,]),'property_assignment':([111,361,],[238,434,]),'property_name':([111,240,241,361,],[239,363,364,239,]),'initializer':([124,],[268,]),'expr_noin_opt':([133,],[274,]),'expr_noin':([133,],[278,]),'assignment_expr_noin':([133,394,395,396,448,495,],[279,451,452,453,493,518,]),'conditional_expr_noin':([133,394,395,396,448,495,],[280,280,280,280,280,280,]),'logical_or_expr_noin':([133,394,395,396,448,495,],[281,281,281,281,281,281,]),'logical_and_expr_noin':([133,394,395,396,397,448,495,],[282,282,282,282,454,282,282,]),'bitwise_or_expr_noin':([133,394,395,396,397,398,448,495,],[283,283,283,283,283,455,283,283,]),'bitwise_xor_expr_noin':([133,394,395,396,397,398,399,448,495,],[284,284,284,284,284,284,456,284,284,]),'bitwise_and_expr_noin':([133,394,395,396,397,398,399,400,448,495,],[285,285,285,285,285,285,285,457,285,285,]),'equality_expr_noin':([133,394,395,396,397,398,399,400,401,448,495,],[286,286,286,286,286,286,286,286,458,286,286,]),'relational_expr_noin':([133,394,395,396,397,398,399,400,401,448,495,],[287,287,287,287,287,287,287,287,287,287,287,]),'catch':([146,],[299,]),'finally':([146,299,],[300,413,]),'argument_list':([169,],[310,]),'variable_declaration_list_noin':([275,],[390,]),'variable_declaration_noin':([275,445,],[392,489,]),'function_body':([344,422,426,477,481,506,507,529,],[424,476,479,503,505,527,528,539,]),'expr_opt':([389,444,487,513,],[441,488,512,531,]),'initializer_noin':([391,490,],[447,514,]),'case_block':([412,],[469,]),'case_clauses_opt':([470,520,],[496,534,]),'case_clauses':([470,520,],[498,498,]),'case_clause':([470,498,520,],[499,522,499,]),'default_clause':([496,],[520,]),}
+_lr_goto_items = {'program':([0,],[1,]),'source_elements':([0,26,333,411,415,466,470,495,496,517,523,524,],[2,121,414,414,414,414,414,414,414,414,532,533,]),'empty':([0,26,52,131,308,333,378,411,415,433,459,466,470,476,495,496,501,508,517,523,524,],[3,3,173,270,173,3,431,3,3,431,486,3,3,431,3,3,431,486,3,3,3,]),'source_element_list':([0,26,333,411,415,466,470,495,496,517,523,524,],[4,4,4,4,4,4,4,4,4,4,4,4,]),'source_element':([0,4,26,333,411,415,466,470,495,496,517,523,524,],[5,89,5,5,5,5,5,5,5,5,5,5,5,]),'statement':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[6,6,6,128,210,6,427,429,457,6,6,6,6,498,505,6,6,520,6,528,530,6,6,535,]),'function_declaration':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[7,7,7,129,129,7,129,129,129,7,7,7,7,129,129,7,7,129,7,129,129,7,7,129,]),'block':([0,4,26,31,40,92,291,333,375,377,400,411,415,466,470,474,483,490,495,496,503,517,518,521,523,524,529,],[8,8,8,8,141,8,404,8,8,8,8,8,8,8,8,8,8,512,8,8,8,8,8,8,8,8,8,]),'variable_statement':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'empty_statement':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'expr_statement':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'if_statement':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'iteration_statement':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'continue_statement':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'break_statement':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'return_statement':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'with_statement':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'switch_statement':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'labelled_statement':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'throw_statement':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'try_statement':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'debugger_statement':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'identifier':([0,4,23,25,26,27,31,34,35,36,39,51,77,78,82,83,84,85,86,87,88,91,92,102,110,111,126,127,130,131,138,139,143,158,159,161,162,163,164,166,167,170,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,206,212,213,216,217,219,220,221,223,224,227,228,234,235,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,260,262,268,333,335,348,350,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,403,405,408,410,411,415,417,426,433,434,435,437,466,470,474,476,481,483,484,489,495,496,501,503,517,518,521,523,524,529,],[24,24,90,103,24,124,24,133,135,103,103,103,103,103,103,103,103,103,103,103,103,209,24,103,229,236,103,103,103,103,103,103,103,103,103,103,297,103,103,103,303,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,209,103,103,103,103,103,341,103,103,344,103,103,236,236,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,124,103,380,24,416,209,236,103,24,103,24,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,24,460,103,103,103,24,24,103,209,103,479,103,103,24,24,24,103,103,24,103,103,24,24,103,24,24,24,24,24,24,24,]),'expr_nobf':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'assignment_expr_nobf':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'conditional_expr_nobf':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'left_hand_side_expr_nobf':([0,4,26,31,92,159,164,175,176,177,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[45,45,45,45,45,295,295,295,295,295,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'logical_or_expr_nobf':([0,4,26,31,92,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'new_expr_nobf':([0,4,26,31,92,159,164,175,176,177,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'call_expr_nobf':([0,4,26,31,92,159,164,175,176,177,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'logical_and_expr_nobf':([0,4,26,31,92,159,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[49,49,49,49,49,294,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'member_expr_nobf':([0,4,26,31,92,159,164,175,176,177,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'bitwise_or_expr_nobf':([0,4,26,31,92,159,164,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[53,53,53,53,53,53,301,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'primary_expr_no_brace':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,126,127,130,131,138,139,143,158,159,161,163,164,166,170,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,405,408,410,411,415,417,433,435,437,466,470,474,476,481,483,484,489,495,496,501,503,517,518,521,523,524,529,],[54,54,108,54,54,108,108,108,108,108,108,108,108,108,108,108,108,54,108,108,108,108,108,108,108,108,108,54,108,108,54,108,108,54,54,54,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,54,108,54,108,54,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,54,108,108,108,54,54,108,108,108,108,54,54,54,108,108,54,108,108,54,54,108,54,54,54,54,54,54,54,]),'function_expr':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,126,127,130,131,138,139,143,158,159,161,163,164,166,170,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,405,408,410,411,415,417,433,435,437,466,470,474,476,481,483,484,489,495,496,501,503,517,518,521,523,524,529,],[55,55,106,55,55,106,106,106,106,106,106,106,106,106,106,106,106,55,106,106,106,106,106,106,106,106,106,55,106,106,55,106,106,55,55,55,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,55,106,55,106,55,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,55,106,106,106,55,55,106,106,106,106,55,55,55,106,106,55,106,106,55,55,106,55,55,55,55,55,55,55,]),'bitwise_xor_expr_nobf':([0,4,26,31,92,159,164,175,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[56,56,56,56,56,56,56,310,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,126,127,130,131,138,139,143,158,159,161,163,164,166,170,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,405,408,410,411,415,417,433,435,437,466,470,474,476,481,483,484,489,495,496,501,503,517,518,521,523,524,529,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'array_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,126,127,130,131,138,139,143,158,159,161,163,164,166,170,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,405,408,410,411,415,417,433,435,437,466,470,474,476,481,483,484,489,495,496,501,503,517,518,521,523,524,529,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'bitwise_and_expr_nobf':([0,4,26,31,92,159,164,175,176,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[60,60,60,60,60,60,60,60,311,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'null_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,126,127,130,131,138,139,143,158,159,161,163,164,166,170,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,405,408,410,411,415,417,433,435,437,466,470,474,476,481,483,484,489,495,496,501,503,517,518,521,523,524,529,],[61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'boolean_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,126,127,130,131,138,139,143,158,159,161,163,164,166,170,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,405,408,410,411,415,417,433,435,437,466,470,474,476,481,483,484,489,495,496,501,503,517,518,521,523,524,529,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'numeric_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,111,126,127,130,131,138,139,143,158,159,161,163,164,166,170,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,234,235,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,333,350,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,405,408,410,411,415,417,433,435,437,466,470,474,476,481,483,484,489,495,496,501,503,517,518,521,523,524,529,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,238,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,238,238,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,238,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'string_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,111,126,127,130,131,138,139,143,158,159,161,163,164,166,170,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,234,235,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,333,350,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,405,408,410,411,415,417,433,435,437,466,470,474,476,481,483,484,489,495,496,501,503,517,518,521,523,524,529,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,237,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,237,237,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,237,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'regex_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,126,127,130,131,138,139,143,158,159,161,163,164,166,170,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,405,408,410,411,415,417,433,435,437,466,470,474,476,481,483,484,489,495,496,501,503,517,518,521,523,524,529,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'equality_expr_nobf':([0,4,26,31,92,159,164,175,176,177,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[66,66,66,66,66,66,66,66,66,312,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'relational_expr_nobf':([0,4,26,31,92,159,164,175,176,177,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,]),'shift_expr_nobf':([0,4,26,31,92,159,164,175,176,177,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,]),'additive_expr_nobf':([0,4,26,31,92,159,164,175,176,177,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'multiplicative_expr_nobf':([0,4,26,31,92,159,164,175,176,177,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'unary_expr_nobf':([0,4,26,31,92,159,164,175,176,177,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'postfix_expr_nobf':([0,4,26,31,92,159,164,175,176,177,333,375,377,400,411,415,466,470,474,483,495,496,503,517,518,521,523,524,529,],[80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,]),'unary_expr_common':([0,4,25,26,31,36,39,77,78,82,83,84,85,86,87,88,92,126,127,130,131,138,139,143,158,159,161,163,164,166,170,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,333,351,375,376,377,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,405,408,410,411,415,417,433,435,437,466,470,474,476,481,483,484,489,495,496,501,503,517,518,521,523,524,529,],[81,81,120,81,81,120,120,120,120,120,120,120,120,120,120,120,81,120,120,120,120,120,120,120,120,81,120,120,81,120,120,81,81,81,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,81,120,81,120,81,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,81,120,120,120,81,81,120,120,120,120,81,81,81,120,120,81,120,120,81,81,120,81,81,81,81,81,81,81,]),'expr':([25,36,39,127,130,138,139,161,166,219,223,376,378,382,433,435,476,481,489,501,],[93,137,140,264,266,285,286,296,302,340,343,428,432,438,432,480,432,504,511,432,]),'assignment_expr':([25,36,39,126,127,130,138,139,143,158,161,163,166,170,212,213,216,219,223,262,351,376,378,382,405,408,410,417,433,435,476,481,489,501,],[94,94,94,263,94,94,94,94,292,293,94,300,94,306,336,337,338,94,94,374,424,94,94,94,461,462,464,469,94,94,94,94,94,94,]),'conditional_expr':([25,36,39,126,127,130,138,139,143,158,161,163,166,170,212,213,216,219,223,262,351,376,378,382,405,408,410,417,433,435,476,481,489,501,],[95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,]),'left_hand_side_expr':([25,36,39,77,78,82,83,84,85,86,87,88,126,127,130,131,138,139,143,158,161,163,166,170,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,351,376,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,405,408,410,417,433,435,437,476,481,484,489,501,],[96,96,96,197,197,197,197,197,197,197,197,197,96,96,96,269,96,96,96,96,96,96,96,96,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,96,96,96,197,96,197,96,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,96,96,96,96,96,439,439,439,197,197,197,197,197,197,197,197,197,197,197,197,197,197,96,96,96,96,96,96,439,96,96,439,96,96,]),'logical_or_expr':([25,36,39,126,127,130,138,139,143,158,161,163,166,170,212,213,216,219,223,262,351,376,378,382,405,408,410,417,433,435,476,481,489,501,],[97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,]),'new_expr':([25,36,39,51,77,78,82,83,84,85,86,87,88,102,126,127,130,131,138,139,143,158,161,163,166,170,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,351,376,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,405,408,410,417,433,435,437,476,481,484,489,501,],[98,98,98,168,98,98,98,98,98,98,98,98,98,225,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,]),'call_expr':([25,36,39,77,78,82,83,84,85,86,87,88,126,127,130,131,138,139,143,158,161,163,166,170,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,351,376,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,405,408,410,417,433,435,437,476,481,484,489,501,],[99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,]),'logical_and_expr':([25,36,39,126,127,130,138,139,143,158,161,163,166,170,212,213,216,217,219,223,262,351,376,378,382,405,408,410,417,433,435,476,481,489,501,],[100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,339,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,]),'member_expr':([25,36,39,51,77,78,82,83,84,85,86,87,88,102,126,127,130,131,138,139,143,158,161,163,166,170,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,351,376,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,405,408,410,417,433,435,437,476,481,484,489,501,],[101,101,101,169,101,101,101,101,101,101,101,101,101,226,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,]),'bitwise_or_expr':([25,36,39,126,127,130,138,139,143,158,161,163,166,170,212,213,216,217,219,221,223,262,351,376,378,382,405,408,410,417,433,435,476,481,489,501,],[104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,342,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,]),'primary_expr':([25,36,39,51,77,78,82,83,84,85,86,87,88,102,126,127,130,131,138,139,143,158,161,163,166,170,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,351,376,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,405,408,410,417,433,435,437,476,481,484,489,501,],[105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,]),'bitwise_xor_expr':([25,36,39,126,127,130,138,139,143,158,161,163,166,170,212,213,216,217,219,221,223,227,262,351,376,378,382,405,408,410,417,433,435,476,481,489,501,],[107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,346,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,]),'object_literal':([25,36,39,51,77,78,82,83,84,85,86,87,88,102,126,127,130,131,138,139,143,158,161,163,166,170,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,351,376,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,405,408,410,417,433,435,437,476,481,484,489,501,],[109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,]),'bitwise_and_expr':([25,36,39,126,127,130,138,139,143,158,161,163,166,170,212,213,216,217,219,221,223,227,228,262,351,376,378,382,405,408,410,417,433,435,476,481,489,501,],[112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,347,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,]),'equality_expr':([25,36,39,126,127,130,138,139,143,158,161,163,166,170,212,213,216,217,219,221,223,227,228,239,262,351,376,378,382,405,408,410,417,433,435,476,481,489,501,],[113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,354,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,]),'relational_expr':([25,36,39,126,127,130,138,139,143,158,161,163,166,170,178,179,180,181,212,213,216,217,219,221,223,227,228,239,240,241,242,243,262,351,376,378,382,391,392,393,394,405,408,410,417,433,435,476,481,489,501,],[114,114,114,114,114,114,114,114,114,114,114,114,114,114,313,314,315,316,114,114,114,114,114,114,114,114,114,114,355,356,357,358,114,114,114,114,114,448,449,450,451,114,114,114,114,114,114,114,114,114,114,]),'shift_expr':([25,36,39,126,127,130,131,138,139,143,158,161,163,166,170,178,179,180,181,182,183,184,185,186,187,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,262,351,376,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,405,408,410,417,433,435,437,476,481,484,489,501,],[115,115,115,115,115,115,281,115,115,115,115,115,115,115,115,115,115,115,115,317,318,319,320,321,322,115,115,115,115,115,115,115,115,115,115,115,115,115,115,359,360,361,362,363,364,115,115,115,115,115,281,281,281,281,281,281,281,281,115,115,115,115,452,453,454,455,456,115,115,115,115,115,115,281,115,115,281,115,115,]),'additive_expr':([25,36,39,126,127,130,131,138,139,143,158,161,163,166,170,178,179,180,181,182,183,184,185,186,187,188,189,190,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,262,351,376,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,405,408,410,417,433,435,437,476,481,484,489,501,],[116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,323,324,325,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,365,366,367,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,]),'multiplicative_expr':([25,36,39,126,127,130,131,138,139,143,158,161,163,166,170,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,262,351,376,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,405,408,410,417,433,435,437,476,481,484,489,501,],[117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,326,327,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,368,369,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,]),'unary_expr':([25,36,39,77,78,82,83,84,85,86,87,88,126,127,130,131,138,139,143,158,161,163,166,170,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,351,376,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,405,408,410,417,433,435,437,476,481,484,489,501,],[118,118,118,196,198,199,200,201,202,203,204,205,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,328,329,330,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,370,371,372,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,]),'postfix_expr':([25,36,39,77,78,82,83,84,85,86,87,88,126,127,130,131,138,139,143,158,161,163,166,170,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,212,213,216,217,219,221,223,227,228,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,262,351,376,378,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,405,408,410,417,433,435,437,476,481,484,489,501,],[119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,]),'variable_declaration_list':([27,],[122,]),'variable_declaration':([27,260,],[123,373,]),'assignment_operator':([45,96,269,439,],[143,213,383,383,]),'arguments':([48,50,99,101,169,226,],[160,165,218,222,304,345,]),'elision_opt':([52,308,],[170,410,]),'element_list':([52,],[171,]),'elision':([52,308,],[174,174,]),'formal_parameter_list':([91,206,348,426,],[208,332,421,473,]),'property_list':([111,],[231,]),'property_assignment':([111,350,],[232,423,]),'property_name':([111,234,235,350,],[233,352,353,233,]),'initializer':([124,],[261,]),'expr_noin_opt':([131,],[267,]),'expr_noin':([131,],[271,]),'assignment_expr_noin':([131,383,384,385,437,484,],[272,440,441,442,482,506,]),'conditional_expr_noin':([131,383,384,385,437,484,],[273,273,273,273,273,273,]),'logical_or_expr_noin':([131,383,384,385,437,484,],[274,274,274,274,274,274,]),'logical_and_expr_noin':([131,383,384,385,386,437,484,],[275,275,275,275,443,275,275,]),'bitwise_or_expr_noin':([131,383,384,385,386,387,437,484,],[276,276,276,276,276,444,276,276,]),'bitwise_xor_expr_noin':([131,383,384,385,386,387,388,437,484,],[277,277,277,277,277,277,445,277,277,]),'bitwise_and_expr_noin':([131,383,384,385,386,387,388,389,437,484,],[278,278,278,278,278,278,278,446,278,278,]),'equality_expr_noin':([131,383,384,385,386,387,388,389,390,437,484,],[279,279,279,279,279,279,279,279,447,279,279,]),'relational_expr_noin':([131,383,384,385,386,387,388,389,390,437,484,],[280,280,280,280,280,280,280,280,280,280,280,]),'catch':([141,],[288,]),'finally':([141,288,],[289,402,]),'argument_list':([163,],[299,]),'variable_declaration_list_noin':([268,],[379,]),'variable_declaration_noin':([268,434,],[381,478,]),'function_body':([333,411,415,466,470,495,496,517,],[413,465,468,492,494,515,516,527,]),'expr_opt':([378,433,476,501,],[430,477,500,519,]),'initializer_noin':([380,479,],[436,502,]),'case_block':([401,],[458,]),'case_clauses_opt':([459,508,],[485,522,]),'case_clauses':([459,508,],[487,487,]),'case_clause':([459,487,508,],[488,510,488,]),'default_clause':([485,],[508,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,305 +27,293 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',96),
-  ('auto_semi -> error','auto_semi',1,'p_auto_semi','parser.py',100),
-  ('program -> source_elements','program',1,'p_program','parser.py',130),
-  ('source_elements -> empty','source_elements',1,'p_source_elements','parser.py',134),
-  ('source_elements -> source_element_list','source_elements',1,'p_source_elements','parser.py',135),
-  ('source_element_list -> source_element','source_element_list',1,'p_source_element_list','parser.py',140),
-  ('source_element_list -> source_element_list source_element','source_element_list',2,'p_source_element_list','parser.py',141),
-  ('source_element -> statement','source_element',1,'p_source_element','parser.py',150),
-  ('source_element -> function_declaration','source_element',1,'p_source_element','parser.py',151),
-  ('statement -> block','statement',1,'p_statement','parser.py',156),
-  ('statement -> variable_statement','statement',1,'p_statement','parser.py',157),
-  ('statement -> empty_statement','statement',1,'p_statement','parser.py',158),
-  ('statement -> expr_statement','statement',1,'p_statement','parser.py',159),
-  ('statement -> if_statement','statement',1,'p_statement','parser.py',160),
-  ('statement -> iteration_statement','statement',1,'p_statement','parser.py',161),
-  ('statement -> continue_statement','statement',1,'p_statement','parser.py',162),
-  ('statement -> break_statement','statement',1,'p_statement','parser.py',163),
-  ('statement -> return_statement','statement',1,'p_statement','parser.py',164),
-  ('statement -> with_statement','statement',1,'p_statement','parser.py',165),
-  ('statement -> switch_statement','statement',1,'p_statement','parser.py',166),
-  ('statement -> labelled_statement','statement',1,'p_statement','parser.py',167),
-  ('statement -> throw_statement','statement',1,'p_statement','parser.py',168),
-  ('statement -> try_statement','statement',1,'p_statement','parser.py',169),
-  ('statement -> debugger_statement','statement',1,'p_statement','parser.py',170),
-  ('statement -> function_declaration','statement',1,'p_statement','parser.py',171),
-  ('block -> LBRACE source_elements RBRACE','block',3,'p_block','parser.py',178),
-  ('literal -> null_literal','literal',1,'p_literal','parser.py',182),
-  ('literal -> boolean_literal','literal',1,'p_literal','parser.py',183),
-  ('literal -> numeric_literal','literal',1,'p_literal','parser.py',184),
-  ('literal -> string_literal','literal',1,'p_literal','parser.py',185),
-  ('literal -> regex_literal','literal',1,'p_literal','parser.py',186),
-  ('boolean_literal -> TRUE','boolean_literal',1,'p_boolean_literal','parser.py',191),
-  ('boolean_literal -> FALSE','boolean_literal',1,'p_boolean_literal','parser.py',192),
-  ('null_literal -> NULL','null_literal',1,'p_null_literal','parser.py',197),
-  ('numeric_literal -> NUMBER','numeric_literal',1,'p_numeric_literal','parser.py',201),
-  ('string_literal -> STRING','string_literal',1,'p_string_literal','parser.py',205),
-  ('regex_literal -> REGEX','regex_literal',1,'p_regex_literal','parser.py',209),
-  ('identifier -> ID','identifier',1,'p_identifier','parser.py',213),
-  ('primary_expr -> primary_expr_no_brace','primary_expr',1,'p_primary_expr','parser.py',220),
-  ('primary_expr -> object_literal','primary_expr',1,'p_primary_expr','parser.py',221),
-  ('primary_expr_no_brace -> identifier','primary_expr_no_brace',1,'p_primary_expr_no_brace_1','parser.py',226),
-  ('primary_expr_no_brace -> THIS','primary_expr_no_brace',1,'p_primary_expr_no_brace_2','parser.py',232),
-  ('primary_expr_no_brace -> literal','primary_expr_no_brace',1,'p_primary_expr_no_brace_3','parser.py',236),
-  ('primary_expr_no_brace -> array_literal','primary_expr_no_brace',1,'p_primary_expr_no_brace_3','parser.py',237),
-  ('primary_expr_no_brace -> LPAREN expr RPAREN','primary_expr_no_brace',3,'p_primary_expr_no_brace_4','parser.py',242),
-  ('array_literal -> LBRACKET elision_opt RBRACKET','array_literal',3,'p_array_literal_1','parser.py',247),
-  ('array_literal -> LBRACKET element_list RBRACKET','array_literal',3,'p_array_literal_2','parser.py',251),
-  ('array_literal -> LBRACKET element_list COMMA elision_opt RBRACKET','array_literal',5,'p_array_literal_2','parser.py',252),
-  ('element_list -> elision_opt assignment_expr','element_list',2,'p_element_list','parser.py',261),
-  ('element_list -> element_list COMMA elision_opt assignment_expr','element_list',4,'p_element_list','parser.py',262),
-  ('elision_opt -> empty','elision_opt',1,'p_elision_opt_1','parser.py',272),
-  ('elision_opt -> elision','elision_opt',1,'p_elision_opt_2','parser.py',276),
-  ('elision -> COMMA','elision',1,'p_elision','parser.py',280),
-  ('elision -> elision COMMA','elision',2,'p_elision','parser.py',281),
-  ('object_literal -> LBRACE RBRACE','object_literal',2,'p_object_literal','parser.py',290),
-  ('object_literal -> LBRACE property_list RBRACE','object_literal',3,'p_object_literal','parser.py',291),
-  ('object_literal -> LBRACE property_list COMMA RBRACE','object_literal',4,'p_object_literal','parser.py',292),
-  ('property_list -> property_assignment','property_list',1,'p_property_list','parser.py',300),
-  ('property_list -> property_list COMMA property_assignment','property_list',3,'p_property_list','parser.py',301),
-  ('property_assignment -> property_name COLON assignment_expr','property_assignment',3,'p_property_assignment','parser.py',311),
-  ('property_assignment -> GETPROP property_name LPAREN RPAREN LBRACE function_body RBRACE','property_assignment',7,'p_property_assignment','parser.py',312),
-  ('property_assignment -> SETPROP property_name LPAREN formal_parameter_list RPAREN LBRACE function_body RBRACE','property_assignment',8,'p_property_assignment','parser.py',313),
-  ('property_name -> identifier','property_name',1,'p_property_name','parser.py',326),
-  ('property_name -> string_literal','property_name',1,'p_property_name','parser.py',327),
-  ('property_name -> numeric_literal','property_name',1,'p_property_name','parser.py',328),
-  ('member_expr -> primary_expr','member_expr',1,'p_member_expr','parser.py',334),
-  ('member_expr -> function_expr','member_expr',1,'p_member_expr','parser.py',335),
-  ('member_expr -> member_expr LBRACKET expr RBRACKET','member_expr',4,'p_member_expr','parser.py',336),
-  ('member_expr -> member_expr PERIOD identifier','member_expr',3,'p_member_expr','parser.py',337),
-  ('member_expr -> NEW member_expr arguments','member_expr',3,'p_member_expr','parser.py',338),
-  ('member_expr_nobf -> primary_expr_no_brace','member_expr_nobf',1,'p_member_expr_nobf','parser.py',350),
-  ('member_expr_nobf -> function_expr','member_expr_nobf',1,'p_member_expr_nobf','parser.py',351),
-  ('member_expr_nobf -> member_expr_nobf LBRACKET expr RBRACKET','member_expr_nobf',4,'p_member_expr_nobf','parser.py',352),
-  ('member_expr_nobf -> member_expr_nobf PERIOD identifier','member_expr_nobf',3,'p_member_expr_nobf','parser.py',353),
-  ('member_expr_nobf -> NEW member_expr arguments','member_expr_nobf',3,'p_member_expr_nobf','parser.py',354),
-  ('new_expr -> member_expr','new_expr',1,'p_new_expr','parser.py',366),
-  ('new_expr -> NEW new_expr','new_expr',2,'p_new_expr','parser.py',367),
-  ('new_expr_nobf -> member_expr_nobf','new_expr_nobf',1,'p_new_expr_nobf','parser.py',375),
-  ('new_expr_nobf -> NEW new_expr','new_expr_nobf',2,'p_new_expr_nobf','parser.py',376),
-  ('call_expr -> member_expr arguments','call_expr',2,'p_call_expr','parser.py',384),
-  ('call_expr -> call_expr arguments','call_expr',2,'p_call_expr','parser.py',385),
-  ('call_expr -> call_expr LBRACKET expr RBRACKET','call_expr',4,'p_call_expr','parser.py',386),
-  ('call_expr -> call_expr PERIOD identifier','call_expr',3,'p_call_expr','parser.py',387),
-  ('call_expr_nobf -> member_expr_nobf arguments','call_expr_nobf',2,'p_call_expr_nobf','parser.py',397),
-  ('call_expr_nobf -> call_expr_nobf arguments','call_expr_nobf',2,'p_call_expr_nobf','parser.py',398),
-  ('call_expr_nobf -> call_expr_nobf LBRACKET expr RBRACKET','call_expr_nobf',4,'p_call_expr_nobf','parser.py',399),
-  ('call_expr_nobf -> call_expr_nobf PERIOD identifier','call_expr_nobf',3,'p_call_expr_nobf','parser.py',400),
-  ('arguments -> LPAREN RPAREN','arguments',2,'p_arguments','parser.py',410),
-  ('arguments -> LPAREN argument_list RPAREN','arguments',3,'p_arguments','parser.py',411),
-  ('argument_list -> assignment_expr','argument_list',1,'p_argument_list','parser.py',417),
-  ('argument_list -> argument_list COMMA assignment_expr','argument_list',3,'p_argument_list','parser.py',418),
-  ('left_hand_side_expr -> new_expr','left_hand_side_expr',1,'p_lef_hand_side_expr','parser.py',427),
-  ('left_hand_side_expr -> call_expr','left_hand_side_expr',1,'p_lef_hand_side_expr','parser.py',428),
-  ('left_hand_side_expr_nobf -> new_expr_nobf','left_hand_side_expr_nobf',1,'p_lef_hand_side_expr_nobf','parser.py',433),
-  ('left_hand_side_expr_nobf -> call_expr_nobf','left_hand_side_expr_nobf',1,'p_lef_hand_side_expr_nobf','parser.py',434),
-  ('postfix_expr -> left_hand_side_expr','postfix_expr',1,'p_postfix_expr','parser.py',440),
-  ('postfix_expr -> left_hand_side_expr PLUSPLUS','postfix_expr',2,'p_postfix_expr','parser.py',441),
-  ('postfix_expr -> left_hand_side_expr MINUSMINUS','postfix_expr',2,'p_postfix_expr','parser.py',442),
-  ('postfix_expr_nobf -> left_hand_side_expr_nobf','postfix_expr_nobf',1,'p_postfix_expr_nobf','parser.py',450),
-  ('postfix_expr_nobf -> left_hand_side_expr_nobf PLUSPLUS','postfix_expr_nobf',2,'p_postfix_expr_nobf','parser.py',451),
-  ('postfix_expr_nobf -> left_hand_side_expr_nobf MINUSMINUS','postfix_expr_nobf',2,'p_postfix_expr_nobf','parser.py',452),
-  ('unary_expr -> postfix_expr','unary_expr',1,'p_unary_expr','parser.py',461),
-  ('unary_expr -> unary_expr_common','unary_expr',1,'p_unary_expr','parser.py',462),
-  ('unary_expr_nobf -> postfix_expr_nobf','unary_expr_nobf',1,'p_unary_expr_nobf','parser.py',467),
-  ('unary_expr_nobf -> unary_expr_common','unary_expr_nobf',1,'p_unary_expr_nobf','parser.py',468),
-  ('unary_expr_common -> DELETE unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',473),
-  ('unary_expr_common -> VOID unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',474),
-  ('unary_expr_common -> TYPEOF unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',475),
-  ('unary_expr_common -> PLUSPLUS unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',476),
-  ('unary_expr_common -> MINUSMINUS unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',477),
-  ('unary_expr_common -> PLUS unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',478),
-  ('unary_expr_common -> MINUS unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',479),
-  ('unary_expr_common -> BNOT unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',480),
-  ('unary_expr_common -> NOT unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',481),
-  ('multiplicative_expr -> unary_expr','multiplicative_expr',1,'p_multiplicative_expr','parser.py',487),
-  ('multiplicative_expr -> multiplicative_expr MULT unary_expr','multiplicative_expr',3,'p_multiplicative_expr','parser.py',488),
-  ('multiplicative_expr -> multiplicative_expr DIV unary_expr','multiplicative_expr',3,'p_multiplicative_expr','parser.py',489),
-  ('multiplicative_expr -> multiplicative_expr MOD unary_expr','multiplicative_expr',3,'p_multiplicative_expr','parser.py',490),
-  ('multiplicative_expr_nobf -> unary_expr_nobf','multiplicative_expr_nobf',1,'p_multiplicative_expr_nobf','parser.py',498),
-  ('multiplicative_expr_nobf -> multiplicative_expr_nobf MULT unary_expr','multiplicative_expr_nobf',3,'p_multiplicative_expr_nobf','parser.py',499),
-  ('multiplicative_expr_nobf -> multiplicative_expr_nobf DIV unary_expr','multiplicative_expr_nobf',3,'p_multiplicative_expr_nobf','parser.py',500),
-  ('multiplicative_expr_nobf -> multiplicative_expr_nobf MOD unary_expr','multiplicative_expr_nobf',3,'p_multiplicative_expr_nobf','parser.py',501),
-  ('additive_expr -> multiplicative_expr','additive_expr',1,'p_additive_expr','parser.py',510),
-  ('additive_expr -> additive_expr PLUS multiplicative_expr','additive_expr',3,'p_additive_expr','parser.py',511),
-  ('additive_expr -> additive_expr MINUS multiplicative_expr','additive_expr',3,'p_additive_expr','parser.py',512),
-  ('additive_expr_nobf -> multiplicative_expr_nobf','additive_expr_nobf',1,'p_additive_expr_nobf','parser.py',520),
-  ('additive_expr_nobf -> additive_expr_nobf PLUS multiplicative_expr','additive_expr_nobf',3,'p_additive_expr_nobf','parser.py',521),
-  ('additive_expr_nobf -> additive_expr_nobf MINUS multiplicative_expr','additive_expr_nobf',3,'p_additive_expr_nobf','parser.py',522),
-  ('shift_expr -> additive_expr','shift_expr',1,'p_shift_expr','parser.py',531),
-  ('shift_expr -> shift_expr LSHIFT additive_expr','shift_expr',3,'p_shift_expr','parser.py',532),
-  ('shift_expr -> shift_expr RSHIFT additive_expr','shift_expr',3,'p_shift_expr','parser.py',533),
-  ('shift_expr -> shift_expr URSHIFT additive_expr','shift_expr',3,'p_shift_expr','parser.py',534),
-  ('shift_expr_nobf -> additive_expr_nobf','shift_expr_nobf',1,'p_shift_expr_nobf','parser.py',542),
-  ('shift_expr_nobf -> shift_expr_nobf LSHIFT additive_expr','shift_expr_nobf',3,'p_shift_expr_nobf','parser.py',543),
-  ('shift_expr_nobf -> shift_expr_nobf RSHIFT additive_expr','shift_expr_nobf',3,'p_shift_expr_nobf','parser.py',544),
-  ('shift_expr_nobf -> shift_expr_nobf URSHIFT additive_expr','shift_expr_nobf',3,'p_shift_expr_nobf','parser.py',545),
-  ('relational_expr -> shift_expr','relational_expr',1,'p_relational_expr','parser.py',555),
-  ('relational_expr -> relational_expr LT shift_expr','relational_expr',3,'p_relational_expr','parser.py',556),
-  ('relational_expr -> relational_expr GT shift_expr','relational_expr',3,'p_relational_expr','parser.py',557),
-  ('relational_expr -> relational_expr LE shift_expr','relational_expr',3,'p_relational_expr','parser.py',558),
-  ('relational_expr -> relational_expr GE shift_expr','relational_expr',3,'p_relational_expr','parser.py',559),
-  ('relational_expr -> relational_expr INSTANCEOF shift_expr','relational_expr',3,'p_relational_expr','parser.py',560),
-  ('relational_expr -> relational_expr IN shift_expr','relational_expr',3,'p_relational_expr','parser.py',561),
-  ('relational_expr_noin -> shift_expr','relational_expr_noin',1,'p_relational_expr_noin','parser.py',569),
-  ('relational_expr_noin -> relational_expr_noin LT shift_expr','relational_expr_noin',3,'p_relational_expr_noin','parser.py',570),
-  ('relational_expr_noin -> relational_expr_noin GT shift_expr','relational_expr_noin',3,'p_relational_expr_noin','parser.py',571),
-  ('relational_expr_noin -> relational_expr_noin LE shift_expr','relational_expr_noin',3,'p_relational_expr_noin','parser.py',572),
-  ('relational_expr_noin -> relational_expr_noin GE shift_expr','relational_expr_noin',3,'p_relational_expr_noin','parser.py',573),
-  ('relational_expr_noin -> relational_expr_noin INSTANCEOF shift_expr','relational_expr_noin',3,'p_relational_expr_noin','parser.py',574),
-  ('relational_expr_nobf -> shift_expr_nobf','relational_expr_nobf',1,'p_relational_expr_nobf','parser.py',582),
-  ('relational_expr_nobf -> relational_expr_nobf LT shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','parser.py',583),
-  ('relational_expr_nobf -> relational_expr_nobf GT shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','parser.py',584),
-  ('relational_expr_nobf -> relational_expr_nobf LE shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','parser.py',585),
-  ('relational_expr_nobf -> relational_expr_nobf GE shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','parser.py',586),
-  ('relational_expr_nobf -> relational_expr_nobf INSTANCEOF shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','parser.py',587),
-  ('relational_expr_nobf -> relational_expr_nobf IN shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','parser.py',588),
-  ('equality_expr -> relational_expr','equality_expr',1,'p_equality_expr','parser.py',597),
-  ('equality_expr -> equality_expr EQEQ relational_expr','equality_expr',3,'p_equality_expr','parser.py',598),
-  ('equality_expr -> equality_expr NE relational_expr','equality_expr',3,'p_equality_expr','parser.py',599),
-  ('equality_expr -> equality_expr STREQ relational_expr','equality_expr',3,'p_equality_expr','parser.py',600),
-  ('equality_expr -> equality_expr STRNEQ relational_expr','equality_expr',3,'p_equality_expr','parser.py',601),
-  ('equality_expr_noin -> relational_expr_noin','equality_expr_noin',1,'p_equality_expr_noin','parser.py',609),
-  ('equality_expr_noin -> equality_expr_noin EQEQ relational_expr','equality_expr_noin',3,'p_equality_expr_noin','parser.py',610),
-  ('equality_expr_noin -> equality_expr_noin NE relational_expr','equality_expr_noin',3,'p_equality_expr_noin','parser.py',611),
-  ('equality_expr_noin -> equality_expr_noin STREQ relational_expr','equality_expr_noin',3,'p_equality_expr_noin','parser.py',612),
-  ('equality_expr_noin -> equality_expr_noin STRNEQ relational_expr','equality_expr_noin',3,'p_equality_expr_noin','parser.py',613),
-  ('equality_expr_nobf -> relational_expr_nobf','equality_expr_nobf',1,'p_equality_expr_nobf','parser.py',621),
-  ('equality_expr_nobf -> equality_expr_nobf EQEQ relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','parser.py',622),
-  ('equality_expr_nobf -> equality_expr_nobf NE relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','parser.py',623),
-  ('equality_expr_nobf -> equality_expr_nobf STREQ relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','parser.py',624),
-  ('equality_expr_nobf -> equality_expr_nobf STRNEQ relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','parser.py',625),
-  ('bitwise_and_expr -> equality_expr','bitwise_and_expr',1,'p_bitwise_and_expr','parser.py',634),
-  ('bitwise_and_expr -> bitwise_and_expr BAND equality_expr','bitwise_and_expr',3,'p_bitwise_and_expr','parser.py',635),
-  ('bitwise_and_expr_noin -> equality_expr_noin','bitwise_and_expr_noin',1,'p_bitwise_and_expr_noin','parser.py',643),
-  ('bitwise_and_expr_noin -> bitwise_and_expr_noin BAND equality_expr_noin','bitwise_and_expr_noin',3,'p_bitwise_and_expr_noin','parser.py',644),
-  ('bitwise_and_expr_nobf -> equality_expr_nobf','bitwise_and_expr_nobf',1,'p_bitwise_and_expr_nobf','parser.py',653),
-  ('bitwise_and_expr_nobf -> bitwise_and_expr_nobf BAND equality_expr_nobf','bitwise_and_expr_nobf',3,'p_bitwise_and_expr_nobf','parser.py',654),
-  ('bitwise_xor_expr -> bitwise_and_expr','bitwise_xor_expr',1,'p_bitwise_xor_expr','parser.py',663),
-  ('bitwise_xor_expr -> bitwise_xor_expr BXOR bitwise_and_expr','bitwise_xor_expr',3,'p_bitwise_xor_expr','parser.py',664),
-  ('bitwise_xor_expr_noin -> bitwise_and_expr_noin','bitwise_xor_expr_noin',1,'p_bitwise_xor_expr_noin','parser.py',673),
-  ('bitwise_xor_expr_noin -> bitwise_xor_expr_noin BXOR bitwise_and_expr_noin','bitwise_xor_expr_noin',3,'p_bitwise_xor_expr_noin','parser.py',674),
-  ('bitwise_xor_expr_nobf -> bitwise_and_expr_nobf','bitwise_xor_expr_nobf',1,'p_bitwise_xor_expr_nobf','parser.py',684),
-  ('bitwise_xor_expr_nobf -> bitwise_xor_expr_nobf BXOR bitwise_and_expr_nobf','bitwise_xor_expr_nobf',3,'p_bitwise_xor_expr_nobf','parser.py',685),
-  ('bitwise_or_expr -> bitwise_xor_expr','bitwise_or_expr',1,'p_bitwise_or_expr','parser.py',694),
-  ('bitwise_or_expr -> bitwise_or_expr BOR bitwise_xor_expr','bitwise_or_expr',3,'p_bitwise_or_expr','parser.py',695),
-  ('bitwise_or_expr_noin -> bitwise_xor_expr_noin','bitwise_or_expr_noin',1,'p_bitwise_or_expr_noin','parser.py',704),
-  ('bitwise_or_expr_noin -> bitwise_or_expr_noin BOR bitwise_xor_expr_noin','bitwise_or_expr_noin',3,'p_bitwise_or_expr_noin','parser.py',705),
-  ('bitwise_or_expr_nobf -> bitwise_xor_expr_nobf','bitwise_or_expr_nobf',1,'p_bitwise_or_expr_nobf','parser.py',715),
-  ('bitwise_or_expr_nobf -> bitwise_or_expr_nobf BOR bitwise_xor_expr_nobf','bitwise_or_expr_nobf',3,'p_bitwise_or_expr_nobf','parser.py',716),
-  ('logical_and_expr -> bitwise_or_expr','logical_and_expr',1,'p_logical_and_expr','parser.py',726),
-  ('logical_and_expr -> logical_and_expr AND bitwise_or_expr','logical_and_expr',3,'p_logical_and_expr','parser.py',727),
-  ('logical_and_expr_noin -> bitwise_or_expr_noin','logical_and_expr_noin',1,'p_logical_and_expr_noin','parser.py',736),
-  ('logical_and_expr_noin -> logical_and_expr_noin AND bitwise_or_expr_noin','logical_and_expr_noin',3,'p_logical_and_expr_noin','parser.py',737),
-  ('logical_and_expr_nobf -> bitwise_or_expr_nobf','logical_and_expr_nobf',1,'p_logical_and_expr_nobf','parser.py',746),
-  ('logical_and_expr_nobf -> logical_and_expr_nobf AND bitwise_or_expr_nobf','logical_and_expr_nobf',3,'p_logical_and_expr_nobf','parser.py',747),
-  ('logical_or_expr -> logical_and_expr','logical_or_expr',1,'p_logical_or_expr','parser.py',755),
-  ('logical_or_expr -> logical_or_expr OR logical_and_expr','logical_or_expr',3,'p_logical_or_expr','parser.py',756),
-  ('logical_or_expr_noin -> logical_and_expr_noin','logical_or_expr_noin',1,'p_logical_or_expr_noin','parser.py',764),
-  ('logical_or_expr_noin -> logical_or_expr_noin OR logical_and_expr_noin','logical_or_expr_noin',3,'p_logical_or_expr_noin','parser.py',765),
-  ('logical_or_expr_nobf -> logical_and_expr_nobf','logical_or_expr_nobf',1,'p_logical_or_expr_nobf','parser.py',773),
-  ('logical_or_expr_nobf -> logical_or_expr_nobf OR logical_and_expr_nobf','logical_or_expr_nobf',3,'p_logical_or_expr_nobf','parser.py',774),
-  ('conditional_expr -> logical_or_expr','conditional_expr',1,'p_conditional_expr','parser.py',784),
-  ('conditional_expr -> logical_or_expr CONDOP assignment_expr COLON assignment_expr','conditional_expr',5,'p_conditional_expr','parser.py',785),
-  ('conditional_expr_noin -> logical_or_expr_noin','conditional_expr_noin',1,'p_conditional_expr_noin','parser.py',796),
-  ('conditional_expr_noin -> logical_or_expr_noin CONDOP assignment_expr_noin COLON assignment_expr_noin','conditional_expr_noin',5,'p_conditional_expr_noin','parser.py',797),
-  ('conditional_expr_nobf -> logical_or_expr_nobf','conditional_expr_nobf',1,'p_conditional_expr_nobf','parser.py',809),
-  ('conditional_expr_nobf -> logical_or_expr_nobf CONDOP assignment_expr COLON assignment_expr','conditional_expr_nobf',5,'p_conditional_expr_nobf','parser.py',810),
-  ('assignment_expr -> conditional_expr','assignment_expr',1,'p_assignment_expr','parser.py',822),
-  ('assignment_expr -> left_hand_side_expr assignment_operator assignment_expr','assignment_expr',3,'p_assignment_expr','parser.py',823),
-  ('assignment_expr_noin -> conditional_expr_noin','assignment_expr_noin',1,'p_assignment_expr_noin','parser.py',833),
-  ('assignment_expr_noin -> left_hand_side_expr assignment_operator assignment_expr_noin','assignment_expr_noin',3,'p_assignment_expr_noin','parser.py',834),
-  ('assignment_expr_nobf -> conditional_expr_nobf','assignment_expr_nobf',1,'p_assignment_expr_nobf','parser.py',844),
-  ('assignment_expr_nobf -> left_hand_side_expr_nobf assignment_operator assignment_expr','assignment_expr_nobf',3,'p_assignment_expr_nobf','parser.py',845),
-  ('assignment_operator -> EQ','assignment_operator',1,'p_assignment_operator','parser.py',854),
-  ('assignment_operator -> MULTEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',855),
-  ('assignment_operator -> DIVEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',856),
-  ('assignment_operator -> MODEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',857),
-  ('assignment_operator -> PLUSEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',858),
-  ('assignment_operator -> MINUSEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',859),
-  ('assignment_operator -> LSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',860),
-  ('assignment_operator -> RSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',861),
-  ('assignment_operator -> URSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',862),
-  ('assignment_operator -> ANDEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',863),
-  ('assignment_operator -> XOREQUAL','assignment_operator',1,'p_assignment_operator','parser.py',864),
-  ('assignment_operator -> OREQUAL','assignment_operator',1,'p_assignment_operator','parser.py',865),
-  ('expr -> assignment_expr','expr',1,'p_expr','parser.py',871),
-  ('expr -> expr COMMA assignment_expr','expr',3,'p_expr','parser.py',872),
-  ('expr_noin -> assignment_expr_noin','expr_noin',1,'p_expr_noin','parser.py',880),
-  ('expr_noin -> expr_noin COMMA assignment_expr_noin','expr_noin',3,'p_expr_noin','parser.py',881),
-  ('expr_nobf -> assignment_expr_nobf','expr_nobf',1,'p_expr_nobf','parser.py',889),
-  ('expr_nobf -> expr_nobf COMMA assignment_expr','expr_nobf',3,'p_expr_nobf','parser.py',890),
-  ('variable_statement -> VAR variable_declaration_list SEMI','variable_statement',3,'p_variable_statement','parser.py',899),
-  ('variable_statement -> VAR variable_declaration_list auto_semi','variable_statement',3,'p_variable_statement','parser.py',900),
-  ('variable_declaration_list -> variable_declaration','variable_declaration_list',1,'p_variable_declaration_list','parser.py',906),
-  ('variable_declaration_list -> variable_declaration_list COMMA variable_declaration','variable_declaration_list',3,'p_variable_declaration_list','parser.py',907),
-  ('variable_declaration_list_noin -> variable_declaration_noin','variable_declaration_list_noin',1,'p_variable_declaration_list_noin','parser.py',918),
-  ('variable_declaration_list_noin -> variable_declaration_list_noin COMMA variable_declaration_noin','variable_declaration_list_noin',3,'p_variable_declaration_list_noin','parser.py',919),
-  ('variable_declaration -> identifier','variable_declaration',1,'p_variable_declaration','parser.py',929),
-  ('variable_declaration -> identifier initializer','variable_declaration',2,'p_variable_declaration','parser.py',930),
-  ('variable_declaration_noin -> identifier','variable_declaration_noin',1,'p_variable_declaration_noin','parser.py',938),
-  ('variable_declaration_noin -> identifier initializer_noin','variable_declaration_noin',2,'p_variable_declaration_noin','parser.py',939),
-  ('initializer -> EQ assignment_expr','initializer',2,'p_initializer','parser.py',947),
-  ('initializer_noin -> EQ assignment_expr_noin','initializer_noin',2,'p_initializer_noin','parser.py',951),
-  ('empty_statement -> SEMI','empty_statement',1,'p_empty_statement','parser.py',956),
-  ('expr_statement -> expr_nobf SEMI','expr_statement',2,'p_expr_statement','parser.py',961),
-  ('expr_statement -> expr_nobf auto_semi','expr_statement',2,'p_expr_statement','parser.py',962),
-  ('if_statement -> IF LPAREN expr RPAREN statement','if_statement',5,'p_if_statement_1','parser.py',968),
-  ('if_statement -> IF LPAREN expr RPAREN statement ELSE statement','if_statement',7,'p_if_statement_2','parser.py',972),
-  ('iteration_statement -> DO statement WHILE LPAREN expr RPAREN SEMI','iteration_statement',7,'p_iteration_statement_1','parser.py',978),
-  ('iteration_statement -> DO statement WHILE LPAREN expr RPAREN auto_semi','iteration_statement',7,'p_iteration_statement_1','parser.py',979),
-  ('iteration_statement -> WHILE LPAREN expr RPAREN statement','iteration_statement',5,'p_iteration_statement_2','parser.py',985),
-  ('iteration_statement -> FOR LPAREN expr_noin_opt SEMI expr_opt SEMI expr_opt RPAREN statement','iteration_statement',9,'p_iteration_statement_3','parser.py',990),
-  ('iteration_statement -> FOR LPAREN VAR variable_declaration_list_noin SEMI expr_opt SEMI expr_opt RPAREN statement','iteration_statement',10,'p_iteration_statement_3','parser.py',991),
-  ('iteration_statement -> FOR LPAREN left_hand_side_expr IN expr RPAREN statement','iteration_statement',7,'p_iteration_statement_4','parser.py',1004),
-  ('iteration_statement -> FOR LPAREN VAR identifier IN expr RPAREN statement','iteration_statement',8,'p_iteration_statement_5','parser.py',1011),
-  ('iteration_statement -> FOR LPAREN VAR identifier initializer_noin IN expr RPAREN statement','iteration_statement',9,'p_iteration_statement_6','parser.py',1018),
-  ('expr_opt -> empty','expr_opt',1,'p_expr_opt','parser.py',1025),
-  ('expr_opt -> expr','expr_opt',1,'p_expr_opt','parser.py',1026),
-  ('expr_noin_opt -> empty','expr_noin_opt',1,'p_expr_noin_opt','parser.py',1031),
-  ('expr_noin_opt -> expr_noin','expr_noin_opt',1,'p_expr_noin_opt','parser.py',1032),
-  ('continue_statement -> CONTINUE SEMI','continue_statement',2,'p_continue_statement_1','parser.py',1038),
-  ('continue_statement -> CONTINUE auto_semi','continue_statement',2,'p_continue_statement_1','parser.py',1039),
-  ('continue_statement -> CONTINUE identifier SEMI','continue_statement',3,'p_continue_statement_2','parser.py',1044),
-  ('continue_statement -> CONTINUE identifier auto_semi','continue_statement',3,'p_continue_statement_2','parser.py',1045),
-  ('break_statement -> BREAK SEMI','break_statement',2,'p_break_statement_1','parser.py',1051),
-  ('break_statement -> BREAK auto_semi','break_statement',2,'p_break_statement_1','parser.py',1052),
-  ('break_statement -> BREAK identifier SEMI','break_statement',3,'p_break_statement_2','parser.py',1057),
-  ('break_statement -> BREAK identifier auto_semi','break_statement',3,'p_break_statement_2','parser.py',1058),
-  ('return_statement -> RETURN SEMI','return_statement',2,'p_return_statement_1','parser.py',1065),
-  ('return_statement -> RETURN auto_semi','return_statement',2,'p_return_statement_1','parser.py',1066),
-  ('return_statement -> RETURN expr SEMI','return_statement',3,'p_return_statement_2','parser.py',1071),
-  ('return_statement -> RETURN expr auto_semi','return_statement',3,'p_return_statement_2','parser.py',1072),
-  ('with_statement -> WITH LPAREN expr RPAREN statement','with_statement',5,'p_with_statement','parser.py',1078),
-  ('switch_statement -> SWITCH LPAREN expr RPAREN case_block','switch_statement',5,'p_switch_statement','parser.py',1083),
-  ('case_block -> LBRACE case_clauses_opt RBRACE','case_block',3,'p_case_block','parser.py',1097),
-  ('case_block -> LBRACE case_clauses_opt default_clause case_clauses_opt RBRACE','case_block',5,'p_case_block','parser.py',1098),
-  ('case_clauses_opt -> empty','case_clauses_opt',1,'p_case_clauses_opt','parser.py',1104),
-  ('case_clauses_opt -> case_clauses','case_clauses_opt',1,'p_case_clauses_opt','parser.py',1105),
-  ('case_clauses -> case_clause','case_clauses',1,'p_case_clauses','parser.py',1110),
-  ('case_clauses -> case_clauses case_clause','case_clauses',2,'p_case_clauses','parser.py',1111),
-  ('case_clause -> CASE expr COLON source_elements','case_clause',4,'p_case_clause','parser.py',1120),
-  ('default_clause -> DEFAULT COLON source_elements','default_clause',3,'p_default_clause','parser.py',1124),
-  ('labelled_statement -> identifier COLON statement','labelled_statement',3,'p_labelled_statement','parser.py',1129),
-  ('throw_statement -> THROW expr SEMI','throw_statement',3,'p_throw_statement','parser.py',1134),
-  ('throw_statement -> THROW expr auto_semi','throw_statement',3,'p_throw_statement','parser.py',1135),
-  ('try_statement -> TRY block catch','try_statement',3,'p_try_statement_1','parser.py',1141),
-  ('try_statement -> TRY block finally','try_statement',3,'p_try_statement_2','parser.py',1145),
-  ('try_statement -> TRY block catch finally','try_statement',4,'p_try_statement_3','parser.py',1149),
-  ('catch -> CATCH LPAREN identifier RPAREN block','catch',5,'p_catch','parser.py',1153),
-  ('finally -> FINALLY block','finally',2,'p_finally','parser.py',1157),
-  ('debugger_statement -> DEBUGGER SEMI','debugger_statement',2,'p_debugger_statement','parser.py',1162),
-  ('debugger_statement -> DEBUGGER auto_semi','debugger_statement',2,'p_debugger_statement','parser.py',1163),
-  ('function_declaration -> FUNCTION identifier LPAREN RPAREN LBRACE function_body RBRACE','function_declaration',7,'p_function_declaration','parser.py',1170),
-  ('function_declaration -> FUNCTION identifier LPAREN formal_parameter_list RPAREN LBRACE function_body RBRACE','function_declaration',8,'p_function_declaration','parser.py',1171),
-  ('function_expr -> FUNCTION LPAREN RPAREN LBRACE function_body RBRACE','function_expr',6,'p_function_expr_1','parser.py',1184),
-  ('function_expr -> FUNCTION LPAREN formal_parameter_list RPAREN LBRACE function_body RBRACE','function_expr',7,'p_function_expr_1','parser.py',1185),
-  ('function_expr -> FUNCTION identifier LPAREN RPAREN LBRACE function_body RBRACE','function_expr',7,'p_function_expr_2','parser.py',1198),
-  ('function_expr -> FUNCTION identifier LPAREN formal_parameter_list RPAREN LBRACE function_body RBRACE','function_expr',8,'p_function_expr_2','parser.py',1199),
-  ('formal_parameter_list -> identifier','formal_parameter_list',1,'p_formal_parameter_list','parser.py',1212),
-  ('formal_parameter_list -> formal_parameter_list COMMA identifier','formal_parameter_list',3,'p_formal_parameter_list','parser.py',1213),
-  ('function_body -> source_elements','function_body',1,'p_function_body','parser.py',1222),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',189),
+  ('program -> source_elements','program',1,'p_program','parser.py',207),
+  ('source_elements -> empty','source_elements',1,'p_source_elements','parser.py',211),
+  ('source_elements -> source_element_list','source_elements',1,'p_source_elements','parser.py',212),
+  ('source_element_list -> source_element','source_element_list',1,'p_source_element_list','parser.py',217),
+  ('source_element_list -> source_element_list source_element','source_element_list',2,'p_source_element_list','parser.py',218),
+  ('source_element -> statement','source_element',1,'p_source_element','parser.py',227),
+  ('source_element -> function_declaration','source_element',1,'p_source_element','parser.py',228),
+  ('statement -> block','statement',1,'p_statement','parser.py',233),
+  ('statement -> variable_statement','statement',1,'p_statement','parser.py',234),
+  ('statement -> empty_statement','statement',1,'p_statement','parser.py',235),
+  ('statement -> expr_statement','statement',1,'p_statement','parser.py',236),
+  ('statement -> if_statement','statement',1,'p_statement','parser.py',237),
+  ('statement -> iteration_statement','statement',1,'p_statement','parser.py',238),
+  ('statement -> continue_statement','statement',1,'p_statement','parser.py',239),
+  ('statement -> break_statement','statement',1,'p_statement','parser.py',240),
+  ('statement -> return_statement','statement',1,'p_statement','parser.py',241),
+  ('statement -> with_statement','statement',1,'p_statement','parser.py',242),
+  ('statement -> switch_statement','statement',1,'p_statement','parser.py',243),
+  ('statement -> labelled_statement','statement',1,'p_statement','parser.py',244),
+  ('statement -> throw_statement','statement',1,'p_statement','parser.py',245),
+  ('statement -> try_statement','statement',1,'p_statement','parser.py',246),
+  ('statement -> debugger_statement','statement',1,'p_statement','parser.py',247),
+  ('statement -> function_declaration','statement',1,'p_statement','parser.py',248),
+  ('block -> LBRACE source_elements RBRACE','block',3,'p_block','parser.py',255),
+  ('literal -> null_literal','literal',1,'p_literal','parser.py',259),
+  ('literal -> boolean_literal','literal',1,'p_literal','parser.py',260),
+  ('literal -> numeric_literal','literal',1,'p_literal','parser.py',261),
+  ('literal -> string_literal','literal',1,'p_literal','parser.py',262),
+  ('literal -> regex_literal','literal',1,'p_literal','parser.py',263),
+  ('boolean_literal -> TRUE','boolean_literal',1,'p_boolean_literal','parser.py',268),
+  ('boolean_literal -> FALSE','boolean_literal',1,'p_boolean_literal','parser.py',269),
+  ('null_literal -> NULL','null_literal',1,'p_null_literal','parser.py',274),
+  ('numeric_literal -> NUMBER','numeric_literal',1,'p_numeric_literal','parser.py',278),
+  ('string_literal -> STRING','string_literal',1,'p_string_literal','parser.py',282),
+  ('regex_literal -> REGEX','regex_literal',1,'p_regex_literal','parser.py',286),
+  ('identifier -> ID','identifier',1,'p_identifier','parser.py',290),
+  ('primary_expr -> primary_expr_no_brace','primary_expr',1,'p_primary_expr','parser.py',297),
+  ('primary_expr -> object_literal','primary_expr',1,'p_primary_expr','parser.py',298),
+  ('primary_expr_no_brace -> identifier','primary_expr_no_brace',1,'p_primary_expr_no_brace_1','parser.py',303),
+  ('primary_expr_no_brace -> THIS','primary_expr_no_brace',1,'p_primary_expr_no_brace_2','parser.py',309),
+  ('primary_expr_no_brace -> literal','primary_expr_no_brace',1,'p_primary_expr_no_brace_3','parser.py',313),
+  ('primary_expr_no_brace -> array_literal','primary_expr_no_brace',1,'p_primary_expr_no_brace_3','parser.py',314),
+  ('primary_expr_no_brace -> LPAREN expr RPAREN','primary_expr_no_brace',3,'p_primary_expr_no_brace_4','parser.py',319),
+  ('array_literal -> LBRACKET elision_opt RBRACKET','array_literal',3,'p_array_literal_1','parser.py',324),
+  ('array_literal -> LBRACKET element_list RBRACKET','array_literal',3,'p_array_literal_2','parser.py',328),
+  ('array_literal -> LBRACKET element_list COMMA elision_opt RBRACKET','array_literal',5,'p_array_literal_2','parser.py',329),
+  ('element_list -> elision_opt assignment_expr','element_list',2,'p_element_list','parser.py',338),
+  ('element_list -> element_list COMMA elision_opt assignment_expr','element_list',4,'p_element_list','parser.py',339),
+  ('elision_opt -> empty','elision_opt',1,'p_elision_opt_1','parser.py',349),
+  ('elision_opt -> elision','elision_opt',1,'p_elision_opt_2','parser.py',353),
+  ('elision -> COMMA','elision',1,'p_elision','parser.py',357),
+  ('elision -> elision COMMA','elision',2,'p_elision','parser.py',358),
+  ('object_literal -> LBRACE RBRACE','object_literal',2,'p_object_literal','parser.py',367),
+  ('object_literal -> LBRACE property_list RBRACE','object_literal',3,'p_object_literal','parser.py',368),
+  ('object_literal -> LBRACE property_list COMMA RBRACE','object_literal',4,'p_object_literal','parser.py',369),
+  ('property_list -> property_assignment','property_list',1,'p_property_list','parser.py',377),
+  ('property_list -> property_list COMMA property_assignment','property_list',3,'p_property_list','parser.py',378),
+  ('property_assignment -> property_name COLON assignment_expr','property_assignment',3,'p_property_assignment','parser.py',388),
+  ('property_assignment -> GETPROP property_name LPAREN RPAREN LBRACE function_body RBRACE','property_assignment',7,'p_property_assignment','parser.py',389),
+  ('property_assignment -> SETPROP property_name LPAREN formal_parameter_list RPAREN LBRACE function_body RBRACE','property_assignment',8,'p_property_assignment','parser.py',390),
+  ('property_name -> identifier','property_name',1,'p_property_name','parser.py',403),
+  ('property_name -> string_literal','property_name',1,'p_property_name','parser.py',404),
+  ('property_name -> numeric_literal','property_name',1,'p_property_name','parser.py',405),
+  ('member_expr -> primary_expr','member_expr',1,'p_member_expr','parser.py',411),
+  ('member_expr -> function_expr','member_expr',1,'p_member_expr','parser.py',412),
+  ('member_expr -> member_expr LBRACKET expr RBRACKET','member_expr',4,'p_member_expr','parser.py',413),
+  ('member_expr -> member_expr PERIOD identifier','member_expr',3,'p_member_expr','parser.py',414),
+  ('member_expr -> NEW member_expr arguments','member_expr',3,'p_member_expr','parser.py',415),
+  ('member_expr_nobf -> primary_expr_no_brace','member_expr_nobf',1,'p_member_expr_nobf','parser.py',427),
+  ('member_expr_nobf -> function_expr','member_expr_nobf',1,'p_member_expr_nobf','parser.py',428),
+  ('member_expr_nobf -> member_expr_nobf LBRACKET expr RBRACKET','member_expr_nobf',4,'p_member_expr_nobf','parser.py',429),
+  ('member_expr_nobf -> member_expr_nobf PERIOD identifier','member_expr_nobf',3,'p_member_expr_nobf','parser.py',430),
+  ('member_expr_nobf -> NEW member_expr arguments','member_expr_nobf',3,'p_member_expr_nobf','parser.py',431),
+  ('new_expr -> member_expr','new_expr',1,'p_new_expr','parser.py',443),
+  ('new_expr -> NEW new_expr','new_expr',2,'p_new_expr','parser.py',444),
+  ('new_expr_nobf -> member_expr_nobf','new_expr_nobf',1,'p_new_expr_nobf','parser.py',452),
+  ('new_expr_nobf -> NEW new_expr','new_expr_nobf',2,'p_new_expr_nobf','parser.py',453),
+  ('call_expr -> member_expr arguments','call_expr',2,'p_call_expr','parser.py',461),
+  ('call_expr -> call_expr arguments','call_expr',2,'p_call_expr','parser.py',462),
+  ('call_expr -> call_expr LBRACKET expr RBRACKET','call_expr',4,'p_call_expr','parser.py',463),
+  ('call_expr -> call_expr PERIOD identifier','call_expr',3,'p_call_expr','parser.py',464),
+  ('call_expr_nobf -> member_expr_nobf arguments','call_expr_nobf',2,'p_call_expr_nobf','parser.py',474),
+  ('call_expr_nobf -> call_expr_nobf arguments','call_expr_nobf',2,'p_call_expr_nobf','parser.py',475),
+  ('call_expr_nobf -> call_expr_nobf LBRACKET expr RBRACKET','call_expr_nobf',4,'p_call_expr_nobf','parser.py',476),
+  ('call_expr_nobf -> call_expr_nobf PERIOD identifier','call_expr_nobf',3,'p_call_expr_nobf','parser.py',477),
+  ('arguments -> LPAREN RPAREN','arguments',2,'p_arguments','parser.py',487),
+  ('arguments -> LPAREN argument_list RPAREN','arguments',3,'p_arguments','parser.py',488),
+  ('argument_list -> assignment_expr','argument_list',1,'p_argument_list','parser.py',494),
+  ('argument_list -> argument_list COMMA assignment_expr','argument_list',3,'p_argument_list','parser.py',495),
+  ('left_hand_side_expr -> new_expr','left_hand_side_expr',1,'p_lef_hand_side_expr','parser.py',504),
+  ('left_hand_side_expr -> call_expr','left_hand_side_expr',1,'p_lef_hand_side_expr','parser.py',505),
+  ('left_hand_side_expr_nobf -> new_expr_nobf','left_hand_side_expr_nobf',1,'p_lef_hand_side_expr_nobf','parser.py',510),
+  ('left_hand_side_expr_nobf -> call_expr_nobf','left_hand_side_expr_nobf',1,'p_lef_hand_side_expr_nobf','parser.py',511),
+  ('postfix_expr -> left_hand_side_expr','postfix_expr',1,'p_postfix_expr','parser.py',517),
+  ('postfix_expr -> left_hand_side_expr PLUSPLUS','postfix_expr',2,'p_postfix_expr','parser.py',518),
+  ('postfix_expr -> left_hand_side_expr MINUSMINUS','postfix_expr',2,'p_postfix_expr','parser.py',519),
+  ('postfix_expr_nobf -> left_hand_side_expr_nobf','postfix_expr_nobf',1,'p_postfix_expr_nobf','parser.py',527),
+  ('postfix_expr_nobf -> left_hand_side_expr_nobf PLUSPLUS','postfix_expr_nobf',2,'p_postfix_expr_nobf','parser.py',528),
+  ('postfix_expr_nobf -> left_hand_side_expr_nobf MINUSMINUS','postfix_expr_nobf',2,'p_postfix_expr_nobf','parser.py',529),
+  ('unary_expr -> postfix_expr','unary_expr',1,'p_unary_expr','parser.py',538),
+  ('unary_expr -> unary_expr_common','unary_expr',1,'p_unary_expr','parser.py',539),
+  ('unary_expr_nobf -> postfix_expr_nobf','unary_expr_nobf',1,'p_unary_expr_nobf','parser.py',544),
+  ('unary_expr_nobf -> unary_expr_common','unary_expr_nobf',1,'p_unary_expr_nobf','parser.py',545),
+  ('unary_expr_common -> DELETE unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',550),
+  ('unary_expr_common -> VOID unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',551),
+  ('unary_expr_common -> TYPEOF unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',552),
+  ('unary_expr_common -> PLUSPLUS unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',553),
+  ('unary_expr_common -> MINUSMINUS unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',554),
+  ('unary_expr_common -> PLUS unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',555),
+  ('unary_expr_common -> MINUS unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',556),
+  ('unary_expr_common -> BNOT unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',557),
+  ('unary_expr_common -> NOT unary_expr','unary_expr_common',2,'p_unary_expr_common','parser.py',558),
+  ('multiplicative_expr -> unary_expr','multiplicative_expr',1,'p_multiplicative_expr','parser.py',564),
+  ('multiplicative_expr -> multiplicative_expr MULT unary_expr','multiplicative_expr',3,'p_multiplicative_expr','parser.py',565),
+  ('multiplicative_expr -> multiplicative_expr DIV unary_expr','multiplicative_expr',3,'p_multiplicative_expr','parser.py',566),
+  ('multiplicative_expr -> multiplicative_expr MOD unary_expr','multiplicative_expr',3,'p_multiplicative_expr','parser.py',567),
+  ('multiplicative_expr_nobf -> unary_expr_nobf','multiplicative_expr_nobf',1,'p_multiplicative_expr_nobf','parser.py',575),
+  ('multiplicative_expr_nobf -> multiplicative_expr_nobf MULT unary_expr','multiplicative_expr_nobf',3,'p_multiplicative_expr_nobf','parser.py',576),
+  ('multiplicative_expr_nobf -> multiplicative_expr_nobf DIV unary_expr','multiplicative_expr_nobf',3,'p_multiplicative_expr_nobf','parser.py',577),
+  ('multiplicative_expr_nobf -> multiplicative_expr_nobf MOD unary_expr','multiplicative_expr_nobf',3,'p_multiplicative_expr_nobf','parser.py',578),
+  ('additive_expr -> multiplicative_expr','additive_expr',1,'p_additive_expr','parser.py',587),
+  ('additive_expr -> additive_expr PLUS multiplicative_expr','additive_expr',3,'p_additive_expr','parser.py',588),
+  ('additive_expr -> additive_expr MINUS multiplicative_expr','additive_expr',3,'p_additive_expr','parser.py',589),
+  ('additive_expr_nobf -> multiplicative_expr_nobf','additive_expr_nobf',1,'p_additive_expr_nobf','parser.py',597),
+  ('additive_expr_nobf -> additive_expr_nobf PLUS multiplicative_expr','additive_expr_nobf',3,'p_additive_expr_nobf','parser.py',598),
+  ('additive_expr_nobf -> additive_expr_nobf MINUS multiplicative_expr','additive_expr_nobf',3,'p_additive_expr_nobf','parser.py',599),
+  ('shift_expr -> additive_expr','shift_expr',1,'p_shift_expr','parser.py',608),
+  ('shift_expr -> shift_expr LSHIFT additive_expr','shift_expr',3,'p_shift_expr','parser.py',609),
+  ('shift_expr -> shift_expr RSHIFT additive_expr','shift_expr',3,'p_shift_expr','parser.py',610),
+  ('shift_expr -> shift_expr URSHIFT additive_expr','shift_expr',3,'p_shift_expr','parser.py',611),
+  ('shift_expr_nobf -> additive_expr_nobf','shift_expr_nobf',1,'p_shift_expr_nobf','parser.py',619),
+  ('shift_expr_nobf -> shift_expr_nobf LSHIFT additive_expr','shift_expr_nobf',3,'p_shift_expr_nobf','parser.py',620),
+  ('shift_expr_nobf -> shift_expr_nobf RSHIFT additive_expr','shift_expr_nobf',3,'p_shift_expr_nobf','parser.py',621),
+  ('shift_expr_nobf -> shift_expr_nobf URSHIFT additive_expr','shift_expr_nobf',3,'p_shift_expr_nobf','parser.py',622),
+  ('relational_expr -> shift_expr','relational_expr',1,'p_relational_expr','parser.py',632),
+  ('relational_expr -> relational_expr LT shift_expr','relational_expr',3,'p_relational_expr','parser.py',633),
+  ('relational_expr -> relational_expr GT shift_expr','relational_expr',3,'p_relational_expr','parser.py',634),
+  ('relational_expr -> relational_expr LE shift_expr','relational_expr',3,'p_relational_expr','parser.py',635),
+  ('relational_expr -> relational_expr GE shift_expr','relational_expr',3,'p_relational_expr','parser.py',636),
+  ('relational_expr -> relational_expr INSTANCEOF shift_expr','relational_expr',3,'p_relational_expr','parser.py',637),
+  ('relational_expr -> relational_expr IN shift_expr','relational_expr',3,'p_relational_expr','parser.py',638),
+  ('relational_expr_noin -> shift_expr','relational_expr_noin',1,'p_relational_expr_noin','parser.py',646),
+  ('relational_expr_noin -> relational_expr_noin LT shift_expr','relational_expr_noin',3,'p_relational_expr_noin','parser.py',647),
+  ('relational_expr_noin -> relational_expr_noin GT shift_expr','relational_expr_noin',3,'p_relational_expr_noin','parser.py',648),
+  ('relational_expr_noin -> relational_expr_noin LE shift_expr','relational_expr_noin',3,'p_relational_expr_noin','parser.py',649),
+  ('relational_expr_noin -> relational_expr_noin GE shift_expr','relational_expr_noin',3,'p_relational_expr_noin','parser.py',650),
+  ('relational_expr_noin -> relational_expr_noin INSTANCEOF shift_expr','relational_expr_noin',3,'p_relational_expr_noin','parser.py',651),
+  ('relational_expr_nobf -> shift_expr_nobf','relational_expr_nobf',1,'p_relational_expr_nobf','parser.py',659),
+  ('relational_expr_nobf -> relational_expr_nobf LT shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','parser.py',660),
+  ('relational_expr_nobf -> relational_expr_nobf GT shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','parser.py',661),
+  ('relational_expr_nobf -> relational_expr_nobf LE shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','parser.py',662),
+  ('relational_expr_nobf -> relational_expr_nobf GE shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','parser.py',663),
+  ('relational_expr_nobf -> relational_expr_nobf INSTANCEOF shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','parser.py',664),
+  ('relational_expr_nobf -> relational_expr_nobf IN shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','parser.py',665),
+  ('equality_expr -> relational_expr','equality_expr',1,'p_equality_expr','parser.py',674),
+  ('equality_expr -> equality_expr EQEQ relational_expr','equality_expr',3,'p_equality_expr','parser.py',675),
+  ('equality_expr -> equality_expr NE relational_expr','equality_expr',3,'p_equality_expr','parser.py',676),
+  ('equality_expr -> equality_expr STREQ relational_expr','equality_expr',3,'p_equality_expr','parser.py',677),
+  ('equality_expr -> equality_expr STRNEQ relational_expr','equality_expr',3,'p_equality_expr','parser.py',678),
+  ('equality_expr_noin -> relational_expr_noin','equality_expr_noin',1,'p_equality_expr_noin','parser.py',686),
+  ('equality_expr_noin -> equality_expr_noin EQEQ relational_expr','equality_expr_noin',3,'p_equality_expr_noin','parser.py',687),
+  ('equality_expr_noin -> equality_expr_noin NE relational_expr','equality_expr_noin',3,'p_equality_expr_noin','parser.py',688),
+  ('equality_expr_noin -> equality_expr_noin STREQ relational_expr','equality_expr_noin',3,'p_equality_expr_noin','parser.py',689),
+  ('equality_expr_noin -> equality_expr_noin STRNEQ relational_expr','equality_expr_noin',3,'p_equality_expr_noin','parser.py',690),
+  ('equality_expr_nobf -> relational_expr_nobf','equality_expr_nobf',1,'p_equality_expr_nobf','parser.py',698),
+  ('equality_expr_nobf -> equality_expr_nobf EQEQ relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','parser.py',699),
+  ('equality_expr_nobf -> equality_expr_nobf NE relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','parser.py',700),
+  ('equality_expr_nobf -> equality_expr_nobf STREQ relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','parser.py',701),
+  ('equality_expr_nobf -> equality_expr_nobf STRNEQ relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','parser.py',702),
+  ('bitwise_and_expr -> equality_expr','bitwise_and_expr',1,'p_bitwise_and_expr','parser.py',711),
+  ('bitwise_and_expr -> bitwise_and_expr BAND equality_expr','bitwise_and_expr',3,'p_bitwise_and_expr','parser.py',712),
+  ('bitwise_and_expr_noin -> equality_expr_noin','bitwise_and_expr_noin',1,'p_bitwise_and_expr_noin','parser.py',720),
+  ('bitwise_and_expr_noin -> bitwise_and_expr_noin BAND equality_expr_noin','bitwise_and_expr_noin',3,'p_bitwise_and_expr_noin','parser.py',721),
+  ('bitwise_and_expr_nobf -> equality_expr_nobf','bitwise_and_expr_nobf',1,'p_bitwise_and_expr_nobf','parser.py',730),
+  ('bitwise_and_expr_nobf -> bitwise_and_expr_nobf BAND equality_expr_nobf','bitwise_and_expr_nobf',3,'p_bitwise_and_expr_nobf','parser.py',731),
+  ('bitwise_xor_expr -> bitwise_and_expr','bitwise_xor_expr',1,'p_bitwise_xor_expr','parser.py',740),
+  ('bitwise_xor_expr -> bitwise_xor_expr BXOR bitwise_and_expr','bitwise_xor_expr',3,'p_bitwise_xor_expr','parser.py',741),
+  ('bitwise_xor_expr_noin -> bitwise_and_expr_noin','bitwise_xor_expr_noin',1,'p_bitwise_xor_expr_noin','parser.py',750),
+  ('bitwise_xor_expr_noin -> bitwise_xor_expr_noin BXOR bitwise_and_expr_noin','bitwise_xor_expr_noin',3,'p_bitwise_xor_expr_noin','parser.py',751),
+  ('bitwise_xor_expr_nobf -> bitwise_and_expr_nobf','bitwise_xor_expr_nobf',1,'p_bitwise_xor_expr_nobf','parser.py',761),
+  ('bitwise_xor_expr_nobf -> bitwise_xor_expr_nobf BXOR bitwise_and_expr_nobf','bitwise_xor_expr_nobf',3,'p_bitwise_xor_expr_nobf','parser.py',762),
+  ('bitwise_or_expr -> bitwise_xor_expr','bitwise_or_expr',1,'p_bitwise_or_expr','parser.py',771),
+  ('bitwise_or_expr -> bitwise_or_expr BOR bitwise_xor_expr','bitwise_or_expr',3,'p_bitwise_or_expr','parser.py',772),
+  ('bitwise_or_expr_noin -> bitwise_xor_expr_noin','bitwise_or_expr_noin',1,'p_bitwise_or_expr_noin','parser.py',781),
+  ('bitwise_or_expr_noin -> bitwise_or_expr_noin BOR bitwise_xor_expr_noin','bitwise_or_expr_noin',3,'p_bitwise_or_expr_noin','parser.py',782),
+  ('bitwise_or_expr_nobf -> bitwise_xor_expr_nobf','bitwise_or_expr_nobf',1,'p_bitwise_or_expr_nobf','parser.py',792),
+  ('bitwise_or_expr_nobf -> bitwise_or_expr_nobf BOR bitwise_xor_expr_nobf','bitwise_or_expr_nobf',3,'p_bitwise_or_expr_nobf','parser.py',793),
+  ('logical_and_expr -> bitwise_or_expr','logical_and_expr',1,'p_logical_and_expr','parser.py',803),
+  ('logical_and_expr -> logical_and_expr AND bitwise_or_expr','logical_and_expr',3,'p_logical_and_expr','parser.py',804),
+  ('logical_and_expr_noin -> bitwise_or_expr_noin','logical_and_expr_noin',1,'p_logical_and_expr_noin','parser.py',813),
+  ('logical_and_expr_noin -> logical_and_expr_noin AND bitwise_or_expr_noin','logical_and_expr_noin',3,'p_logical_and_expr_noin','parser.py',814),
+  ('logical_and_expr_nobf -> bitwise_or_expr_nobf','logical_and_expr_nobf',1,'p_logical_and_expr_nobf','parser.py',823),
+  ('logical_and_expr_nobf -> logical_and_expr_nobf AND bitwise_or_expr_nobf','logical_and_expr_nobf',3,'p_logical_and_expr_nobf','parser.py',824),
+  ('logical_or_expr -> logical_and_expr','logical_or_expr',1,'p_logical_or_expr','parser.py',832),
+  ('logical_or_expr -> logical_or_expr OR logical_and_expr','logical_or_expr',3,'p_logical_or_expr','parser.py',833),
+  ('logical_or_expr_noin -> logical_and_expr_noin','logical_or_expr_noin',1,'p_logical_or_expr_noin','parser.py',841),
+  ('logical_or_expr_noin -> logical_or_expr_noin OR logical_and_expr_noin','logical_or_expr_noin',3,'p_logical_or_expr_noin','parser.py',842),
+  ('logical_or_expr_nobf -> logical_and_expr_nobf','logical_or_expr_nobf',1,'p_logical_or_expr_nobf','parser.py',850),
+  ('logical_or_expr_nobf -> logical_or_expr_nobf OR logical_and_expr_nobf','logical_or_expr_nobf',3,'p_logical_or_expr_nobf','parser.py',851),
+  ('conditional_expr -> logical_or_expr','conditional_expr',1,'p_conditional_expr','parser.py',861),
+  ('conditional_expr -> logical_or_expr CONDOP assignment_expr COLON assignment_expr','conditional_expr',5,'p_conditional_expr','parser.py',862),
+  ('conditional_expr_noin -> logical_or_expr_noin','conditional_expr_noin',1,'p_conditional_expr_noin','parser.py',873),
+  ('conditional_expr_noin -> logical_or_expr_noin CONDOP assignment_expr_noin COLON assignment_expr_noin','conditional_expr_noin',5,'p_conditional_expr_noin','parser.py',874),
+  ('conditional_expr_nobf -> logical_or_expr_nobf','conditional_expr_nobf',1,'p_conditional_expr_nobf','parser.py',886),
+  ('conditional_expr_nobf -> logical_or_expr_nobf CONDOP assignment_expr COLON assignment_expr','conditional_expr_nobf',5,'p_conditional_expr_nobf','parser.py',887),
+  ('assignment_expr -> conditional_expr','assignment_expr',1,'p_assignment_expr','parser.py',899),
+  ('assignment_expr -> left_hand_side_expr assignment_operator assignment_expr','assignment_expr',3,'p_assignment_expr','parser.py',900),
+  ('assignment_expr_noin -> conditional_expr_noin','assignment_expr_noin',1,'p_assignment_expr_noin','parser.py',910),
+  ('assignment_expr_noin -> left_hand_side_expr assignment_operator assignment_expr_noin','assignment_expr_noin',3,'p_assignment_expr_noin','parser.py',911),
+  ('assignment_expr_nobf -> conditional_expr_nobf','assignment_expr_nobf',1,'p_assignment_expr_nobf','parser.py',921),
+  ('assignment_expr_nobf -> left_hand_side_expr_nobf assignment_operator assignment_expr','assignment_expr_nobf',3,'p_assignment_expr_nobf','parser.py',922),
+  ('assignment_operator -> EQ','assignment_operator',1,'p_assignment_operator','parser.py',931),
+  ('assignment_operator -> MULTEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',932),
+  ('assignment_operator -> DIVEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',933),
+  ('assignment_operator -> MODEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',934),
+  ('assignment_operator -> PLUSEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',935),
+  ('assignment_operator -> MINUSEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',936),
+  ('assignment_operator -> LSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',937),
+  ('assignment_operator -> RSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',938),
+  ('assignment_operator -> URSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',939),
+  ('assignment_operator -> ANDEQUAL','assignment_operator',1,'p_assignment_operator','parser.py',940),
+  ('assignment_operator -> XOREQUAL','assignment_operator',1,'p_assignment_operator','parser.py',941),
+  ('assignment_operator -> OREQUAL','assignment_operator',1,'p_assignment_operator','parser.py',942),
+  ('expr -> assignment_expr','expr',1,'p_expr','parser.py',948),
+  ('expr -> expr COMMA assignment_expr','expr',3,'p_expr','parser.py',949),
+  ('expr_noin -> assignment_expr_noin','expr_noin',1,'p_expr_noin','parser.py',957),
+  ('expr_noin -> expr_noin COMMA assignment_expr_noin','expr_noin',3,'p_expr_noin','parser.py',958),
+  ('expr_nobf -> assignment_expr_nobf','expr_nobf',1,'p_expr_nobf','parser.py',966),
+  ('expr_nobf -> expr_nobf COMMA assignment_expr','expr_nobf',3,'p_expr_nobf','parser.py',967),
+  ('variable_statement -> VAR variable_declaration_list SEMI','variable_statement',3,'p_variable_statement','parser.py',976),
+  ('variable_declaration_list -> variable_declaration','variable_declaration_list',1,'p_variable_declaration_list','parser.py',981),
+  ('variable_declaration_list -> variable_declaration_list COMMA variable_declaration','variable_declaration_list',3,'p_variable_declaration_list','parser.py',982),
+  ('variable_declaration_list_noin -> variable_declaration_noin','variable_declaration_list_noin',1,'p_variable_declaration_list_noin','parser.py',993),
+  ('variable_declaration_list_noin -> variable_declaration_list_noin COMMA variable_declaration_noin','variable_declaration_list_noin',3,'p_variable_declaration_list_noin','parser.py',994),
+  ('variable_declaration -> identifier','variable_declaration',1,'p_variable_declaration','parser.py',1004),
+  ('variable_declaration -> identifier initializer','variable_declaration',2,'p_variable_declaration','parser.py',1005),
+  ('variable_declaration_noin -> identifier','variable_declaration_noin',1,'p_variable_declaration_noin','parser.py',1013),
+  ('variable_declaration_noin -> identifier initializer_noin','variable_declaration_noin',2,'p_variable_declaration_noin','parser.py',1014),
+  ('initializer -> EQ assignment_expr','initializer',2,'p_initializer','parser.py',1022),
+  ('initializer_noin -> EQ assignment_expr_noin','initializer_noin',2,'p_initializer_noin','parser.py',1026),
+  ('empty_statement -> SEMI','empty_statement',1,'p_empty_statement','parser.py',1031),
+  ('expr_statement -> expr_nobf SEMI','expr_statement',2,'p_expr_statement','parser.py',1036),
+  ('if_statement -> IF LPAREN expr RPAREN statement','if_statement',5,'p_if_statement_1','parser.py',1041),
+  ('if_statement -> IF LPAREN expr RPAREN statement ELSE statement','if_statement',7,'p_if_statement_2','parser.py',1045),
+  ('iteration_statement -> DO statement WHILE LPAREN expr RPAREN SEMI','iteration_statement',7,'p_iteration_statement_1','parser.py',1050),
+  ('iteration_statement -> WHILE LPAREN expr RPAREN statement','iteration_statement',5,'p_iteration_statement_2','parser.py',1054),
+  ('iteration_statement -> FOR LPAREN expr_noin_opt SEMI expr_opt SEMI expr_opt RPAREN statement','iteration_statement',9,'p_iteration_statement_3','parser.py',1059),
+  ('iteration_statement -> FOR LPAREN VAR variable_declaration_list_noin SEMI expr_opt SEMI expr_opt RPAREN statement','iteration_statement',10,'p_iteration_statement_3','parser.py',1060),
+  ('iteration_statement -> FOR LPAREN left_hand_side_expr IN expr RPAREN statement','iteration_statement',7,'p_iteration_statement_4','parser.py',1073),
+  ('iteration_statement -> FOR LPAREN VAR identifier IN expr RPAREN statement','iteration_statement',8,'p_iteration_statement_5','parser.py',1080),
+  ('iteration_statement -> FOR LPAREN VAR identifier initializer_noin IN expr RPAREN statement','iteration_statement',9,'p_iteration_statement_6','parser.py',1087),
+  ('expr_opt -> empty','expr_opt',1,'p_expr_opt','parser.py',1094),
+  ('expr_opt -> expr','expr_opt',1,'p_expr_opt','parser.py',1095),
+  ('expr_noin_opt -> empty','expr_noin_opt',1,'p_expr_noin_opt','parser.py',1100),
+  ('expr_noin_opt -> expr_noin','expr_noin_opt',1,'p_expr_noin_opt','parser.py',1101),
+  ('continue_statement -> CONTINUE SEMI','continue_statement',2,'p_continue_statement_1','parser.py',1107),
+  ('continue_statement -> CONTINUE identifier SEMI','continue_statement',3,'p_continue_statement_2','parser.py',1111),
+  ('break_statement -> BREAK SEMI','break_statement',2,'p_break_statement_1','parser.py',1116),
+  ('break_statement -> BREAK identifier SEMI','break_statement',3,'p_break_statement_2','parser.py',1120),
+  ('return_statement -> RETURN SEMI','return_statement',2,'p_return_statement_1','parser.py',1126),
+  ('return_statement -> RETURN expr SEMI','return_statement',3,'p_return_statement_2','parser.py',1130),
+  ('with_statement -> WITH LPAREN expr RPAREN statement','with_statement',5,'p_with_statement','parser.py',1135),
+  ('switch_statement -> SWITCH LPAREN expr RPAREN case_block','switch_statement',5,'p_switch_statement','parser.py',1140),
+  ('case_block -> LBRACE case_clauses_opt RBRACE','case_block',3,'p_case_block','parser.py',1154),
+  ('case_block -> LBRACE case_clauses_opt default_clause case_clauses_opt RBRACE','case_block',5,'p_case_block','parser.py',1155),
+  ('case_clauses_opt -> empty','case_clauses_opt',1,'p_case_clauses_opt','parser.py',1161),
+  ('case_clauses_opt -> case_clauses','case_clauses_opt',1,'p_case_clauses_opt','parser.py',1162),
+  ('case_clauses -> case_clause','case_clauses',1,'p_case_clauses','parser.py',1167),
+  ('case_clauses -> case_clauses case_clause','case_clauses',2,'p_case_clauses','parser.py',1168),
+  ('case_clause -> CASE expr COLON source_elements','case_clause',4,'p_case_clause','parser.py',1177),
+  ('default_clause -> DEFAULT COLON source_elements','default_clause',3,'p_default_clause','parser.py',1181),
+  ('labelled_statement -> identifier COLON statement','labelled_statement',3,'p_labelled_statement','parser.py',1186),
+  ('throw_statement -> THROW expr SEMI','throw_statement',3,'p_throw_statement','parser.py',1191),
+  ('try_statement -> TRY block catch','try_statement',3,'p_try_statement_1','parser.py',1196),
+  ('try_statement -> TRY block finally','try_statement',3,'p_try_statement_2','parser.py',1200),
+  ('try_statement -> TRY block catch finally','try_statement',4,'p_try_statement_3','parser.py',1204),
+  ('catch -> CATCH LPAREN identifier RPAREN block','catch',5,'p_catch','parser.py',1208),
+  ('finally -> FINALLY block','finally',2,'p_finally','parser.py',1212),
+  ('debugger_statement -> DEBUGGER SEMI','debugger_statement',2,'p_debugger_statement','parser.py',1217),
+  ('function_declaration -> FUNCTION identifier LPAREN RPAREN LBRACE function_body RBRACE','function_declaration',7,'p_function_declaration','parser.py',1223),
+  ('function_declaration -> FUNCTION identifier LPAREN formal_parameter_list RPAREN LBRACE function_body RBRACE','function_declaration',8,'p_function_declaration','parser.py',1224),
+  ('function_expr -> FUNCTION LPAREN RPAREN LBRACE function_body RBRACE','function_expr',6,'p_function_expr_1','parser.py',1237),
+  ('function_expr -> FUNCTION LPAREN formal_parameter_list RPAREN LBRACE function_body RBRACE','function_expr',7,'p_function_expr_1','parser.py',1238),
+  ('function_expr -> FUNCTION identifier LPAREN RPAREN LBRACE function_body RBRACE','function_expr',7,'p_function_expr_2','parser.py',1251),
+  ('function_expr -> FUNCTION identifier LPAREN formal_parameter_list RPAREN LBRACE function_body RBRACE','function_expr',8,'p_function_expr_2','parser.py',1252),
+  ('formal_parameter_list -> identifier','formal_parameter_list',1,'p_formal_parameter_list','parser.py',1265),
+  ('formal_parameter_list -> formal_parameter_list COMMA identifier','formal_parameter_list',3,'p_formal_parameter_list','parser.py',1266),
+  ('function_body -> source_elements','function_body',1,'p_function_body','parser.py',1275),
 ]